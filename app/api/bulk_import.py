@@ -0,0 +1,47 @@
+"""
+Request helpers for streaming bulk import endpoints.
+
+Import services are synchronous and run on the threadpool; they read
+the upload through :func:`request_body_chunks`, which pulls the body
+from the event loop one chunk at a time so large files are never
+buffered in memory.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+import anyio.from_thread
+from fastapi import Request
+
+from app.domain.services.bulk_import_service import resolve_format
+
+
+def import_format(request: Request, requested: Optional[str]) -> str:
+    """Resolve ``ndjson`` or ``csv`` from ``?format=`` or the Content-Type."""
+    return resolve_format(requested, request.headers.get("content-type"))
+
+
+def request_body_chunks(request: Request) -> Iterator[bytes]:
+    """Iterate the request body from a worker thread.
+
+    Must be consumed inside ``run_in_threadpool`` (or another
+    ``anyio.to_thread`` worker) started from the request's event loop.
+    """
+    stream = request.stream().__aiter__()
+
+    async def _next() -> Optional[bytes]:
+        try:
+            return await stream.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    while True:
+        chunk = anyio.from_thread.run(_next)
+        if chunk is None:
+            return
+        if chunk:
+            yield chunk
+
+
+__all__ = ["import_format", "request_body_chunks"]
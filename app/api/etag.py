@@ -0,0 +1,117 @@
+"""
+Conditional GET support for single-resource endpoints.
+
+:func:`etag_guard` builds a route dependency that looks up the version
+token of the requested resource (see
+``app.domain.services.resource_version_service``) before the handler
+runs.  When the client's ``If-None-Match`` matches, the request ends
+with ``304 Not Modified`` and the handler never loads or serializes the
+resource; otherwise the weak ETag is added to the response.
+
+Guards are attached with ``dependencies=[Depends(...)]`` so handler
+signatures stay unchanged, and they share the handler's (cached)
+database session dependency.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.core.db import get_async_read_db, get_read_db
+
+VersionLookup = Callable[..., Optional[str]]
+
+# Clients may keep the representation but must revalidate it each time
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(version: str) -> str:
+    """Return the weak ETag for a version token."""
+    return f'W/"{version}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def if_none_match(header: Optional[str], etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = _opaque(etag)
+    return any(_opaque(tag) == wanted for tag in header.split(","))
+
+
+def _apply(request: Request, response: Response, version: Optional[str]) -> None:
+    if version is None:
+        # Unknown resource: the handler produces the 404
+        return
+    etag = make_etag(version)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if if_none_match(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+
+def _resource_id(request: Request, id_param: str) -> Optional[UUID]:
+    try:
+        return UUID(str(request.path_params[id_param]))
+    except (KeyError, ValueError):
+        # Invalid path parameters are reported by the handler's validation
+        return None
+
+
+def etag_guard(version_lookup: VersionLookup, id_param: str, *, use_async: bool = False) -> Any:
+    """Return a dependency adding ETags / 304s to a single-resource GET.
+
+    ``version_lookup`` is a service function called as
+    ``version_lookup(db, tenant_id=..., <id_param>=...)``.  With
+    ``use_async`` the dependency shares the handler's ``AsyncSession``
+    and runs the lookup through ``run_sync``.
+    """
+    if use_async:
+
+        async def async_guard(
+            request: Request,
+            response: Response,
+            tenant_id: UUID,
+            db: Any = Depends(get_async_read_db),
+        ) -> None:
+            resource_id = _resource_id(request, id_param)
+            if resource_id is None:
+                return
+            version = await db.run_sync(
+                lambda session: version_lookup(
+                    session, tenant_id=tenant_id, **{id_param: resource_id}
+                )
+            )
+            _apply(request, response, version)
+
+        return Depends(async_guard)
+
+    def guard(
+        request: Request,
+        response: Response,
+        tenant_id: UUID,
+        db: Session = Depends(get_read_db),
+    ) -> None:
+        resource_id = _resource_id(request, id_param)
+        if resource_id is None:
+            return
+        _apply(
+            request,
+            response,
+            version_lookup(db, tenant_id=tenant_id, **{id_param: resource_id}),
+        )
+
+    return Depends(guard)
+
+
+__all__ = ["CACHE_CONTROL", "etag_guard", "if_none_match", "make_etag"]
@@ -0,0 +1,66 @@
+"""
+Response helper for streaming export endpoints.
+
+:func:`export_response` wraps :func:`export_service.stream_export` in a
+``StreamingResponse``.  The body is produced after the endpoint has
+returned, when sessions from yield dependencies may already be closed
+(FastAPI only keeps them open until the response finishes from 0.118
+on), so the stream opens its own session from the factory supplied by
+``get_reporting_session_factory`` and closes it after the last chunk.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional
+from uuid import UUID
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.services.export_service import (
+    MEDIA_TYPES,
+    ExportSpec,
+    resolve_export_format,
+    stream_export,
+)
+
+
+def _stream(
+    session_factory: sessionmaker,
+    spec: ExportSpec,
+    *,
+    tenant_id: UUID,
+    fmt: str,
+    gzip: bool,
+) -> Iterator[bytes]:
+    with session_factory() as db:
+        yield from stream_export(db, spec, tenant_id=tenant_id, fmt=fmt, gzip=gzip)
+
+
+def export_response(
+    request: Request,
+    session_factory: sessionmaker,
+    spec: ExportSpec,
+    *,
+    tenant_id: UUID,
+    format: Optional[str] = None,
+    gzip: bool = False,
+) -> StreamingResponse:
+    """Stream the tenant's ``spec`` rows as NDJSON or CSV."""
+    fmt = resolve_export_format(format, request.headers.get("accept"))
+    headers = {
+        "Content-Disposition": f'attachment; filename="{spec.name}-{tenant_id}.{fmt}"',
+        "Cache-Control": "no-store",
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(
+        _stream(session_factory, spec, tenant_id=tenant_id, fmt=fmt, gzip=gzip),
+        media_type=MEDIA_TYPES[fmt],
+        headers=headers,
+    )
+
+
+__all__ = ["export_response"]
@@ -0,0 +1,47 @@
+"""
+Response classes shared by the CRM API.
+
+``FastJSONResponse`` renders with the orjson based encoder from
+``app.util.serialization`` instead of the stdlib ``json`` module.
+
+Recent FastAPI releases serialize routes that declare a response model
+straight to JSON bytes with Pydantic's Rust core, which is faster than
+dumping to Python objects and encoding those with orjson.  FastAPI only
+takes that path while the application's default response class is left
+unset, so :func:`default_response_class` installs ``FastJSONResponse``
+only on FastAPI versions that lack it (e.g. the 0.104 line pinned in
+``requirements.txt``).
+"""
+
+from __future__ import annotations
+
+import inspect
+from typing import Any, Type, Union
+
+from fastapi import routing
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import JSONResponse, Response
+
+from app.util.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _fastapi_dumps_response_models() -> bool:
+    """Whether FastAPI encodes response models directly to JSON bytes."""
+    return "dump_json" in inspect.signature(routing.serialize_response).parameters
+
+
+def default_response_class() -> Union[Type[Response], DefaultPlaceholder]:
+    """Return the ``default_response_class`` for the application."""
+    if _fastapi_dumps_response_models():
+        return Default(JSONResponse)
+    return FastJSONResponse
+
+
+__all__ = ["FastJSONResponse", "default_response_class"]
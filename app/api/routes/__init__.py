@@ -108,6 +108,8 @@ from .record_watchers_tenant_route import router as record_watchers_tenant_route
 from .automation_actions_admin_route import router as automation_actions_admin_router
 from .automation_actions_tenant_route import router as automation_actions_tenant_router
 from .stage_history_tenant_route import router as stage_history_tenant_router
+from .pipeline_reports_tenant_route import router as pipeline_reports_tenant_router
+from .business_hours_tenant_route import router as business_hours_tenant_router
 
 __all__ = [
     "contact_router",
@@ -192,4 +194,6 @@ __all__ = [
     "automation_actions_admin_router",
     "automation_actions_tenant_router",
     "stage_history_tenant_router",
+    "pipeline_reports_tenant_router",
+    "business_hours_tenant_router",
 ]
\ No newline at end of file
@@ -19,9 +19,10 @@ from sqlalchemy.orm import Session
 import app.domain.services.activity_service as activity_service
 
 from app.domain.schemas.activity import ActivityCreate, ActivityUpdate, ActivityRead
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -40,7 +41,10 @@ def list_activities_admin(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[ActivityRead]:
     """List or search activities across tenants.
 
@@ -55,12 +59,18 @@ def list_activities_admin(
         status=status,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[ActivityRead] = [
-        ActivityRead.model_validate(act, from_attributes=True) for act in activities
-    ]
+    items: List[ActivityRead] = validate_items(ActivityRead, activities)
     return PaginationEnvelope[ActivityRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
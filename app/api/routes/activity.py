@@ -14,7 +14,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import activity_service
 
@@ -26,7 +26,7 @@ router = APIRouter(prefix="/activities", tags=["activities"])
 def list_activities(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[schemas.ActivityRead]:
     """List all activities for a tenant."""
     return list(activity_service.list_activities(db, tenant_id))
@@ -50,7 +50,7 @@ def get_activity(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
     activity_id: UUID = Path(..., description="Activity ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.ActivityRead:
     """Retrieve an activity by ID."""
     activity = activity_service.get_activity(db, activity_id, tenant_id)
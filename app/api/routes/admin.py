@@ -15,14 +15,14 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_read_db
 from app.domain.models import Contact
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 @router.get("/tenants", response_model=List[UUID], summary="List tenant identifiers")
-def list_tenants(db: Session = Depends(get_db)) -> List[UUID]:
+def list_tenants(db: Session = Depends(get_read_db)) -> List[UUID]:
     """Return a list of unique tenant identifiers present in the system.
 
     The current implementation inspects the Contact table to infer
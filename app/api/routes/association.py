@@ -13,7 +13,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import association_service
 
@@ -25,7 +25,7 @@ router = APIRouter(prefix="/associations", tags=["associations"])
 def list_associations(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[schemas.AssociationRead]:
     """List all associations for a tenant."""
     return list(association_service.list_associations(db, tenant_id))
@@ -49,7 +49,7 @@ def get_association(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
     association_id: UUID = Path(..., description="Association ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.AssociationRead:
     """Retrieve an association by ID."""
     assoc = association_service.get_association(db, association_id, tenant_id)
@@ -20,9 +20,10 @@ from sqlalchemy.orm import Session
 import app.domain.services.association_service as association_service
 
 from app.domain.schemas.association import AssociationCreate, AssociationRead
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -36,7 +37,10 @@ def list_associations_endpoint(
     tenant_id: UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[AssociationRead]:
     """List associations for a tenant.
 
@@ -47,12 +51,18 @@ def list_associations_endpoint(
         tenant_id=tenant_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[AssociationRead] = [
-        AssociationRead.model_validate(assoc, from_attributes=True) for assoc in associations
-    ]
+    items: List[AssociationRead] = validate_items(AssociationRead, associations)
     return PaginationEnvelope[AssociationRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
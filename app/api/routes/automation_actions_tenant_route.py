@@ -16,7 +16,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.automation_action_service import (
     list_automation_actions as service_list_actions,
     create_automation_action as service_create_action,
@@ -29,7 +29,8 @@ from app.domain.schemas.automation_action import (
     AutomationActionUpdate,
     AutomationActionRead,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -49,7 +50,10 @@ def list_automation_actions_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[AutomationActionRead]:
     """List automation actions for a tenant with optional filters.
 
@@ -65,12 +69,18 @@ def list_automation_actions_endpoint(
         scope_type=scope_type,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[AutomationActionRead] = [
-        AutomationActionRead.model_validate(a, from_attributes=True) for a in actions
-    ]
+    items: List[AutomationActionRead] = validate_items(AutomationActionRead, actions)
     return PaginationEnvelope[AutomationActionRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -125,7 +135,7 @@ def update_automation_action_endpoint(
 def get_automation_action_endpoint(
     tenant_id: UUID,
     action_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> AutomationActionRead:
     """Retrieve a single automation action by ID within a tenant.
 
@@ -0,0 +1,138 @@
+"""
+Tenant‑scoped FastAPI routes for business hours calendars.
+
+These endpoints allow tenants to list, create, update, retrieve and
+delete the calendars that group profiles reference for SLA due-date
+computation.  Audit fields are populated from the ``X-User`` header
+when provided; otherwise "anonymous" is used.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db, get_read_db
+from app.domain.services.business_hours_service import (
+    list_business_hours as service_list_business_hours,
+    create_business_hours as service_create_business_hours,
+    update_business_hours as service_update_business_hours,
+    get_business_hours as service_get_business_hours,
+    delete_business_hours as service_delete_business_hours,
+)
+from app.domain.schemas.business_hours import (
+    TenantCreateBusinessHours,
+    BusinessHoursUpdate,
+    BusinessHoursOut,
+)
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
+
+
+router = APIRouter(
+    prefix="/tenants/{tenant_id}/business_hours",
+    tags=["BusinessHours"],
+)
+
+
+@router.get("/", response_model=PaginationEnvelope[BusinessHoursOut])
+def list_business_hours_endpoint(
+    tenant_id: UUID,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
+) -> PaginationEnvelope[BusinessHoursOut]:
+    """List business hours calendars for a tenant, newest first."""
+    calendars, total = service_list_business_hours(
+        db,
+        tenant_id=tenant_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[BusinessHoursOut] = validate_items(BusinessHoursOut, calendars)
+    return PaginationEnvelope[BusinessHoursOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
+    )
+
+
+@router.post("/", response_model=BusinessHoursOut, status_code=status.HTTP_201_CREATED)
+def create_business_hours_endpoint(
+    tenant_id: UUID,
+    business_hours_in: TenantCreateBusinessHours,
+    db: Session = Depends(get_db),
+    x_user: str | None = Query(default=None),
+) -> BusinessHoursOut:
+    """Create a business hours calendar for a tenant."""
+    created_user = x_user or "anonymous"
+    calendar = service_create_business_hours(
+        db,
+        tenant_id=tenant_id,
+        request=business_hours_in,
+        created_by=created_user,
+    )
+    return BusinessHoursOut.model_validate(calendar, from_attributes=True)
+
+
+@router.patch("/{business_hours_id}", response_model=BusinessHoursOut)
+def update_business_hours_endpoint(
+    tenant_id: UUID,
+    business_hours_id: UUID,
+    business_hours_update: BusinessHoursUpdate,
+    db: Session = Depends(get_db),
+    x_user: str | None = Query(default=None),
+) -> BusinessHoursOut:
+    """Update a business hours calendar.
+
+    Changing the schedule, time zone or holidays queues a recomputation
+    of the tenant's open ticket SLA due dates.
+    """
+    updated_user = x_user or "anonymous"
+    calendar = service_update_business_hours(
+        db,
+        tenant_id=tenant_id,
+        business_hours_id=business_hours_id,
+        request=business_hours_update,
+        updated_by=updated_user,
+    )
+    return BusinessHoursOut.model_validate(calendar, from_attributes=True)
+
+
+@router.get("/{business_hours_id}", response_model=BusinessHoursOut)
+def get_business_hours_endpoint(
+    tenant_id: UUID,
+    business_hours_id: UUID,
+    db: Session = Depends(get_read_db),
+) -> BusinessHoursOut:
+    """Retrieve a single business hours calendar by ID within a tenant."""
+    calendar = service_get_business_hours(
+        db, tenant_id=tenant_id, business_hours_id=business_hours_id
+    )
+    return BusinessHoursOut.model_validate(calendar, from_attributes=True)
+
+
+@router.delete("/{business_hours_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_business_hours_endpoint(
+    tenant_id: UUID,
+    business_hours_id: UUID,
+    db: Session = Depends(get_db),
+) -> None:
+    """Delete a business hours calendar from a tenant.
+
+    Group profiles that used it fall back to around-the-clock SLAs.
+    """
+    service_delete_business_hours(db, tenant_id=tenant_id, business_hours_id=business_hours_id)
+    return None
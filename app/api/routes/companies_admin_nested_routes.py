@@ -65,7 +65,8 @@ from app.domain.schemas.company import (
     CompanyRelationshipResponse,
 )
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(prefix="/companies/{company_id}", tags=["Company Nested Resources"])
@@ -83,10 +84,10 @@ def list_phones_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the company whose phone numbers to list"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyPhoneNumberResponse]:
     phones = list_company_phones(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyPhoneNumberResponse.model_validate(p, from_attributes=True) for p in phones]
+    return validate_items(CompanyPhoneNumberResponse, phones)
 
 
 @router.post(
@@ -170,10 +171,10 @@ def list_emails_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the company whose emails to list"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyEmailResponse]:
     emails = list_company_emails(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyEmailResponse.model_validate(e, from_attributes=True) for e in emails]
+    return validate_items(CompanyEmailResponse, emails)
 
 
 @router.post(
@@ -257,10 +258,10 @@ def list_addresses_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the company whose addresses to list"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyAddressResponse]:
     addresses = list_company_addresses(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyAddressResponse.model_validate(a, from_attributes=True) for a in addresses]
+    return validate_items(CompanyAddressResponse, addresses)
 
 
 @router.post(
@@ -344,10 +345,10 @@ def list_social_profiles_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the company whose social profiles to list"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanySocialProfileResponse]:
     profiles = list_company_social_profiles(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanySocialProfileResponse.model_validate(s, from_attributes=True) for s in profiles]
+    return validate_items(CompanySocialProfileResponse, profiles)
 
 
 @router.post(
@@ -431,10 +432,10 @@ def list_notes_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the company whose notes to list"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyNoteResponse]:
     notes = list_company_notes(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyNoteResponse.model_validate(n, from_attributes=True) for n in notes]
+    return validate_items(CompanyNoteResponse, notes)
 
 
 @router.post(
@@ -518,10 +519,10 @@ def list_relationships_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the company whose relationships to list"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyRelationshipResponse]:
     rels = list_company_relationships(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyRelationshipResponse.model_validate(r, from_attributes=True) for r in rels]
+    return validate_items(CompanyRelationshipResponse, rels)
 
 
 @router.post(
@@ -30,9 +30,10 @@ from app.domain.schemas.company import (
     CompanyOut,
 )
 from app.domain.schemas.json_patch import JsonPatchRequest
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -54,7 +55,10 @@ def list_companies_admin(
     contact_name: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[CompanyOut]:
     """List or search companies across tenants.
 
@@ -73,9 +77,19 @@ def list_companies_admin(
         contact_name=contact_name,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[CompanyOut] = validate_items(CompanyOut, companies)
+    return PaginationEnvelope[CompanyOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
-    items: List[CompanyOut] = [CompanyOut.model_validate(c, from_attributes=True) for c in companies]
-    return PaginationEnvelope[CompanyOut](items=items, total=total, limit=limit, offset=offset)
 
 
 @router.post("/", response_model=CompanyOut, status_code=status.HTTP_201_CREATED)
@@ -138,7 +152,7 @@ def get_company_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the company to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CompanyOut:
     """Retrieve a company by ID across tenants.
 
@@ -146,7 +160,7 @@ def get_company_admin(
     company can be resolved in the correct tenant context.  Raises
     404 if the company does not exist in the tenant.
     """
-    company = service_get_company(db, tenant_id=tenant_id, company_id=company_id)
+    company = service_get_company(db, tenant_id=tenant_id, company_id=company_id, snapshot=True)
     return CompanyOut.model_validate(company, from_attributes=True)
 
 
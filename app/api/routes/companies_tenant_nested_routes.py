@@ -70,7 +70,8 @@ from app.domain.schemas.company import (
     CompanyContactRelationshipResponse,
 )
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -88,10 +89,10 @@ router = APIRouter(
 def list_phones(
     tenant_id: UUID,
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyPhoneNumberResponse]:
     phones = list_company_phones(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyPhoneNumberResponse.model_validate(p, from_attributes=True) for p in phones]
+    return validate_items(CompanyPhoneNumberResponse, phones)
 
 
 @router.post("/phone-numbers", response_model=CompanyPhoneNumberResponse, status_code=status.HTTP_201_CREATED)
@@ -159,10 +160,10 @@ def delete_phone(
 def list_emails(
     tenant_id: UUID,
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyEmailResponse]:
     emails = list_company_emails(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyEmailResponse.model_validate(e, from_attributes=True) for e in emails]
+    return validate_items(CompanyEmailResponse, emails)
 
 
 @router.post("/emails", response_model=CompanyEmailResponse, status_code=status.HTTP_201_CREATED)
@@ -230,10 +231,10 @@ def delete_email(
 def list_addresses(
     tenant_id: UUID,
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyAddressResponse]:
     addresses = list_company_addresses(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyAddressResponse.model_validate(a, from_attributes=True) for a in addresses]
+    return validate_items(CompanyAddressResponse, addresses)
 
 
 @router.post("/addresses", response_model=CompanyAddressResponse, status_code=status.HTTP_201_CREATED)
@@ -301,10 +302,10 @@ def delete_address(
 def list_social_profiles(
     tenant_id: UUID,
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanySocialProfileResponse]:
     profiles = list_company_social_profiles(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanySocialProfileResponse.model_validate(s, from_attributes=True) for s in profiles]
+    return validate_items(CompanySocialProfileResponse, profiles)
 
 
 @router.post("/social-profiles", response_model=CompanySocialProfileResponse, status_code=status.HTTP_201_CREATED)
@@ -372,10 +373,10 @@ def delete_social_profile(
 def list_notes(
     tenant_id: UUID,
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyNoteResponse]:
     notes = list_company_notes(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyNoteResponse.model_validate(n, from_attributes=True) for n in notes]
+    return validate_items(CompanyNoteResponse, notes)
 
 
 @router.post("/notes", response_model=CompanyNoteResponse, status_code=status.HTTP_201_CREATED)
@@ -443,10 +444,10 @@ def delete_note(
 def list_relationships(
     tenant_id: UUID,
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyRelationshipResponse]:
     rels = list_company_relationships(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyRelationshipResponse.model_validate(r, from_attributes=True) for r in rels]
+    return validate_items(CompanyRelationshipResponse, rels)
 
 
 @router.post("/relationships", response_model=CompanyRelationshipResponse, status_code=status.HTTP_201_CREATED)
@@ -514,10 +515,10 @@ def delete_relationship(
 def list_contacts(
     tenant_id: UUID,
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CompanyContactRelationshipResponse]:
     rels = list_company_contacts(db, tenant_id=tenant_id, company_id=company_id)
-    return [CompanyContactRelationshipResponse.model_validate(r, from_attributes=True) for r in rels]
+    return validate_items(CompanyContactRelationshipResponse, rels)
 
 
 @router.post("/contacts", response_model=CompanyContactRelationshipResponse, status_code=status.HTTP_201_CREATED)
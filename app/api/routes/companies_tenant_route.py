@@ -14,20 +14,28 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, status, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.api.bulk_import import import_format, request_body_chunks
+from app.api.etag import etag_guard
+from app.api.export import export_response
 from app.domain.services import company_service  # for mypy namespace package support
+from app.domain.services import company_import_service
+from app.domain.services.bulk_import_service import iter_lines
+from app.domain.schemas.company_import import CompanyImportJobOut
 
 from app.domain.schemas.company import (
     TenantCreateCompany,
     CompanyOut,
 )
 from app.domain.schemas.json_patch import JsonPatchRequest
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db, get_reporting_session_factory
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -45,7 +53,10 @@ def list_companies_endpoint(
     contact_name: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[CompanyOut]:
     """List or search companies for a tenant.
 
@@ -64,9 +75,19 @@ def list_companies_endpoint(
         contact_name=contact_name,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[CompanyOut] = validate_items(CompanyOut, companies)
+    return PaginationEnvelope[CompanyOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
-    items: List[CompanyOut] = [CompanyOut.model_validate(c, from_attributes=True) for c in companies]
-    return PaginationEnvelope[CompanyOut](items=items, total=total, limit=limit, offset=offset)
 
 
 @router.post("/", response_model=CompanyOut, status_code=status.HTTP_201_CREATED)
@@ -92,6 +113,71 @@ def create_company_endpoint(
     return CompanyOut.model_validate(company, from_attributes=True)
 
 
+@router.post(
+    "/import",
+    response_model=CompanyImportJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_companies_endpoint(
+    tenant_id: UUID,
+    request: Request,
+    format: Optional[str] = Query(
+        default=None,
+        description="ndjson or csv; defaults from the Content-Type header",
+    ),
+    db: Session = Depends(get_db),
+    x_user: str | None = Query(default=None),
+) -> CompanyImportJobOut:
+    """Start a bulk company import from an NDJSON or CSV upload.
+
+    Each row uses the company create schema plus ``external_key``,
+    ``parent_external_key``, ``relationships`` and
+    ``contact_relationships``.  The upload is queued and processed by a
+    background job; poll ``GET /import/{job_id}`` for progress.
+    """
+    fmt = import_format(request, format)
+
+    def _run():
+        return company_import_service.create_import_job(
+            db,
+            tenant_id=tenant_id,
+            lines=iter_lines(request_body_chunks(request)),
+            fmt=fmt,
+            created_by=x_user or "anonymous",
+        )
+
+    job = await run_in_threadpool(_run)
+    return CompanyImportJobOut.model_validate(job, from_attributes=True)
+
+
+@router.get("/export")
+def export_companies_endpoint(
+    tenant_id: UUID,
+    request: Request,
+    format: Optional[str] = Query(
+        default=None,
+        description="ndjson or csv; defaults from the Accept header",
+    ),
+    gzip: bool = Query(default=False, description="gzip-compress the stream"),
+    session_factory: sessionmaker = Depends(get_reporting_session_factory),
+):
+    """Stream all companies of the tenant as NDJSON or CSV."""
+    return export_response(
+        request, session_factory, company_service.EXPORT_SPEC, tenant_id=tenant_id, format=format, gzip=gzip
+    )
+
+
+@router.get("/import/{job_id}", response_model=CompanyImportJobOut)
+def get_company_import_endpoint(
+    tenant_id: UUID,
+    job_id: UUID,
+    db: Session = Depends(get_db),
+) -> CompanyImportJobOut:
+    """Return the status and progress of a bulk company import job."""
+    job = company_import_service.get_import_job(db, tenant_id=tenant_id, job_id=job_id)
+    return CompanyImportJobOut.model_validate(job, from_attributes=True)
+
+
 @router.patch("/{company_id}", response_model=CompanyOut)
 def patch_company_endpoint(
     tenant_id: UUID,
@@ -118,18 +204,24 @@ def patch_company_endpoint(
     return CompanyOut.model_validate(company, from_attributes=True)
 
 
-@router.get("/{company_id}", response_model=CompanyOut)
+@router.get(
+    "/{company_id}",
+    response_model=CompanyOut,
+    dependencies=[etag_guard(company_service.get_company_version, "company_id")],
+)
 def get_company_endpoint(
     tenant_id: UUID,
     company_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CompanyOut:
     """Retrieve a single company by ID within a tenant.
 
     Raises 404 if the company does not exist or does not belong to
     the tenant.
     """
-    company = company_service.get_company(db, tenant_id=tenant_id, company_id=company_id)
+    company = company_service.get_company(
+        db, tenant_id=tenant_id, company_id=company_id, snapshot=True
+    )
     return CompanyOut.model_validate(company, from_attributes=True)
 
 
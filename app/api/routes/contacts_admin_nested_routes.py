@@ -64,7 +64,8 @@ from app.domain.schemas.contact import (
     ContactCompanyRelationshipResponse,
 )
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(prefix="/contacts/{contact_id}", tags=["Contact Nested Resources"])
@@ -81,10 +82,10 @@ def list_phones_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the contact whose phone numbers to list"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[ContactPhoneNumberResponse]:
     phones = list_contact_phones(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactPhoneNumberResponse.model_validate(p, from_attributes=True) for p in phones]
+    return validate_items(ContactPhoneNumberResponse, phones)
 
 
 @router.post(
@@ -161,10 +162,10 @@ def list_emails_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the contact whose emails to list"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[ContactEmailResponse]:
     emails = list_contact_emails(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactEmailResponse.model_validate(e, from_attributes=True) for e in emails]
+    return validate_items(ContactEmailResponse, emails)
 
 
 @router.post(
@@ -239,10 +240,10 @@ def delete_email_admin(
 def list_addresses_admin(
     contact_id: UUID,
     tenant_id: UUID = Query(..., description="Tenant ID of the contact whose addresses to list"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[ContactAddressResponse]:
     addresses = list_contact_addresses(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactAddressResponse.model_validate(a, from_attributes=True) for a in addresses]
+    return validate_items(ContactAddressResponse, addresses)
 
 
 @router.post(
@@ -317,10 +318,10 @@ def delete_address_admin(
 def list_social_profiles_admin(
     contact_id: UUID,
     tenant_id: UUID = Query(..., description="Tenant ID of the contact whose social profiles to list"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[ContactSocialProfileResponse]:
     profiles = list_contact_social_profiles(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactSocialProfileResponse.model_validate(p, from_attributes=True) for p in profiles]
+    return validate_items(ContactSocialProfileResponse, profiles)
 
 
 @router.post(
@@ -395,10 +396,10 @@ def delete_social_profile_admin(
 def list_notes_admin(
     contact_id: UUID,
     tenant_id: UUID = Query(..., description="Tenant ID of the contact whose notes to list"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[ContactNoteResponse]:
     notes = list_contact_notes(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactNoteResponse.model_validate(n, from_attributes=True) for n in notes]
+    return validate_items(ContactNoteResponse, notes)
 
 
 @router.post(
@@ -473,10 +474,10 @@ def delete_note_admin(
 def list_company_relationships_admin(
     contact_id: UUID,
     tenant_id: UUID = Query(..., description="Tenant ID of the contact whose company relationships to list"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[ContactCompanyRelationshipResponse]:
     rels = list_contact_company_relationships(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactCompanyRelationshipResponse.model_validate(r, from_attributes=True) for r in rels]
+    return validate_items(ContactCompanyRelationshipResponse, rels)
 
 
 @router.post(
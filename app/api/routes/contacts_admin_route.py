@@ -26,9 +26,10 @@ from app.domain.services.contact_service import (
 )
 from app.domain.schemas.contact import AdminCreateContact, ContactOut, ContactSearchCriteria
 from app.domain.schemas.json_patch import JsonPatchRequest
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(prefix="/admin/contacts", tags=["Contacts"])
@@ -48,7 +49,10 @@ def list_contacts_admin(
     company_name: Optional[str] = Query(None),
     limit: Optional[int] = Query(None),
     offset: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[ContactOut]:
     """List or search contacts across tenants.
 
@@ -67,9 +71,19 @@ def list_contacts_admin(
         company_name=company_name,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[ContactOut] = validate_items(ContactOut, contacts)
+    return PaginationEnvelope[ContactOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
-    items: List[ContactOut] = [ContactOut.model_validate(c, from_attributes=True) for c in contacts]
-    return PaginationEnvelope[ContactOut](items=items, total=total, limit=limit, offset=offset)
 
 
 @router.post("/", response_model=ContactOut, status_code=status.HTTP_201_CREATED)
@@ -102,14 +116,14 @@ def get_contact_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the contact to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> ContactOut:
     """Retrieve a contact belonging to a given tenant.
 
     A tenant identifier is required to ensure that the contact ID is
     resolved within the correct tenant scope.
     """
-    contact = service_get_contact(db, tenant_id=tenant_id, contact_id=contact_id)
+    contact = service_get_contact(db, tenant_id=tenant_id, contact_id=contact_id, snapshot=True)
     return ContactOut.model_validate(contact, from_attributes=True)
 
 
@@ -63,7 +63,8 @@ from app.domain.schemas.contact import (
     ContactCompanyRelationshipResponse,
 )
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(prefix="/tenants/{tenant_id}/contacts/{contact_id}", tags=["Contact Nested Resources"])
@@ -78,10 +79,10 @@ router = APIRouter(prefix="/tenants/{tenant_id}/contacts/{contact_id}", tags=["C
 def list_phones(
     tenant_id: UUID,
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     phones = list_contact_phones(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactPhoneNumberResponse.model_validate(p, from_attributes=True) for p in phones]
+    return validate_items(ContactPhoneNumberResponse, phones)
 
 
 @router.post("/phone-numbers", response_model=ContactPhoneNumberResponse, status_code=status.HTTP_201_CREATED)
@@ -149,10 +150,10 @@ def delete_phone(
 def list_emails(
     tenant_id: UUID,
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     emails = list_contact_emails(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactEmailResponse.model_validate(e, from_attributes=True) for e in emails]
+    return validate_items(ContactEmailResponse, emails)
 
 
 @router.post("/emails", response_model=ContactEmailResponse, status_code=status.HTTP_201_CREATED)
@@ -220,10 +221,10 @@ def delete_email(
 def list_addresses(
     tenant_id: UUID,
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     addresses = list_contact_addresses(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactAddressResponse.model_validate(a, from_attributes=True) for a in addresses]
+    return validate_items(ContactAddressResponse, addresses)
 
 
 @router.post("/addresses", response_model=ContactAddressResponse, status_code=status.HTTP_201_CREATED)
@@ -291,10 +292,10 @@ def delete_address(
 def list_social_profiles(
     tenant_id: UUID,
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     profiles = list_contact_social_profiles(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactSocialProfileResponse.model_validate(p, from_attributes=True) for p in profiles]
+    return validate_items(ContactSocialProfileResponse, profiles)
 
 
 @router.post("/social-profiles", response_model=ContactSocialProfileResponse, status_code=status.HTTP_201_CREATED)
@@ -362,10 +363,10 @@ def delete_social_profile(
 def list_notes(
     tenant_id: UUID,
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     notes = list_contact_notes(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactNoteResponse.model_validate(n, from_attributes=True) for n in notes]
+    return validate_items(ContactNoteResponse, notes)
 
 
 @router.post("/notes", response_model=ContactNoteResponse, status_code=status.HTTP_201_CREATED)
@@ -433,10 +434,10 @@ def delete_note(
 def list_company_relationships(
     tenant_id: UUID,
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     rels = list_contact_company_relationships(db, tenant_id=tenant_id, contact_id=contact_id)
-    return [ContactCompanyRelationshipResponse.model_validate(r, from_attributes=True) for r in rels]
+    return validate_items(ContactCompanyRelationshipResponse, rels)
 
 
 @router.post("/companies", response_model=ContactCompanyRelationshipResponse, status_code=status.HTTP_201_CREATED)
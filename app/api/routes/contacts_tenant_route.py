@@ -12,19 +12,34 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
-from sqlalchemy.orm import Session
-
-from app.domain.services import contact_service
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.bulk_import import import_format, request_body_chunks
+from app.api.etag import etag_guard
+from app.api.export import export_response
+from app.domain.services import contact_import_service, contact_service
+from app.domain.services.bulk_import_service import iter_lines
+from app.domain.schemas.bulk_import import BulkImportResult
+from app.domain.schemas.bulk_patch import BulkPatchItem, BulkPatchResult
 from app.domain.schemas.contact import (
     TenantCreateContact,
     ContactOut,
     ContactSearchCriteria,
 )
 from app.domain.schemas.json_patch import JsonPatchRequest
-from app.domain.schemas.common import PaginationEnvelope
-
-from app.core.db import get_db
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+
+from app.core.db import (
+    AsyncSession,
+    async_db_enabled,
+    get_async_read_db,
+    get_db,
+    get_read_db,
+    get_reporting_session_factory,
+)
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(prefix="/tenants/{tenant_id}/contacts", tags=["Contacts"])
@@ -40,7 +55,10 @@ def list_contacts_endpoint(
     company_name: Optional[str] = Query(None),
     limit: Optional[int] = Query(None),
     offset: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ):
     """List or search contacts for a tenant.
 
@@ -57,9 +75,19 @@ def list_contacts_endpoint(
         company_name=company_name,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[ContactOut] = validate_items(ContactOut, contacts)
+    return PaginationEnvelope[ContactOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
-    items: List[ContactOut] = [ContactOut.model_validate(c, from_attributes=True) for c in contacts]
-    return PaginationEnvelope[ContactOut](items=items, total=total, limit=limit, offset=offset)
 
 
 @router.post("/", response_model=ContactOut, status_code=status.HTTP_201_CREATED)
@@ -80,17 +108,117 @@ def create_contact_endpoint(
     return ContactOut.model_validate(contact, from_attributes=True)
 
 
-@router.get("/{contact_id}", response_model=ContactOut)
+@router.post("/import", response_model=BulkImportResult)
+async def import_contacts_endpoint(
+    tenant_id: UUID,
+    request: Request,
+    format: Optional[str] = Query(
+        default=None,
+        description="ndjson or csv; defaults from the Content-Type header",
+    ),
+    db: Session = Depends(get_db),
+    x_user: str | None = Query(default=None),
+):
+    """Bulk import contacts from an NDJSON or CSV upload.
+
+    Each row uses the contact create schema; CSV columns ``phones``,
+    ``emails``, ``addresses``, ``social_profiles`` and ``notes`` hold
+    JSON arrays.  Invalid rows are reported and skipped.
+    """
+    fmt = import_format(request, format)
+
+    def _run() -> BulkImportResult:
+        return contact_import_service.import_contacts(
+            db,
+            tenant_id=tenant_id,
+            lines=iter_lines(request_body_chunks(request)),
+            fmt=fmt,
+            created_by=x_user or "anonymous",
+        )
+
+    return await run_in_threadpool(_run)
+
+
+@router.get("/export")
+def export_contacts_endpoint(
+    tenant_id: UUID,
+    request: Request,
+    format: Optional[str] = Query(
+        default=None,
+        description="ndjson or csv; defaults from the Accept header",
+    ),
+    gzip: bool = Query(default=False, description="gzip-compress the stream"),
+    session_factory: sessionmaker = Depends(get_reporting_session_factory),
+):
+    """Stream all contacts of the tenant as NDJSON or CSV."""
+    return export_response(
+        request, session_factory, contact_service.EXPORT_SPEC, tenant_id=tenant_id, format=format, gzip=gzip
+    )
+
+
 def get_contact_endpoint(
     tenant_id: UUID,
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Retrieve a contact by ID within the tenant."""
-    contact = contact_service.get_contact(db, tenant_id=tenant_id, contact_id=contact_id)
+    contact = contact_service.get_contact(
+        db, tenant_id=tenant_id, contact_id=contact_id, snapshot=True
+    )
     return ContactOut.model_validate(contact, from_attributes=True)
 
 
+async def get_contact_endpoint_async(
+    tenant_id: UUID,
+    contact_id: UUID,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """Async variant of :func:`get_contact_endpoint` (asyncpg engine)."""
+    contact = await contact_service.get_contact_async(
+        db, tenant_id=tenant_id, contact_id=contact_id, snapshot=True
+    )
+    return ContactOut.model_validate(contact, from_attributes=True)
+
+
+# The async handler is served when the asyncpg engine is enabled; the
+# sync handler on the threadpool remains the fallback.
+router.add_api_route(
+    "/{contact_id}",
+    get_contact_endpoint_async if async_db_enabled() else get_contact_endpoint,
+    methods=["GET"],
+    response_model=ContactOut,
+    name="get_contact_endpoint",
+    dependencies=[
+        etag_guard(
+            contact_service.get_contact_version,
+            "contact_id",
+            use_async=async_db_enabled(),
+        )
+    ],
+)
+
+
+@router.patch("/", response_model=BulkPatchResult)
+def bulk_patch_contacts_endpoint(
+    tenant_id: UUID,
+    items: List[BulkPatchItem],
+    db: Session = Depends(get_db),
+    x_user: str | None = Query(default=None),
+):
+    """Apply a JSON Patch document to each of many contacts.
+
+    The body is a list of ``{"id": ..., "patch": {"operations": [...]}}``
+    items.  Items that fail are reported in the result and do not
+    abort the others.
+    """
+    return contact_service.bulk_patch_contacts(
+        db,
+        tenant_id=tenant_id,
+        items=items,
+        updated_by=x_user or "anonymous",
+    )
+
+
 @router.patch("/{contact_id}", response_model=ContactOut)
 def patch_contact_endpoint(
     tenant_id: UUID,
@@ -14,13 +14,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.csat_survey import (
     AdminCreateCsatSurvey,
     CsatSurveyUpdate,
     CsatSurveyOut,
 )
 from app.domain.services import csat_survey_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -39,7 +40,7 @@ def list_csat_surveys_admin_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CsatSurveyOut]:
     """List CSAT surveys across tenants with optional tenant and active filters."""
     surveys, _ = csat_survey_service.list_csat_surveys(
@@ -49,7 +50,7 @@ def list_csat_surveys_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [CsatSurveyOut.model_validate(s, from_attributes=True) for s in surveys]
+    return validate_items(CsatSurveyOut, surveys)
 
 
 @router.post("", response_model=CsatSurveyOut, status_code=status.HTTP_201_CREATED)
@@ -75,7 +76,7 @@ def get_csat_survey_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the survey to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CsatSurveyOut:
     """Retrieve a CSAT survey via the admin API."""
     survey = csat_survey_service.get_csat_survey(
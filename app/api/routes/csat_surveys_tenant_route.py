@@ -14,13 +14,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.csat_survey import (
     TenantCreateCsatSurvey,
     CsatSurveyUpdate,
     CsatSurveyOut,
 )
 from app.domain.services import csat_survey_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -37,7 +38,7 @@ def list_csat_surveys_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CsatSurveyOut]:
     """List CSAT surveys for a tenant with optional active filter and pagination."""
     surveys, _ = csat_survey_service.list_csat_surveys(
@@ -47,7 +48,7 @@ def list_csat_surveys_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [CsatSurveyOut.model_validate(s, from_attributes=True) for s in surveys]
+    return validate_items(CsatSurveyOut, surveys)
 
 
 @router.post("", response_model=CsatSurveyOut, status_code=status.HTTP_201_CREATED)
@@ -72,7 +73,7 @@ def create_csat_survey_endpoint(
 def get_csat_survey_endpoint(
     tenant_id: UUID,
     survey_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CsatSurveyOut:
     """Retrieve a CSAT survey by ID within a tenant."""
     survey = csat_survey_service.get_csat_survey(
@@ -14,7 +14,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import (
     deal_service,
@@ -30,7 +30,7 @@ router = APIRouter(prefix="/deals", tags=["deals"])
 def list_deals(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[schemas.DealRead]:
     """List all deals for a given tenant."""
     return deal_service.list_deals(db, tenant_id)
@@ -46,12 +46,13 @@ def create_deal(
 ) -> schemas.DealRead:
     """Create a new deal after validating pipeline and stage."""
     # Validate pipeline belongs to tenant
-    pipeline = pipeline_service.get_pipeline(db, deal_in.pipeline_id, tenant_id)
-    if not pipeline:
+    if not pipeline_service.pipeline_exists(db, tenant_id=tenant_id, pipeline_id=deal_in.pipeline_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pipeline not found")
     # Validate stage exists and belongs to same pipeline
-    stage = pipeline_stage_service.get_stage(db, deal_in.stage_id)
-    if not stage or stage.pipeline_id != deal_in.pipeline_id:
+    stage_pipeline_id = pipeline_stage_service.get_stage_pipeline_id(
+        db, tenant_id=tenant_id, stage_id=deal_in.stage_id
+    )
+    if stage_pipeline_id != deal_in.pipeline_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stage not found in pipeline")
     deal = deal_service.create_deal(db, tenant_id, user_id, deal_in)
     return deal
@@ -62,7 +63,7 @@ def get_deal(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
     deal_id: UUID = Path(..., description="Deal ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.DealRead:
     """Retrieve a deal by ID."""
     deal = deal_service.get_deal(db, deal_id, tenant_id)
@@ -88,12 +89,13 @@ def update_deal(
     new_pipeline_id = deal_in.pipeline_id or deal_obj.pipeline_id
     new_stage_id = deal_in.stage_id or deal_obj.stage_id
     # Check pipeline belongs to tenant
-    pipeline = pipeline_service.get_pipeline(db, new_pipeline_id, tenant_id)
-    if not pipeline:
+    if not pipeline_service.pipeline_exists(db, tenant_id=tenant_id, pipeline_id=new_pipeline_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pipeline not found")
     # Check stage belongs to pipeline
-    stage = pipeline_stage_service.get_stage(db, new_stage_id)
-    if not stage or stage.pipeline_id != new_pipeline_id:
+    stage_pipeline_id = pipeline_stage_service.get_stage_pipeline_id(
+        db, tenant_id=tenant_id, stage_id=new_stage_id
+    )
+    if stage_pipeline_id != new_pipeline_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stage not found in pipeline")
     updated = deal_service.update_deal(db, deal_obj, user_id, deal_in)
     return updated
@@ -11,16 +11,18 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response, status
+from sqlalchemy.orm import Session, sessionmaker
 
 import app.domain.services.deal_service as deal_service
 import app.domain.services.pipeline_service as pipeline_service
 import app.domain.services.pipeline_stage_service as pipeline_stage_service
 
+from app.api.export import export_response
 from app.domain.schemas.deal import DealCreate, DealUpdate, DealRead
-from app.domain.schemas.common import PaginationEnvelope
-from app.core.db import get_db
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.core.db import get_db, get_read_db, get_reporting_session_factory
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 router = APIRouter(
     prefix="/tenants/{tenant_id}/deals",
@@ -36,7 +38,10 @@ def list_deals_tenant(
     stage_id: Optional[UUID] = Query(None, description="Optional stage ID filter"),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[DealRead]:
     """List or search deals for a single tenant with optional filters and pagination."""
     deals, total = deal_service.service_list_deals(
@@ -46,9 +51,36 @@ def list_deals_tenant(
         stage_id=stage_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[DealRead] = validate_items(DealRead, deals)
+    return PaginationEnvelope[DealRead](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
+    )
+
+
+@router.get("/export")
+def export_deals_endpoint(
+    tenant_id: UUID,
+    request: Request,
+    format: Optional[str] = Query(
+        default=None,
+        description="ndjson or csv; defaults from the Accept header",
+    ),
+    gzip: bool = Query(default=False, description="gzip-compress the stream"),
+    session_factory: sessionmaker = Depends(get_reporting_session_factory),
+):
+    """Stream all deals of the tenant as NDJSON or CSV."""
+    return export_response(
+        request, session_factory, deal_service.EXPORT_SPEC, tenant_id=tenant_id, format=format, gzip=gzip
     )
-    items: List[DealRead] = [DealRead.model_validate(dl, from_attributes=True) for dl in deals]
-    return PaginationEnvelope[DealRead](items=items, total=total, limit=limit, offset=offset)
 
 
 @router.post("/", response_model=DealRead, status_code=status.HTTP_201_CREATED)
@@ -66,12 +98,13 @@ def create_deal_tenant(
     ``X-User`` header.
     """
     # Validate pipeline belongs to tenant
-    pipeline = pipeline_service.get_pipeline(db, deal_in.pipeline_id, tenant_id)
-    if not pipeline:
+    if not pipeline_service.pipeline_exists(db, tenant_id=tenant_id, pipeline_id=deal_in.pipeline_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pipeline not found")
     # Validate stage exists and belongs to the specified pipeline
-    stage = pipeline_stage_service.get_stage(db, deal_in.stage_id)
-    if not stage or stage.pipeline_id != deal_in.pipeline_id:
+    stage_pipeline_id = pipeline_stage_service.get_stage_pipeline_id(
+        db, tenant_id=tenant_id, stage_id=deal_in.stage_id
+    )
+    if stage_pipeline_id != deal_in.pipeline_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stage not found in pipeline")
     created_user = x_user or "anonymous"
     deal = deal_service.service_create_deal(
@@ -104,12 +137,13 @@ def update_deal_tenant(
     new_pipeline_id = deal_in.pipeline_id or current_deal.pipeline_id
     new_stage_id = deal_in.stage_id or current_deal.stage_id
     # Validate pipeline belongs to tenant
-    pipeline = pipeline_service.get_pipeline(db, new_pipeline_id, tenant_id)
-    if not pipeline:
+    if not pipeline_service.pipeline_exists(db, tenant_id=tenant_id, pipeline_id=new_pipeline_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pipeline not found")
     # Validate stage belongs to the pipeline
-    stage = pipeline_stage_service.get_stage(db, new_stage_id)
-    if not stage or stage.pipeline_id != new_pipeline_id:
+    stage_pipeline_id = pipeline_stage_service.get_stage_pipeline_id(
+        db, tenant_id=tenant_id, stage_id=new_stage_id
+    )
+    if stage_pipeline_id != new_pipeline_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stage not found in pipeline")
     modified_user = x_user or "anonymous"
     updated = deal_service.service_update_deal(
@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.group_profile_service import (
     list_group_profiles as service_list_group_profiles,
     create_group_profile as service_create_group_profile,
@@ -31,7 +31,8 @@ from app.domain.schemas.group_profile import (
     GroupProfileUpdate,
     GroupProfileOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -51,7 +52,10 @@ def list_group_profiles_admin(
     is_support_queue: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[GroupProfileOut]:
     """List or search group profiles across tenants.
 
@@ -67,12 +71,18 @@ def list_group_profiles_admin(
         is_support_queue=is_support_queue,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[GroupProfileOut] = [
-        GroupProfileOut.model_validate(p, from_attributes=True) for p in profiles
-    ]
+    items: List[GroupProfileOut] = validate_items(GroupProfileOut, profiles)
     return PaginationEnvelope[GroupProfileOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -135,7 +145,7 @@ def get_group_profile_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the group profile to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> GroupProfileOut:
     """Retrieve a group profile across tenants.
 
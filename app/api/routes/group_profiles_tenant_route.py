@@ -16,14 +16,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services import group_profile_service  # for mypy namespace support
 from app.domain.schemas.group_profile import (
     TenantCreateGroupProfile,
     GroupProfileUpdate,
     GroupProfileOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -39,7 +40,10 @@ def list_group_profiles_endpoint(
     is_support_queue: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[GroupProfileOut]:
     """List group profiles for a tenant with optional filters.
 
@@ -55,12 +59,18 @@ def list_group_profiles_endpoint(
         is_support_queue=is_support_queue,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[GroupProfileOut] = [
-        GroupProfileOut.model_validate(p, from_attributes=True) for p in profiles
-    ]
+    items: List[GroupProfileOut] = validate_items(GroupProfileOut, profiles)
     return PaginationEnvelope[GroupProfileOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -122,10 +132,9 @@ def get_group_profile_endpoint(
     Raises 404 if the profile does not exist or does not belong to
     the tenant.
     """
-    profile = group_profile_service.get_group_profile(
+    return group_profile_service.get_group_profile_config(
         db, tenant_id=tenant_id, profile_id=profile_id
     )
-    return GroupProfileOut.model_validate(profile, from_attributes=True)
 
 
 @router.delete("/{profile_id}", status_code=status.HTTP_204_NO_CONTENT)
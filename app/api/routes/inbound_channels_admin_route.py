@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.inbound_channel_service import (
     list_inbound_channels as service_list_inbound_channels,
     create_inbound_channel as service_create_inbound_channel,
@@ -31,7 +31,8 @@ from app.domain.schemas.inbound_channel import (
     InboundChannelUpdate,
     InboundChannelOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -51,7 +52,10 @@ def list_inbound_channels_admin(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[InboundChannelOut]:
     """List or search inbound channels across tenants.
 
@@ -67,12 +71,18 @@ def list_inbound_channels_admin(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[InboundChannelOut] = [
-        InboundChannelOut.model_validate(c, from_attributes=True) for c in channels
-    ]
+    items: List[InboundChannelOut] = validate_items(InboundChannelOut, channels)
     return PaginationEnvelope[InboundChannelOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -135,7 +145,7 @@ def get_inbound_channel_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the inbound channel to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> InboundChannelOut:
     """Retrieve an inbound channel across tenants.
 
@@ -16,7 +16,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services import inbound_channel_service  # for mypy namespace support
 
 from app.domain.schemas.inbound_channel import (
@@ -24,7 +24,8 @@ from app.domain.schemas.inbound_channel import (
     InboundChannelUpdate,
     InboundChannelOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -40,7 +41,10 @@ def list_inbound_channels_endpoint(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[InboundChannelOut]:
     """List inbound channels for a tenant with optional filters.
 
@@ -56,12 +60,18 @@ def list_inbound_channels_endpoint(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[InboundChannelOut] = [
-        InboundChannelOut.model_validate(c, from_attributes=True) for c in channels
-    ]
+    items: List[InboundChannelOut] = validate_items(InboundChannelOut, channels)
     return PaginationEnvelope[InboundChannelOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -116,7 +126,7 @@ def update_inbound_channel_endpoint(
 def get_inbound_channel_endpoint(
     tenant_id: UUID,
     channel_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> InboundChannelOut:
     """Retrieve a single inbound channel by ID within a tenant.
 
@@ -15,12 +15,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_article_feedback import (
     AdminCreateKbArticleFeedback,
     KbArticleFeedbackOut,
 )
 from app.domain.services import kb_article_feedback_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -39,7 +40,7 @@ def list_kb_article_feedback_admin_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbArticleFeedbackOut]:
     """List knowledge base article feedback across tenants with optional filters."""
     feedback_entries, _ = kb_article_feedback_service.list_kb_article_feedback(
@@ -49,7 +50,7 @@ def list_kb_article_feedback_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [KbArticleFeedbackOut.model_validate(f, from_attributes=True) for f in feedback_entries]
+    return validate_items(KbArticleFeedbackOut, feedback_entries)
 
 
 @router.post("", response_model=KbArticleFeedbackOut, status_code=status.HTTP_201_CREATED)
@@ -75,7 +76,7 @@ def get_kb_article_feedback_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the feedback to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbArticleFeedbackOut:
     """Retrieve an article feedback entry via the admin API."""
     feedback = kb_article_feedback_service.get_kb_article_feedback(
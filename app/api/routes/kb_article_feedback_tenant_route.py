@@ -14,12 +14,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_article_feedback import (
     TenantCreateKbArticleFeedback,
     KbArticleFeedbackOut,
 )
 from app.domain.services import kb_article_feedback_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -32,7 +33,7 @@ router = APIRouter(
 def list_kb_article_feedback_tenant_endpoint(
     tenant_id: UUID = Path(..., description="Tenant ID"),
     article_id: UUID = Path(..., description="Article ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbArticleFeedbackOut]:
     """List feedback entries for a specific article within a tenant."""
     feedback_entries, _ = kb_article_feedback_service.list_kb_article_feedback(
@@ -40,7 +41,7 @@ def list_kb_article_feedback_tenant_endpoint(
         tenant_id=tenant_id,
         kb_article_id=article_id,
     )
-    return [KbArticleFeedbackOut.model_validate(f, from_attributes=True) for f in feedback_entries]
+    return validate_items(KbArticleFeedbackOut, feedback_entries)
 
 
 @router.post("", response_model=KbArticleFeedbackOut, status_code=status.HTTP_201_CREATED)
@@ -70,7 +71,7 @@ def get_kb_article_feedback_tenant_endpoint(
     tenant_id: UUID = Path(..., description="Tenant ID"),
     article_id: UUID = Path(..., description="Article ID"),
     feedback_id: UUID = Path(..., description="Feedback ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbArticleFeedbackOut:
     """Retrieve a specific feedback entry within a tenant."""
     feedback = kb_article_feedback_service.get_kb_article_feedback(
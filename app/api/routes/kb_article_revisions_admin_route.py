@@ -15,12 +15,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_article_revision import (
     AdminCreateKbArticleRevision,
     KbArticleRevisionOut,
 )
 from app.domain.services import kb_article_revision_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -39,7 +40,7 @@ def list_kb_article_revisions_admin_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbArticleRevisionOut]:
     """List knowledge base article revisions across tenants with optional filters."""
     revisions, _ = kb_article_revision_service.list_kb_article_revisions(
@@ -49,7 +50,7 @@ def list_kb_article_revisions_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [KbArticleRevisionOut.model_validate(r, from_attributes=True) for r in revisions]
+    return validate_items(KbArticleRevisionOut, revisions)
 
 
 @router.post("", response_model=KbArticleRevisionOut, status_code=status.HTTP_201_CREATED)
@@ -75,7 +76,7 @@ def get_kb_article_revision_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the revision to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbArticleRevisionOut:
     """Retrieve an article revision via the admin API."""
     revision = kb_article_revision_service.get_kb_article_revision(
@@ -14,12 +14,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_article_revision import (
     TenantCreateKbArticleRevision,
     KbArticleRevisionOut,
 )
 from app.domain.services import kb_article_revision_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -32,7 +33,7 @@ router = APIRouter(
 def list_kb_article_revisions_tenant_endpoint(
     tenant_id: UUID = Path(..., description="Tenant ID"),
     article_id: UUID = Path(..., description="Article ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbArticleRevisionOut]:
     """List revisions for a specific article within a tenant."""
     revisions, _ = kb_article_revision_service.list_kb_article_revisions(
@@ -40,7 +41,7 @@ def list_kb_article_revisions_tenant_endpoint(
         tenant_id=tenant_id,
         kb_article_id=article_id,
     )
-    return [KbArticleRevisionOut.model_validate(r, from_attributes=True) for r in revisions]
+    return validate_items(KbArticleRevisionOut, revisions)
 
 
 @router.post("", response_model=KbArticleRevisionOut, status_code=status.HTTP_201_CREATED)
@@ -70,7 +71,7 @@ def get_kb_article_revision_tenant_endpoint(
     tenant_id: UUID = Path(..., description="Tenant ID"),
     article_id: UUID = Path(..., description="Article ID"),
     revision_id: UUID = Path(..., description="Revision ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbArticleRevisionOut:
     """Retrieve a specific article revision within a tenant."""
     revision = kb_article_revision_service.get_kb_article_revision(
@@ -15,13 +15,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, Path, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_article import (
     AdminCreateKbArticle,
     KbArticleUpdate,
     KbArticleOut,
 )
 from app.domain.services import kb_article_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -40,7 +41,7 @@ def list_kb_articles_admin_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbArticleOut]:
     """List knowledge base articles across tenants with optional filters."""
     articles, _ = kb_article_service.list_kb_articles(
@@ -50,7 +51,7 @@ def list_kb_articles_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [KbArticleOut.model_validate(a, from_attributes=True) for a in articles]
+    return validate_items(KbArticleOut, articles)
 
 
 @router.post("", response_model=KbArticleOut, status_code=status.HTTP_201_CREATED)
@@ -76,7 +77,7 @@ def get_kb_article_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the article to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbArticleOut:
     """Retrieve a knowledge base article via the admin API."""
     article = kb_article_service.get_kb_article(
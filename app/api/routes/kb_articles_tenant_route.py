@@ -15,13 +15,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.api.etag import etag_guard
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_article import (
     TenantCreateKbArticle,
     KbArticleUpdate,
     KbArticleOut,
 )
 from app.domain.services import kb_article_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -38,7 +40,7 @@ def list_kb_articles_tenant_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbArticleOut]:
     """List knowledge base articles for a tenant, optionally filtered by section."""
     articles, _ = kb_article_service.list_kb_articles(
@@ -48,7 +50,7 @@ def list_kb_articles_tenant_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [KbArticleOut.model_validate(a, from_attributes=True) for a in articles]
+    return validate_items(KbArticleOut, articles)
 
 
 @router.post("", response_model=KbArticleOut, status_code=status.HTTP_201_CREATED)
@@ -69,11 +71,15 @@ def create_kb_article_tenant_endpoint(
     return KbArticleOut.model_validate(article, from_attributes=True)
 
 
-@router.get("/{article_id}", response_model=KbArticleOut)
+@router.get(
+    "/{article_id}",
+    response_model=KbArticleOut,
+    dependencies=[etag_guard(kb_article_service.get_kb_article_version, "article_id")],
+)
 def get_kb_article_tenant_endpoint(
     tenant_id: UUID = Path(..., description="Tenant ID"),
     article_id: UUID = Path(..., description="Article ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbArticleOut:
     """Retrieve a knowledge base article within a tenant."""
     article = kb_article_service.get_kb_article(
@@ -16,13 +16,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, Path, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_category import (
     AdminCreateKbCategory,
     KbCategoryUpdate,
     KbCategoryOut,
 )
 from app.domain.services import kb_category_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -38,7 +39,7 @@ def list_kb_categories_admin_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbCategoryOut]:
     """List knowledge base categories across tenants with optional tenant filter."""
     categories, _ = kb_category_service.list_kb_categories(
@@ -47,7 +48,7 @@ def list_kb_categories_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [KbCategoryOut.model_validate(c, from_attributes=True) for c in categories]
+    return validate_items(KbCategoryOut, categories)
 
 
 @router.post("", response_model=KbCategoryOut, status_code=status.HTTP_201_CREATED)
@@ -73,7 +74,7 @@ def get_kb_category_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the category to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbCategoryOut:
     """Retrieve a knowledge base category via the admin API."""
     category = kb_category_service.get_kb_category(
@@ -14,13 +14,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_category import (
     TenantCreateKbCategory,
     KbCategoryUpdate,
     KbCategoryOut,
 )
 from app.domain.services import kb_category_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -34,13 +35,13 @@ def list_kb_categories_tenant_endpoint(
     tenant_id: UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbCategoryOut]:
     """List knowledge base categories for a tenant."""
     categories, _ = kb_category_service.list_kb_categories(
         db, tenant_id=tenant_id, limit=limit, offset=offset
     )
-    return [KbCategoryOut.model_validate(c, from_attributes=True) for c in categories]
+    return validate_items(KbCategoryOut, categories)
 
 
 @router.post("", response_model=KbCategoryOut, status_code=status.HTTP_201_CREATED)
@@ -65,7 +66,7 @@ def create_kb_category_tenant_endpoint(
 def get_kb_category_tenant_endpoint(
     tenant_id: UUID,
     category_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbCategoryOut:
     """Retrieve a knowledge base category within a tenant."""
     category = kb_category_service.get_kb_category(
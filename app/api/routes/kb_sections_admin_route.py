@@ -15,13 +15,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, Path, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_section import (
     AdminCreateKbSection,
     KbSectionUpdate,
     KbSectionOut,
 )
 from app.domain.services import kb_section_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -40,7 +41,7 @@ def list_kb_sections_admin_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbSectionOut]:
     """List knowledge base sections across tenants with optional filters."""
     sections, _ = kb_section_service.list_kb_sections(
@@ -50,7 +51,7 @@ def list_kb_sections_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [KbSectionOut.model_validate(s, from_attributes=True) for s in sections]
+    return validate_items(KbSectionOut, sections)
 
 
 @router.post("", response_model=KbSectionOut, status_code=status.HTTP_201_CREATED)
@@ -76,7 +77,7 @@ def get_kb_section_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the section to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbSectionOut:
     """Retrieve a knowledge base section via the admin API."""
     section = kb_section_service.get_kb_section(
@@ -15,13 +15,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.schemas.kb_section import (
     TenantCreateKbSection,
     KbSectionUpdate,
     KbSectionOut,
 )
 from app.domain.services import kb_section_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -38,7 +39,7 @@ def list_kb_sections_tenant_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[KbSectionOut]:
     """List knowledge base sections for a tenant, optionally filtered by category."""
     sections, _ = kb_section_service.list_kb_sections(
@@ -48,7 +49,7 @@ def list_kb_sections_tenant_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [KbSectionOut.model_validate(s, from_attributes=True) for s in sections]
+    return validate_items(KbSectionOut, sections)
 
 
 @router.post("", response_model=KbSectionOut, status_code=status.HTTP_201_CREATED)
@@ -73,7 +74,7 @@ def create_kb_section_tenant_endpoint(
 def get_kb_section_tenant_endpoint(
     tenant_id: UUID = Path(..., description="Tenant ID"),
     section_id: UUID = Path(..., description="Section ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> KbSectionOut:
     """Retrieve a knowledge base section within a tenant."""
     section = kb_section_service.get_kb_section(
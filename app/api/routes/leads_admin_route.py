@@ -20,9 +20,10 @@ import app.domain.services.lead_service as lead_service
 
 from app.domain.schemas.lead import CreateLead, UpdateLead, LeadOut
 from app.domain.schemas.json_patch import JsonPatchRequest
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -43,7 +44,10 @@ def list_leads_admin(
     email: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ):
     """List or search leads across tenants.
 
@@ -60,9 +64,19 @@ def list_leads_admin(
         email=email,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[LeadOut] = validate_items(LeadOut, leads)
+    return PaginationEnvelope[LeadOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
-    items: List[LeadOut] = [LeadOut.model_validate(ld, from_attributes=True) for ld in leads]
-    return PaginationEnvelope[LeadOut](items=items, total=total, limit=limit, offset=offset)
 
 
 @router.post("/", response_model=LeadOut, status_code=status.HTTP_201_CREATED)
@@ -21,9 +21,11 @@ import app.domain.services.lead_service as lead_service
 
 from app.domain.schemas.lead import CreateLead, UpdateLead, LeadOut
 from app.domain.schemas.json_patch import JsonPatchRequest
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.bulk_patch import BulkPatchItem, BulkPatchResult
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -41,7 +43,10 @@ def list_leads_endpoint(
     email: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ):
     """List or search leads for a tenant.
 
@@ -58,9 +63,19 @@ def list_leads_endpoint(
         email=email,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[LeadOut] = validate_items(LeadOut, leads)
+    return PaginationEnvelope[LeadOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
-    items: List[LeadOut] = [LeadOut.model_validate(ld, from_attributes=True) for ld in leads]
-    return PaginationEnvelope[LeadOut](items=items, total=total, limit=limit, offset=offset)
 
 
 @router.post("/", response_model=LeadOut, status_code=status.HTTP_201_CREATED)
@@ -86,6 +101,27 @@ def create_lead_endpoint(
     return LeadOut.model_validate(lead, from_attributes=True)
 
 
+@router.patch("/", response_model=BulkPatchResult)
+def bulk_patch_leads_endpoint(
+    tenant_id: UUID,
+    items: List[BulkPatchItem],
+    db: Session = Depends(get_db),
+    x_user: str | None = Query(default=None),
+):
+    """Apply a JSON Patch document to each of many leads.
+
+    The body is a list of ``{"id": ..., "patch": {"operations": [...]}}``
+    items.  Items that fail are reported in the result and do not
+    abort the others.
+    """
+    return lead_service.bulk_patch_leads(
+        db,
+        tenant_id=tenant_id,
+        items=items,
+        modified_user=x_user or "anonymous",
+    )
+
+
 @router.put("/{lead_id}", response_model=LeadOut)
 def update_lead_endpoint(
     tenant_id: UUID,
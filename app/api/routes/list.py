@@ -14,7 +14,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import list_service
 
@@ -26,7 +26,7 @@ router = APIRouter(prefix="/lists", tags=["lists"])
 def list_lists(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[schemas.ListRead]:
     """List all lists for the tenant."""
     return list(list_service.list_lists(db, tenant_id))
@@ -50,7 +50,7 @@ def get_list(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
     list_id: UUID = Path(..., description="List ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.ListRead:
     """Retrieve a list by ID."""
     lst = list_service.get_list(db, list_id, tenant_id)
@@ -14,7 +14,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import (
     list_service,
@@ -30,7 +30,7 @@ def list_memberships(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
     list_id: UUID = Path(..., description="List ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[schemas.ListMembershipRead]:
     """List all memberships for a list."""
     # Verify list exists for tenant
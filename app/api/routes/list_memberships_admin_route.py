@@ -21,9 +21,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import list_service, list_membership_service
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 # Parent router to aggregate collection and singleton sub‑routers
@@ -49,7 +50,10 @@ def list_memberships(
     offset: Optional[int] = Query(
         None, ge=0, description="Number of memberships to skip from the beginning"
     ),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[schemas.ListMembershipRead]:
     """List memberships for a list (admin context).
 
@@ -67,9 +71,17 @@ def list_memberships(
         list_id=list_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[schemas.ListMembershipRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -118,7 +130,7 @@ def get_membership(
     tenant_id: Optional[UUID] = Query(
         None, description="Tenant identifier for scoping; omit to ignore tenant filtering"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.ListMembershipRead:
     """Retrieve a membership by ID (admin context).
 
@@ -22,9 +22,10 @@ from fastapi import APIRouter, Depends, Header, HTTPException, Path, Response, s
 from fastapi import Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import list_service, list_membership_service
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 # Parent router for tenant list membership endpoints
@@ -44,7 +45,10 @@ def list_memberships(
     list_id: UUID = Path(..., description="List identifier"),
     limit: Optional[int] = Query(None, ge=1, description="Maximum number of memberships to return"),
     offset: Optional[int] = Query(None, ge=0, description="Number of memberships to skip"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[schemas.ListMembershipRead]:
     """List memberships for a list (tenant context).
 
@@ -61,9 +65,17 @@ def list_memberships(
         list_id=list_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[schemas.ListMembershipRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -108,7 +120,7 @@ def get_membership(
     *,
     tenant_id: UUID = Path(..., description="Tenant identifier"),
     membership_id: UUID = Path(..., description="Membership identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.ListMembershipRead:
     """Retrieve a membership by ID (tenant context).
 
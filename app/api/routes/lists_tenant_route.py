@@ -17,9 +17,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import list_service
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(prefix="/tenants/{tenant_id}/lists", tags=["lists"])
@@ -50,7 +51,10 @@ def list_lists(
     offset: Optional[int] = Query(
         None, ge=0, description="Number of lists to skip from the beginning"
     ),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[schemas.ListRead]:
     """List lists for a single tenant with optional filters and pagination."""
     items, total = list_service.service_list_lists(
@@ -63,9 +67,17 @@ def list_lists(
         is_archived=is_archived,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[schemas.ListRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -91,7 +103,7 @@ def get_list(
     *,
     tenant_id: UUID = Path(..., description="Tenant identifier"),
     list_id: UUID = Path(..., description="List identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.ListRead:
     """Retrieve a list within the tenant."""
     return list_service.service_get_list(
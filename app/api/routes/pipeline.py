@@ -12,7 +12,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import pipeline_service
 
@@ -23,7 +23,7 @@ router = APIRouter(prefix="/pipelines", tags=["pipelines"])
 @router.get("/", response_model=List[schemas.PipelineRead])
 def list_pipelines(
     tenant_id: UUID = Query(..., description="Tenant identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[schemas.PipelineRead]:
     return pipeline_service.list_pipelines(db, tenant_id)
 
@@ -45,7 +45,7 @@ def get_pipeline(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
     pipeline_id: UUID = Path(..., description="Pipeline ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.PipelineRead:
     pipeline = pipeline_service.get_pipeline(db, pipeline_id, tenant_id)
     if not pipeline:
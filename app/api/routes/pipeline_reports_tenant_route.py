@@ -0,0 +1,197 @@
+"""
+Tenant FastAPI routes for pipeline reports.
+
+The reports are read from the pipeline rollup tables, which are kept
+up to date as stage transitions are recorded and deals change, so each
+request aggregates a few rows per stage and day instead of the full
+stage history.  The forecast is computed by the vectorized forecast
+engine from a single columnar fetch of the tenant's deals; stage
+duration percentiles and deal aging are aggregated from the stage
+history with window functions.  Queries run on the reporting session.
+
+Period-based figures take an optional inclusive UTC ``start_date`` and
+``end_date``; without them the whole history is covered.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from sqlalchemy.orm import Session
+
+import app.domain.services.pipeline_forecast_service as forecast_service
+import app.domain.services.pipeline_rollup_service as rollup_service
+import app.domain.services.stage_duration_service as duration_service
+from app.core.db import get_reporting_db
+from app.domain.schemas.pipeline_report import (
+    DealAgingRow,
+    ForecastGroupBy,
+    ForecastRow,
+    PipelineOverviewRow,
+    StageConversionRow,
+    StageDurationRow,
+    StageFunnelRow,
+    StageVelocityRow,
+    WeightedPipelineRow,
+)
+
+
+router = APIRouter(
+    prefix="/tenants/{tenant_id}/reports/pipelines",
+    tags=["Pipeline Reports"],
+)
+
+
+def _check_period(start_date: Optional[date], end_date: Optional[date]) -> None:
+    if start_date is not None and end_date is not None and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The start of the period must not be after its end",
+        )
+
+
+@router.get("/overview", response_model=List[PipelineOverviewRow])
+def pipeline_overview(
+    *,
+    tenant_id: UUID = Path(..., description="Tenant ID"),
+    pipeline_id: Optional[UUID] = Query(None, description="Optional pipeline ID filter"),
+    db: Session = Depends(get_reporting_db),
+) -> List[PipelineOverviewRow]:
+    """Current deal count and amount per pipeline and stage state (OPEN, WON, LOST)."""
+    return rollup_service.pipeline_overview(db, tenant_id=tenant_id, pipeline_id=pipeline_id)
+
+
+@router.get("/weighted", response_model=List[WeightedPipelineRow])
+def weighted_pipeline(
+    *,
+    tenant_id: UUID = Path(..., description="Tenant ID"),
+    pipeline_id: Optional[UUID] = Query(None, description="Optional pipeline ID filter"),
+    db: Session = Depends(get_reporting_db),
+) -> List[WeightedPipelineRow]:
+    """Open deals per pipeline with their probability-weighted amount."""
+    return rollup_service.weighted_pipeline(db, tenant_id=tenant_id, pipeline_id=pipeline_id)
+
+
+@router.get("/forecast", response_model=List[ForecastRow])
+def pipeline_forecast(
+    *,
+    tenant_id: UUID = Path(..., description="Tenant ID"),
+    pipeline_id: Optional[UUID] = Query(None, description="Optional pipeline ID filter"),
+    group_by: List[ForecastGroupBy] = Query(
+        [], description="Dimensions to group by: owner, stage and/or close_month"
+    ),
+    start_month: Optional[date] = Query(None, description="Any day of the first close month"),
+    end_month: Optional[date] = Query(None, description="Any day of the last close month"),
+    commit_probability: float = Query(
+        forecast_service.DEFAULT_COMMIT_PROBABILITY, ge=0, le=1,
+        description="Minimum probability of deals in the commit scenario",
+    ),
+    best_case_probability: float = Query(
+        forecast_service.DEFAULT_BEST_CASE_PROBABILITY, ge=0, le=1,
+        description="Minimum probability of deals in the best-case scenario",
+    ),
+    db: Session = Depends(get_reporting_db),
+) -> List[ForecastRow]:
+    """Weighted pipeline, commit/best-case scenarios and won amounts per group."""
+    _check_period(start_month, end_month)
+    return forecast_service.forecast(
+        db,
+        tenant_id=tenant_id,
+        pipeline_id=pipeline_id,
+        group_by=group_by,
+        start_month=start_month,
+        end_month=end_month,
+        commit_probability=commit_probability,
+        best_case_probability=best_case_probability,
+    )
+
+
+@router.get("/{pipeline_id}/funnel", response_model=List[StageFunnelRow])
+def stage_funnel(
+    *,
+    tenant_id: UUID = Path(..., description="Tenant ID"),
+    pipeline_id: UUID = Path(..., description="Pipeline ID"),
+    start_date: Optional[date] = Query(None, description="First day of the period (UTC)"),
+    end_date: Optional[date] = Query(None, description="Last day of the period (UTC)"),
+    db: Session = Depends(get_reporting_db),
+) -> List[StageFunnelRow]:
+    """Current deals per stage and the entries into each stage in the period."""
+    _check_period(start_date, end_date)
+    return rollup_service.stage_funnel(
+        db, tenant_id=tenant_id, pipeline_id=pipeline_id, start_date=start_date, end_date=end_date
+    )
+
+
+@router.get("/{pipeline_id}/velocity", response_model=List[StageVelocityRow])
+def stage_velocity(
+    *,
+    tenant_id: UUID = Path(..., description="Tenant ID"),
+    pipeline_id: UUID = Path(..., description="Pipeline ID"),
+    start_date: Optional[date] = Query(None, description="First day of the period (UTC)"),
+    end_date: Optional[date] = Query(None, description="Last day of the period (UTC)"),
+    db: Session = Depends(get_reporting_db),
+) -> List[StageVelocityRow]:
+    """Entries, exits and average time in stage per stage in the period."""
+    _check_period(start_date, end_date)
+    return rollup_service.stage_velocity(
+        db, tenant_id=tenant_id, pipeline_id=pipeline_id, start_date=start_date, end_date=end_date
+    )
+
+
+@router.get("/{pipeline_id}/stage-durations", response_model=List[StageDurationRow])
+def stage_durations(
+    *,
+    tenant_id: UUID = Path(..., description="Tenant ID"),
+    pipeline_id: UUID = Path(..., description="Pipeline ID"),
+    start_date: Optional[date] = Query(None, description="First day of the period (UTC)"),
+    end_date: Optional[date] = Query(None, description="Last day of the period (UTC)"),
+    db: Session = Depends(get_reporting_db),
+) -> List[StageDurationRow]:
+    """p50/p90 time in stage of the stays that ended in the period and of the current stays."""
+    _check_period(start_date, end_date)
+    return duration_service.stage_durations(
+        db, tenant_id=tenant_id, pipeline_id=pipeline_id, start_date=start_date, end_date=end_date
+    )
+
+
+@router.get("/{pipeline_id}/aging", response_model=List[DealAgingRow])
+def deal_aging(
+    *,
+    tenant_id: UUID = Path(..., description="Tenant ID"),
+    pipeline_id: UUID = Path(..., description="Pipeline ID"),
+    threshold_days: float = Query(
+        duration_service.DEFAULT_AGING_THRESHOLD_DAYS, gt=0,
+        description="Days in stage after which an open deal is at risk",
+    ),
+    cycle_threshold_days: Optional[float] = Query(
+        None, gt=0, description="Days since creation after which an open deal is at risk"
+    ),
+    db: Session = Depends(get_reporting_db),
+) -> List[DealAgingRow]:
+    """Age of the open deals per open stage and the deals at risk."""
+    return duration_service.deal_aging(
+        db,
+        tenant_id=tenant_id,
+        pipeline_id=pipeline_id,
+        threshold_days=threshold_days,
+        cycle_threshold_days=cycle_threshold_days,
+    )
+
+
+@router.get("/{pipeline_id}/conversion", response_model=List[StageConversionRow])
+def stage_conversion(
+    *,
+    tenant_id: UUID = Path(..., description="Tenant ID"),
+    pipeline_id: UUID = Path(..., description="Pipeline ID"),
+    start_date: Optional[date] = Query(None, description="First day of the period (UTC)"),
+    end_date: Optional[date] = Query(None, description="Last day of the period (UTC)"),
+    db: Session = Depends(get_reporting_db),
+) -> List[StageConversionRow]:
+    """Stage-to-stage movements in the period and their rate of the source stage's entries."""
+    _check_period(start_date, end_date)
+    return rollup_service.stage_conversion(
+        db, tenant_id=tenant_id, pipeline_id=pipeline_id, start_date=start_date, end_date=end_date
+    )
@@ -14,7 +14,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import pipeline_stage_service
 from app.domain.services import pipeline_service
@@ -28,7 +28,7 @@ def list_stages(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
     pipeline_id: UUID = Path(..., description="Pipeline ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[schemas.PipelineStageRead]:
     # Ensure pipeline exists within tenant
     pipeline = pipeline_service.get_pipeline(db, pipeline_id, tenant_id)
@@ -61,7 +61,7 @@ def get_stage(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier"),
     stage_id: UUID = Path(..., description="Stage ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.PipelineStageRead:
     stage = pipeline_stage_service.get_stage(db, stage_id)
     if not stage:
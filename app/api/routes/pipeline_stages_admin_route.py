@@ -26,10 +26,11 @@ from fastapi import APIRouter, Depends, Header, HTTPException, Path, Response, s
 from fastapi import Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.models.pipeline import Pipeline
 from app.domain.services import pipeline_stage_service
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 # Parent router
@@ -48,7 +49,10 @@ def list_stages(
     pipeline_id: UUID = Path(..., description="Pipeline identifier"),
     limit: Optional[int] = Query(None, ge=1, description="Maximum number of stages to return"),
     offset: Optional[int] = Query(None, ge=0, description="Number of stages to skip"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[schemas.PipelineStageRead]:
     """List stages for a pipeline (admin context).
 
@@ -63,9 +67,17 @@ def list_stages(
         pipeline_id=pipeline_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[schemas.PipelineStageRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -106,7 +118,7 @@ singleton_router = APIRouter(prefix="/admin/stages")
 def get_stage(
     *,
     stage_id: UUID = Path(..., description="Stage identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.PipelineStageRead:
     """Retrieve a stage by ID (admin context)."""
     stage = pipeline_stage_service.service_get_stage(db, stage_id=stage_id)
@@ -21,9 +21,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import pipeline_service
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(prefix="/admin/pipelines", tags=["pipelines"])
@@ -58,7 +59,10 @@ def list_pipelines(
         ge=0,
         description="Number of pipelines to skip",
     ),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[schemas.PipelineRead]:
     """List pipelines (admin context).
 
@@ -73,12 +77,17 @@ def list_pipelines(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[schemas.PipelineRead](
         items=items,
         total=total,
         limit=limit,
         offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -109,7 +118,7 @@ def get_pipeline(
     *,
     tenant_id: UUID = Query(..., description="Tenant identifier for scoping"),
     pipeline_id: UUID = Path(..., description="Pipeline identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.PipelineRead:
     """Retrieve a pipeline by ID (admin context)."""
     pipeline = pipeline_service.service_get_pipeline(
@@ -20,9 +20,10 @@ from fastapi import APIRouter, Depends, Header, HTTPException, Path, Response, s
 from fastapi import Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.services import pipeline_service
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(prefix="/tenants/{tenant_id}/pipelines", tags=["pipelines"])
@@ -54,7 +55,10 @@ def list_pipelines(
         ge=0,
         description="Number of pipelines to skip",
     ),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[schemas.PipelineRead]:
     """List pipelines for a tenant.
 
@@ -69,12 +73,17 @@ def list_pipelines(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[schemas.PipelineRead](
         items=items,
         total=total,
         limit=limit,
         offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -101,7 +110,7 @@ def get_pipeline(
     *,
     tenant_id: UUID = Path(..., description="Tenant identifier"),
     pipeline_id: UUID = Path(..., description="Pipeline identifier"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.PipelineRead:
     """Retrieve a pipeline by ID (tenant context)."""
     pipeline = pipeline_service.service_get_pipeline(
@@ -18,10 +18,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Path, Query, Response, status, HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.schemas.record_watcher import RecordWatcherCreate, RecordWatcherRead
 from app.domain.services import record_watcher_service
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 # Parent router for record watcher endpoints
@@ -46,7 +47,10 @@ def list_watchers_for_record(
     tenant_id: UUID = Query(..., description="Tenant identifier for scoping"),
     limit: Optional[int] = Query(None, ge=1, description="Maximum number of watchers to return"),
     offset: Optional[int] = Query(None, ge=0, description="Number of watchers to skip"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[RecordWatcherRead]:
     """List record watchers for a specific record (admin context).
 
@@ -60,9 +64,17 @@ def list_watchers_for_record(
         record_id=record_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[RecordWatcherRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size, id_attr="principal_id"),
     )
 
 
@@ -150,7 +162,10 @@ def list_watchers_for_principal(
     tenant_id: UUID = Query(..., description="Tenant identifier for scoping"),
     limit: Optional[int] = Query(None, ge=1, description="Maximum number of watchers to return"),
     offset: Optional[int] = Query(None, ge=0, description="Number of watchers to skip"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[RecordWatcherRead]:
     """List record watchers for a principal (admin context)."""
     items, total = record_watcher_service.service_list_watchers_by_principal(
@@ -160,9 +175,17 @@ def list_watchers_for_principal(
         principal_id=principal_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[RecordWatcherRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size, id_attr="record_id"),
     )
 
 
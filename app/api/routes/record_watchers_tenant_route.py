@@ -20,10 +20,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, HTTPException, Path, Response, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain import schemas
 from app.domain.schemas.record_watcher import RecordWatcherCreate, RecordWatcherRead
 from app.domain.services import record_watcher_service
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 # Parent router for tenant record watcher endpoints
@@ -48,7 +49,10 @@ def list_watchers(
     record_id: UUID = Path(..., description="Identifier of the record being watched"),
     limit: Optional[int] = Query(None, ge=1, description="Maximum number of watchers to return"),
     offset: Optional[int] = Query(None, ge=0, description="Number of watchers to skip"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> schemas.PaginationEnvelope[RecordWatcherRead]:
     """List watchers for a record (tenant context).
 
@@ -62,9 +66,17 @@ def list_watchers(
         record_id=record_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     return schemas.PaginationEnvelope[RecordWatcherRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size, id_attr="principal_id"),
     )
 
 
@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.sla_policy_service import (
     list_sla_policies as service_list_sla_policies,
     create_sla_policy as service_create_sla_policy,
@@ -31,7 +31,8 @@ from app.domain.schemas.sla_policy import (
     SlaPolicyUpdate,
     SlaPolicyOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -50,7 +51,10 @@ def list_sla_policies_admin(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[SlaPolicyOut]:
     """List or search SLA policies across tenants.
 
@@ -65,12 +69,18 @@ def list_sla_policies_admin(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[SlaPolicyOut] = [
-        SlaPolicyOut.model_validate(p, from_attributes=True) for p in policies
-    ]
+    items: List[SlaPolicyOut] = validate_items(SlaPolicyOut, policies)
     return PaginationEnvelope[SlaPolicyOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -133,7 +143,7 @@ def get_sla_policy_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the SLA policy to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> SlaPolicyOut:
     """Retrieve an SLA policy across tenants.
 
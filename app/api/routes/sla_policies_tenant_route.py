@@ -15,12 +15,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.sla_policy_service import (
     list_sla_policies as service_list_sla_policies,
     create_sla_policy as service_create_sla_policy,
     update_sla_policy as service_update_sla_policy,
-    get_sla_policy as service_get_sla_policy,
+    get_sla_policy_config as service_get_sla_policy_config,
     delete_sla_policy as service_delete_sla_policy,
 )
 from app.domain.schemas.sla_policy import (
@@ -28,7 +28,8 @@ from app.domain.schemas.sla_policy import (
     SlaPolicyUpdate,
     SlaPolicyOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -43,7 +44,10 @@ def list_sla_policies_endpoint(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[SlaPolicyOut]:
     """List SLA policies for a tenant with an optional active filter.
 
@@ -58,12 +62,18 @@ def list_sla_policies_endpoint(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[SlaPolicyOut] = [
-        SlaPolicyOut.model_validate(p, from_attributes=True) for p in policies
-    ]
+    items: List[SlaPolicyOut] = validate_items(SlaPolicyOut, policies)
     return PaginationEnvelope[SlaPolicyOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -125,8 +135,7 @@ def get_sla_policy_endpoint(
     Raises 404 if the policy does not exist or does not belong to
     the tenant.
     """
-    policy = service_get_sla_policy(db, tenant_id=tenant_id, policy_id=policy_id)
-    return SlaPolicyOut.model_validate(policy, from_attributes=True)
+    return service_get_sla_policy_config(db, tenant_id=tenant_id, policy_id=policy_id)
 
 
 @router.delete("/{policy_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.sla_target_service import (
     list_sla_targets as service_list_sla_targets,
     create_sla_target as service_create_sla_target,
@@ -31,7 +31,8 @@ from app.domain.schemas.sla_target import (
     SlaTargetUpdate,
     SlaTargetOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -51,7 +52,10 @@ def list_sla_targets_admin(
     priority: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[SlaTargetOut]:
     """List or search SLA targets across tenants.
 
@@ -68,12 +72,18 @@ def list_sla_targets_admin(
         priority=priority,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[SlaTargetOut] = [
-        SlaTargetOut.model_validate(t, from_attributes=True) for t in targets
-    ]
+    items: List[SlaTargetOut] = validate_items(SlaTargetOut, targets)
     return PaginationEnvelope[SlaTargetOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -136,7 +146,7 @@ def get_sla_target_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the SLA target to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> SlaTargetOut:
     """Retrieve an SLA target across tenants.
 
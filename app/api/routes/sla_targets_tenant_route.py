@@ -17,12 +17,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.sla_target_service import (
     list_sla_targets as service_list_sla_targets,
     create_sla_target as service_create_sla_target,
     update_sla_target as service_update_sla_target,
-    get_sla_target as service_get_sla_target,
+    get_sla_target_config as service_get_sla_target_config,
     delete_sla_target as service_delete_sla_target,
 )
 from app.domain.schemas.sla_target import (
@@ -30,7 +30,8 @@ from app.domain.schemas.sla_target import (
     SlaTargetUpdate,
     SlaTargetOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -46,7 +47,10 @@ def list_sla_targets_endpoint(
     priority: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[SlaTargetOut]:
     """List SLA targets for a tenant with optional policy and priority filters.
 
@@ -62,12 +66,18 @@ def list_sla_targets_endpoint(
         priority=priority,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[SlaTargetOut] = [
-        SlaTargetOut.model_validate(t, from_attributes=True) for t in targets
-    ]
+    items: List[SlaTargetOut] = validate_items(SlaTargetOut, targets)
     return PaginationEnvelope[SlaTargetOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -128,10 +138,9 @@ def get_sla_target_endpoint(
     Raises 404 if the target does not exist or does not belong to
     the tenant.
     """
-    target = service_get_sla_target(
+    return service_get_sla_target_config(
         db, tenant_id=tenant_id, target_id=target_id
     )
-    return SlaTargetOut.model_validate(target, from_attributes=True)
 
 
 @router.delete("/{target_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -17,8 +17,9 @@ from sqlalchemy.orm import Session
 
 import app.domain.services.stage_history_service as history_service
 from app.domain.schemas.stage_history import StageHistoryRead
-from app.domain.schemas.common import PaginationEnvelope
-from app.core.db import get_db
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.core.db import get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -35,7 +36,10 @@ def list_stage_history(
     entity_id: UUID = Path(..., description="Entity ID"),
     limit: Optional[int] = Query(None, description="Number of records to return"),
     offset: Optional[int] = Query(None, description="Records to skip before returning results"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[StageHistoryRead]:
     """List stage history records for the specified entity.
 
@@ -50,10 +54,16 @@ def list_stage_history(
         entity_id=entity_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[StageHistoryRead] = [
-        StageHistoryRead.model_validate(e, from_attributes=True) for e in entries
-    ]
+    items: List[StageHistoryRead] = validate_items(StageHistoryRead, entries)
     return PaginationEnvelope[StageHistoryRead](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size, sort_attr="changed_at"),
     )
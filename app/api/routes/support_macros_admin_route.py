@@ -17,7 +17,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.support_macro_service import (
     list_support_macros as service_list_support_macros,
     create_support_macro as service_create_support_macro,
@@ -30,7 +30,8 @@ from app.domain.schemas.support_macro import (
     SupportMacroUpdate,
     SupportMacroOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -49,7 +50,10 @@ def list_support_macros_admin(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[SupportMacroOut]:
     """List or search support macros across tenants.
 
@@ -64,12 +68,18 @@ def list_support_macros_admin(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[SupportMacroOut] = [
-        SupportMacroOut.model_validate(m, from_attributes=True) for m in macros
-    ]
+    items: List[SupportMacroOut] = validate_items(SupportMacroOut, macros)
     return PaginationEnvelope[SupportMacroOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -132,7 +142,7 @@ def get_support_macro_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the support macro to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> SupportMacroOut:
     """Retrieve a support macro across tenants.
 
@@ -16,14 +16,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services import support_macro_service
 from app.domain.schemas.support_macro import (
     TenantCreateSupportMacro,
     SupportMacroUpdate,
     SupportMacroOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -38,7 +39,10 @@ def list_support_macros_endpoint(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[SupportMacroOut]:
     """List support macros for a tenant with optional filters.
 
@@ -53,12 +57,18 @@ def list_support_macros_endpoint(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[SupportMacroOut] = [
-        SupportMacroOut.model_validate(m, from_attributes=True) for m in macros
-    ]
+    items: List[SupportMacroOut] = validate_items(SupportMacroOut, macros)
     return PaginationEnvelope[SupportMacroOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -113,7 +123,7 @@ def update_support_macro_endpoint(
 def get_support_macro_endpoint(
     tenant_id: UUID,
     macro_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> SupportMacroOut:
     """Retrieve a single support macro by ID within a tenant.
 
@@ -17,7 +17,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.support_view_service import (
     list_support_views as service_list_support_views,
     create_support_view as service_create_support_view,
@@ -30,7 +30,8 @@ from app.domain.schemas.support_view import (
     SupportViewUpdate,
     SupportViewOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -49,7 +50,10 @@ def list_support_views_admin(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[SupportViewOut]:
     """List or search support views across tenants.
 
@@ -64,12 +68,18 @@ def list_support_views_admin(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[SupportViewOut] = [
-        SupportViewOut.model_validate(v, from_attributes=True) for v in views
-    ]
+    items: List[SupportViewOut] = validate_items(SupportViewOut, views)
     return PaginationEnvelope[SupportViewOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -132,7 +142,7 @@ def get_support_view_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the support view to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> SupportViewOut:
     """Retrieve a support view across tenants.
 
@@ -3,7 +3,8 @@ Tenant‑scoped FastAPI routes for support views.
 
 These endpoints allow tenants to manage support views that define
 filters and sort orders for ticket lists.  Agents can create, update,
-retrieve, list and delete views within their tenant context.  Audit
+retrieve, list and delete views within their tenant context, and
+execute a view to fetch the tickets it selects.  Audit
 fields are populated using the ``X-User`` header when provided.
 """
 
@@ -15,14 +16,22 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import (
+    AsyncSession,
+    async_db_enabled,
+    get_async_read_db,
+    get_db,
+    get_read_db,
+)
 from app.domain.services import support_view_service
 from app.domain.schemas.support_view import (
     TenantCreateSupportView,
     SupportViewUpdate,
     SupportViewOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.ticket import TicketOut
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -37,7 +46,10 @@ def list_support_views_endpoint(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[SupportViewOut]:
     """List support views for a tenant with optional filters.
 
@@ -52,12 +64,18 @@ def list_support_views_endpoint(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[SupportViewOut] = [
-        SupportViewOut.model_validate(v, from_attributes=True) for v in views
-    ]
+    items: List[SupportViewOut] = validate_items(SupportViewOut, views)
     return PaginationEnvelope[SupportViewOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -112,7 +130,7 @@ def update_support_view_endpoint(
 def get_support_view_endpoint(
     tenant_id: UUID,
     view_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> SupportViewOut:
     """Retrieve a single support view by ID within a tenant.
 
@@ -125,6 +143,85 @@ def get_support_view_endpoint(
     return SupportViewOut.model_validate(view, from_attributes=True)
 
 
+def execute_support_view_endpoint(
+    tenant_id: UUID,
+    view_id: UUID,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
+) -> PaginationEnvelope[TicketOut]:
+    """Return the tickets matching a saved support view.
+
+    The view's filter and sort definitions are applied to the tenant's
+    tickets; results are paginated like the ticket list endpoint.
+    """
+    tickets, total = support_view_service.execute_support_view(
+        db,
+        tenant_id=tenant_id,
+        view_id=view_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[TicketOut] = validate_items(TicketOut, tickets)
+    return PaginationEnvelope[TicketOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
+    )
+
+
+async def execute_support_view_endpoint_async(
+    tenant_id: UUID,
+    view_id: UUID,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> PaginationEnvelope[TicketOut]:
+    """Async variant of :func:`execute_support_view_endpoint` (asyncpg engine)."""
+    tickets, total = await support_view_service.execute_support_view_async(
+        db,
+        tenant_id=tenant_id,
+        view_id=view_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    items: List[TicketOut] = validate_items(TicketOut, tickets)
+    return PaginationEnvelope[TicketOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
+    )
+
+
+# The async handler is served when the asyncpg engine is enabled; the
+# sync handler on the threadpool remains the fallback.
+router.add_api_route(
+    "/{view_id}/tickets",
+    execute_support_view_endpoint_async if async_db_enabled() else execute_support_view_endpoint,
+    methods=["GET"],
+    response_model=PaginationEnvelope[TicketOut],
+    name="execute_support_view_endpoint",
+)
+
+
 @router.delete("/{view_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_support_view_endpoint(
     tenant_id: UUID,
@@ -22,9 +22,10 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.domain.schemas.tenant_group_shadow import TenantGroupShadowOut
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 from app.domain.services import tenant_group_shadow_service  # noqa: F401
-from app.core.db import get_db
+from app.core.db import get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -40,7 +41,10 @@ def list_tenant_groups_endpoint(
     key: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TenantGroupShadowOut]:
     """List or search tenant group projections.
 
@@ -55,12 +59,18 @@ def list_tenant_groups_endpoint(
         key=key,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    out_items: List[TenantGroupShadowOut] = [
-        TenantGroupShadowOut.model_validate(g, from_attributes=True) for g in items
-    ]
+    out_items: List[TenantGroupShadowOut] = validate_items(TenantGroupShadowOut, items)
     return PaginationEnvelope[TenantGroupShadowOut](
-        items=out_items, total=total, limit=limit, offset=offset
+        items=out_items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(out_items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -68,7 +78,7 @@ def list_tenant_groups_endpoint(
 def get_tenant_group_endpoint(
     tenant_id: UUID,
     group_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TenantGroupShadowOut:
     """Retrieve a single tenant group projection by identifier.
 
@@ -21,9 +21,10 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.domain.schemas.tenant_user_shadow import CreateTenantUserShadow, TenantUserShadowOut
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
 from app.domain.services import tenant_user_shadow_service  # noqa: F401
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -39,7 +40,10 @@ def list_tenant_users_endpoint(
     email: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TenantUserShadowOut]:
     """List or search tenant user projections.
 
@@ -55,12 +59,18 @@ def list_tenant_users_endpoint(
         email=email,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    out_items: List[TenantUserShadowOut] = [
-        TenantUserShadowOut.model_validate(u, from_attributes=True) for u in items
-    ]
+    out_items: List[TenantUserShadowOut] = validate_items(TenantUserShadowOut, items)
     return PaginationEnvelope[TenantUserShadowOut](
-        items=out_items, total=total, limit=limit, offset=offset
+        items=out_items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(out_items, cursor=cursor, page_size=page_size, id_attr="user_id"),
     )
 
 
@@ -68,7 +78,7 @@ def list_tenant_users_endpoint(
 def get_tenant_user_endpoint(
     tenant_id: UUID,
     user_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TenantUserShadowOut:
     """Retrieve a single tenant user projection by identifier.
 
@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_ai_work_ref_service import (
     list_ticket_ai_work_refs as service_list_ai_work_refs,
     upsert_ticket_ai_work_ref as service_upsert_ai_work_ref,
@@ -29,7 +29,8 @@ from app.domain.schemas.ticket_ai_work_ref import (
     AdminUpsertTicketAiWorkRef,
     TicketAiWorkRefOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 import uuid
 
@@ -52,7 +53,10 @@ def list_ticket_ai_work_refs_admin(
     agent_key: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketAiWorkRefOut]:
     """List ticket AI work references across tenants.
 
@@ -67,12 +71,18 @@ def list_ticket_ai_work_refs_admin(
         agent_key=agent_key,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketAiWorkRefOut] = [
-        TicketAiWorkRefOut.model_validate(r, from_attributes=True) for r in refs
-    ]
+    items: List[TicketAiWorkRefOut] = validate_items(TicketAiWorkRefOut, refs)
     return PaginationEnvelope[TicketAiWorkRefOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size, sort_attr="requested_at"),
     )
 
 
@@ -111,7 +121,7 @@ def get_ticket_ai_work_ref_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the AI work reference to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketAiWorkRefOut:
     """Retrieve a ticket AI work reference across tenants.
 
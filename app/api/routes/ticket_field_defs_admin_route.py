@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_field_def_service import (
     list_ticket_field_defs as service_list_ticket_field_defs,
     create_ticket_field_def as service_create_ticket_field_def,
@@ -31,7 +31,8 @@ from app.domain.schemas.ticket_field_def import (
     TicketFieldDefUpdate,
     TicketFieldDefOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -51,7 +52,10 @@ def list_ticket_field_defs_admin(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketFieldDefOut]:
     """List or search ticket field definitions across tenants.
 
@@ -68,12 +72,18 @@ def list_ticket_field_defs_admin(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketFieldDefOut] = [
-        TicketFieldDefOut.model_validate(d, from_attributes=True) for d in defs
-    ]
+    items: List[TicketFieldDefOut] = validate_items(TicketFieldDefOut, defs)
     return PaginationEnvelope[TicketFieldDefOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -136,7 +146,7 @@ def get_ticket_field_def_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket field definition to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketFieldDefOut:
     """Retrieve a ticket field definition across tenants.
 
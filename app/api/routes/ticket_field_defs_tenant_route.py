@@ -16,12 +16,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_field_def_service import (
     list_ticket_field_defs as service_list_ticket_field_defs,
     create_ticket_field_def as service_create_ticket_field_def,
     update_ticket_field_def as service_update_ticket_field_def,
-    get_ticket_field_def as service_get_ticket_field_def,
+    get_ticket_field_def_config as service_get_ticket_field_def_config,
     delete_ticket_field_def as service_delete_ticket_field_def,
 )
 from app.domain.schemas.ticket_field_def import (
@@ -29,7 +29,8 @@ from app.domain.schemas.ticket_field_def import (
     TicketFieldDefUpdate,
     TicketFieldDefOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -45,7 +46,10 @@ def list_ticket_field_defs_endpoint(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketFieldDefOut]:
     """List ticket field definitions for a tenant with optional filters.
 
@@ -61,12 +65,18 @@ def list_ticket_field_defs_endpoint(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketFieldDefOut] = [
-        TicketFieldDefOut.model_validate(d, from_attributes=True) for d in defs
-    ]
+    items: List[TicketFieldDefOut] = validate_items(TicketFieldDefOut, defs)
     return PaginationEnvelope[TicketFieldDefOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -128,10 +138,9 @@ def get_ticket_field_def_endpoint(
     Raises 404 if the definition does not exist or does not belong to
     the tenant.
     """
-    defn = service_get_ticket_field_def(
+    return service_get_ticket_field_def_config(
         db, tenant_id=tenant_id, field_def_id=field_def_id
     )
-    return TicketFieldDefOut.model_validate(defn, from_attributes=True)
 
 
 @router.delete("/{field_def_id}", status_code=status.HTTP_204_NO_CONTENT)
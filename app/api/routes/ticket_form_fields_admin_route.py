@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_form_field_service import (
     list_ticket_form_fields as service_list_ticket_form_fields,
     create_ticket_form_field as service_create_ticket_form_field,
@@ -31,7 +31,8 @@ from app.domain.schemas.ticket_form_field import (
     TicketFormFieldUpdate,
     TicketFormFieldOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -50,7 +51,10 @@ def list_ticket_form_fields_admin_endpoint(
     ticket_field_def_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketFormFieldOut]:
     """List ticket form fields in an admin context with optional filters.
 
@@ -66,12 +70,18 @@ def list_ticket_form_fields_admin_endpoint(
         ticket_field_def_id=ticket_field_def_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketFormFieldOut] = [
-        TicketFormFieldOut.model_validate(f, from_attributes=True) for f in fields
-    ]
+    items: List[TicketFormFieldOut] = validate_items(TicketFormFieldOut, fields)
     return PaginationEnvelope[TicketFormFieldOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -133,7 +143,7 @@ def get_ticket_form_field_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket form field to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketFormFieldOut:
     """Retrieve a single ticket form field by ID via the admin API.
 
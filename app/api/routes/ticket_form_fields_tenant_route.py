@@ -17,12 +17,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_form_field_service import (
     list_ticket_form_fields as service_list_ticket_form_fields,
     create_ticket_form_field as service_create_ticket_form_field,
     update_ticket_form_field as service_update_ticket_form_field,
-    get_ticket_form_field as service_get_ticket_form_field,
+    get_ticket_form_field_config as service_get_ticket_form_field_config,
     delete_ticket_form_field as service_delete_ticket_form_field,
 )
 from app.domain.schemas.ticket_form_field import (
@@ -30,7 +30,8 @@ from app.domain.schemas.ticket_form_field import (
     TicketFormFieldUpdate,
     TicketFormFieldOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -46,7 +47,10 @@ def list_ticket_form_fields_endpoint(
     ticket_field_def_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketFormFieldOut]:
     """List ticket form fields for a tenant with optional filters.
 
@@ -62,12 +66,18 @@ def list_ticket_form_fields_endpoint(
         ticket_field_def_id=ticket_field_def_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketFormFieldOut] = [
-        TicketFormFieldOut.model_validate(f, from_attributes=True) for f in fields
-    ]
+    items: List[TicketFormFieldOut] = validate_items(TicketFormFieldOut, fields)
     return PaginationEnvelope[TicketFormFieldOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -129,10 +139,9 @@ def get_ticket_form_field_endpoint(
     Raises 404 if the association does not exist or does not belong to
     the tenant.
     """
-    form_field = service_get_ticket_form_field(
+    return service_get_ticket_form_field_config(
         db, tenant_id=tenant_id, form_field_id=form_field_id
     )
-    return TicketFormFieldOut.model_validate(form_field, from_attributes=True)
 
 
 @router.delete("/{form_field_id}", status_code=status.HTTP_204_NO_CONTENT)
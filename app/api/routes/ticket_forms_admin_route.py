@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_form_service import (
     list_ticket_forms as service_list_ticket_forms,
     create_ticket_form as service_create_ticket_form,
@@ -31,7 +31,8 @@ from app.domain.schemas.ticket_form import (
     TicketFormUpdate,
     TicketFormOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -50,7 +51,10 @@ def list_ticket_forms_admin(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketFormOut]:
     """List or search ticket forms across tenants.
 
@@ -65,12 +69,18 @@ def list_ticket_forms_admin(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketFormOut] = [
-        TicketFormOut.model_validate(f, from_attributes=True) for f in forms
-    ]
+    items: List[TicketFormOut] = validate_items(TicketFormOut, forms)
     return PaginationEnvelope[TicketFormOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -133,7 +143,7 @@ def get_ticket_form_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket form to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketFormOut:
     """Retrieve a ticket form across tenants.
 
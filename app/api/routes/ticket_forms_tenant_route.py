@@ -15,12 +15,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_form_service import (
     list_ticket_forms as service_list_ticket_forms,
     create_ticket_form as service_create_ticket_form,
     update_ticket_form as service_update_ticket_form,
-    get_ticket_form as service_get_ticket_form,
+    get_ticket_form_config as service_get_ticket_form_config,
     delete_ticket_form as service_delete_ticket_form,
 )
 from app.domain.schemas.ticket_form import (
@@ -28,7 +28,8 @@ from app.domain.schemas.ticket_form import (
     TicketFormUpdate,
     TicketFormOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -43,7 +44,10 @@ def list_ticket_forms_endpoint(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketFormOut]:
     """List ticket forms for a tenant with an optional active filter.
 
@@ -58,12 +62,18 @@ def list_ticket_forms_endpoint(
         is_active=is_active,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketFormOut] = [
-        TicketFormOut.model_validate(f, from_attributes=True) for f in forms
-    ]
+    items: List[TicketFormOut] = validate_items(TicketFormOut, forms)
     return PaginationEnvelope[TicketFormOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -125,10 +135,9 @@ def get_ticket_form_endpoint(
     Raises 404 if the form does not exist or does not belong to
     the tenant.
     """
-    form = service_get_ticket_form(
+    return service_get_ticket_form_config(
         db, tenant_id=tenant_id, form_id=form_id
     )
-    return TicketFormOut.model_validate(form, from_attributes=True)
 
 
 @router.delete("/{form_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -16,7 +16,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_sla_state_service import (
     list_ticket_sla_states as service_list_ticket_sla_states,
     update_ticket_sla_state as service_update_ticket_sla_state,
@@ -40,7 +40,7 @@ def get_ticket_sla_state_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to retrieve SLA state for"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketSlaStateOut:
     """Retrieve the SLA state for a ticket in an admin context.
 
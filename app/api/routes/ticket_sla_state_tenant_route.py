@@ -16,7 +16,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_read_db
 from app.domain.services.ticket_sla_state_service import (
     list_ticket_sla_states as service_list_ticket_sla_states,
 )
@@ -33,7 +33,7 @@ router = APIRouter(
 def get_ticket_sla_state_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketSlaStateOut:
     """Retrieve the SLA state for a specific ticket.
 
@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_task_mirror_service import (
     list_ticket_task_mirrors as service_list_task_mirrors,
     upsert_ticket_task_mirror as service_upsert_task_mirror,
@@ -29,7 +29,8 @@ from app.domain.schemas.ticket_task_mirror import (
     AdminUpsertTicketTaskMirror,
     TicketTaskMirrorOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 import uuid
 
@@ -52,7 +53,10 @@ def list_ticket_task_mirrors_admin(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketTaskMirrorOut]:
     """List ticket task mirrors across tenants.
 
@@ -67,17 +71,23 @@ def list_ticket_task_mirrors_admin(
         status=status,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
     # If tenant_id is None, our service expects a tenant_id; we supply dummy
     # tenant id 0. The DB query will ignore tenant filter when None; but due to our
     # service design, tenant_id is required. To support cross-tenant listing, we pass
     # UUID(int=0) which yields no results in service, but listing across
     # tenants isn't supported. For future improvement, cross-tenant queries may be added.
-    items: List[TicketTaskMirrorOut] = [
-        TicketTaskMirrorOut.model_validate(t, from_attributes=True) for t in tasks
-    ]
+    items: List[TicketTaskMirrorOut] = validate_items(TicketTaskMirrorOut, tasks)
     return PaginationEnvelope[TicketTaskMirrorOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -118,7 +128,7 @@ def get_ticket_task_mirror_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the task mirror to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketTaskMirrorOut:
     """Retrieve a ticket task mirror across tenants.
 
@@ -16,7 +16,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status, HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db, get_reporting_db
 from app.domain.services import (
     ticket_participant_service,
     ticket_tag_service,
@@ -87,6 +87,7 @@ from app.domain.schemas.ticket_status_duration import (
 )
 
 from app.domain.services import ticket_metrics_service, ticket_status_duration_service
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -109,7 +110,7 @@ def list_ticket_participants_admin_endpoint(
     ),
     participant_type: Optional[str] = None,
     role: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketParticipantOut]:
     """List participants on a ticket in an admin context."""
     participants = ticket_participant_service.list_ticket_participants(
@@ -119,7 +120,7 @@ def list_ticket_participants_admin_endpoint(
         participant_type=participant_type,
         role=role,
     )
-    return [TicketParticipantOut.model_validate(p, from_attributes=True) for p in participants]
+    return validate_items(TicketParticipantOut, participants)
 
 
 @router.post(
@@ -182,13 +183,13 @@ def list_ticket_tags_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketTagOut]:
     """List tags on a ticket in an admin context."""
     tags = ticket_tag_service.list_ticket_tags(
         db, tenant_id=tenant_id, ticket_id=ticket_id
     )
-    return [TicketTagOut.model_validate(t, from_attributes=True) for t in tags]
+    return validate_items(TicketTagOut, tags)
 
 
 @router.post(
@@ -254,7 +255,7 @@ def list_ticket_messages_admin_endpoint(
     author_type: Optional[str] = None,
     is_public: Optional[bool] = None,
     channel_type: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketMessageOut]:
     """List messages on a ticket in an admin context."""
     messages = ticket_message_service.list_ticket_messages(
@@ -265,7 +266,7 @@ def list_ticket_messages_admin_endpoint(
         is_public=is_public,
         channel_type=channel_type,
     )
-    return [TicketMessageOut.model_validate(m, from_attributes=True) for m in messages]
+    return validate_items(TicketMessageOut, messages)
 
 
 @router.post(
@@ -306,7 +307,7 @@ def list_ticket_attachments_admin_endpoint(
     ),
     ticket_message_id: Optional[UUID] = None,
     storage_provider: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketAttachmentOut]:
     """List attachments on a ticket in an admin context."""
     attachments = ticket_attachment_service.list_ticket_attachments(
@@ -316,7 +317,7 @@ def list_ticket_attachments_admin_endpoint(
         ticket_message_id=ticket_message_id,
         storage_provider=storage_provider,
     )
-    return [TicketAttachmentOut.model_validate(a, from_attributes=True) for a in attachments]
+    return validate_items(TicketAttachmentOut, attachments)
 
 
 @router.post(
@@ -379,7 +380,7 @@ def list_ticket_assignments_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketAssignmentOut]:
     """List assignment history on a ticket in an admin context."""
     assignments = ticket_assignment_service.list_ticket_assignments(
@@ -387,7 +388,7 @@ def list_ticket_assignments_admin_endpoint(
         tenant_id=tenant_id,
         ticket_id=ticket_id,
     )
-    return [TicketAssignmentOut.model_validate(a, from_attributes=True) for a in assignments]
+    return validate_items(TicketAssignmentOut, assignments)
 
 
 @router.post(
@@ -428,7 +429,7 @@ def list_ticket_audits_admin_endpoint(
     ),
     event_type: Optional[str] = None,
     actor_type: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketAuditOut]:
     """List audit events on a ticket in an admin context."""
     audits = ticket_audit_service.list_ticket_audits(
@@ -438,7 +439,7 @@ def list_ticket_audits_admin_endpoint(
         event_type=event_type,
         actor_type=actor_type,
     )
-    return [TicketAuditOut.model_validate(a, from_attributes=True) for a in audits]
+    return validate_items(TicketAuditOut, audits)
 
 
 # ---------------------------------------------------------------------------
@@ -456,7 +457,7 @@ def list_ticket_field_values_admin_endpoint(
     ticket_field_def_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketFieldValueOut]:
     """List custom field values on a ticket in an admin context.
 
@@ -472,7 +473,7 @@ def list_ticket_field_values_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketFieldValueOut.model_validate(v, from_attributes=True) for v in values]
+    return validate_items(TicketFieldValueOut, values)
 
 
 @router.post(
@@ -516,7 +517,7 @@ def get_ticket_field_value_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketFieldValueOut:
     """Retrieve a single custom field value via the admin API."""
     value = ticket_field_value_service.get_ticket_field_value(
@@ -598,7 +599,7 @@ def list_ticket_task_mirrors_admin_endpoint(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketTaskMirrorOut]:
     """List mirrored tasks on a ticket in an admin context."""
     tasks, _ = ticket_task_mirror_service.list_ticket_task_mirrors(
@@ -609,7 +610,7 @@ def list_ticket_task_mirrors_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketTaskMirrorOut.model_validate(t, from_attributes=True) for t in tasks]
+    return validate_items(TicketTaskMirrorOut, tasks)
 
 
 @router.get(
@@ -623,7 +624,7 @@ def get_ticket_task_mirror_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketTaskMirrorOut:
     """Retrieve a single mirrored task via the admin API."""
     mirror = ticket_task_mirror_service.get_ticket_task_mirror(
@@ -658,7 +659,7 @@ def list_ticket_ai_work_refs_admin_endpoint(
     agent_key: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketAiWorkRefOut]:
     """List AI work references on a ticket in an admin context."""
     refs, _ = ticket_ai_work_ref_service.list_ticket_ai_work_refs(
@@ -669,7 +670,7 @@ def list_ticket_ai_work_refs_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketAiWorkRefOut.model_validate(r, from_attributes=True) for r in refs]
+    return validate_items(TicketAiWorkRefOut, refs)
 
 
 @router.get(
@@ -683,7 +684,7 @@ def get_ticket_ai_work_ref_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketAiWorkRefOut:
     """Retrieve a single AI work reference via the admin API."""
     ref = ticket_ai_work_ref_service.get_ticket_ai_work_ref(
@@ -718,7 +719,7 @@ def list_ticket_time_entries_admin_endpoint(
     work_type: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketTimeEntryOut]:
     """List time entries on a ticket in an admin context.
 
@@ -734,7 +735,7 @@ def list_ticket_time_entries_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketTimeEntryOut.model_validate(e, from_attributes=True) for e in entries]
+    return validate_items(TicketTimeEntryOut, entries)
 
 
 @router.post(
@@ -783,7 +784,7 @@ def get_ticket_time_entry_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketTimeEntryOut:
     """Retrieve a single time entry via the admin API."""
     entry = ticket_time_entry_service.get_ticket_time_entry(
@@ -872,7 +873,7 @@ def list_csat_responses_admin_endpoint(
     csat_survey_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CsatResponseOut]:
     """List CSAT responses on a ticket in an admin context.
 
@@ -886,7 +887,7 @@ def list_csat_responses_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [CsatResponseOut.model_validate(r, from_attributes=True) for r in responses]
+    return validate_items(CsatResponseOut, responses)
 
 
 @router.post(
@@ -935,7 +936,7 @@ def get_csat_response_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CsatResponseOut:
     """Retrieve a single CSAT response via the admin API."""
     resp = csat_response_service.get_csat_response(
@@ -1023,7 +1024,7 @@ def list_ticket_metrics_admin_endpoint(
     ),
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_reporting_db),
 ) -> List[TicketMetricsOut]:
     """List ticket metrics on a ticket via the admin API."""
     metrics_list, _ = ticket_metrics_service.list_ticket_metrics(
@@ -1033,7 +1034,7 @@ def list_ticket_metrics_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketMetricsOut.model_validate(m, from_attributes=True) for m in metrics_list]
+    return validate_items(TicketMetricsOut, metrics_list)
 
 
 @router.post(
@@ -1080,7 +1081,7 @@ def get_ticket_metrics_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_reporting_db),
 ) -> TicketMetricsOut:
     """Retrieve a ticket metrics record via the admin API."""
     metrics = ticket_metrics_service.get_ticket_metrics(
@@ -1169,7 +1170,7 @@ def list_ticket_status_durations_admin_endpoint(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_reporting_db),
 ) -> List[TicketStatusDurationOut]:
     """List ticket status duration records on a ticket via the admin API."""
     durations, _ = ticket_status_duration_service.list_ticket_status_durations(
@@ -1180,7 +1181,7 @@ def list_ticket_status_durations_admin_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketStatusDurationOut.model_validate(d, from_attributes=True) for d in durations]
+    return validate_items(TicketStatusDurationOut, durations)
 
 
 @router.post(
@@ -1221,7 +1222,7 @@ def get_ticket_status_duration_admin_endpoint(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to scope the search"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_reporting_db),
 ) -> TicketStatusDurationOut:
     """Retrieve a ticket status duration record via the admin API."""
     duration = ticket_status_duration_service.get_ticket_status_duration(
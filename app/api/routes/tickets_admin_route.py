@@ -18,7 +18,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.domain.services.ticket_service import (
     list_tickets as service_list_tickets,
     create_ticket as service_create_ticket,
@@ -31,7 +31,8 @@ from app.domain.schemas.ticket import (
     TicketUpdate,
     TicketOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -53,7 +54,10 @@ def list_tickets_admin(
     assigned_group_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketOut]:
     """List or search tickets across tenants.
 
@@ -72,10 +76,18 @@ def list_tickets_admin(
         assigned_group_id=assigned_group_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketOut] = [TicketOut.model_validate(t, from_attributes=True) for t in tickets]
+    items: List[TicketOut] = validate_items(TicketOut, tickets)
     return PaginationEnvelope[TicketOut](
-        items=items, total=total, limit=limit, offset=offset
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
     )
 
 
@@ -138,7 +150,7 @@ def get_ticket_admin(
     tenant_id: UUID = Query(
         ..., description="Tenant ID of the ticket to retrieve"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketOut:
     """Retrieve a ticket by ID across tenants.
 
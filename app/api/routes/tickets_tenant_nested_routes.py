@@ -30,7 +30,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, status, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db, get_reporting_db
 from app.domain.services import (
     ticket_participant_service,
     ticket_tag_service,
@@ -95,6 +95,7 @@ from app.domain.services import (
     ticket_metrics_service,
     ticket_status_duration_service,
 )
+from app.domain.schemas.common import validate_items
 
 
 router = APIRouter(
@@ -114,7 +115,7 @@ def list_ticket_participants_endpoint(
     ticket_id: UUID,
     participant_type: Optional[str] = None,
     role: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketParticipantOut]:
     """List participants for a ticket within a tenant."""
     participants = ticket_participant_service.list_ticket_participants(
@@ -124,7 +125,7 @@ def list_ticket_participants_endpoint(
         participant_type=participant_type,
         role=role,
     )
-    return [TicketParticipantOut.model_validate(p, from_attributes=True) for p in participants]
+    return validate_items(TicketParticipantOut, participants)
 
 
 @router.post(
@@ -181,13 +182,13 @@ def delete_ticket_participant_endpoint(
 def list_ticket_tags_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketTagOut]:
     """List tags for a ticket within a tenant."""
     tags = ticket_tag_service.list_ticket_tags(
         db, tenant_id=tenant_id, ticket_id=ticket_id
     )
-    return [TicketTagOut.model_validate(t, from_attributes=True) for t in tags]
+    return validate_items(TicketTagOut, tags)
 
 
 @router.post(
@@ -247,7 +248,7 @@ def list_ticket_messages_endpoint(
     author_type: Optional[str] = None,
     is_public: Optional[bool] = None,
     channel_type: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketMessageOut]:
     """List messages for a ticket within a tenant."""
     messages = ticket_message_service.list_ticket_messages(
@@ -258,7 +259,7 @@ def list_ticket_messages_endpoint(
         is_public=is_public,
         channel_type=channel_type,
     )
-    return [TicketMessageOut.model_validate(m, from_attributes=True) for m in messages]
+    return validate_items(TicketMessageOut, messages)
 
 
 @router.post(
@@ -296,7 +297,7 @@ def list_ticket_attachments_endpoint(
     ticket_id: UUID,
     ticket_message_id: Optional[UUID] = None,
     storage_provider: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketAttachmentOut]:
     """List attachments for a ticket within a tenant."""
     attachments = ticket_attachment_service.list_ticket_attachments(
@@ -306,7 +307,7 @@ def list_ticket_attachments_endpoint(
         ticket_message_id=ticket_message_id,
         storage_provider=storage_provider,
     )
-    return [TicketAttachmentOut.model_validate(a, from_attributes=True) for a in attachments]
+    return validate_items(TicketAttachmentOut, attachments)
 
 
 @router.post(
@@ -363,7 +364,7 @@ def delete_ticket_attachment_endpoint(
 def list_ticket_assignments_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketAssignmentOut]:
     """List assignment history for a ticket within a tenant."""
     assignments = ticket_assignment_service.list_ticket_assignments(
@@ -371,7 +372,7 @@ def list_ticket_assignments_endpoint(
         tenant_id=tenant_id,
         ticket_id=ticket_id,
     )
-    return [TicketAssignmentOut.model_validate(a, from_attributes=True) for a in assignments]
+    return validate_items(TicketAssignmentOut, assignments)
 
 
 @router.post(
@@ -409,7 +410,7 @@ def list_ticket_audits_endpoint(
     ticket_id: UUID,
     event_type: Optional[str] = None,
     actor_type: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketAuditOut]:
     """List audit events for a ticket within a tenant."""
     audits = ticket_audit_service.list_ticket_audits(
@@ -419,7 +420,7 @@ def list_ticket_audits_endpoint(
         event_type=event_type,
         actor_type=actor_type,
     )
-    return [TicketAuditOut.model_validate(a, from_attributes=True) for a in audits]
+    return validate_items(TicketAuditOut, audits)
 
 
 # ---------------------------------------------------------------------------
@@ -434,7 +435,7 @@ def list_ticket_field_values_endpoint(
     ticket_field_def_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketFieldValueOut]:
     """List custom field values for a ticket within a tenant.
 
@@ -450,7 +451,7 @@ def list_ticket_field_values_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketFieldValueOut.model_validate(v, from_attributes=True) for v in values]
+    return validate_items(TicketFieldValueOut, values)
 
 
 @router.post(
@@ -490,7 +491,7 @@ def get_ticket_field_value_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
     value_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketFieldValueOut:
     """Retrieve a single custom field value by ID within a tenant and ticket."""
     value = ticket_field_value_service.get_ticket_field_value(
@@ -546,7 +547,7 @@ def list_ticket_task_mirrors_endpoint(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketTaskMirrorOut]:
     """List mirrored tasks for a ticket within a tenant.
 
@@ -561,7 +562,7 @@ def list_ticket_task_mirrors_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketTaskMirrorOut.model_validate(t, from_attributes=True) for t in tasks]
+    return validate_items(TicketTaskMirrorOut, tasks)
 
 
 @router.get(
@@ -572,7 +573,7 @@ def get_ticket_task_mirror_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
     mirror_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketTaskMirrorOut:
     """Retrieve a single task mirror by ID for a ticket within a tenant."""
     mirror = ticket_task_mirror_service.get_ticket_task_mirror(
@@ -604,7 +605,7 @@ def list_ticket_ai_work_refs_endpoint(
     agent_key: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketAiWorkRefOut]:
     """List AI work references for a ticket within a tenant.
 
@@ -619,7 +620,7 @@ def list_ticket_ai_work_refs_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketAiWorkRefOut.model_validate(r, from_attributes=True) for r in refs]
+    return validate_items(TicketAiWorkRefOut, refs)
 
 
 @router.get(
@@ -630,7 +631,7 @@ def get_ticket_ai_work_ref_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
     ref_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketAiWorkRefOut:
     """Retrieve a single AI work reference by ID for a ticket within a tenant."""
     ref = ticket_ai_work_ref_service.get_ticket_ai_work_ref(
@@ -663,7 +664,7 @@ def list_ticket_time_entries_endpoint(
     work_type: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[TicketTimeEntryOut]:
     """List time entries for a ticket within a tenant.
 
@@ -679,7 +680,7 @@ def list_ticket_time_entries_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketTimeEntryOut.model_validate(e, from_attributes=True) for e in entries]
+    return validate_items(TicketTimeEntryOut, entries)
 
 
 @router.post(
@@ -718,7 +719,7 @@ def get_ticket_time_entry_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
     entry_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketTimeEntryOut:
     """Retrieve a single time entry by ID within a tenant and ticket."""
     entry = ticket_time_entry_service.get_ticket_time_entry(
@@ -805,7 +806,7 @@ def list_csat_responses_endpoint(
     csat_survey_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[CsatResponseOut]:
     """List CSAT responses for a ticket within a tenant.
 
@@ -820,7 +821,7 @@ def list_csat_responses_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [CsatResponseOut.model_validate(r, from_attributes=True) for r in responses]
+    return validate_items(CsatResponseOut, responses)
 
 
 @router.post(
@@ -859,7 +860,7 @@ def get_csat_response_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
     response_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CsatResponseOut:
     """Retrieve a single CSAT response by ID within a tenant and ticket."""
     resp = csat_response_service.get_csat_response(
@@ -890,7 +891,7 @@ def list_ticket_metrics_tenant_endpoint(
     ticket_id: UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_reporting_db),
 ) -> List[TicketMetricsOut]:
     """List ticket metrics for a ticket within a tenant.
 
@@ -905,7 +906,7 @@ def list_ticket_metrics_tenant_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [TicketMetricsOut.model_validate(m, from_attributes=True) for m in metrics_list]
+    return validate_items(TicketMetricsOut, metrics_list)
 
 
 @router.get(
@@ -916,7 +917,7 @@ def get_ticket_metrics_tenant_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
     metrics_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_reporting_db),
 ) -> TicketMetricsOut:
     """Retrieve a single ticket metrics record by ID within a tenant and ticket."""
     metrics = ticket_metrics_service.get_ticket_metrics(
@@ -948,7 +949,7 @@ def list_ticket_status_durations_tenant_endpoint(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_reporting_db),
 ) -> List[TicketStatusDurationOut]:
     """List status duration records for a ticket within a tenant.
 
@@ -964,10 +965,7 @@ def list_ticket_status_durations_tenant_endpoint(
         limit=limit,
         offset=offset,
     )
-    return [
-        TicketStatusDurationOut.model_validate(d, from_attributes=True)
-        for d in durations
-    ]
+    return validate_items(TicketStatusDurationOut, durations)
 
 
 @router.get(
@@ -978,7 +976,7 @@ def get_ticket_status_duration_tenant_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
     duration_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_reporting_db),
 ) -> TicketStatusDurationOut:
     """Retrieve a single status duration record by ID within a tenant and ticket."""
     duration = ticket_status_duration_service.get_ticket_status_duration(
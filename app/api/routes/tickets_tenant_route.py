@@ -9,20 +9,30 @@ the ``X-User`` header when provided; otherwise "anonymous" is used.
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, status, Query
-from sqlalchemy.orm import Session
-
-from app.core.db import get_db
+from fastapi import APIRouter, Depends, Header, Request, status, Query
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.etag import etag_guard
+from app.api.export import export_response
+from app.core.db import (
+    AsyncSession,
+    async_db_enabled,
+    get_async_read_db,
+    get_db,
+    get_read_db,
+    get_reporting_session_factory,
+)
 from app.domain.services import ticket_service  # for mypy namespace support
 from app.domain.schemas.ticket import (
     TenantCreateTicket,
     TicketUpdate,
     TicketOut,
 )
-from app.domain.schemas.common import PaginationEnvelope
+from app.domain.schemas.common import PaginationEnvelope, validate_items
+from app.domain.services.pagination_service import TotalMode, next_cursor
 
 
 router = APIRouter(
@@ -31,7 +41,26 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=PaginationEnvelope[TicketOut])
+def _ticket_page(
+    tickets: List[Any],
+    total: Optional[int],
+    *,
+    limit: Optional[int],
+    offset: Optional[int],
+    cursor: Optional[str],
+    page_size: Optional[int],
+) -> PaginationEnvelope[TicketOut]:
+    items: List[TicketOut] = validate_items(TicketOut, tickets)
+    return PaginationEnvelope[TicketOut](
+        items=items,
+        total=total,
+        limit=limit,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=next_cursor(items, cursor=cursor, page_size=page_size),
+    )
+
+
 def list_tickets_endpoint(
     tenant_id: UUID,
     status: Optional[str] = None,
@@ -40,7 +69,10 @@ def list_tickets_endpoint(
     assigned_group_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: Session = Depends(get_read_db),
 ) -> PaginationEnvelope[TicketOut]:
     """List tickets for a tenant with optional filters.
 
@@ -58,10 +90,72 @@ def list_tickets_endpoint(
         assigned_group_id=assigned_group_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
     )
-    items: List[TicketOut] = [TicketOut.model_validate(t, from_attributes=True) for t in tickets]
-    return PaginationEnvelope[TicketOut](
-        items=items, total=total, limit=limit, offset=offset
+    return _ticket_page(
+        tickets, total, limit=limit, offset=offset, cursor=cursor, page_size=page_size
+    )
+
+
+async def list_tickets_endpoint_async(
+    tenant_id: UUID,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    assigned_user_id: Optional[UUID] = None,
+    assigned_group_id: Optional[UUID] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> PaginationEnvelope[TicketOut]:
+    """Async variant of :func:`list_tickets_endpoint` (asyncpg engine)."""
+    tickets, total = await ticket_service.list_tickets_async(
+        db,
+        tenant_id=tenant_id,
+        status=status,
+        priority=priority,
+        assigned_user_id=assigned_user_id,
+        assigned_group_id=assigned_group_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+    return _ticket_page(
+        tickets, total, limit=limit, offset=offset, cursor=cursor, page_size=page_size
+    )
+
+
+# The async handler is served when the asyncpg engine is enabled; the
+# sync handler on the threadpool remains the fallback.
+router.add_api_route(
+    "/",
+    list_tickets_endpoint_async if async_db_enabled() else list_tickets_endpoint,
+    methods=["GET"],
+    response_model=PaginationEnvelope[TicketOut],
+    name="list_tickets_endpoint",
+)
+
+
+@router.get("/export")
+def export_tickets_endpoint(
+    tenant_id: UUID,
+    request: Request,
+    format: Optional[str] = Query(
+        default=None,
+        description="ndjson or csv; defaults from the Accept header",
+    ),
+    gzip: bool = Query(default=False, description="gzip-compress the stream"),
+    session_factory: sessionmaker = Depends(get_reporting_session_factory),
+):
+    """Stream all tickets of the tenant as NDJSON or CSV."""
+    return export_response(
+        request, session_factory, ticket_service.EXPORT_SPEC, tenant_id=tenant_id, format=format, gzip=gzip
     )
 
 
@@ -112,11 +206,15 @@ def update_ticket_endpoint(
     return TicketOut.model_validate(ticket, from_attributes=True)
 
 
-@router.get("/{ticket_id}", response_model=TicketOut)
+@router.get(
+    "/{ticket_id}",
+    response_model=TicketOut,
+    dependencies=[etag_guard(ticket_service.get_ticket_version, "ticket_id")],
+)
 def get_ticket_endpoint(
     tenant_id: UUID,
     ticket_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> TicketOut:
     """Retrieve a single ticket by ID within a tenant.
 
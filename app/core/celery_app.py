@@ -18,9 +18,11 @@ from __future__ import annotations
 
 from celery import Celery
 from kombu import Exchange, Queue
+from kombu.serialization import register as register_serializer
 
 from app.core.config import Config
 from app.core.telemetry import init_tracing, instrument_celery
+from app.util import serialization
 
 
 # Instantiate a single Celery application for the CRM service.  The
@@ -32,11 +34,24 @@ celery_app = Celery("dyno_crm_service")
 # --------------------------------------------------------------------
 # Core broker / backend configuration
 # --------------------------------------------------------------------
+# Task messages are encoded with orjson, which writes UUIDs and
+# datetimes natively so event envelopes are encoded in one pass.  The
+# output is plain JSON under the ``application/json`` content type; no
+# decoder is registered so incoming messages still use kombu's json
+# decoder and ``accept_content=["json"]`` keeps accepting them.
+register_serializer(
+    "orjson",
+    serialization.dumps,
+    None,
+    content_type="application/json",
+    content_encoding="utf-8",
+)
+
 # All CRM tasks are serialized as JSON for safety and interoperability.
 celery_app.conf.update(
     broker_url=Config.celery_broker_url(),
     result_backend=Config.celery_result_backend(),
-    task_serializer="json",
+    task_serializer="orjson",
     accept_content=["json"],
     result_serializer="json",
     enable_utc=True,
@@ -85,6 +100,13 @@ _domains = [
     "association",
 ]
 
+# Actions beyond the standard lifecycle, keyed by domain
+_domain_extra_actions: dict[str, tuple[str, ...]] = {
+    "contact": ("bulk_imported", "bulk_patched"),
+    "company": ("bulk_imported",),
+    "lead": ("bulk_patched",),
+}
+
 # Start with the default queue for tasks that lack an explicit route.
 task_queues: list[Queue] = [
     Queue(
@@ -120,6 +142,25 @@ for _domain in _domains:
         )
     )
 
+# Long-running jobs (e.g. bulk imports) get their own queue so a
+# worker pool can be sized for them without competing with event
+# consumers on the domain queues.
+JOBS_QUEUE: str = f"{EXCHANGE_NAME}.jobs"
+task_queues.append(
+    Queue(
+        JOBS_QUEUE,
+        exchange=crm_exchange,
+        routing_key=f"{JOBS_QUEUE}.#",
+        queue_arguments={
+            "x-dead-letter-exchange": crm_dlx.name,
+            "x-dead-letter-routing-key": f"{JOBS_QUEUE}.dlq",
+        },
+    )
+)
+task_queues.append(
+    Queue(f"{JOBS_QUEUE}.dlq", exchange=crm_dlx, routing_key=f"{JOBS_QUEUE}.dlq")
+)
+
 celery_app.conf.task_queues = tuple(task_queues)
 
 
@@ -133,13 +174,29 @@ celery_app.conf.task_queues = tuple(task_queues)
 # expand this mapping accordingly.
 task_routes: dict[str, dict[str, str]] = {}
 for _domain in _domains:
-    for _action in ("created", "updated", "deleted"):
+    for _action in ("created", "updated", "deleted") + _domain_extra_actions.get(_domain, ()):
         task_name = f"{EXCHANGE_NAME}.{_domain}.{_action}"
         task_routes[task_name] = {
             "queue": f"{EXCHANGE_NAME}.{_domain}",
             "routing_key": task_name,
         }
 
+# Tenant configuration cache invalidations go to the CRM exchange under
+# their own routing key.  Only the exclusive per-process queues declared
+# by app.messaging.config_cache are bound to it.
+task_routes[f"{EXCHANGE_NAME}.config_cache.invalidated"] = {
+    "exchange": crm_exchange.name,
+    "exchange_type": crm_exchange.type,
+    "routing_key": f"{EXCHANGE_NAME}.config_cache.invalidated",
+}
+
+# Job tasks are named ``{EXCHANGE_NAME}.jobs.<job>``
+for _job in ("company_import", "sla_recompute"):
+    task_routes[f"{JOBS_QUEUE}.{_job}"] = {
+        "queue": JOBS_QUEUE,
+        "routing_key": f"{JOBS_QUEUE}.{_job}",
+    }
+
 celery_app.conf.task_routes = task_routes
 
 
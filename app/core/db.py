@@ -3,30 +3,187 @@
 This module defines the SQLAlchemy engine, session factory and base class
 used across the application.  It follows the patterns described in the
 Python Developer Guide and mirrors the setup in the Tenant Management
-Service for consistency.  The engine is configured via the Config class
-and uses connection pooling with `pool_pre_ping` enabled to detect
-disconnected connections.
+Service for consistency.  Separate engines serve API requests,
+background workers and reporting queries; their pools and server-side
+statement timeouts are configured via the Config class.  Read-only
+endpoints can be routed to a streaming replica through ``get_read_db``.
+With ``ASYNC_DB_ENABLED`` the hottest read endpoints are served by
+``async def`` handlers on an asyncpg engine (``get_async_read_db``).
 """
 
 from __future__ import annotations
 
-from typing import Generator, Iterator
+import importlib.util
+from typing import Any, AsyncIterator, Dict, Generator, Iterator, Optional
 
+from fastapi import Request
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+try:
+    # The async path needs the sqlalchemy[asyncio] extra (greenlet).
+    from sqlalchemy.ext.asyncio import (
+        AsyncSession,
+        async_sessionmaker,
+        create_async_engine,
+    )
+except ImportError:  # pragma: no cover - depends on installed extras
+    AsyncSession = async_sessionmaker = create_async_engine = None  # type: ignore[assignment,misc]
+
+from app.core import read_routing
 from app.core.config import Config
+from app.util.serialization import dumps_str
+
+# The service runs three kinds of workload against the same database:
+# short API requests, Celery workers / the outbox relay and long-running
+# reporting queries.  Each gets its own engine so a burst of reports
+# cannot exhaust the connections request handlers need, and so every
+# workload gets a server-side statement_timeout that suits it.  Pool
+# sizes and timeouts come from Config (DB_* / DB_<WORKLOAD>_* variables).
+WORKLOADS = ("api", "worker", "reporting")
+
+
+def engine_options(workload: str, url: Optional[str] = None) -> Dict[str, Any]:
+    """Return the ``create_engine`` keyword arguments for ``workload``.
+
+    PostgreSQL connections carry ``statement_timeout`` as a startup
+    option, so the limit is enforced by the server without an extra
+    ``SET`` round trip per checkout, and an ``application_name`` that
+    shows the workload in ``pg_stat_activity``.
+    """
+    if workload not in WORKLOADS:
+        raise ValueError(f"Unknown database workload {workload!r}")
+    url = url or Config.database_url()
+    connect_args: Dict[str, Any] = {}
+    if make_url(url).get_backend_name() == "postgresql":
+        connect_args["connect_timeout"] = Config.db_connect_timeout_seconds()
+        connect_args["application_name"] = f"crm_service.{workload}"
+        statement_timeout = Config.db_statement_timeout_ms(workload)
+        if statement_timeout > 0:
+            connect_args["options"] = f"-c statement_timeout={statement_timeout}"
+    return {
+        "pool_size": Config.db_pool_size(workload),
+        "max_overflow": Config.db_max_overflow(workload),
+        "pool_timeout": Config.db_pool_timeout_seconds(workload),
+        "pool_recycle": Config.db_pool_recycle_seconds(workload),
+        "pool_pre_ping": Config.db_pool_pre_ping(workload),
+        # Reuse the most recently returned connection so idle ones age
+        # out through pool_recycle instead of all being kept warm.
+        "pool_use_lifo": True,
+        # JSON/JSONB values are encoded with orjson so event envelopes
+        # holding UUIDs and datetimes can be stored without a conversion
+        # pass.
+        "json_serializer": dumps_str,
+        "connect_args": connect_args,
+    }
 
-# Create the SQLAlchemy engine using the configured database URL.  The
-# pool_pre_ping=True flag ensures the engine checks the connection
-# health before each use, preventing the service from using stale
-# connections.
-engine = create_engine(Config.database_url(), pool_pre_ping=True)
 
-# Session factory for scoped sessions.  autocommit=False and
-# autoflush=False follow recommended patterns for explicit transaction
-# boundaries in FastAPI services.
+def create_workload_engine(workload: str, url: Optional[str] = None) -> Engine:
+    """Create the engine for ``workload`` (``api``, ``worker`` or ``reporting``)."""
+    url = url or Config.database_url()
+    return create_engine(url, **engine_options(workload, url))
+
+
+engine = create_workload_engine("api")
+worker_engine = create_workload_engine("worker")
+reporting_engine = create_workload_engine("reporting")
+
+# Read-only traffic goes to the streaming replica when one is
+# configured; otherwise the read engines are the primary engines.
+# Engines connect lazily, so unused pools cost nothing.
+REPLICA_URL = Config.database_replica_url()
+read_engine = create_workload_engine("api", REPLICA_URL) if REPLICA_URL else engine
+reporting_read_engine = (
+    create_workload_engine("reporting", REPLICA_URL) if REPLICA_URL else reporting_engine
+)
+
+# Session factories.  autocommit=False and autoflush=False follow
+# recommended patterns for explicit transaction boundaries in FastAPI
+# services.  SessionLocal serves API requests, WorkerSessionLocal
+# background processes and ReportingSessionLocal analytics endpoints;
+# the *Read* factories serve read-only endpoints.
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+WorkerSessionLocal = sessionmaker(bind=worker_engine, autocommit=False, autoflush=False)
+ReportingSessionLocal = sessionmaker(
+    bind=reporting_engine, autocommit=False, autoflush=False
+)
+ReadSessionLocal = (
+    sessionmaker(bind=read_engine, autocommit=False, autoflush=False)
+    if REPLICA_URL
+    else SessionLocal
+)
+ReportingReadSessionLocal = (
+    sessionmaker(bind=reporting_read_engine, autocommit=False, autoflush=False)
+    if REPLICA_URL
+    else ReportingSessionLocal
+)
+
+# Async engines (asyncpg) for ``async def`` read endpoints.  They are
+# created on first use so processes that never serve async reads, and
+# installations without asyncpg, do not pay for them.
+_async_engines: Dict[str, Any] = {}
+_async_session_factories: Dict[str, Any] = {}
+
+
+def async_db_enabled() -> bool:
+    """Return ``True`` when async read endpoints should be registered."""
+    return (
+        Config.async_db_enabled()
+        and create_async_engine is not None
+        and importlib.util.find_spec("asyncpg") is not None
+    )
+
+
+def async_engine_options(workload: str, url: Optional[str] = None) -> Dict[str, Any]:
+    """Return ``create_async_engine`` keyword arguments for ``workload``.
+
+    Same pool settings as :func:`engine_options`; asyncpg takes the
+    statement timeout and application name as server settings.
+    """
+    options = engine_options(workload, url)
+    connect_args = options.pop("connect_args")
+    server_settings = {"application_name": f"crm_service.{workload}"}
+    statement_timeout = Config.db_statement_timeout_ms(workload)
+    if statement_timeout > 0:
+        server_settings["statement_timeout"] = str(statement_timeout)
+    options["connect_args"] = {
+        "server_settings": server_settings,
+        "timeout": connect_args.get("connect_timeout", Config.db_connect_timeout_seconds()),
+    }
+    return options
+
+
+def async_database_url(url: str) -> str:
+    """Rewrite a PostgreSQL URL to use the asyncpg driver."""
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(
+        hide_password=False
+    )
+
+
+def _async_session_factory(target: str) -> Any:
+    factory = _async_session_factories.get(target)
+    if factory is None:
+        url = REPLICA_URL if target == "replica" else Config.database_url()
+        async_engine = create_async_engine(
+            async_database_url(url), **async_engine_options("api", url)
+        )
+        factory = async_sessionmaker(
+            bind=async_engine, autoflush=False, expire_on_commit=False
+        )
+        _async_engines[target] = async_engine
+        _async_session_factories[target] = factory
+    return factory
+
+
+async def dispose_async_engines() -> None:
+    """Close the pools of any async engines created so far."""
+    engines = list(_async_engines.values())
+    _async_engines.clear()
+    _async_session_factories.clear()
+    for async_engine in engines:
+        await async_engine.dispose()
+
 
 # Base class for declarative models.  All ORM models in app/domain/models
 # must inherit from this Base to register with the SQLAlchemy metadata.
@@ -70,6 +227,64 @@ def get_db() -> Iterator:
         db.close()
 
 
+def get_read_db(request: Request) -> Iterator:
+    """Provide a session for read-only endpoints.
+
+    Sessions are bound to the read replica unless the request must see
+    its own (or its tenant's) recent writes, in which case they use the
+    primary; see ``app.core.read_routing``.  Without a replica this is
+    equivalent to :func:`get_db`.
+    """
+    factory = ReadSessionLocal
+    if REPLICA_URL and read_routing.must_read_primary(request):
+        factory = SessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncIterator:
+    """Async counterpart of :func:`get_read_db` yielding an ``AsyncSession``.
+
+    Only used by endpoints registered when :func:`async_db_enabled` is
+    true; the same read-your-writes routing applies.
+    """
+    target = "replica"
+    if not REPLICA_URL or read_routing.must_read_primary(request):
+        target = "primary"
+    async with _async_session_factory(target)() as db:
+        yield db
+
+
+def get_reporting_session_factory(request: Request) -> sessionmaker:
+    """Return the reporting session factory to use for ``request``.
+
+    Reads go to the replica when one is configured, except for
+    requests pinned to the primary by the read-your-writes guard.
+    Streaming endpoints depend on the factory rather than a session so
+    they can open a session that lives as long as the response body.
+    """
+    if REPLICA_URL and read_routing.must_read_primary(request):
+        return ReportingSessionLocal
+    return ReportingReadSessionLocal
+
+
+def get_reporting_db(request: Request) -> Iterator:
+    """Provide a session bound to the reporting engine.
+
+    Used by metrics and other aggregate endpoints so their longer
+    statement timeout and separate pool do not affect request traffic.
+    The engine is chosen by :func:`get_reporting_session_factory`.
+    """
+    db = get_reporting_session_factory(request)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def check_database_connection() -> bool:
     """Perform a simple readiness check against the database."""
     try:
@@ -81,4 +296,29 @@ def check_database_connection() -> bool:
         raise
 
 
-__all__ = ["engine", "SessionLocal", "Base", "get_db", "check_database_connection"]
\ No newline at end of file
+__all__ = [
+    "engine",
+    "worker_engine",
+    "read_engine",
+    "reporting_engine",
+    "reporting_read_engine",
+    "engine_options",
+    "create_workload_engine",
+    "SessionLocal",
+    "WorkerSessionLocal",
+    "ReportingSessionLocal",
+    "ReadSessionLocal",
+    "ReportingReadSessionLocal",
+    "Base",
+    "get_db",
+    "get_read_db",
+    "get_async_read_db",
+    "async_db_enabled",
+    "async_engine_options",
+    "async_database_url",
+    "dispose_async_engines",
+    "AsyncSession",
+    "get_reporting_db",
+    "get_reporting_session_factory",
+    "check_database_connection",
+]
\ No newline at end of file
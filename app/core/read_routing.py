@@ -0,0 +1,112 @@
+"""
+Read-your-writes guard for read-replica routing.
+
+When ``DATABASE_REPLICA_URL`` is set, read-only endpoints use sessions
+bound to the streaming replica (see ``app.core.db.get_read_db``).  A
+replica lags the primary slightly, so a client that just wrote would
+otherwise be able to read stale data.  After every successful write the
+API therefore pins reads to the primary for
+``READ_YOUR_WRITES_SECONDS``:
+
+* the client receives a ``crm_primary_until`` cookie and an
+  ``X-CRM-Primary-Until`` response header holding the pin deadline
+  (Unix seconds).  Browsers send the cookie back automatically;
+  service clients can echo the header.
+* the tenant of the write is also pinned in this process, so other
+  clients of the same tenant served here see the change as well.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import Config
+
+
+PRIMARY_UNTIL_COOKIE = "crm_primary_until"
+PRIMARY_UNTIL_HEADER = "X-CRM-Primary-Until"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_TENANT_PATH = re.compile(r"^/tenants/([0-9a-fA-F-]{36})(?:/|$)")
+# Prune expired tenant pins once the map grows past this size
+_MAX_TENANT_PINS = 10_000
+
+# tenant_id -> wall-clock deadline of the primary pin
+_tenant_pins: Dict[str, float] = {}
+
+
+def _parse_deadline(raw: Optional[str]) -> float:
+    if not raw:
+        return 0.0
+    try:
+        return float(raw)
+    except ValueError:
+        return 0.0
+
+
+def _request_tenant_id(request: Request) -> Optional[str]:
+    tenant_id = request.path_params.get("tenant_id") or request.query_params.get(
+        "tenant_id"
+    )
+    if tenant_id is None:
+        match = _TENANT_PATH.match(request.url.path)
+        tenant_id = match.group(1) if match else None
+    return str(tenant_id).lower() if tenant_id is not None else None
+
+
+def pin_tenant(tenant_id: str, *, now: Optional[float] = None) -> float:
+    """Pin ``tenant_id`` to the primary and return the pin deadline."""
+    now = time.time() if now is None else now
+    deadline = now + Config.read_your_writes_seconds()
+    if len(_tenant_pins) >= _MAX_TENANT_PINS:
+        for key, until in list(_tenant_pins.items()):
+            if until <= now:
+                _tenant_pins.pop(key, None)
+    _tenant_pins[tenant_id.lower()] = deadline
+    return deadline
+
+
+def must_read_primary(request: Request, *, now: Optional[float] = None) -> bool:
+    """Return ``True`` when ``request`` has to see the primary's data."""
+    now = time.time() if now is None else now
+    if _parse_deadline(request.headers.get(PRIMARY_UNTIL_HEADER)) > now:
+        return True
+    if _parse_deadline(request.cookies.get(PRIMARY_UNTIL_COOKIE)) > now:
+        return True
+    tenant_id = _request_tenant_id(request)
+    return tenant_id is not None and _tenant_pins.get(tenant_id, 0.0) > now
+
+
+def record_write(request: Request, response: Response) -> None:
+    """Pin the client (and tenant) of a successful write to the primary."""
+    if request.method in SAFE_METHODS or response.status_code >= 400:
+        return
+    now = time.time()
+    tenant_id = _request_tenant_id(request)
+    if tenant_id is not None:
+        deadline = pin_tenant(tenant_id, now=now)
+    else:
+        deadline = now + Config.read_your_writes_seconds()
+    value = f"{deadline:.3f}"
+    response.headers[PRIMARY_UNTIL_HEADER] = value
+    response.set_cookie(
+        PRIMARY_UNTIL_COOKIE,
+        value,
+        max_age=max(1, int(Config.read_your_writes_seconds() + 0.999)),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+__all__ = [
+    "PRIMARY_UNTIL_COOKIE",
+    "PRIMARY_UNTIL_HEADER",
+    "must_read_primary",
+    "pin_tenant",
+    "record_write",
+]
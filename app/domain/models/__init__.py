@@ -64,6 +64,14 @@ from .record_watcher import RecordWatcher
 from .automation_action import AutomationAction
 from .automation_action_execution import AutomationActionExecution
 from .stage_history import StageHistory
+from .event_outbox import EventOutbox
+from .company_import import CompanyImportJob, CompanyImportRow
+from .pipeline_rollup import (
+    PipelineStageDailyRollup,
+    PipelineStageTransitionDailyRollup,
+    PipelineStageDealRollup,
+)
+from .business_hours import BusinessHours
 
 __all__ = [
     "Lead",
@@ -124,4 +132,11 @@ __all__ = [
     "AutomationAction",
     "AutomationActionExecution",
     "StageHistory",
+    "EventOutbox",
+    "CompanyImportJob",
+    "CompanyImportRow",
+    "PipelineStageDailyRollup",
+    "PipelineStageTransitionDailyRollup",
+    "PipelineStageDealRollup",
+    "BusinessHours",
 ]
\ No newline at end of file
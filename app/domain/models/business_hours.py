@@ -0,0 +1,58 @@
+"""
+SQLAlchemy model for Business Hours.
+
+A business hours calendar defines when a support queue is open: a
+weekly schedule of open intervals in a time zone plus holiday dates.
+Group profiles reference a calendar through ``business_hours_id`` and
+the SLA engine measures ticket deadlines in the open time of the
+assigned group's calendar.  Calendars belong to a tenant.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import DateTime, JSON, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class BusinessHours(Base):
+    """ORM model for the ``business_hours`` table."""
+
+    __tablename__ = "business_hours"
+    __table_args__ = (
+        UniqueConstraint("id", "tenant_id", name="ux_business_hours_id_tenant"),
+        UniqueConstraint("tenant_id", "name", name="ux_business_hours_tenant_name"),
+        {"schema": "dyno_crm"},
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        PGUUID(as_uuid=True), nullable=False
+    )
+
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    time_zone: Mapped[str] = mapped_column(String(64), nullable=False, default="UTC")
+    # [{"day": "mon", "start": "09:00", "end": "17:00"}, ...]; empty = always open
+    weekly_hours: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
+    # ISO dates on which the calendar is closed
+    holidays: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+    created_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    updated_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<BusinessHours id={self.id} tenant_id={self.tenant_id} name={self.name}>"
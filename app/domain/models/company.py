@@ -34,6 +34,12 @@ class Company(Base):
         # Standard tenant‑scoped indexes
         Index("ix_company_tenant", "tenant_id"),
         Index("ix_company_tenant_name", "tenant_id", "company_name"),
+        Index(
+            "ix_company_tenant_created_at",
+            "tenant_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
         # Domain index for case‑insensitive searches
         Index(
             "ix_company_tenant_domain",
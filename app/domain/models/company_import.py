@@ -0,0 +1,110 @@
+"""
+SQLAlchemy models for bulk company import jobs.
+
+``CompanyImportJob`` tracks one asynchronous import (status, progress
+counters and row errors).  ``CompanyImportRow`` spools the uploaded
+records until the Celery task has processed them; once a company is
+inserted its id is stored on the row so relationships given by
+external key can be resolved with a join.
+
+Schema: dyno_crm.company_import_job, dyno_crm.company_import_row
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+IMPORT_JOB_STATUSES = ("queued", "running", "completed", "failed")
+
+
+class CompanyImportJob(Base):
+    """SQLAlchemy model for the ``company_import_job`` table."""
+
+    __tablename__ = "company_import_job"
+    __table_args__ = (
+        CheckConstraint(
+            f"status IN ({', '.join(repr(s) for s in IMPORT_JOB_STATUSES)})",
+            name="ck_company_import_job_status",
+        ),
+        Index("ix_company_import_job_tenant_created", "tenant_id", text("created_at DESC")),
+        {"schema": "dyno_crm"},
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
+
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
+    # "companies" while loading companies, "relationships" afterwards
+    phase: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+
+    total_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    imported: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    relationships: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    errors: Mapped[List[Dict[str, Any]]] = mapped_column(JSONB, nullable=False, default=list)
+    errors_truncated: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+    created_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    updated_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+
+    def __repr__(self) -> str:  # pragma: no cover - trivial repr
+        return (
+            f"<CompanyImportJob id={self.id} tenant_id={self.tenant_id} "
+            f"status={self.status} processed_rows={self.processed_rows}>"
+        )
+
+
+class CompanyImportRow(Base):
+    """SQLAlchemy model for the ``company_import_row`` table."""
+
+    __tablename__ = "company_import_row"
+    __table_args__ = (
+        Index(
+            "ix_company_import_row_job_external_key",
+            "job_id",
+            "external_key",
+            postgresql_where=text("external_key IS NOT NULL"),
+        ),
+        {"schema": "dyno_crm"},
+    )
+
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("dyno_crm.company_import_job.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    row_no: Mapped[int] = mapped_column(Integer, primary_key=True)
+    external_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    payload: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    parse_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    company_id: Mapped[Optional[uuid.UUID]] = mapped_column(PGUUID(as_uuid=True), nullable=True)
+
+
+__all__ = ["CompanyImportJob", "CompanyImportRow", "IMPORT_JOB_STATUSES"]
@@ -13,7 +13,7 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import DateTime, Index, String, UniqueConstraint, ForeignKeyConstraint
+from sqlalchemy import DateTime, Index, String, UniqueConstraint, ForeignKeyConstraint, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -28,6 +28,12 @@ class Contact(Base):
         # Existing indexes on tenant and name for search
         Index("ix_contact_tenant", "tenant_id"),
         Index("ix_contact_tenant_last_first", "tenant_id", "last_name", "first_name"),
+        Index(
+            "ix_contact_tenant_created_at",
+            "tenant_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
         # Indexes for ownership fields to accelerate lookups
         Index("ix_contact_tenant_owned_by_user", "tenant_id", "owned_by_user_id"),
         Index("ix_contact_tenant_owned_by_group", "tenant_id", "owned_by_group_id"),
@@ -30,6 +30,13 @@ class ContactEmail(Base):
         ),
         Index("ix_contact_email_tenant_contact", "tenant_id", "contact_id"),
         Index("ix_contact_email_tenant_email", "tenant_id", text("lower(email)")),
+        # Trigram index backing substring search (see 007_contact_search_indexes.sql)
+        Index(
+            "ix_contact_email_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
         Index(
             "ux_contact_email_contact_email",
             "tenant_id",
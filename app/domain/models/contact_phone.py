@@ -34,6 +34,20 @@ class ContactPhone(Base):
             postgresql_where=text("phone_e164 IS NOT NULL"),
         ),
         Index("ix_contact_phone_tenant_phone_raw", "tenant_id", "phone_raw"),
+        # Trigram indexes backing substring search (see 007_contact_search_indexes.sql)
+        Index(
+            "ix_contact_phone_phone_raw_trgm",
+            "phone_raw",
+            postgresql_using="gin",
+            postgresql_ops={"phone_raw": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contact_phone_phone_e164_trgm",
+            "phone_e164",
+            postgresql_using="gin",
+            postgresql_ops={"phone_e164": "gin_trgm_ops"},
+            postgresql_where=text("phone_e164 IS NOT NULL"),
+        ),
         Index(
             "ux_contact_phone_contact_phone_e164",
             "tenant_id",
@@ -19,6 +19,7 @@ from sqlalchemy import (
     Numeric,
     String,
     ForeignKeyConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -33,6 +34,12 @@ class Deal(Base):
         Index("ix_deals_tenant", "tenant_id"),
         Index("ix_deals_pipeline", "pipeline_id"),
         Index("ix_deals_stage", "stage_id"),
+        Index(
+            "ix_deals_tenant_created_at",
+            "tenant_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
         # Indexes for ownership and assignment fields to improve query performance
         Index("ix_deals_tenant_owned_by_user", "tenant_id", "owned_by_user_id"),
         Index("ix_deals_tenant_owned_by_group", "tenant_id", "owned_by_group_id"),
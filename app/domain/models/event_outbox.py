@@ -0,0 +1,74 @@
+"""
+SQLAlchemy model for EventOutbox.
+
+The outbox holds domain event envelopes that have been produced by the
+service layer but not yet published to the message broker.  Rows are
+written by ``BaseProducer`` (or directly via ``app.messaging.outbox``)
+and drained in batches by the outbox relay, which publishes each
+envelope and stamps ``published_at``.  Because producers only touch the
+database, write latency is independent of broker health and events
+survive broker outages.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class EventOutbox(Base):
+    """SQLAlchemy model for the ``event_outbox`` table."""
+
+    __tablename__ = "event_outbox"
+    __table_args__ = (
+        # Relay scan: oldest unpublished events first
+        Index(
+            "ix_event_outbox_unpublished",
+            "created_at",
+            postgresql_where=text("published_at IS NULL"),
+        ),
+        # Retention purge of already published events
+        Index(
+            "ix_event_outbox_published_at",
+            "published_at",
+            postgresql_where=text("published_at IS NOT NULL"),
+        ),
+        {"schema": "dyno_crm"},
+    )
+
+    # Same value as the envelope's event_id; also used as the broker task id
+    id: Mapped[uuid.UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    tenant_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        PGUUID(as_uuid=True), nullable=True
+    )
+    task_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    envelope: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    headers: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, default=dict
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+    published_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    def __repr__(self) -> str:  # pragma: no cover - trivial repr
+        return (
+            f"<EventOutbox id={self.id} task_name={self.task_name} "
+            f"published_at={self.published_at} attempts={self.attempts}>"
+        )
+
+
+__all__ = ["EventOutbox"]
@@ -81,7 +81,11 @@ class GroupProfile(Base):
     )
     routing_config: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     ai_work_mode_default: Mapped[str] = mapped_column(String(50), nullable=False, default="human_only")
-    business_hours_id: Mapped[Optional[uuid.UUID]] = mapped_column(PGUUID(as_uuid=True), nullable=True)
+    business_hours_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("dyno_crm.business_hours.id", ondelete="SET NULL"),
+        nullable=True,
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=datetime.utcnow
@@ -11,7 +11,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Index, String, ForeignKeyConstraint
+from sqlalchemy import DateTime, Index, String, ForeignKeyConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -24,6 +24,16 @@ class Lead(Base):
         # Existing indexes on tenant and name for search
         Index("ix_lead_tenant", "tenant_id"),
         Index("ix_lead_tenant_last_first", "tenant_id", "last_name", "first_name"),
+        Index(
+            "ix_lead_tenant_created_at",
+            "tenant_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Trigram GIN expression indexes on lead_data phone/email values
+        # (ix_lead_lead_data_phone_numbers_trgm, ix_lead_lead_data_emails_trgm)
+        # are managed in 008_lead_data_search_indexes.sql only, because the
+        # operator class on a cast expression cannot be declared here.
         # Indexes for ownership fields to accelerate lookups
         Index("ix_lead_tenant_owned_by_user", "tenant_id", "owned_by_user_id"),
         Index("ix_lead_tenant_owned_by_group", "tenant_id", "owned_by_group_id"),
@@ -0,0 +1,98 @@
+"""
+SQLAlchemy models for the pipeline analytics rollups.
+
+These tables hold pre-aggregated counters that are updated in the same
+transaction as the stage history row or deal they summarise (see
+``pipeline_rollup_service``).  They carry no surrogate ids; each row is
+addressed by its natural key and only ever incremented.
+
+Schema: dyno_crm.pipeline_stage_daily_rollup,
+dyno_crm.pipeline_stage_transition_daily_rollup,
+dyno_crm.pipeline_stage_deal_rollup
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, Date, DateTime, Integer, Numeric, func
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class PipelineStageDailyRollup(Base):
+    """Stage entries and exits per (tenant, pipeline, stage, UTC day)."""
+
+    __tablename__ = "pipeline_stage_daily_rollup"
+    __table_args__ = {"schema": "dyno_crm"}
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    pipeline_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    stage_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    entered_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    exited_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Exits whose entry into the stage is known; exit_duration_seconds is
+    # the total time in stage of exactly these exits.
+    timed_exit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    exit_duration_seconds: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class PipelineStageTransitionDailyRollup(Base):
+    """Transition counts per (tenant, pipeline, from stage, to stage, UTC day)."""
+
+    __tablename__ = "pipeline_stage_transition_daily_rollup"
+    __table_args__ = {"schema": "dyno_crm"}
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    pipeline_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    from_stage_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    to_stage_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    transition_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class PipelineStageDealRollup(Base):
+    """Deals currently in each (tenant, pipeline, stage)."""
+
+    __tablename__ = "pipeline_stage_deal_rollup"
+    __table_args__ = {"schema": "dyno_crm"}
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    pipeline_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    stage_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+
+    deal_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    amount_sum: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    # SUM(amount * COALESCE(forecast_probability, probability)) of deals
+    # with a probability of their own
+    forecast_weighted_amount: Mapped[Decimal] = mapped_column(
+        Numeric(20, 4), nullable=False, default=0
+    )
+    # SUM(amount) of deals without one; weighted by the stage probability
+    unforecast_amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+__all__ = [
+    "PipelineStageDailyRollup",
+    "PipelineStageTransitionDailyRollup",
+    "PipelineStageDealRollup",
+]
@@ -67,6 +67,15 @@ class StageHistory(Base):
         ),
         # Index for filtering by pipeline
         Index("ix_stage_history_pipeline", "tenant_id", "pipeline_id"),
+        # Covering index for the dwell-time window queries (one
+        # record's history in changed_at order)
+        Index(
+            "ix_stage_history_entity_changed_at",
+            "tenant_id",
+            "entity_id",
+            "changed_at",
+            postgresql_include=["entity_type", "pipeline_id", "to_stage_id"],
+        ),
         {"schema": "dyno_crm"},
     )
 
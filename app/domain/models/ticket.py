@@ -73,6 +73,12 @@ class Ticket(Base):
         Index("ix_ticket_tenant", "tenant_id"),
         Index("ix_ticket_tenant_status", "tenant_id", "status"),
         Index("ix_ticket_tenant_priority", "tenant_id", "priority"),
+        Index(
+            "ix_ticket_tenant_created_at",
+            "tenant_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
         Index(
             "ix_ticket_tenant_assigned_user",
             "tenant_id",
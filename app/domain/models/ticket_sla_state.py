@@ -17,11 +17,13 @@ from typing import Optional
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     DateTime,
     ForeignKeyConstraint,
     UniqueConstraint,
     String,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -55,6 +57,11 @@ class TicketSlaState(Base):
             ondelete="SET NULL",
         ),
         Index("ix_ticket_sla_state_tenant_ticket", "tenant_id", "ticket_id"),
+        Index(
+            "ix_ticket_sla_state_next_due",
+            "next_due_at",
+            postgresql_where=text("next_due_at IS NOT NULL"),
+        ),
         {"schema": "dyno_crm"},
     )
 
@@ -92,6 +99,19 @@ class TicketSlaState(Base):
         Boolean, nullable=False, default=False
     )
 
+    # Earliest due date of the unbreached timers; drives the breach scanner
+    next_due_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        Computed(
+            "LEAST("
+            "CASE WHEN NOT first_response_breached THEN first_response_due_at END, "
+            "CASE WHEN NOT next_response_breached THEN next_response_due_at END, "
+            "CASE WHEN NOT resolution_breached THEN resolution_due_at END)",
+            persisted=True,
+        ),
+        nullable=True,
+    )
+
     last_computed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=datetime.utcnow
     )
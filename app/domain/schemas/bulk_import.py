@@ -0,0 +1,42 @@
+"""
+Pydantic models for bulk import results.
+
+Bulk import endpoints accept a stream of records (NDJSON or CSV) and
+report, per request, how many rows were imported and which rows were
+rejected.  Row numbers are 1-based positions in the uploaded stream
+(CSV rows are counted after the header).
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BulkImportRowError(BaseModel):
+    """A rejected input row and the reasons it was rejected."""
+
+    row: int = Field(..., description="1-based row number in the upload")
+    errors: List[str] = Field(default_factory=list)
+    constraint: Optional[str] = Field(
+        default=None, description="Database constraint that rejected the row, if any"
+    )
+
+
+class BulkImportResult(BaseModel):
+    """Outcome of a bulk import request."""
+
+    import_id: uuid.UUID
+    total_rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[BulkImportRowError] = Field(default_factory=list)
+    errors_truncated: bool = Field(
+        default=False,
+        description="True when more rows failed than are listed in ``errors``",
+    )
+
+
+__all__ = ["BulkImportRowError", "BulkImportResult"]
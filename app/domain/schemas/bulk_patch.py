@@ -0,0 +1,50 @@
+"""
+Pydantic models for bulk JSON Patch requests.
+
+A bulk patch applies a separate JSON Patch document to each of many
+records of one resource type.  Items are addressed by their position
+in the request (0-based ``index``) as well as their ``id`` so that
+repeated ids can be told apart in the error report.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.domain.schemas.json_patch import JsonPatchRequest
+
+
+class BulkPatchItem(BaseModel):
+    """One record to patch and the patch document to apply to it."""
+
+    id: uuid.UUID
+    patch: JsonPatchRequest
+
+
+class BulkPatchItemError(BaseModel):
+    """An item that was not applied and the reasons it was rejected."""
+
+    index: int = Field(..., description="0-based position of the item in the request")
+    id: uuid.UUID
+    status_code: int = Field(..., description="HTTP status the single-record patch would return")
+    errors: List[str] = Field(default_factory=list)
+
+
+class BulkPatchResult(BaseModel):
+    """Outcome of a bulk patch request."""
+
+    patch_id: uuid.UUID
+    total: int = 0
+    patched: int = 0
+    failed: int = 0
+    errors: List[BulkPatchItemError] = Field(default_factory=list)
+    errors_truncated: bool = Field(
+        default=False,
+        description="True when more items failed than are listed in ``errors``",
+    )
+
+
+__all__ = ["BulkPatchItem", "BulkPatchItemError", "BulkPatchResult"]
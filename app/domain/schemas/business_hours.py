@@ -0,0 +1,101 @@
+"""
+Pydantic schemas for the Business Hours domain.
+
+A calendar is a weekly list of open intervals in an IANA time zone
+plus holiday dates.  Interval bounds are ``HH:MM`` local times;
+``24:00`` ends an interval at midnight.  An empty ``weekly_hours``
+list means the calendar is always open.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from typing import List, Literal, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+Weekday = Literal["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+_TIME_PATTERN = r"^(([01]\d|2[0-3]):[0-5]\d|24:00)$"
+
+
+class BusinessHoursInterval(BaseModel):
+    """One open interval of a weekday."""
+
+    day: Weekday
+    start: str = Field(..., pattern=_TIME_PATTERN, description="Local opening time (HH:MM)")
+    end: str = Field(..., pattern=_TIME_PATTERN, description="Local closing time (HH:MM)")
+
+    @model_validator(mode="after")
+    def _check_order(self) -> "BusinessHoursInterval":
+        if self.end <= self.start:
+            raise ValueError("end must be after start")
+        return self
+
+
+class BusinessHoursBase(BaseModel):
+    """Shared attributes for business hours creation and update."""
+
+    # All fields are optional on update
+    name: Optional[str] = Field(
+        default=None, max_length=255, description="Name of the calendar"
+    )
+    time_zone: Optional[str] = Field(
+        default=None, max_length=64, description="IANA time zone of the schedule"
+    )
+    weekly_hours: Optional[List[BusinessHoursInterval]] = Field(
+        default=None, description="Open intervals per weekday; empty means always open"
+    )
+    holidays: Optional[List[date]] = Field(
+        default=None, description="Local dates on which the calendar is closed"
+    )
+
+    @field_validator("time_zone")
+    @classmethod
+    def _check_time_zone(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None:
+            try:
+                ZoneInfo(value)
+            except (ZoneInfoNotFoundError, ValueError):
+                raise ValueError(f"Unknown time zone: {value}")
+        return value
+
+
+class TenantCreateBusinessHours(BusinessHoursBase):
+    """Request model for creating a business hours calendar in a tenant context."""
+
+    name: str = Field(..., max_length=255, description="Name of the calendar")
+
+
+class BusinessHoursUpdate(BusinessHoursBase):
+    """Request model for updating an existing business hours calendar."""
+
+
+class BusinessHoursOut(BaseModel):
+    """Response model representing a business hours calendar."""
+
+    id: uuid.UUID
+    tenant_id: uuid.UUID
+    name: str
+    time_zone: str
+    weekly_hours: List[BusinessHoursInterval] = Field(default_factory=list)
+    holidays: List[date] = Field(default_factory=list)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    created_by: Optional[str] = None
+    updated_by: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+__all__ = [
+    "Weekday",
+    "BusinessHoursInterval",
+    "BusinessHoursBase",
+    "TenantCreateBusinessHours",
+    "BusinessHoursUpdate",
+    "BusinessHoursOut",
+]
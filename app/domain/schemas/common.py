@@ -7,11 +7,13 @@ envelopes used by list endpoints.
 
 from __future__ import annotations
 
-from typing import Generic, List, Optional, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, Iterable, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 class ErrorResponseBody(BaseModel):
@@ -32,9 +34,37 @@ class PaginationEnvelope(BaseModel, Generic[T]):
     ``items`` contains the list of returned resources, ``total`` is the
     total number of matching records, and ``limit``/``offset`` echo the
     request parameters.
+
+    When a list is requested in keyset mode (``cursor``/``page_size``),
+    ``page_size`` is echoed, ``next_cursor`` carries the opaque cursor
+    for the following page (``None`` on the last page) and ``total`` is
+    omitted because no count query is executed.
+
+    The ``total_mode`` query parameter overrides how ``total`` is
+    produced: ``exact`` counts, ``estimated`` may return a cached or
+    planner‑estimated figure, and ``none`` omits it.
     """
 
     items: List[T]
-    total: int
+    total: Optional[int] = None
     limit: Optional[int] = None
     offset: Optional[int] = None
+    page_size: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def validate_items(model: Type[ModelT], rows: Iterable[Any]) -> List[ModelT]:
+    """Validate ``rows`` (ORM objects, dicts or ``model`` instances) as a list.
+
+    The whole page is validated in a single pydantic-core call instead
+    of one ``model_validate`` per row.  Rows that already are ``model``
+    instances are passed through without being validated again, and
+    FastAPI's response validation of the returned envelope is likewise
+    a pass-through, so every item is validated exactly once.
+    """
+    return _list_adapter(model).validate_python(rows, from_attributes=True)
@@ -0,0 +1,94 @@
+"""
+Pydantic models for bulk company import jobs.
+
+An import record is a :class:`TenantCreateCompany` extended with an
+``external_key`` (the company's identifier in the source system) and
+relationships that may point at other companies of the same upload by
+external key.  Records are processed asynchronously; the job resource
+reports progress and row errors.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.domain.schemas.bulk_import import BulkImportRowError
+from app.domain.schemas.company import (
+    CompanyContactRelationshipCreateRequest,
+    TenantCreateCompany,
+)
+
+
+class CompanyImportRelationship(BaseModel):
+    """A company relationship from the imported company to another one.
+
+    The target is either another company of the same upload
+    (``to_external_key``) or an existing company (``to_company_id``).
+    """
+
+    to_external_key: Optional[str] = Field(default=None, max_length=255)
+    to_company_id: Optional[uuid.UUID] = None
+    from_role: str = Field(..., max_length=50)
+    to_role: str = Field(..., max_length=50)
+    is_active: Optional[bool] = Field(default=True)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    notes: Optional[str] = Field(default=None, max_length=500)
+
+    @model_validator(mode="after")
+    def _one_target(self) -> "CompanyImportRelationship":
+        if (self.to_external_key is None) == (self.to_company_id is None):
+            raise ValueError("exactly one of to_external_key or to_company_id is required")
+        return self
+
+
+class CompanyImportRecord(TenantCreateCompany):
+    """One company of a bulk import upload."""
+
+    external_key: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        description="Identifier of the company in the source system; unique within an upload",
+    )
+    parent_external_key: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        description="External key of the parent company (parent/subsidiary relationship)",
+    )
+    relationships: Optional[List[CompanyImportRelationship]] = None
+    contact_relationships: Optional[List[CompanyContactRelationshipCreateRequest]] = None
+
+
+class CompanyImportJobOut(BaseModel):
+    """Status and outcome of a bulk company import job."""
+
+    id: uuid.UUID
+    tenant_id: uuid.UUID
+    status: str
+    phase: Optional[str] = None
+    total_rows: int
+    processed_rows: int
+    imported: int
+    failed: int
+    relationships: int
+    errors: List[BulkImportRowError] = Field(default_factory=list)
+    errors_truncated: bool = False
+    error_message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    created_by: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+__all__ = [
+    "CompanyImportJobOut",
+    "CompanyImportRecord",
+    "CompanyImportRelationship",
+]
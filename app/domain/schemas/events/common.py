@@ -21,7 +21,7 @@ embedded payload.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, TypeVar, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -61,3 +61,57 @@ class EventEnvelope(BaseModel):
     data: Dict[str, Any] = Field(..., description="Domain payload for the event")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Nested collections shared by ``ContactDelta`` and ``CompanyDelta``.
+DELTA_COLLECTIONS = ("phones", "emails", "addresses", "social_profiles", "notes")
+
+DeltaT = TypeVar("DeltaT", bound=BaseModel)
+
+
+def _item_id(item: Any) -> Any:
+    return item.get("id") if isinstance(item, dict) else None
+
+
+def merge_deltas(first: DeltaT, second: DeltaT) -> DeltaT:
+    """Fold ``second`` into ``first`` and return the combined delta.
+
+    Used to coalesce several updates of the same aggregate into one
+    event.  ``base_fields`` are merged with later values winning.  For
+    each nested collection an item added and later updated stays in
+    ``*_added`` with its latest snapshot, an item added and later
+    deleted disappears entirely, and repeated updates keep only the
+    latest snapshot.
+    """
+    merged = first.model_copy(deep=True)
+    if second.base_fields:
+        merged.base_fields = {**(merged.base_fields or {}), **second.base_fields}
+    for name in DELTA_COLLECTIONS:
+        added: List[Any] = list(getattr(merged, f"{name}_added") or [])
+        updated: List[Any] = list(getattr(merged, f"{name}_updated") or [])
+        deleted: List[Any] = list(getattr(merged, f"{name}_deleted") or [])
+        added.extend(getattr(second, f"{name}_added") or [])
+        for item in getattr(second, f"{name}_updated") or []:
+            item_id = _item_id(item)
+            for bucket in (added, updated):
+                idx = next(
+                    (i for i, cur in enumerate(bucket) if item_id is not None and _item_id(cur) == item_id),
+                    None,
+                )
+                if idx is not None:
+                    bucket[idx] = item
+                    break
+            else:
+                updated.append(item)
+        for item_id in getattr(second, f"{name}_deleted") or []:
+            remaining = [cur for cur in added if _item_id(cur) != item_id]
+            if len(remaining) != len(added):
+                added = remaining
+                continue
+            updated = [cur for cur in updated if _item_id(cur) != item_id]
+            if item_id not in deleted:
+                deleted.append(item_id)
+        setattr(merged, f"{name}_added", added or None)
+        setattr(merged, f"{name}_updated", updated or None)
+        setattr(merged, f"{name}_deleted", deleted or None)
+    return merged
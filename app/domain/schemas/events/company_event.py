@@ -97,9 +97,23 @@ class CompanyDeletedEvent(BaseModel):
     deleted_dt: Optional[str] = Field(None, description="ISO timestamp of when the company was deleted")
 
 
+class CompanyBulkImportedEvent(BaseModel):
+    """Payload for a company bulk imported event.
+
+    Published once per committed chunk of a bulk import job instead of
+    one ``company.created`` event per company.
+    """
+
+    tenant_id: UUID = Field(..., description="Tenant identifier")
+    import_id: UUID = Field(..., description="Identifier of the import job")
+    chunk: int = Field(..., description="1-based chunk number within the import")
+    company_ids: List[UUID] = Field(..., description="Companies created by this chunk")
+
+
 __all__ = [
     "CompanyCreatedEvent",
     "CompanyUpdatedEvent",
     "CompanyDeletedEvent",
+    "CompanyBulkImportedEvent",
     "CompanyDelta",
 ]
\ No newline at end of file
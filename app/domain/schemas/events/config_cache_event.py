@@ -0,0 +1,23 @@
+"""
+Event model for tenant configuration cache invalidation.
+
+Emitted whenever tenant configuration (ticket forms, field definitions,
+SLA policies and targets, pipelines, group profiles) changes so every
+API process can drop its cached copy.  See
+``app.domain.services.tenant_config_cache``.
+"""
+
+from __future__ import annotations
+
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ConfigCacheInvalidatedMessage(BaseModel):
+    """Payload for a config_cache.invalidated event."""
+
+    tenant_id: UUID = Field(..., description="Tenant whose configuration changed")
+    kinds: List[str] = Field(..., description="Cache kinds to drop for the tenant")
+    origin: str = Field(..., description="Identifier of the publishing process")
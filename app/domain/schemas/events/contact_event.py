@@ -100,9 +100,39 @@ class ContactDeletedEvent(BaseModel):
     tenant_id: UUID = Field(..., description="Tenant identifier")
     deleted_dt: Optional[str] = Field(None, description="ISO timestamp of when the contact was deleted")
 
+
+class ContactBulkImportedEvent(BaseModel):
+    """Payload for a contact bulk imported event.
+
+    One event is published per committed import chunk instead of one
+    ``contact.created`` event per contact.  Consumers that need the
+    full records can fetch them by id.
+    """
+
+    tenant_id: UUID = Field(..., description="Tenant identifier")
+    import_id: UUID = Field(..., description="Identifier of the import request")
+    chunk: int = Field(..., description="1-based chunk number within the import")
+    contact_ids: List[UUID] = Field(..., description="Contacts created by this chunk")
+
+
+class ContactBulkPatchedEvent(BaseModel):
+    """Payload for a contact bulk patched event.
+
+    One event is published per committed bulk patch chunk instead of
+    one ``contact.updated`` event per contact.  ``changes`` maps each
+    changed contact to its delta; snapshots are not included.
+    """
+
+    tenant_id: UUID = Field(..., description="Tenant identifier")
+    patch_id: UUID = Field(..., description="Identifier of the bulk patch request")
+    chunk: int = Field(..., description="1-based chunk number within the request")
+    changes: Dict[UUID, ContactDelta] = Field(..., description="Delta per changed contact")
+
 __all__ = [
     "ContactCreatedEvent",
     "ContactUpdatedEvent",
     "ContactDeletedEvent",
+    "ContactBulkImportedEvent",
+    "ContactBulkPatchedEvent",
     "ContactDelta",
 ]
\ No newline at end of file
@@ -59,3 +59,19 @@ class LeadDeletedMessage(BaseModel):
             "ISO 8601 timestamp at which the lead was deleted.  May be null if not provided."
         ),
     )
+
+
+class LeadBulkPatchedMessage(BaseModel):
+    """Event emitted once per committed chunk of a bulk lead patch.
+
+    Replaces one ``lead.updated`` event per lead.  ``changes`` maps
+    each changed lead to the subset of its attributes that changed;
+    snapshots are not included.
+    """
+
+    tenant_id: UUID = Field(..., description="Identifier of the tenant that owns the leads")
+    patch_id: UUID = Field(..., description="Identifier of the bulk patch request")
+    chunk: int = Field(..., description="1-based chunk number within the request")
+    changes: Dict[UUID, Dict[str, Any]] = Field(
+        ..., description="Changed attributes per lead"
+    )
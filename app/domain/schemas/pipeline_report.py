@@ -0,0 +1,149 @@
+"""
+Pydantic response models for the pipeline reports.
+
+The reports are read from the pipeline rollup tables.  Amounts are
+decimals; durations are reported in days.  Period-based figures
+(entries, exits, conversions) cover the requested UTC date range,
+while current figures (deal counts and amounts) describe the deals in
+each stage right now.  Forecast rows are computed by the vectorized
+forecast engine from the deal table rather than from rollups.  Stage
+duration and deal aging rows are computed from ``stage_history`` with
+window functions, since percentiles cannot be summed from rollups.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PipelineOverviewRow(BaseModel):
+    """Deal count and amount of one pipeline in one stage state."""
+
+    pipeline_id: uuid.UUID
+    status: str = Field(..., description="Stage state of the deals (OPEN, WON or LOST)")
+    deal_count: int = 0
+    total_amount: Decimal = Decimal("0")
+
+
+class WeightedPipelineRow(BaseModel):
+    """Open deals of one pipeline weighted by their win probability."""
+
+    pipeline_id: uuid.UUID
+    open_deal_count: int = 0
+    total_amount: Decimal = Decimal("0")
+    weighted_amount: Decimal = Field(
+        default=Decimal("0"),
+        description="SUM(amount * COALESCE(forecast_probability, probability, stage probability, 0))",
+    )
+
+
+class StageFunnelRow(BaseModel):
+    """Current deals in a stage and the entries into it during the period."""
+
+    stage_id: uuid.UUID
+    stage_name: str
+    display_order: int
+    deal_count: int = 0
+    total_amount: Decimal = Decimal("0")
+    entered_count: int = 0
+
+
+class StageVelocityRow(BaseModel):
+    """How long records stayed in a stage before leaving it."""
+
+    stage_id: uuid.UUID
+    stage_name: str
+    display_order: int
+    entered_count: int = 0
+    exited_count: int = 0
+    avg_duration_days: Optional[float] = Field(
+        default=None,
+        description="Average time in stage of the exits whose entry is known",
+    )
+    current_count: int = 0
+
+
+class StageConversionRow(BaseModel):
+    """Movements from one stage to another during the period."""
+
+    from_stage_id: uuid.UUID
+    to_stage_id: uuid.UUID
+    entered_count: int = Field(0, description="Entries into the from stage")
+    converted_count: int = Field(0, description="Transitions from the from stage to the to stage")
+    conversion_rate: Optional[float] = None
+
+
+class StageDurationRow(BaseModel):
+    """Time-in-stage percentiles of the completed and current stays in a stage."""
+
+    stage_id: uuid.UUID
+    stage_name: str
+    display_order: int
+    exited_count: int = Field(0, description="Stays that ended during the period")
+    avg_days: Optional[float] = None
+    p50_days: Optional[float] = None
+    p90_days: Optional[float] = None
+    current_count: int = Field(0, description="Records in the stage right now")
+    current_p50_days: Optional[float] = None
+    current_p90_days: Optional[float] = None
+
+
+class DealAgingRow(BaseModel):
+    """How long the open deals in a stage have been there, and which are at risk."""
+
+    stage_id: uuid.UUID
+    stage_name: str
+    display_order: int
+    open_deal_count: int = 0
+    open_amount: Decimal = Decimal("0")
+    avg_days_in_stage: Optional[float] = None
+    p50_days_in_stage: Optional[float] = None
+    p90_days_in_stage: Optional[float] = None
+    at_risk_count: int = Field(
+        0, description="Open deals over the stage or cycle age threshold"
+    )
+    at_risk_amount: Decimal = Decimal("0")
+
+
+ForecastGroupBy = Literal["owner", "stage", "close_month"]
+
+
+class ForecastRow(BaseModel):
+    """Pipeline, scenario and won amounts of one group of deals.
+
+    Dimensions the report was not grouped by are ``None``.  A grouped
+    dimension is also ``None`` for deals without an owner or close month.
+    """
+
+    owner_id: Optional[uuid.UUID] = None
+    stage_id: Optional[uuid.UUID] = None
+    close_month: Optional[date] = Field(default=None, description="First day of the close month")
+    open_deal_count: int = 0
+    pipeline_amount: float = Field(0.0, description="Unweighted amount of open deals")
+    weighted_amount: float = Field(0.0, description="SUM(amount * probability) of open deals")
+    commit_amount: float = Field(
+        0.0, description="Amount of open deals at or above the commit probability"
+    )
+    best_case_amount: float = Field(
+        0.0, description="Amount of open deals at or above the best-case probability"
+    )
+    won_deal_count: int = 0
+    won_amount: float = 0.0
+
+
+__all__ = [
+    "PipelineOverviewRow",
+    "WeightedPipelineRow",
+    "StageFunnelRow",
+    "StageVelocityRow",
+    "StageConversionRow",
+    "StageDurationRow",
+    "DealAgingRow",
+    "ForecastGroupBy",
+    "ForecastRow",
+]
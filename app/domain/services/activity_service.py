@@ -20,7 +20,8 @@ from sqlalchemy.orm import Session
 
 from app.domain.models.activity import Activity
 from app.domain.schemas.activity import ActivityCreate, ActivityUpdate, ActivityRead
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 # Import the canonical activity message producer.  This class publishes events
 # after successful commits and should be used for all activity lifecycle
 # notifications.  See app/messaging/producers/activity_producer.py for details.
@@ -43,9 +44,12 @@ def list_activities(
     tenant_id: UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
     type: Optional[str] = None,
     status: Optional[str] = None,
-) -> Tuple[List[Activity], int]:
+) -> Tuple[List[Activity], Optional[int]]:
     """Return a list of activities for a given tenant with optional pagination and filters.
 
     Parameters
@@ -71,13 +75,15 @@ def list_activities(
         query = query.filter(Activity.type.ilike(type))
     if status:
         query = query.filter(Activity.status.ilike(status))
-    total = query.count()
-    if offset is not None:
-        query = query.offset(offset)
-    if limit is not None:
-        query = query.limit(limit)
-    activities = query.all()
-    return activities, total
+    return paginate(
+        query,
+        Activity,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def get_activity(
@@ -127,7 +133,7 @@ def create_activity(
         updated_by=created_user,
     )
     db.add(activity)
-    commit_or_raise(db, refresh=activity, action="create activity")
+    flush_or_raise(db, refresh=activity, action="create activity")
     snapshot = _activity_snapshot(activity)
     try:
         ActivityMessageProducer.send_activity_created(
@@ -142,6 +148,7 @@ def create_activity(
             tenant_id,
             activity.id,
         )
+    commit_or_raise(db, action="create activity")
     return activity
 
 
@@ -183,7 +190,7 @@ def update_activity(
     activity.updated_by = modified_user
     activity.updated_at = datetime.utcnow()
     db.add(activity)
-    commit_or_raise(db, refresh=activity, action="update activity")
+    flush_or_raise(db, refresh=activity, action="update activity")
     changes: Dict[str, Any] = {}
     if original["type"] != activity.type:
         changes["type"] = activity.type
@@ -213,6 +220,7 @@ def update_activity(
                 tenant_id,
                 activity.id,
             )
+    commit_or_raise(db, action="update activity")
     return activity
 
 
@@ -225,7 +233,7 @@ def delete_activity(
     """Delete the specified activity and publish a deletion event."""
     activity = get_activity(db, tenant_id=tenant_id, activity_id=activity_id)
     db.delete(activity)
-    commit_or_raise(db, action="delete activity")
+    flush_or_raise(db, action="delete activity")
     try:
         ActivityMessageProducer.send_activity_deleted(
             tenant_id=tenant_id,
@@ -239,6 +247,7 @@ def delete_activity(
             tenant_id,
             activity.id,
         )
+    commit_or_raise(db, action="delete activity")
 
 
 def service_list_activities(
@@ -247,9 +256,12 @@ def service_list_activities(
     tenant_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
     type: Optional[str] = None,
     status: Optional[str] = None,
-) -> Tuple[List[Activity], int]:
+) -> Tuple[List[Activity], Optional[int]]:
     """Admin variant of list_activities that optionally scopes by tenant.
 
     If ``tenant_id`` is ``None``, activities across all tenants are returned.
@@ -261,13 +273,15 @@ def service_list_activities(
         query = query.filter(Activity.type.ilike(type))
     if status:
         query = query.filter(Activity.status.ilike(status))
-    total = query.count()
-    if offset is not None:
-        query = query.offset(offset)
-    if limit is not None:
-        query = query.limit(limit)
-    activities = query.all()
-    return activities, total
+    return paginate(
+        query,
+        Activity,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_create_activity(
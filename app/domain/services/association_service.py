@@ -25,7 +25,8 @@ from sqlalchemy.orm import Session
 
 from app.domain.models.association import Association
 from app.domain.schemas.association import AssociationCreate, AssociationRead
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 from app.messaging.producers.association_producer import AssociationMessageProducer
 
 import logging
@@ -45,16 +46,21 @@ def list_associations(
     tenant_id: uuid.UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[Association], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Association], Optional[int]]:
     """Return a list of associations for a given tenant with optional pagination."""
     query = db.query(Association).filter(Association.tenant_id == tenant_id)
-    total = query.count()
-    if offset is not None:
-        query = query.offset(offset)
-    if limit is not None:
-        query = query.limit(limit)
-    items = query.all()
-    return items, total
+    return paginate(
+        query,
+        Association,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def get_association(
@@ -102,7 +108,7 @@ def create_association(
         created_by=created_user,
     )
     db.add(association)
-    commit_or_raise(db, refresh=association, action="create association")
+    flush_or_raise(db, refresh=association, action="create association")
     snapshot = _association_snapshot(association)
     try:
         AssociationMessageProducer.send_association_created(
@@ -115,6 +121,7 @@ def create_association(
             tenant_id,
             association.id,
         )
+    commit_or_raise(db, action="create association")
     return association
 
 
@@ -127,7 +134,7 @@ def delete_association(
     """Delete the specified association and publish a deletion event."""
     association = get_association(db, tenant_id=tenant_id, association_id=association_id)
     db.delete(association)
-    commit_or_raise(db, action="delete association")
+    flush_or_raise(db, action="delete association")
     try:
         AssociationMessageProducer.send_association_deleted(
             tenant_id=tenant_id,
@@ -139,6 +146,7 @@ def delete_association(
             tenant_id,
             association_id,
         )
+    commit_or_raise(db, action="delete association")
 
 
 def service_list_associations(
@@ -147,7 +155,10 @@ def service_list_associations(
     tenant_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[Association], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Association], Optional[int]]:
     """Admin variant of list_associations that optionally scopes by tenant.
 
     If ``tenant_id`` is ``None``, associations across all tenants are returned.
@@ -155,13 +166,15 @@ def service_list_associations(
     query = db.query(Association)
     if tenant_id is not None:
         query = query.filter(Association.tenant_id == tenant_id)
-    total = query.count()
-    if offset is not None:
-        query = query.offset(offset)
-    if limit is not None:
-        query = query.limit(limit)
-    items = query.all()
-    return items, total
+    return paginate(
+        query,
+        Association,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_create_association(
@@ -25,7 +25,8 @@ from app.domain.schemas.automation_action_execution import (
     AutomationActionExecutionCreate,
     AutomationActionExecutionRead,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 from app.messaging.producers.automation_action_execution_producer import (
     AutomationActionExecutionMessageProducer,
 )
@@ -149,8 +150,8 @@ def update_execution_status(
         entry.started_at = _parse_iso(started_at)
     if completed_at is not None:
         entry.completed_at = _parse_iso(completed_at)
-    commit_or_raise(db, refresh=entry, action="update automation action execution")
-    # Emit status changed event after successful commit
+    flush_or_raise(db, refresh=entry, action="update automation action execution")
+    # Emit status changed event; commit_or_raise stages it with the update
     try:
         payload = _execution_snapshot(entry)
         AutomationActionExecutionMessageProducer.send_execution_status_changed(
@@ -164,6 +165,7 @@ def update_execution_status(
     except Exception:
         # Suppress messaging errors; classification handled by messaging layer
         pass
+    commit_or_raise(db, action="update automation action execution")
     return entry
 
 
@@ -175,7 +177,10 @@ def list_executions_by_action(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[AutomationActionExecution], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[AutomationActionExecution], Optional[int]]:
     """List execution records for a given action and optional status filter."""
     query = db.query(AutomationActionExecution).filter(
         AutomationActionExecution.tenant_id == tenant_id,
@@ -183,13 +188,16 @@ def list_executions_by_action(
     )
     if status:
         query = query.filter(AutomationActionExecution.status == status)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(AutomationActionExecution.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        AutomationActionExecution,
+        order_by=(AutomationActionExecution.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def list_executions_by_entity(
@@ -31,7 +31,8 @@ from app.domain.schemas.events.automation_action_event import (
 from app.messaging.producers.automation_action_producer import (
     AutomationActionMessageProducer as AutomationActionProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("automation_action_service")
 
@@ -68,7 +69,10 @@ def list_automation_actions(
     scope_type: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[AutomationAction], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[AutomationAction], Optional[int]]:
     """List automation actions with optional filtering by entity_type and scope_type.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.  Filters
@@ -91,13 +95,16 @@ def list_automation_actions(
         query = query.filter(AutomationAction.entity_type == entity_type)
     if scope_type:
         query = query.filter(AutomationAction.scope_type == scope_type)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(AutomationAction.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        AutomationAction,
+        order_by=(AutomationAction.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_automation_action(
@@ -135,7 +142,7 @@ def create_automation_action(
         updated_by_user_id=created_by,
     )
     db.add(action)
-    commit_or_raise(db, refresh=action, action="create automation action")
+    flush_or_raise(db, refresh=action, action="create automation action")
     snapshot = _snapshot(action)
     try:
         AutomationActionProducer.send_automation_action_created(
@@ -144,6 +151,7 @@ def create_automation_action(
     except Exception:
         # Suppress messaging errors; classification handled by messaging layer
         pass
+    commit_or_raise(db, action="create automation action")
     return action
 
 
@@ -207,7 +215,7 @@ def update_automation_action(
             setattr(action, field, value)
         action.updated_by_user_id = updated_by
         action.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=action, action="update automation action")
+        flush_or_raise(db, refresh=action, action="update automation action")
         snapshot = _snapshot(action)
         try:
             AutomationActionProducer.send_automation_action_updated(
@@ -217,6 +225,7 @@ def update_automation_action(
             )
         except Exception:
             pass
+        commit_or_raise(db, action="update automation action")
     return action
 
 
@@ -229,7 +238,7 @@ def delete_automation_action(
     """Delete an automation action and publish a deletion event."""
     action = get_automation_action(db, tenant_id=tenant_id, action_id=action_id)
     db.delete(action)
-    commit_or_raise(db, action="delete automation action")
+    flush_or_raise(db, action="delete automation action")
     deleted_dt = datetime.utcnow().isoformat()
     try:
         AutomationActionProducer.send_automation_action_deleted(
@@ -238,6 +247,7 @@ def delete_automation_action(
         )
     except Exception:
         pass
+    commit_or_raise(db, action="delete automation action")
     return None
 
 
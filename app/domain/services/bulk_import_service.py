@@ -0,0 +1,418 @@
+"""
+Shared machinery for bulk import endpoints.
+
+Bulk imports read NDJSON or CSV records from a stream, validate each
+record with the regular create schema and load valid rows in chunks.
+Two loaders share the same failure handling:
+
+* :class:`StagedLoader` writes every chunk with ``COPY ... FROM STDIN``
+  into session-local staging tables (``crm_import_<table>``) and moves
+  it into the real tables with one ``INSERT ... SELECT`` per table;
+* :class:`MultiRowLoader` sends the chunk as multi-row ``INSERT``
+  statements, for jobs that need no staging tables.
+
+Either way a chunk is loaded inside a savepoint, so all constraints,
+foreign keys and defaults of the target schema apply unchanged.  When
+that fails, the chunk is split in halves and retried until the
+offending rows are isolated; they are reported with the translated
+database error while the rest of the chunk is kept.
+
+Staging tables are created with ``CREATE TEMP TABLE ... AS ... WITH NO
+DATA`` so they have the target column types but no constraints, and
+are emptied after each load.  Callers commit each chunk on their own.
+"""
+
+from __future__ import annotations
+
+import abc
+import codecs
+import csv
+import io
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import Table, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.domain.schemas.bulk_import import BulkImportResult, BulkImportRowError
+from app.domain.services.common_service import _http_exception_from_db_error
+from app.util.serialization import loads
+
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+# Upper bound on row errors returned in one response
+MAX_REPORTED_ERRORS = 1000
+
+# One parsed input row: (row number, record or None, parse error or None)
+ParsedRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+
+def resolve_format(requested: Optional[str], content_type: Optional[str]) -> str:
+    """Pick the import format from an explicit choice or the Content-Type."""
+    if requested:
+        fmt = requested.lower()
+        if fmt not in IMPORT_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported import format {requested!r}; use one of {', '.join(IMPORT_FORMATS)}",
+            )
+        return fmt
+    if content_type and "csv" in content_type.lower():
+        return "csv"
+    return "ndjson"
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode a UTF-8 byte stream into lines, keeping line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.splitlines(keepends=True)
+        # The last piece may be an incomplete line (or "\r" of a "\r\n")
+        pending = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _iter_ndjson(lines: Iterable[str]) -> Iterator[ParsedRecord]:
+    row = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = loads(line)
+        except ValueError as exc:
+            yield row, None, f"invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield row, None, "each line must be a JSON object"
+            continue
+        yield row, record, None
+
+
+def _iter_csv(lines: Iterable[str], json_fields: Sequence[str]) -> Iterator[ParsedRecord]:
+    reader = csv.DictReader(lines)
+    for row, raw in enumerate(reader, start=1):
+        if None in raw:
+            yield row, None, "row has more columns than the header"
+            continue
+        record: Dict[str, Any] = {}
+        error: Optional[str] = None
+        for key, value in raw.items():
+            if value is None or value == "":
+                continue
+            key = key.strip()
+            if key in json_fields:
+                try:
+                    record[key] = loads(value)
+                except ValueError:
+                    error = f"{key}: column must hold a JSON array"
+                    break
+            else:
+                record[key] = value
+        yield row, (None if error else record), error
+
+
+def iter_records(
+    lines: Iterable[str], fmt: str, *, json_fields: Sequence[str] = ()
+) -> Iterator[ParsedRecord]:
+    """Yield ``(row, record, error)`` for every input row.
+
+    CSV columns map to schema fields; columns listed in ``json_fields``
+    (nested collections) hold JSON arrays.  Empty CSV cells are left
+    out so schema defaults apply.
+    """
+    if fmt == "csv":
+        return _iter_csv(lines, json_fields)
+    return _iter_ndjson(lines)
+
+
+def validation_messages(exc: ValidationError) -> List[str]:
+    """Flatten a Pydantic validation error into ``"field: message"`` strings."""
+    messages = []
+    for error in exc.errors():
+        loc = ".".join(str(part) for part in error.get("loc", ()))
+        messages.append(f"{loc}: {error.get('msg')}" if loc else str(error.get("msg")))
+    return messages
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ImportReport:
+    """Accumulates the outcome of an import."""
+
+    import_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    total_rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[BulkImportRowError] = field(default_factory=list)
+    truncated: bool = False
+
+    def add_error(
+        self,
+        row: int,
+        errors: List[str],
+        constraint: Optional[str] = None,
+        *,
+        rejected: bool = True,
+    ) -> None:
+        """Record errors for ``row``.
+
+        ``rejected=False`` reports a problem with a row that was still
+        imported (e.g. one of its relationships), so ``failed`` is not
+        incremented.
+        """
+        if rejected:
+            self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(
+                BulkImportRowError(row=row, errors=errors, constraint=constraint)
+            )
+        else:
+            self.truncated = True
+
+    def result(self) -> BulkImportResult:
+        return BulkImportResult(
+            import_id=self.import_id,
+            total_rows=self.total_rows,
+            imported=self.imported,
+            failed=self.failed,
+            errors=sorted(self.errors, key=lambda e: e.row),
+            errors_truncated=self.truncated,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class StagedTable:
+    """A target table and the columns an import writes to it."""
+
+    table: Table
+    columns: Tuple[str, ...]
+
+    @property
+    def stage_name(self) -> str:
+        return f"crm_import_{self.table.name}"
+
+
+@dataclass
+class ImportItem:
+    """One valid input row expanded into rows for each target table.
+
+    ``rows`` maps a table name to value tuples ordered like the
+    corresponding :attr:`StagedTable.columns`.
+    """
+
+    row: int
+    key: uuid.UUID
+    rows: Dict[str, List[Tuple[Any, ...]]]
+
+
+def _copy_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def encode_copy_rows(rows: Iterable[Sequence[Any]]) -> str:
+    """Encode rows in PostgreSQL ``COPY`` text format."""
+    return "".join("\t".join(_copy_value(v) for v in row) + "\n" for row in rows)
+
+
+class BatchLoader(abc.ABC):
+    """Base class for loaders that insert :class:`ImportItem` chunks.
+
+    ``tables`` must be ordered parents first.  Loaders work on the
+    connection of ``db`` and never commit; callers commit per chunk.
+    Subclasses implement :meth:`_load_once`, which inserts a chunk and
+    raises a database error when any row is rejected.
+    """
+
+    def __init__(self, db: Session, tables: Sequence[StagedTable]) -> None:
+        self.db = db
+        self.tables = tuple(tables)
+
+    def load(self, items: Sequence[ImportItem]) -> Tuple[List[ImportItem], List[Tuple[ImportItem, BaseException]]]:
+        """Insert ``items``; return the loaded items and the rejected ones."""
+        self._prepare()
+        loaded: List[ImportItem] = []
+        rejected: List[Tuple[ImportItem, BaseException]] = []
+        self._load_or_split(list(items), loaded, rejected)
+        return loaded, rejected
+
+    # -- internals ---------------------------------------------------------
+
+    def _prepare(self) -> None:
+        """Hook run once per chunk before the first insert."""
+
+    @abc.abstractmethod
+    def _load_once(self, items: List[ImportItem]) -> None:
+        """Insert ``items`` in one statement batch or raise a database error."""
+
+    def _rows(self, items: List[ImportItem], staged: StagedTable) -> List[Tuple[Any, ...]]:
+        return [row for item in items for row in item.rows.get(staged.table.name, ())]
+
+    def _db_errors(self) -> Tuple[type, ...]:
+        dbapi = getattr(self.db.get_bind().dialect, "loaded_dbapi", None)
+        dbapi_error = getattr(dbapi, "Error", None)
+        return (DBAPIError, dbapi_error) if dbapi_error else (DBAPIError,)
+
+    def _load_or_split(
+        self,
+        items: List[ImportItem],
+        loaded: List[ImportItem],
+        rejected: List[Tuple[ImportItem, BaseException]],
+    ) -> None:
+        if not items:
+            return
+        try:
+            self._load_once(items)
+        except self._db_errors() as exc:
+            if len(items) == 1:
+                rejected.append((items[0], exc))
+                return
+            middle = len(items) // 2
+            self._load_or_split(items[:middle], loaded, rejected)
+            self._load_or_split(items[middle:], loaded, rejected)
+            return
+        loaded.extend(items)
+
+
+class StagedLoader(BatchLoader):
+    """Loads chunks through ``COPY`` into temporary staging tables."""
+
+    def _prepare(self) -> None:
+        # Temp tables live per connection; the session may get a
+        # different pooled connection after each commit.
+        for staged in self.tables:
+            columns = ", ".join(staged.columns)
+            self.db.execute(
+                text(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {staged.stage_name} "
+                    f"ON COMMIT DELETE ROWS AS SELECT {columns} "
+                    f"FROM {staged.table.fullname} WITH NO DATA"
+                )
+            )
+
+    def _copy(self, staged: StagedTable, rows: List[Tuple[Any, ...]]) -> None:
+        data = encode_copy_rows(rows)
+        sql = f"COPY {staged.stage_name} ({', '.join(staged.columns)}) FROM STDIN"
+        dbapi_connection = self.db.connection().connection.dbapi_connection
+        cursor = dbapi_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(sql, io.StringIO(data))
+            else:  # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(data)
+        finally:
+            cursor.close()
+
+    def _load_once(self, items: List[ImportItem]) -> None:
+        with self.db.begin_nested():
+            for staged in self.tables:
+                rows = self._rows(items, staged)
+                if rows:
+                    self._copy(staged, rows)
+            for staged in self.tables:
+                columns = ", ".join(staged.columns)
+                self.db.execute(
+                    text(
+                        f"INSERT INTO {staged.table.fullname} ({columns}) "
+                        f"SELECT {columns} FROM {staged.stage_name}"
+                    )
+                )
+            self.db.execute(
+                text("TRUNCATE " + ", ".join(s.stage_name for s in self.tables))
+            )
+
+
+class MultiRowLoader(BatchLoader):
+    """Loads chunks with multi-row ``INSERT ... VALUES`` statements.
+
+    Each table's rows are passed to a single ``execute`` call, which
+    SQLAlchemy sends as batched multi-row ``VALUES`` statements.
+    """
+
+    def _load_once(self, items: List[ImportItem]) -> None:
+        with self.db.begin_nested():
+            for staged in self.tables:
+                rows = self._rows(items, staged)
+                if rows:
+                    self.db.execute(
+                        staged.table.insert(),
+                        [dict(zip(staged.columns, row)) for row in rows],
+                    )
+
+
+def describe_db_error(exc: BaseException) -> Tuple[List[str], Optional[str]]:
+    """Return user-facing messages and the constraint name for a DB error."""
+    detail = _http_exception_from_db_error(exc).detail
+    if isinstance(detail, dict):
+        messages = [str(detail.get("message"))]
+        if detail.get("db_detail"):
+            messages.append(str(detail["db_detail"]))
+        return messages, detail.get("constraint")
+    return [str(detail)], None
+
+
+__all__ = [
+    "IMPORT_FORMATS",
+    "MAX_REPORTED_ERRORS",
+    "ImportItem",
+    "ImportReport",
+    "BatchLoader",
+    "MultiRowLoader",
+    "StagedLoader",
+    "StagedTable",
+    "describe_db_error",
+    "encode_copy_rows",
+    "iter_lines",
+    "iter_records",
+    "resolve_format",
+    "validation_messages",
+]
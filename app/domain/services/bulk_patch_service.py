@@ -0,0 +1,178 @@
+"""
+Shared machinery for bulk JSON Patch endpoints.
+
+:func:`run_bulk_patch` applies a JSON Patch document to each of many
+records of one model.  Items are processed in chunks: the targets of a
+chunk are loaded with a single ``IN`` query, every item is applied in
+its own savepoint so a failing item is rolled back and reported
+without aborting its neighbours, and the chunk is committed as one
+transaction.  Before each commit the resource's ``publish`` callback
+receives the changes of the chunk so that one grouped event per chunk,
+instead of one event per record, commits together with it.
+
+The per-resource pieces (applying a patch to one instance, merging
+two changes of the same record, publishing) are supplied by the
+resource's service module.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import Config
+from app.domain.schemas.bulk_patch import BulkPatchItem, BulkPatchItemError, BulkPatchResult
+from app.domain.schemas.json_patch import JsonPatchRequest
+
+from .bulk_import_service import MAX_REPORTED_ERRORS, validation_messages
+from .common_service import _http_exception_from_db_error, commit_or_raise
+
+logger = logging.getLogger("bulk_patch_service")
+
+ChangeT = TypeVar("ChangeT")
+
+
+@dataclass
+class BulkPatchReport:
+    """Accumulates the outcome of a bulk patch."""
+
+    patch_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    total: int = 0
+    patched: int = 0
+    failed: int = 0
+    errors: List[BulkPatchItemError] = field(default_factory=list)
+    truncated: bool = False
+
+    def add_error(self, index: int, item_id: uuid.UUID, status_code: int, errors: List[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(
+                BulkPatchItemError(index=index, id=item_id, status_code=status_code, errors=errors)
+            )
+        else:
+            self.truncated = True
+
+    def result(self) -> BulkPatchResult:
+        return BulkPatchResult(
+            patch_id=self.patch_id,
+            total=self.total,
+            patched=self.patched,
+            failed=self.failed,
+            errors=self.errors,
+            errors_truncated=self.truncated,
+        )
+
+
+def _http_messages(exc: HTTPException) -> List[str]:
+    detail = exc.detail
+    if isinstance(detail, dict) and "message" in detail:
+        messages = [str(detail["message"])]
+        if detail.get("db_detail"):
+            messages.append(str(detail["db_detail"]))
+        return messages
+    if isinstance(detail, list):
+        return [str(d) for d in detail]
+    return [str(detail)]
+
+
+def _load_targets(
+    db: Session,
+    model: Any,
+    *,
+    tenant_id: uuid.UUID,
+    ids: Iterable[uuid.UUID],
+    options: Sequence[Any],
+) -> Dict[uuid.UUID, Any]:
+    query = db.query(model).filter(model.tenant_id == tenant_id, model.id.in_(set(ids)))
+    if options:
+        query = query.options(*options)
+    return {obj.id: obj for obj in query}
+
+
+def _apply_in_savepoint(
+    db: Session,
+    apply: Callable[[Any, JsonPatchRequest], ChangeT],
+    target: Any,
+    patch: JsonPatchRequest,
+) -> ChangeT:
+    """Run ``apply`` in a savepoint, translating database errors."""
+    try:
+        with db.begin_nested():
+            return apply(target, patch)
+    except SQLAlchemyError as exc:
+        raise _http_exception_from_db_error(exc) from exc
+
+
+def run_bulk_patch(
+    db: Session,
+    items: Sequence[BulkPatchItem],
+    *,
+    model: Any,
+    tenant_id: uuid.UUID,
+    apply: Callable[[Any, JsonPatchRequest], ChangeT],
+    publish: Callable[[uuid.UUID, int, Dict[uuid.UUID, ChangeT]], None],
+    merge: Callable[[ChangeT, ChangeT], ChangeT],
+    has_changes: Callable[[ChangeT], bool] = bool,
+    options: Sequence[Any] = (),
+    not_found: str = "Record not found",
+    action: str = "bulk_patch",
+    chunk_size: Optional[int] = None,
+) -> BulkPatchResult:
+    """Apply ``items`` to records of ``model`` in the tenant.
+
+    ``apply`` mutates one loaded instance and returns the change it
+    made; errors it raises (``HTTPException``, Pydantic validation
+    errors, database errors surfacing when the savepoint is flushed)
+    reject just that item.  Changes of an id patched more than once
+    are combined with ``merge``.  ``publish(patch_id, chunk, changes)``
+    runs before each chunk commits and is given only records whose
+    change is non-empty according to ``has_changes``.
+    """
+    chunk_size = max(1, chunk_size or Config.bulk_patch_chunk_size())
+    report = BulkPatchReport(total=len(items))
+    for chunk_no, start in enumerate(range(0, len(items), chunk_size), start=1):
+        chunk = items[start : start + chunk_size]
+        targets = _load_targets(
+            db, model, tenant_id=tenant_id, ids=(i.id for i in chunk), options=options
+        )
+        changes: Dict[uuid.UUID, ChangeT] = {}
+        for index, item in enumerate(chunk, start=start):
+            target = targets.get(item.id)
+            if target is None:
+                report.add_error(index, item.id, status.HTTP_404_NOT_FOUND, [not_found])
+                continue
+            try:
+                change = _apply_in_savepoint(db, apply, target, item.patch)
+            except HTTPException as exc:
+                report.add_error(index, item.id, exc.status_code, _http_messages(exc))
+                continue
+            except ValidationError as exc:
+                report.add_error(
+                    index, item.id, status.HTTP_422_UNPROCESSABLE_ENTITY, validation_messages(exc)
+                )
+                continue
+            report.patched += 1
+            changes[item.id] = merge(changes[item.id], change) if item.id in changes else change
+        changed = {key: change for key, change in changes.items() if has_changes(change)}
+        if changed:
+            try:
+                publish(report.patch_id, chunk_no, changed)
+            except Exception:
+                logger.exception(
+                    "Failed to publish bulk patch event tenant_id=%s patch_id=%s chunk=%s",
+                    tenant_id,
+                    report.patch_id,
+                    chunk_no,
+                )
+        commit_or_raise(db, action=action)
+    return report.result()
+
+
+__all__ = ["BulkPatchReport", "run_bulk_patch"]
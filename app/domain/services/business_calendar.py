@@ -0,0 +1,229 @@
+"""
+Business-hours calendar arithmetic for SLA due dates.
+
+A calendar is a weekly schedule of open intervals in a time zone plus
+a set of holiday dates.  :class:`BusinessCalendar` expands it into a
+table of UTC open intervals with the cumulative business seconds
+before each one, so converting between a timestamp and its business
+offset is a binary search (O(log n)) and adding business minutes is
+two of them.
+
+The table covers a range of local days around recent lookups; it is
+grown when a deadline falls past its end and rebuilt around a lookup
+that falls outside it.
+Compiled calendars are shared per definition through
+:func:`get_calendar`.  An empty weekly schedule means "always open".
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# Initial table range around the first lookup, and the furthest a
+# lookup may extend it (guards against schedules that are never open).
+_INITIAL_DAYS_BEFORE = 366
+_INITIAL_DAYS_AFTER = 731
+_MAX_SPAN_DAYS = 366 * 50
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _minute_of_day(value: str) -> int:
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+@dataclass(frozen=True)
+class _Table:
+    first_day: date
+    last_day: date  # exclusive
+    starts: List[float]
+    ends: List[float]
+    # Business seconds before each interval starts / once it ends
+    before: List[float]
+    after: List[float]
+
+
+class BusinessCalendar:
+    """Business-time arithmetic over a precomputed table of open intervals.
+
+    ``weekly_hours`` maps a weekday (``mon``..``sun``) to its open
+    intervals in minutes of the local day; ``holidays`` are local dates
+    on which the calendar is closed.
+    """
+
+    def __init__(
+        self,
+        time_zone: str = "UTC",
+        weekly_hours: Optional[Dict[int, Sequence[Tuple[int, int]]]] = None,
+        holidays: Iterable[date] = (),
+    ) -> None:
+        self.zone = ZoneInfo(time_zone)
+        self.weekly_hours = {
+            day: self._merge(intervals) for day, intervals in (weekly_hours or {}).items() if intervals
+        }
+        self.holidays: FrozenSet[date] = frozenset(holidays)
+        self.always_open = not self.weekly_hours
+        self._table: Optional[_Table] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _merge(intervals: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            elif start < end:
+                merged.append((start, end))
+        return merged
+
+    # ------------------------------------------------------------------
+    # Interval table
+    # ------------------------------------------------------------------
+
+    def _local(self, day: date, minute: int) -> float:
+        # Aware arithmetic is wall-clock, so DST days keep their local hours.
+        midnight = datetime(day.year, day.month, day.day, tzinfo=self.zone)
+        return (midnight + timedelta(minutes=minute)).timestamp()
+
+    def _build(self, first_day: date, last_day: date) -> _Table:
+        starts: List[float] = []
+        ends: List[float] = []
+        before: List[float] = []
+        after: List[float] = []
+        total = 0.0
+        day = first_day
+        while day < last_day:
+            if day not in self.holidays:
+                for start, end in self.weekly_hours.get(day.weekday(), ()):
+                    start_ts, end_ts = self._local(day, start), self._local(day, end)
+                    if end_ts <= start_ts:
+                        continue
+                    starts.append(start_ts)
+                    ends.append(end_ts)
+                    before.append(total)
+                    total += end_ts - start_ts
+                    after.append(total)
+            day += timedelta(days=1)
+        return _Table(first_day, last_day, starts, ends, before, after)
+
+    def _covering(self, first_day: date, last_day: date) -> _Table:
+        """Return a table covering at least ``[first_day, last_day)``."""
+        table = self._table
+        if table is not None and table.first_day <= first_day and last_day <= table.last_day:
+            return table
+        with self._lock:
+            table = self._table
+            if table is not None and first_day <= table.last_day and table.first_day <= last_day:
+                # Grow the current table; a distant range replaces it.
+                first_day = min(first_day, table.first_day)
+                last_day = max(last_day, table.last_day)
+            if (last_day - first_day).days > _MAX_SPAN_DAYS:
+                raise ValueError("Business hours calendar range exceeded")
+            table = self._build(first_day, last_day)
+            self._table = table
+            return table
+
+    def _table_for(self, moment: datetime) -> _Table:
+        day = moment.astimezone(self.zone).date()
+        table = self._table
+        if table is not None and table.first_day < day < table.last_day - timedelta(days=1):
+            return table
+        return self._covering(
+            day - timedelta(days=_INITIAL_DAYS_BEFORE), day + timedelta(days=_INITIAL_DAYS_AFTER)
+        )
+
+    @staticmethod
+    def _offset(table: _Table, ts: float) -> float:
+        i = bisect_right(table.starts, ts) - 1
+        if i < 0:
+            return 0.0
+        return table.before[i] + min(ts, table.ends[i]) - table.starts[i]
+
+    # ------------------------------------------------------------------
+    # Arithmetic
+    # ------------------------------------------------------------------
+
+    def add_minutes(self, start: datetime, minutes: float) -> datetime:
+        """Return the moment ``minutes`` business minutes after ``start``.
+
+        A deadline that falls exactly at the end of an open interval is
+        that end, not the start of the next interval.
+        """
+        start = _as_utc(start)
+        if self.always_open or minutes <= 0:
+            return start + timedelta(minutes=max(minutes, 0))
+        table = self._table_for(start)
+        target = self._offset(table, start.timestamp()) + minutes * 60
+        while not table.after or target > table.after[-1]:
+            span = table.last_day - table.first_day
+            table = self._covering(table.first_day, table.last_day + span)
+        j = bisect_left(table.after, target)
+        return datetime.fromtimestamp(table.starts[j] + target - table.before[j], timezone.utc)
+
+    def minutes_between(self, start: datetime, end: datetime) -> float:
+        """Business minutes from ``start`` to ``end`` (negative if ``end`` is earlier)."""
+        start, end = _as_utc(start), _as_utc(end)
+        if self.always_open:
+            return (end - start).total_seconds() / 60
+        low, high = sorted((start, end))
+        table = self._table_for(low)
+        high_day = high.astimezone(self.zone).date()
+        if high_day >= table.last_day - timedelta(days=1):
+            table = self._covering(table.first_day, high_day + timedelta(days=2))
+        return (self._offset(table, end.timestamp()) - self._offset(table, start.timestamp())) / 60
+
+
+ALWAYS_OPEN = BusinessCalendar()
+
+
+@lru_cache(maxsize=256)
+def _compile(
+    time_zone: str,
+    weekly_hours: Tuple[Tuple[int, Tuple[Tuple[int, int], ...]], ...],
+    holidays: FrozenSet[date],
+) -> BusinessCalendar:
+    return BusinessCalendar(time_zone, dict(weekly_hours), holidays)
+
+
+def get_calendar(
+    time_zone: Optional[str],
+    weekly_hours: Optional[Sequence[Dict[str, Any]]],
+    holidays: Optional[Sequence[Any]] = None,
+) -> BusinessCalendar:
+    """Return the shared compiled calendar for a stored definition.
+
+    ``weekly_hours`` items are ``{"day": "mon", "start": "09:00",
+    "end": "17:00"}`` (``"24:00"`` ends at midnight); ``holidays`` are
+    dates or ISO date strings.
+    """
+    days: Dict[int, List[Tuple[int, int]]] = {}
+    for item in weekly_hours or ():
+        days.setdefault(WEEKDAYS.index(item["day"]), []).append(
+            (_minute_of_day(item["start"]), _minute_of_day(item["end"]))
+        )
+    key = tuple(sorted((day, tuple(sorted(intervals))) for day, intervals in days.items()))
+    dates = frozenset(
+        value if isinstance(value, date) else date.fromisoformat(value) for value in holidays or ()
+    )
+    return _compile(time_zone or "UTC", key, dates)
+
+
+__all__ = [
+    "WEEKDAYS",
+    "ALWAYS_OPEN",
+    "BusinessCalendar",
+    "get_calendar",
+]
@@ -0,0 +1,166 @@
+"""
+Service layer for BusinessHours entities.
+
+This module provides CRUD operations for business hours calendars in a
+tenant context.  Calendars are SLA configuration rather than CRM
+records, so no domain events are published; instead, changing or
+deleting a calendar drops the tenant's cached SLA context and queues a
+recomputation of the tenant's ticket SLA due dates.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.domain.models.business_hours import BusinessHours
+from app.domain.schemas.business_hours import BusinessHoursUpdate, TenantCreateBusinessHours
+from app.domain.services import sla_engine_service
+from app.domain.services.common_service import commit_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import invalidate_domain
+
+logger = logging.getLogger("business_hours_service")
+
+
+def _stored(field: str, value: Any) -> Any:
+    """Convert a request value to its JSON column representation."""
+    if field == "weekly_hours":
+        return [interval.model_dump() for interval in value]
+    if field == "holidays":
+        return sorted({day.isoformat() for day in value})
+    return value
+
+
+def list_business_hours(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[BusinessHours], Optional[int]]:
+    """List the business hours calendars of a tenant."""
+    query = db.query(BusinessHours).filter(BusinessHours.tenant_id == tenant_id)
+    return paginate(
+        query,
+        BusinessHours,
+        order_by=(BusinessHours.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+
+
+def create_business_hours(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    request: TenantCreateBusinessHours,
+    created_by: str,
+) -> BusinessHours:
+    """Create a business hours calendar."""
+    logger.debug("Creating business hours: tenant_id=%s, name=%s", tenant_id, request.name)
+    hours = BusinessHours(
+        tenant_id=tenant_id,
+        name=request.name,
+        time_zone=request.time_zone or "UTC",
+        weekly_hours=_stored("weekly_hours", request.weekly_hours or []),
+        holidays=_stored("holidays", request.holidays or []),
+        created_by=created_by,
+        updated_by=created_by,
+    )
+    db.add(hours)
+    commit_or_raise(db, refresh=hours, action="create business hours")
+    return hours
+
+
+def get_business_hours(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    business_hours_id: uuid.UUID,
+) -> BusinessHours:
+    """Retrieve a business hours calendar by ID within a tenant context."""
+    hours = (
+        db.query(BusinessHours)
+        .filter(
+            BusinessHours.id == business_hours_id,
+            BusinessHours.tenant_id == tenant_id,
+        )
+        .first()
+    )
+    if not hours:
+        logger.info(
+            "Business hours not found: tenant_id=%s, business_hours_id=%s",
+            tenant_id,
+            business_hours_id,
+        )
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Business hours not found")
+    return hours
+
+
+def update_business_hours(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    business_hours_id: uuid.UUID,
+    request: BusinessHoursUpdate,
+    updated_by: str,
+) -> BusinessHours:
+    """Update a business hours calendar and queue an SLA recomputation."""
+    hours = get_business_hours(db, tenant_id=tenant_id, business_hours_id=business_hours_id)
+    changed: Dict[str, Any] = {}
+    for field in ["name", "time_zone", "weekly_hours", "holidays"]:
+        value = getattr(request, field)
+        if value is None:
+            continue
+        value = _stored(field, value)
+        if getattr(hours, field) != value:
+            changed[field] = value
+    if changed:
+        for field, value in changed.items():
+            setattr(hours, field, value)
+        hours.updated_by = updated_by
+        hours.updated_at = datetime.utcnow()
+        commit_or_raise(db, refresh=hours, action="update business hours")
+        if set(changed) - {"name"}:
+            invalidate_domain(tenant_id, "business_hours")
+            sla_engine_service.enqueue_recompute(tenant_id)
+    return hours
+
+
+def delete_business_hours(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    business_hours_id: uuid.UUID,
+) -> None:
+    """Delete a business hours calendar and queue an SLA recomputation.
+
+    Group profiles using the calendar fall back to around-the-clock SLAs.
+    """
+    hours = get_business_hours(db, tenant_id=tenant_id, business_hours_id=business_hours_id)
+    db.delete(hours)
+    commit_or_raise(db, action="delete business hours")
+    invalidate_domain(tenant_id, "business_hours")
+    sla_engine_service.enqueue_recompute(tenant_id)
+    return None
+
+
+__all__ = [
+    "list_business_hours",
+    "create_business_hours",
+    "get_business_hours",
+    "update_business_hours",
+    "delete_business_hours",
+]
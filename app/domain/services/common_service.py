@@ -10,11 +10,14 @@ response generation.
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from fastapi import HTTPException
 from sqlalchemy.exc import DBAPIError, IntegrityError
 
+from app.messaging.producers.common import BaseProducer
+
 
 logger = logging.getLogger("common_service")
 
@@ -33,6 +36,55 @@ CONSTRAINT_HINTS: dict[str, dict[str, object]] = {
 }
 
 
+@contextmanager
+def _translated_db_errors(db, action: str | None) -> Iterator[None]:
+    """Roll back ``db`` and raise a translated HTTPException on failure."""
+    try:
+        yield
+    except IntegrityError as exc:
+        # Rollback and translate common integrity errors into HTTP responses
+        db.rollback()
+        raise _http_exception_from_db_error(exc) from exc
+    except DBAPIError as exc:
+        # Rollback and translate DBAPI errors
+        db.rollback()
+        raise _http_exception_from_db_error(exc) from exc
+    except Exception as exc:
+        # Rollback and raise a generic 500 error for any unexpected exception
+        db.rollback()
+        # Include action if provided to help identify failing operation
+        err_msg = "Unexpected error while performing database operation"
+        if action:
+            err_msg = f"Unexpected error while {action}"
+        raise HTTPException(status_code=500, detail=err_msg) from exc
+
+
+def flush_or_raise(db, *, refresh: object | None = None, action: str | None = None) -> None:
+    """
+    Flush pending changes on the provided SQLAlchemy Session without
+    committing and optionally refresh the given instance.
+
+    Services flush before publishing so that event snapshots carry
+    generated keys and column defaults; the events are then committed
+    together with the change by :func:`commit_or_raise`.  Failures are
+    rolled back and translated exactly like in :func:`commit_or_raise`.
+
+    Parameters
+    ----------
+    db : Session
+        The SQLAlchemy session to flush.
+    refresh : object, optional
+        A mapped instance to refresh after a successful flush.
+    action : str, optional
+        A human‑readable description of the operation being performed,
+        used only in the message of unexpected errors.
+    """
+    with _translated_db_errors(db, action):
+        db.flush()
+        if refresh is not None:
+            db.refresh(refresh)
+
+
 def commit_or_raise(db, *, refresh: object | None = None, action: str | None = None) -> None:
     """
     Commit the current transaction on the provided SQLAlchemy Session and
@@ -41,6 +93,13 @@ def commit_or_raise(db, *, refresh: object | None = None, action: str | None = N
     a translated HTTPException.  Any unexpected exception will also
     trigger a rollback and result in a generic 500 error.
 
+    Events published into the active publish buffer before the commit
+    are staged in the same transaction (see ``BaseProducer.staged``):
+    with the outbox enabled they are written as ``event_outbox`` rows
+    that commit or roll back with the change, otherwise they are sent
+    to the broker only if the commit succeeds.  Coalesced updates are
+    merged across commits and published when the buffer flushes.
+
     Parameters
     ----------
     db : Session
@@ -58,26 +117,11 @@ def commit_or_raise(db, *, refresh: object | None = None, action: str | None = N
         On any database error translated via `_http_exception_from_db_error` or
         generic unexpected error.
     """
-    try:
-        db.commit()
+    with _translated_db_errors(db, action):
+        with BaseProducer.staged(db):
+            db.commit()
         if refresh is not None:
             db.refresh(refresh)
-    except IntegrityError as exc:
-        # Rollback and translate common integrity errors into HTTP responses
-        db.rollback()
-        raise _http_exception_from_db_error(exc) from exc
-    except DBAPIError as exc:
-        # Rollback and translate DBAPI errors
-        db.rollback()
-        raise _http_exception_from_db_error(exc) from exc
-    except Exception as exc:
-        # Rollback and raise a generic 500 error for any unexpected exception
-        db.rollback()
-        # Include action if provided to help identify failing operation
-        err_msg = "Unexpected error while performing database operation"
-        if action:
-            err_msg = f"Unexpected error while {action}"
-        raise HTTPException(status_code=500, detail=err_msg) from exc
 
 # ---------------------------------------------------------------------------
 # Helper functions for DB error handling
@@ -193,4 +237,5 @@ def _http_exception_from_db_error(err: BaseException) -> HTTPException:
 __all__ = [
     "_http_exception_from_db_error",
     "commit_or_raise",
+    "flush_or_raise",
 ]
\ No newline at end of file
@@ -0,0 +1,652 @@
+"""
+Asynchronous bulk import of companies.
+
+Large migrations (hundreds of thousands of companies together with
+their nested collections, ``company_relationship`` and
+``contact_company_relationship`` rows) are too slow for a request, so
+imports run as a Celery job:
+
+1. :func:`create_import_job` spools the upload into
+   ``company_import_row`` (one multi-row ``INSERT`` per chunk), creates
+   a ``company_import_job`` and enqueues the job task;
+2. :func:`run_import_job` (the task body) validates the spooled
+   records with :class:`CompanyImportRecord`, inserts companies and
+   their nested rows in chunks with multi-row ``INSERT`` statements
+   and stores each new company id on its spooled row;
+3. relationships are then resolved in the same chunked pass over the
+   spooled rows: external keys are looked up with one query per chunk
+   against ``company_import_row``, so a parent may appear anywhere in
+   the upload.
+
+Progress counters and row errors are kept on the job row (and handed
+to an optional callback) after every committed chunk.  Each committed
+chunk of companies publishes one ``company.bulk_imported`` event.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.core.celery_app import EXCHANGE_NAME, celery_app
+from app.core.config import Config
+from app.domain.models.company import Company
+from app.domain.models.company_address import CompanyAddress
+from app.domain.models.company_email import CompanyEmail
+from app.domain.models.company_import import CompanyImportJob, CompanyImportRow
+from app.domain.models.company_note import CompanyNote
+from app.domain.models.company_phone import CompanyPhone
+from app.domain.models.company_relationship import CompanyRelationship
+from app.domain.models.company_social_profile import CompanySocialProfile
+from app.domain.models.contact_company_relationship import ContactCompanyRelationship
+from app.domain.schemas.company_import import CompanyImportRecord
+from app.domain.services.bulk_import_service import (
+    ImportItem,
+    ImportReport,
+    MultiRowLoader,
+    StagedTable,
+    describe_db_error,
+    iter_records,
+    validation_messages,
+)
+from app.domain.services.common_service import commit_or_raise
+from app.messaging.producers.company_producer import CompanyMessageProducer as CompanyProducer
+
+
+logger = logging.getLogger("company_import_service")
+
+TASK_RUN_IMPORT: str = f"{EXCHANGE_NAME}.jobs.company_import"
+
+# Nested collections; CSV uploads carry them as JSON array columns
+NESTED_FIELDS = (
+    "phones",
+    "emails",
+    "addresses",
+    "social_profiles",
+    "notes",
+    "relationships",
+    "contact_relationships",
+)
+
+# Relationship created for ``parent_external_key``
+PARENT_ROLES = ("parent", "subsidiary")
+
+_AUDIT_COLUMNS = ("created_at", "updated_at", "created_by", "updated_by")
+
+# Parents first: child rows reference the company through a foreign key
+COMPANY_TABLES = (
+    StagedTable(
+        Company.__table__,
+        ("id", "tenant_id", "company_name", "domain", "industry", "is_internal",
+         "owned_by_user_id", "owned_by_group_id") + _AUDIT_COLUMNS,
+    ),
+    StagedTable(
+        CompanyPhone.__table__,
+        ("id", "tenant_id", "company_id", "phone_raw", "phone_e164", "phone_ext",
+         "phone_type", "is_primary", "is_sms_capable", "is_verified") + _AUDIT_COLUMNS,
+    ),
+    StagedTable(
+        CompanyEmail.__table__,
+        ("id", "tenant_id", "company_id", "email", "email_type", "is_primary",
+         "is_verified") + _AUDIT_COLUMNS,
+    ),
+    StagedTable(
+        CompanyAddress.__table__,
+        ("id", "tenant_id", "company_id", "address_type", "label", "is_primary",
+         "line1", "line2", "line3", "city", "region", "postal_code",
+         "country_code") + _AUDIT_COLUMNS,
+    ),
+    StagedTable(
+        CompanySocialProfile.__table__,
+        ("id", "tenant_id", "company_id", "profile_type", "profile_url") + _AUDIT_COLUMNS,
+    ),
+    StagedTable(
+        CompanyNote.__table__,
+        ("id", "tenant_id", "company_id", "note_type", "title", "body", "noted_at",
+         "source_system", "source_ref") + _AUDIT_COLUMNS,
+    ),
+)
+
+RELATIONSHIP_TABLES = (
+    StagedTable(
+        CompanyRelationship.__table__,
+        ("id", "tenant_id", "from_company_id", "to_company_id", "from_role", "to_role",
+         "is_active", "start_date", "end_date", "notes") + _AUDIT_COLUMNS,
+    ),
+    StagedTable(
+        ContactCompanyRelationship.__table__,
+        ("id", "tenant_id", "contact_id", "company_id", "relationship_type", "department",
+         "job_title", "work_email", "work_phone_raw", "work_phone_e164", "work_phone_ext",
+         "is_primary", "start_date", "end_date", "is_active") + _AUDIT_COLUMNS,
+    ),
+)
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+# ---------------------------------------------------------------------------
+# Job creation
+# ---------------------------------------------------------------------------
+
+
+def _external_key(record: Optional[Dict[str, Any]]) -> Optional[str]:
+    value = (record or {}).get("external_key")
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        value = str(value)
+        # Over-long keys are rejected by schema validation in the job
+        return value if len(value) <= 255 else None
+    return None
+
+
+def create_import_job(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    lines: Iterable[str],
+    fmt: str,
+    created_by: str,
+    chunk_size: Optional[int] = None,
+) -> CompanyImportJob:
+    """Spool an upload and enqueue the import job that processes it."""
+    chunk_size = max(1, chunk_size or Config.bulk_import_chunk_size())
+    now = datetime.utcnow()
+    job = CompanyImportJob(
+        id=uuid.uuid4(),
+        tenant_id=tenant_id,
+        status="queued",
+        total_rows=0,
+        processed_rows=0,
+        imported=0,
+        failed=0,
+        relationships=0,
+        errors=[],
+        errors_truncated=False,
+        created_at=now,
+        updated_at=now,
+        created_by=created_by,
+        updated_by=created_by,
+    )
+    db.add(job)
+    db.flush()
+
+    table = CompanyImportRow.__table__
+    batch: List[Dict[str, Any]] = []
+    for row, record, error in iter_records(lines, fmt, json_fields=NESTED_FIELDS):
+        batch.append(
+            {
+                "job_id": job.id,
+                "row_no": row,
+                "external_key": _external_key(record),
+                "payload": record,
+                "parse_error": error,
+                "company_id": None,
+            }
+        )
+        if len(batch) >= chunk_size:
+            db.execute(table.insert(), batch)
+            job.total_rows += len(batch)
+            batch = []
+    if batch:
+        db.execute(table.insert(), batch)
+        job.total_rows += len(batch)
+
+    commit_or_raise(db, action="create company import job")
+    logger.info(
+        "Queued company import %s for tenant %s with %d rows",
+        job.id,
+        tenant_id,
+        job.total_rows,
+    )
+    try:
+        celery_app.send_task(
+            TASK_RUN_IMPORT,
+            kwargs={"job_id": str(job.id)},
+            task_id=str(job.id),
+        )
+    except Exception as exc:
+        logger.exception("Failed to enqueue company import %s", job.id)
+        _mark_failed(db, job, "Failed to enqueue import job")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Import job could not be queued",
+        ) from exc
+    return job
+
+
+def get_import_job(db: Session, *, tenant_id: uuid.UUID, job_id: uuid.UUID) -> CompanyImportJob:
+    """Return an import job of the tenant or raise 404."""
+    job = (
+        db.query(CompanyImportJob)
+        .filter(CompanyImportJob.tenant_id == tenant_id, CompanyImportJob.id == job_id)
+        .first()
+    )
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found")
+    return job
+
+
+# ---------------------------------------------------------------------------
+# Row building
+# ---------------------------------------------------------------------------
+
+
+def _record_errors(record: CompanyImportRecord) -> List[str]:
+    """Checks the create schema leaves to the database or the route."""
+    errors = []
+    if record.owned_by_user_id and record.owned_by_group_id:
+        errors.append("owned_by_user_id and owned_by_group_id are mutually exclusive")
+    if record.parent_external_key is not None and record.parent_external_key == record.external_key:
+        errors.append("parent_external_key: a company cannot be its own parent")
+    return errors
+
+
+def build_company_item(
+    row: int,
+    record: CompanyImportRecord,
+    *,
+    tenant_id: uuid.UUID,
+    created_by: str,
+) -> ImportItem:
+    """Expand a validated record into rows for the company tables.
+
+    Defaults mirror :func:`company_service.create_company`.
+    """
+    now = datetime.utcnow()
+    audit = (now, now, created_by, created_by)
+    company_id = uuid.uuid4()
+    rows: Dict[str, List[tuple]] = {
+        "company": [
+            (company_id, tenant_id, record.name, record.website, record.industry, False,
+             record.owned_by_user_id, record.owned_by_group_id) + audit
+        ],
+        "company_phone": [
+            (uuid.uuid4(), tenant_id, company_id, p.phone_raw, p.phone_e164, p.phone_ext,
+             p.phone_type or "main", p.is_primary or False, p.is_sms_capable or False,
+             p.is_verified or False) + audit
+            for p in record.phones or []
+        ],
+        "company_email": [
+            (uuid.uuid4(), tenant_id, company_id, e.email, e.email_type or "work",
+             e.is_primary or False, e.is_verified or False) + audit
+            for e in record.emails or []
+        ],
+        "company_address": [
+            (uuid.uuid4(), tenant_id, company_id, a.address_type or "office", a.label,
+             a.is_primary or False, a.line1, a.line2, a.line3, a.city, a.region,
+             a.postal_code, a.country_code or "US") + audit
+            for a in record.addresses or []
+        ],
+        "company_social_profile": [
+            (uuid.uuid4(), tenant_id, company_id, s.profile_type, s.profile_url) + audit
+            for s in record.social_profiles or []
+        ],
+        "company_note": [
+            (uuid.uuid4(), tenant_id, company_id, n.note_type or "note", n.title, n.body,
+             n.noted_at or now, n.source_system, n.source_ref) + audit
+            for n in record.notes or []
+        ],
+    }
+    return ImportItem(row=row, key=company_id, rows=rows)
+
+
+def referenced_keys(record: CompanyImportRecord) -> Set[str]:
+    """External keys of other companies a record points at."""
+    keys = {r.to_external_key for r in record.relationships or [] if r.to_external_key}
+    if record.parent_external_key:
+        keys.add(record.parent_external_key)
+    return keys
+
+
+def build_relationship_item(
+    row: int,
+    company_id: uuid.UUID,
+    record: CompanyImportRecord,
+    resolved: Dict[str, uuid.UUID],
+    *,
+    tenant_id: uuid.UUID,
+    created_by: str,
+) -> Tuple[ImportItem, List[str]]:
+    """Build relationship rows for an imported company.
+
+    Returns the item and messages for relationships whose external key
+    did not resolve to an imported company (those are skipped).
+    """
+    now = datetime.utcnow()
+    audit = (now, now, created_by, created_by)
+    unresolved: List[str] = []
+    company_rows: List[tuple] = []
+
+    if record.parent_external_key:
+        parent_id = resolved.get(record.parent_external_key)
+        if parent_id is None:
+            unresolved.append(
+                f"parent_external_key: no imported company with key {record.parent_external_key!r}"
+            )
+        else:
+            company_rows.append(
+                (uuid.uuid4(), tenant_id, parent_id, company_id) + PARENT_ROLES
+                + (True, None, None, None) + audit
+            )
+    for index, rel in enumerate(record.relationships or []):
+        to_id = rel.to_company_id or resolved.get(rel.to_external_key or "")
+        if to_id is None:
+            unresolved.append(
+                f"relationships.{index}.to_external_key: no imported company with key "
+                f"{rel.to_external_key!r}"
+            )
+            continue
+        company_rows.append(
+            (uuid.uuid4(), tenant_id, company_id, to_id, rel.from_role, rel.to_role,
+             True if rel.is_active is None else rel.is_active, rel.start_date,
+             rel.end_date, rel.notes) + audit
+        )
+
+    contact_rows = [
+        (uuid.uuid4(), tenant_id, c.contact_id, company_id, c.relationship_type, c.department,
+         c.job_title, c.work_email, c.work_phone_raw, c.work_phone_e164, c.work_phone_ext,
+         c.is_primary or False, c.start_date, c.end_date,
+         True if c.is_active is None else c.is_active) + audit
+        for c in record.contact_relationships or []
+    ]
+    item = ImportItem(
+        row=row,
+        key=company_id,
+        rows={
+            "company_relationship": company_rows,
+            "contact_company_relationship": contact_rows,
+        },
+    )
+    return item, unresolved
+
+
+# ---------------------------------------------------------------------------
+# Job execution
+# ---------------------------------------------------------------------------
+
+
+def _mark_failed(db: Session, job: CompanyImportJob, message: str) -> None:
+    job.status = "failed"
+    job.error_message = message
+    job.finished_at = datetime.utcnow()
+    job.updated_at = job.finished_at
+    commit_or_raise(db, action="fail company import job")
+
+
+def _save_progress(
+    db: Session,
+    job: CompanyImportJob,
+    report: ImportReport,
+    progress: Optional[ProgressCallback],
+) -> None:
+    job.imported = report.imported
+    job.failed = report.failed
+    job.errors = [e.model_dump(mode="json") for e in sorted(report.errors, key=lambda e: e.row)]
+    job.errors_truncated = report.truncated
+    job.updated_at = datetime.utcnow()
+    commit_or_raise(db, action="update company import job")
+    if progress is not None:
+        progress(
+            {
+                "job_id": str(job.id),
+                "phase": job.phase,
+                "total_rows": job.total_rows,
+                "processed_rows": job.processed_rows,
+                "imported": job.imported,
+                "failed": job.failed,
+                "relationships": job.relationships,
+            }
+        )
+
+
+def _iter_spooled(
+    db: Session,
+    job_id: uuid.UUID,
+    chunk_size: int,
+    *,
+    imported_only: bool = False,
+) -> Iterable[List[CompanyImportRow]]:
+    """Yield spooled rows in ``row_no`` order, one chunk at a time."""
+    last_row = 0
+    while True:
+        query = db.query(CompanyImportRow).filter(
+            CompanyImportRow.job_id == job_id,
+            CompanyImportRow.row_no > last_row,
+        )
+        if imported_only:
+            query = query.filter(CompanyImportRow.company_id.isnot(None))
+        rows = query.order_by(CompanyImportRow.row_no).limit(chunk_size).all()
+        if not rows:
+            return
+        yield rows
+        last_row = rows[-1].row_no
+
+
+def _flag_duplicate_keys(db: Session, job_id: uuid.UUID) -> None:
+    """Reject every repeat of an external key after its first row."""
+    db.execute(
+        text(
+            """
+            UPDATE dyno_crm.company_import_row AS r
+               SET parse_error = 'external_key: duplicates row ' || d.first_row
+              FROM (
+                    SELECT external_key, min(row_no) AS first_row
+                      FROM dyno_crm.company_import_row
+                     WHERE job_id = :job_id AND external_key IS NOT NULL
+                     GROUP BY external_key
+                    HAVING count(*) > 1
+                   ) AS d
+             WHERE r.job_id = :job_id
+               AND r.external_key = d.external_key
+               AND r.row_no > d.first_row
+               AND r.parse_error IS NULL
+            """
+        ),
+        {"job_id": job_id},
+    )
+
+
+def _import_companies(
+    db: Session,
+    job: CompanyImportJob,
+    report: ImportReport,
+    chunk_size: int,
+    progress: Optional[ProgressCallback],
+) -> None:
+    loader = MultiRowLoader(db, COMPANY_TABLES)
+    created_by = job.created_by or "anonymous"
+    set_company_id = (
+        CompanyImportRow.__table__.update()
+        .where(
+            CompanyImportRow.__table__.c.job_id == bindparam("b_job_id"),
+            CompanyImportRow.__table__.c.row_no == bindparam("b_row_no"),
+        )
+        .values(company_id=bindparam("b_company_id"))
+    )
+    for chunk, spooled in enumerate(_iter_spooled(db, job.id, chunk_size), start=1):
+        items: List[ImportItem] = []
+        for spooled_row in spooled:
+            if spooled_row.parse_error:
+                report.add_error(spooled_row.row_no, [spooled_row.parse_error])
+                continue
+            try:
+                record = CompanyImportRecord.model_validate(spooled_row.payload)
+            except ValidationError as exc:
+                report.add_error(spooled_row.row_no, validation_messages(exc))
+                continue
+            errors = _record_errors(record)
+            if errors:
+                report.add_error(spooled_row.row_no, errors)
+                continue
+            items.append(
+                build_company_item(
+                    spooled_row.row_no, record, tenant_id=job.tenant_id, created_by=created_by
+                )
+            )
+
+        loaded, rejected = loader.load(items) if items else ([], [])
+        for item, exc in rejected:
+            messages, constraint = describe_db_error(exc)
+            report.add_error(item.row, messages, constraint)
+        if loaded:
+            db.execute(
+                set_company_id,
+                [
+                    {"b_job_id": job.id, "b_row_no": item.row, "b_company_id": item.key}
+                    for item in loaded
+                ],
+            )
+        report.imported += len(loaded)
+        job.processed_rows += len(spooled)
+
+        if loaded:
+            try:
+                CompanyProducer.send_companies_bulk_imported(
+                    tenant_id=job.tenant_id,
+                    import_id=job.id,
+                    chunk=chunk,
+                    company_ids=[item.key for item in loaded],
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to publish company.bulk_imported event tenant_id=%s import_id=%s chunk=%d",
+                    job.tenant_id,
+                    job.id,
+                    chunk,
+                )
+        _save_progress(db, job, report, progress)
+
+
+def _import_relationships(
+    db: Session,
+    job: CompanyImportJob,
+    report: ImportReport,
+    chunk_size: int,
+    progress: Optional[ProgressCallback],
+) -> None:
+    loader = MultiRowLoader(db, RELATIONSHIP_TABLES)
+    created_by = job.created_by or "anonymous"
+    for spooled in _iter_spooled(db, job.id, chunk_size, imported_only=True):
+        records = [
+            (row, CompanyImportRecord.model_validate(row.payload)) for row in spooled
+        ]
+        keys: Set[str] = set()
+        for _, record in records:
+            keys |= referenced_keys(record)
+        resolved: Dict[str, uuid.UUID] = {}
+        if keys:
+            resolved = dict(
+                db.query(CompanyImportRow.external_key, CompanyImportRow.company_id)
+                .filter(
+                    CompanyImportRow.job_id == job.id,
+                    CompanyImportRow.external_key.in_(keys),
+                    CompanyImportRow.company_id.isnot(None),
+                )
+                .all()
+            )
+
+        items: List[ImportItem] = []
+        for spooled_row, record in records:
+            item, unresolved = build_relationship_item(
+                spooled_row.row_no,
+                spooled_row.company_id,
+                record,
+                resolved,
+                tenant_id=job.tenant_id,
+                created_by=created_by,
+            )
+            if unresolved:
+                report.add_error(spooled_row.row_no, unresolved, rejected=False)
+            if any(item.rows.values()):
+                items.append(item)
+
+        loaded, rejected = loader.load(items) if items else ([], [])
+        for item, exc in rejected:
+            messages, constraint = describe_db_error(exc)
+            report.add_error(
+                item.row, ["relationships not imported: " + messages[0]] + messages[1:],
+                constraint,
+                rejected=False,
+            )
+        job.relationships += sum(len(rows) for item in loaded for rows in item.rows.values())
+        _save_progress(db, job, report, progress)
+
+
+def run_import_job(
+    db: Session,
+    job_id: uuid.UUID,
+    *,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> Optional[CompanyImportJob]:
+    """Process a queued import job; called by the Celery task.
+
+    Jobs that are not ``queued`` (already processed or processing) are
+    left untouched.  On an unexpected error the job is marked
+    ``failed``; chunks committed before the error are kept.
+    """
+    chunk_size = max(1, chunk_size or Config.bulk_import_chunk_size())
+    job = db.get(CompanyImportJob, job_id)
+    if job is None:
+        logger.warning("Company import job %s not found", job_id)
+        return None
+    if job.status != "queued":
+        logger.info("Company import job %s is %s; skipping", job_id, job.status)
+        return job
+
+    job.status = "running"
+    job.phase = "companies"
+    job.started_at = datetime.utcnow()
+    _flag_duplicate_keys(db, job.id)
+    commit_or_raise(db, action="start company import job")
+
+    report = ImportReport(import_id=job.id, total_rows=job.total_rows)
+    try:
+        _import_companies(db, job, report, chunk_size, progress)
+        job.phase = "relationships"
+        _import_relationships(db, job, report, chunk_size, progress)
+
+        db.query(CompanyImportRow).filter(CompanyImportRow.job_id == job.id).delete(
+            synchronize_session=False
+        )
+        job.status = "completed"
+        job.phase = None
+        job.finished_at = datetime.utcnow()
+        _save_progress(db, job, report, progress)
+    except Exception as exc:
+        logger.exception("Company import job %s failed", job_id)
+        db.rollback()
+        job = db.get(CompanyImportJob, job_id)
+        _mark_failed(db, job, str(getattr(exc, "detail", exc))[:1000])
+        raise
+
+    logger.info(
+        "Company import %s for tenant %s finished: %d rows, %d imported, %d failed, %d relationships",
+        job.id,
+        job.tenant_id,
+        job.total_rows,
+        job.imported,
+        job.failed,
+        job.relationships,
+    )
+    return job
+
+
+__all__ = [
+    "COMPANY_TABLES",
+    "NESTED_FIELDS",
+    "RELATIONSHIP_TABLES",
+    "TASK_RUN_IMPORT",
+    "build_company_item",
+    "build_relationship_item",
+    "create_import_job",
+    "get_import_job",
+    "referenced_keys",
+    "run_import_job",
+]
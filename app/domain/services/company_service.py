@@ -22,7 +22,7 @@ from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 # Import the CRM domain models rather than relying on placeholder names.
 from app.domain.models.company import Company
@@ -56,6 +56,9 @@ from app.domain.schemas.company import (
 )
 
 # Import event models and message producers from their correct locations.
+from app.core.db import SessionLocal
+from app.util.serialization import column_extractor
+from app.domain.schemas.events.common import merge_deltas
 from app.domain.schemas.events.company_event import CompanyDelta
 from app.messaging.producers.company_producer import CompanyMessageProducer as CompanyProducer
 from app.messaging.producers.company_relationship_producer import (
@@ -66,162 +69,118 @@ from app.messaging.producers.contact_company_relationship_producer import (
 )
 from app.domain.schemas.json_patch import JsonPatchRequest, JsonPatchOperation
 
-from .common_service import commit_or_raise
+from .common_service import commit_or_raise, flush_or_raise
+from .export_service import ExportSpec
+from .pagination_service import TotalMode, paginate
+from .resource_version_service import resource_version
 
 logger = logging.getLogger("company_service")
 
+# Columns streamed by GET /tenants/{tenant_id}/companies/export
+EXPORT_SPEC = ExportSpec("companies", Company)
+
 
 # ---------------------------------------------------------------------------
 # Helper functions for snapshots and delta computation
 # ---------------------------------------------------------------------------
 
+# Snapshot extractors are built once at import; dates and UUIDs are
+# rendered by the JSON encoder when the event is sent.
+
+_phone_snapshot = column_extractor(
+    CompanyPhone,
+    (
+        "id", "phone_raw", "phone_e164", "phone_ext", "phone_type", "is_primary",
+        "is_sms_capable", "is_verified", "verified_at", "created_at", "updated_at",
+        "created_by", "updated_by",
+    ),
+)
+
+
+_email_snapshot = column_extractor(
+    CompanyEmail,
+    (
+        "id", "email", "email_type", "is_primary", "is_verified", "verified_at",
+        "created_at", "updated_at", "created_by", "updated_by",
+    ),
+)
+
+
+_address_snapshot = column_extractor(
+    CompanyAddress,
+    (
+        "id", "address_type", "label", "is_primary", "line1", "line2", "line3", "city",
+        "region", "postal_code", "country_code", "created_at", "updated_at",
+        "created_by", "updated_by",
+    ),
+)
+
+
+_social_profile_snapshot = column_extractor(
+    CompanySocialProfile,
+    (
+        "id", "profile_type", "profile_url", "created_at", "updated_at", "created_by",
+        "updated_by",
+    ),
+)
 
-def _phone_snapshot(phone: CompanyPhone) -> Dict[str, Any]:
-    return {
-        "id": phone.id,
-        "phone_raw": phone.phone_raw,
-        "phone_e164": phone.phone_e164,
-        "phone_ext": phone.phone_ext,
-        "phone_type": phone.phone_type,
-        "is_primary": phone.is_primary,
-        "is_sms_capable": phone.is_sms_capable,
-        "is_verified": phone.is_verified,
-        "verified_at": phone.verified_at.isoformat() if phone.verified_at else None,
-        "created_at": phone.created_at.isoformat() if phone.created_at else None,
-        "updated_at": phone.updated_at.isoformat() if phone.updated_at else None,
-        "created_by": str(phone.created_by) if phone.created_by else None,
-        "updated_by": str(phone.updated_by) if phone.updated_by else None,
-    }
-
-
-def _email_snapshot(email: CompanyEmail) -> Dict[str, Any]:
-    return {
-        "id": email.id,
-        "email": email.email,
-        "email_type": email.email_type,
-        "is_primary": email.is_primary,
-        "is_verified": email.is_verified,
-        "verified_at": email.verified_at.isoformat() if email.verified_at else None,
-        "created_at": email.created_at.isoformat() if email.created_at else None,
-        "updated_at": email.updated_at.isoformat() if email.updated_at else None,
-        "created_by": str(email.created_by) if email.created_by else None,
-        "updated_by": str(email.updated_by) if email.updated_by else None,
-    }
-
-
-def _address_snapshot(address: CompanyAddress) -> Dict[str, Any]:
-    return {
-        "id": address.id,
-        "address_type": address.address_type,
-        "label": address.label,
-        "is_primary": address.is_primary,
-        "line1": address.line1,
-        "line2": address.line2,
-        "line3": address.line3,
-        "city": address.city,
-        "region": address.region,
-        "postal_code": address.postal_code,
-        "country_code": address.country_code,
-        "created_at": address.created_at.isoformat() if address.created_at else None,
-        "updated_at": address.updated_at.isoformat() if address.updated_at else None,
-        "created_by": str(address.created_by) if address.created_by else None,
-        "updated_by": str(address.updated_by) if address.updated_by else None,
-    }
-
-
-def _social_profile_snapshot(profile: CompanySocialProfile) -> Dict[str, Any]:
-    return {
-        "id": profile.id,
-        "profile_type": profile.profile_type,
-        "profile_url": profile.profile_url,
-        "created_at": profile.created_at.isoformat() if profile.created_at else None,
-        "updated_at": profile.updated_at.isoformat() if profile.updated_at else None,
-        "created_by": str(profile.created_by) if profile.created_by else None,
-        "updated_by": str(profile.updated_by) if profile.updated_by else None,
-    }
-
-
-def _note_snapshot(note: CompanyNote) -> Dict[str, Any]:
-    return {
-        "id": note.id,
-        "note_type": note.note_type,
-        "title": note.title,
-        "body": note.body,
-        "noted_at": note.noted_at.isoformat() if note.noted_at else None,
-        "source_system": note.source_system,
-        "source_ref": note.source_ref,
-        "created_at": note.created_at.isoformat() if note.created_at else None,
-        "updated_at": note.updated_at.isoformat() if note.updated_at else None,
-        "created_by": str(note.created_by) if note.created_by else None,
-        "updated_by": str(note.updated_by) if note.updated_by else None,
-    }
-
-
-def _relationship_snapshot(rel: CompanyRelationship) -> Dict[str, Any]:
-    return {
-        "id": rel.id,
-        "from_company_id": rel.from_company_id,
-        "to_company_id": rel.to_company_id,
-        "from_role": rel.from_role,
-        "to_role": rel.to_role,
-        "is_active": rel.is_active,
-        "start_date": rel.start_date.isoformat() if rel.start_date else None,
-        "end_date": rel.end_date.isoformat() if rel.end_date else None,
-        "notes": rel.notes,
-        "created_at": rel.created_at.isoformat() if rel.created_at else None,
-        "updated_at": rel.updated_at.isoformat() if rel.updated_at else None,
-        "created_by": rel.created_by,
-        "updated_by": rel.updated_by,
-    }
-
-
-def _contact_rel_snapshot(rel: ContactCompanyRelationship) -> Dict[str, Any]:
-    return {
-        "id": rel.id,
-        "contact_id": rel.contact_id,
-        "company_id": rel.company_id,
-        "relationship_type": rel.relationship_type,
-        "department": rel.department,
-        "job_title": rel.job_title,
-        "work_email": rel.work_email,
-        "work_phone_raw": rel.work_phone_raw,
-        "work_phone_e164": rel.work_phone_e164,
-        "work_phone_ext": rel.work_phone_ext,
-        "is_primary": rel.is_primary,
-        "start_date": rel.start_date.isoformat() if rel.start_date else None,
-        "end_date": rel.end_date.isoformat() if rel.end_date else None,
-        "is_active": rel.is_active,
-        "created_at": rel.created_at.isoformat() if rel.created_at else None,
-        "updated_at": rel.updated_at.isoformat() if rel.updated_at else None,
-        "created_by": rel.created_by,
-        "updated_by": rel.updated_by,
-    }
+
+_note_snapshot = column_extractor(
+    CompanyNote,
+    (
+        "id", "note_type", "title", "body", "noted_at", "source_system", "source_ref",
+        "created_at", "updated_at", "created_by", "updated_by",
+    ),
+)
+
+
+_relationship_snapshot = column_extractor(
+    CompanyRelationship,
+    (
+        "id", "from_company_id", "to_company_id", "from_role", "to_role", "is_active",
+        "start_date", "end_date", "notes", "created_at", "updated_at", "created_by",
+        "updated_by",
+    ),
+)
+
+
+_contact_rel_snapshot = column_extractor(
+    ContactCompanyRelationship,
+    (
+        "id", "contact_id", "company_id", "relationship_type", "department",
+        "job_title", "work_email", "work_phone_raw", "work_phone_e164",
+        "work_phone_ext", "is_primary", "start_date", "end_date", "is_active",
+        "created_at", "updated_at", "created_by", "updated_by",
+    ),
+)
+
+
+_company_columns = column_extractor(
+    Company,
+    (
+        "id", "tenant_id", "industry", "owned_by_user_id", "owned_by_group_id",
+        "created_at", "updated_at", "created_by", "updated_by",
+    ),
+)
 
 
 def _company_snapshot(company: Any) -> Dict[str, Any]:
     """Return a full snapshot of a company including nested resources."""
-    return {
-        "id": company.id,
-        "tenant_id": company.tenant_id,
-        "name": getattr(company, "name", None),
-        "legal_name": getattr(company, "legal_name", None),
-        "industry": getattr(company, "industry", None),
-        "website": getattr(company, "website", None),
-        # Ownership fields included for consumers
-        "owned_by_user_id": getattr(company, "owned_by_user_id", None),
-        "owned_by_group_id": getattr(company, "owned_by_group_id", None),
-        "created_at": company.created_at.isoformat() if company.created_at else None,
-        "updated_at": company.updated_at.isoformat() if company.updated_at else None,
-        "created_by": getattr(company, "created_by", None),
-        "updated_by": getattr(company, "updated_by", None),
-        "phones": [_phone_snapshot(p) for p in getattr(company, "phones", [])],
-        "emails": [_email_snapshot(e) for e in getattr(company, "emails", [])],
-        "addresses": [_address_snapshot(a) for a in getattr(company, "addresses", [])],
-        "social_profiles": [_social_profile_snapshot(s) for s in getattr(company, "social_profiles", [])],
-        "notes": [_note_snapshot(n) for n in getattr(company, "notes", [])],
-        "relationships": [_relationship_snapshot(r) for r in getattr(company, "relationships_from", [])],
-        "contact_relationships": [_contact_rel_snapshot(c) for c in getattr(company, "contact_relationships", [])],
-    }
+    snapshot = _company_columns(company)
+    # API names for company_name/domain; there is no legal_name column
+    snapshot["name"] = company.company_name
+    snapshot["legal_name"] = None
+    snapshot["website"] = company.domain
+    snapshot["phones"] = [_phone_snapshot(p) for p in company.phones]
+    snapshot["emails"] = [_email_snapshot(e) for e in company.emails]
+    snapshot["addresses"] = [_address_snapshot(a) for a in company.addresses]
+    snapshot["social_profiles"] = [_social_profile_snapshot(s) for s in company.social_profiles]
+    snapshot["notes"] = [_note_snapshot(n) for n in company.notes]
+    snapshot["relationships"] = [_relationship_snapshot(r) for r in company.relationships_from]
+    snapshot["contact_relationships"] = [
+        _contact_rel_snapshot(c) for c in company.contact_relationships
+    ]
+    return snapshot
 
 
 # ---------------------------------------------------------------------------
@@ -239,7 +198,10 @@ def list_companies(
     contact_name: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[Any], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Any], Optional[int]]:
     """Return a list of companies filtered by optional search criteria.
 
     The ``tenant_id`` parameter scopes the search to a single tenant when
@@ -277,20 +239,55 @@ def list_companies(
             (Contact.first_name.ilike(f"%{contact_name}%"))
             | (Contact.last_name.ilike(f"%{contact_name}%"))
         )
-    total = query.count()
-    if limit is not None:
-        query = query.limit(limit)
-    if offset is not None:
-        query = query.offset(offset)
-    query = query.order_by(Company.created_at.desc())
-    return (query.all(), total)
+    # List responses serialize every collection; load them per page, not per row
+    query = query.options(*_company_snapshot_options())
+    return paginate(
+        query,
+        Company,
+        order_by=(Company.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+
+
+def _company_snapshot_options() -> Tuple[Any, ...]:
+    """Loader options for every collection read by ``_company_snapshot``.
+
+    Built on demand because ``contact_relationships`` is a backref
+    that only exists once the mappers are configured.
+    """
+    return (
+        selectinload(Company.phones),
+        selectinload(Company.emails),
+        selectinload(Company.addresses),
+        selectinload(Company.social_profiles),
+        selectinload(Company.notes),
+        selectinload(Company.relationships_from),
+        selectinload(Company.contact_relationships),
+    )
+
 
+def get_company(
+    db: Session,
+    *,
+    tenant_id: Optional[uuid.UUID],
+    company_id: uuid.UUID,
+    snapshot: bool = False,
+) -> Any:
+    """Retrieve a company by its ID and optional tenant ID.
 
-def get_company(db: Session, *, tenant_id: Optional[uuid.UUID], company_id: uuid.UUID) -> Any:
-    """Retrieve a company by its ID and optional tenant ID."""
+    ``snapshot=True`` eager loads the nested collections with one
+    ``selectinload`` query each; use it when a full response or event
+    snapshot follows.
+    """
     if Company is None:
         raise HTTPException(status_code=404, detail="Company not found")
     q = db.query(Company).filter(Company.id == company_id)
+    if snapshot:
+        q = q.options(*_company_snapshot_options())
     if tenant_id:
         q = q.filter(Company.tenant_id == tenant_id)
     company = q.first()
@@ -299,6 +296,52 @@ def get_company(db: Session, *, tenant_id: Optional[uuid.UUID], company_id: uuid
     return company
 
 
+# Collections rendered in ``CompanyOut``; part of the company's version
+_COMPANY_COLLECTIONS = (
+    "phones",
+    "emails",
+    "addresses",
+    "social_profiles",
+    "notes",
+    "relationships_from",
+    "contact_relationships",
+)
+
+
+def get_company_version(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    company_id: uuid.UUID,
+) -> Optional[str]:
+    """Return the version token of a company and its nested collections.
+
+    Returns ``None`` if the company does not exist in the tenant.
+    """
+    return resource_version(
+        db,
+        Company,
+        tenant_id=tenant_id,
+        resource_id=company_id,
+        collections=_COMPANY_COLLECTIONS,
+    )
+
+
+def _reload_company_snapshot(db: Session, *, tenant_id: uuid.UUID, company_id: uuid.UUID) -> Any:
+    """Reload a flushed company with all snapshot collections.
+
+    Used instead of ``db.refresh`` so the snapshot and response do not
+    lazy load each collection separately.
+    """
+    return (
+        db.query(Company)
+        .options(*_company_snapshot_options())
+        .populate_existing()
+        .filter(Company.id == company_id, Company.tenant_id == tenant_id)
+        .one()
+    )
+
+
 def create_company(
     db: Session,
     *,
@@ -401,12 +444,14 @@ def create_company(
         company.notes.append(note)
 
     db.add(company)
-    # Commit with robust error handling and refresh the company
-    commit_or_raise(db, refresh=company, action="create_company")
+    # Flush with robust error handling and reload the company snapshot
+    flush_or_raise(db, action="create_company")
+    company = _reload_company_snapshot(db, tenant_id=tenant_id, company_id=company.id)
 
     # Emit event
     snapshot = _company_snapshot(company)
     CompanyProducer.send_company_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create_company")
     return company
 
 
@@ -414,9 +459,10 @@ def delete_company(db: Session, *, tenant_id: uuid.UUID, company_id: uuid.UUID)
     """Delete a company."""
     company = get_company(db, tenant_id=tenant_id, company_id=company_id)
     db.delete(company)
-    commit_or_raise(db, action="delete_company")
+    flush_or_raise(db, action="delete_company")
     # Emit deletion event
     CompanyProducer.send_company_deleted(tenant_id=tenant_id)
+    commit_or_raise(db, action="delete_company")
 
 
 # ---------------------------------------------------------------------------
@@ -442,7 +488,7 @@ def patch_company(
     endpoints must be used for those relationships; they are not
     supported via JSON Patch.
     """
-    company = get_company(db, tenant_id=tenant_id, company_id=company_id)
+    company = get_company(db, tenant_id=tenant_id, company_id=company_id, snapshot=True)
     # Build delta accumulator
     delta = CompanyDelta()
 
@@ -779,13 +825,76 @@ def patch_company(
     company.updated_at = datetime.utcnow()
     company.updated_by = updated_by
     db.add(company)
-    commit_or_raise(db, refresh=company, action="patch_company")
-    # Emit update event
-    snapshot = _company_snapshot(company)
-    CompanyProducer.send_company_updated(tenant_id=tenant_id, changes=delta, payload=snapshot)
+    flush_or_raise(db, action="patch_company")
+    company = _reload_company_snapshot(db, tenant_id=tenant_id, company_id=company_id)
+    # Emit update event (snapshot already reloaded above)
+    _emit_company_update_event(db, company, tenant_id, delta, refresh=False)
+    commit_or_raise(db, action="patch_company")
     return company
 
 
+def _publish_coalesced_company_update(
+    tenant_id: uuid.UUID, company_id: uuid.UUID, delta: CompanyDelta
+) -> None:
+    """Publish one company.updated event for a merged delta.
+
+    Called when the request's publish buffer flushes, after the last
+    commit; the snapshot is read with a short-lived session because
+    the request session is already closed.  Deleted companies are
+    skipped.
+    """
+    with SessionLocal() as session:
+        try:
+            company = get_company(
+                session, tenant_id=tenant_id, company_id=company_id, snapshot=True
+            )
+        except HTTPException:
+            return
+        snapshot = _company_snapshot(company)
+    CompanyProducer.send_company_updated(tenant_id=tenant_id, changes=delta, payload=snapshot)
+
+
+def _emit_company_update_event(
+    db: Session,
+    company: Any,
+    tenant_id: uuid.UUID,
+    delta: CompanyDelta,
+    *,
+    refresh: bool = True,
+) -> None:
+    """Emit a company.updated event, coalescing updates within a request.
+
+    Call it after flushing and before committing.  Inside a publish
+    buffer, deltas for the same company in the request are merged and
+    a single event is published when the buffer flushes, after the
+    last commit.  Otherwise the company and its collections are
+    reloaded, the snapshot is built and the event published
+    immediately.
+    """
+    company_id = company.id
+    if CompanyProducer.coalesce(
+        ("company.updated", tenant_id, company_id),
+        delta,
+        merge=merge_deltas,
+        emit=lambda merged: _publish_coalesced_company_update(tenant_id, company_id, merged),
+    ):
+        return
+    try:
+        if refresh:
+            company = _reload_company_snapshot(db, tenant_id=tenant_id, company_id=company_id)
+        CompanyProducer.send_company_updated(
+            tenant_id=tenant_id,
+            changes=delta,
+            payload=_company_snapshot(company),
+        )
+    except Exception:
+        logger.exception(
+            "Failed to publish company.updated event tenant_id=%s company_id=%s",
+            tenant_id,
+            company_id,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Nested resource list functions
 # ---------------------------------------------------------------------------
@@ -862,14 +971,11 @@ def add_company_phone(
     )
     company.phones.append(phone)
     db.add(phone)
-    commit_or_raise(db, refresh=phone, action="add_company_phone")
+    flush_or_raise(db, refresh=phone, action="add_company_phone")
     # Emit update event
     delta = CompanyDelta(phones_added=[_phone_snapshot(phone)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="add_company_phone")
     return phone
 
 
@@ -911,14 +1017,11 @@ def update_company_phone(
     phone.updated_at = datetime.utcnow()
     phone.updated_by = updated_by
     db.add(phone)
-    commit_or_raise(db, refresh=phone, action="update_company_phone")
+    flush_or_raise(db, refresh=phone, action="update_company_phone")
     # Emit update delta
     delta = CompanyDelta(phones_updated=[_phone_snapshot(phone)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="update_company_phone")
     return phone
 
 
@@ -935,14 +1038,11 @@ def delete_company_phone(
     if phone is None:
         raise HTTPException(status_code=404, detail="Phone not found")
     db.delete(phone)
-    commit_or_raise(db, action="delete_company_phone")
+    flush_or_raise(db, action="delete_company_phone")
     # Emit delta
     delta = CompanyDelta(phones_deleted=[phone.id])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="delete_company_phone")
     return None
 
 
@@ -967,13 +1067,10 @@ def add_company_email(
     )
     company.emails.append(email)
     db.add(email)
-    commit_or_raise(db, refresh=email, action="add_company_email")
+    flush_or_raise(db, refresh=email, action="add_company_email")
     delta = CompanyDelta(emails_added=[_email_snapshot(email)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="add_company_email")
     return email
 
 
@@ -1006,13 +1103,10 @@ def update_company_email(
     email.updated_at = datetime.utcnow()
     email.updated_by = updated_by
     db.add(email)
-    commit_or_raise(db, refresh=email, action="update_company_email")
+    flush_or_raise(db, refresh=email, action="update_company_email")
     delta = CompanyDelta(emails_updated=[_email_snapshot(email)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="update_company_email")
     return email
 
 
@@ -1029,13 +1123,10 @@ def delete_company_email(
     if email is None:
         raise HTTPException(status_code=404, detail="Email not found")
     db.delete(email)
-    commit_or_raise(db, action="delete_company_email")
+    flush_or_raise(db, action="delete_company_email")
     delta = CompanyDelta(emails_deleted=[email.id])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="delete_company_email")
     return None
 
 
@@ -1066,13 +1157,10 @@ def add_company_address(
     )
     company.addresses.append(addr)
     db.add(addr)
-    commit_or_raise(db, refresh=addr, action="add_company_address")
+    flush_or_raise(db, refresh=addr, action="add_company_address")
     delta = CompanyDelta(addresses_added=[_address_snapshot(addr)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="add_company_address")
     return addr
 
 
@@ -1112,13 +1200,10 @@ def update_company_address(
     addr.updated_at = datetime.utcnow()
     addr.updated_by = updated_by
     db.add(addr)
-    commit_or_raise(db, refresh=addr, action="update_company_address")
+    flush_or_raise(db, refresh=addr, action="update_company_address")
     delta = CompanyDelta(addresses_updated=[_address_snapshot(addr)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="update_company_address")
     return addr
 
 
@@ -1135,13 +1220,10 @@ def delete_company_address(
     if addr is None:
         raise HTTPException(status_code=404, detail="Address not found")
     db.delete(addr)
-    commit_or_raise(db, action="delete_company_address")
+    flush_or_raise(db, action="delete_company_address")
     delta = CompanyDelta(addresses_deleted=[addr.id])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="delete_company_address")
     return None
 
 
@@ -1164,13 +1246,10 @@ def add_company_social_profile(
     )
     company.social_profiles.append(profile)
     db.add(profile)
-    commit_or_raise(db, refresh=profile, action="add_company_social_profile")
+    flush_or_raise(db, refresh=profile, action="add_company_social_profile")
     delta = CompanyDelta(social_profiles_added=[_social_profile_snapshot(profile)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="add_company_social_profile")
     return profile
 
 
@@ -1194,13 +1273,10 @@ def update_company_social_profile(
     profile.updated_at = datetime.utcnow()
     profile.updated_by = updated_by
     db.add(profile)
-    commit_or_raise(db, refresh=profile, action="update_company_social_profile")
+    flush_or_raise(db, refresh=profile, action="update_company_social_profile")
     delta = CompanyDelta(social_profiles_updated=[_social_profile_snapshot(profile)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="update_company_social_profile")
     return profile
 
 
@@ -1217,13 +1293,10 @@ def delete_company_social_profile(
     if profile is None:
         raise HTTPException(status_code=404, detail="Social profile not found")
     db.delete(profile)
-    commit_or_raise(db, action="delete_company_social_profile")
+    flush_or_raise(db, action="delete_company_social_profile")
     delta = CompanyDelta(social_profiles_deleted=[profile.id])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="delete_company_social_profile")
     return None
 
 
@@ -1250,13 +1323,10 @@ def add_company_note(
     )
     company.notes.append(note)
     db.add(note)
-    commit_or_raise(db, refresh=note, action="add_company_note")
+    flush_or_raise(db, refresh=note, action="add_company_note")
     delta = CompanyDelta(notes_added=[_note_snapshot(note)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="add_company_note")
     return note
 
 
@@ -1288,13 +1358,10 @@ def update_company_note(
     note.updated_at = datetime.utcnow()
     note.updated_by = updated_by
     db.add(note)
-    commit_or_raise(db, refresh=note, action="update_company_note")
+    flush_or_raise(db, refresh=note, action="update_company_note")
     delta = CompanyDelta(notes_updated=[_note_snapshot(note)])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="update_company_note")
     return note
 
 
@@ -1311,13 +1378,10 @@ def delete_company_note(
     if note is None:
         raise HTTPException(status_code=404, detail="Note not found")
     db.delete(note)
-    commit_or_raise(db, action="delete_company_note")
+    flush_or_raise(db, action="delete_company_note")
     delta = CompanyDelta(notes_deleted=[note.id])
-    CompanyProducer.send_company_updated(
-        tenant_id=tenant_id,
-        changes=delta,
-        payload=_company_snapshot(company),
-    )
+    _emit_company_update_event(db, company, tenant_id, delta)
+    commit_or_raise(db, action="delete_company_note")
     return None
 
 
@@ -1349,7 +1413,7 @@ def add_company_relationship(
         updated_by=updated_by,
     )
     db.add(rel)
-    commit_or_raise(db, refresh=rel, action="add_company_relationship")
+    flush_or_raise(db, refresh=rel, action="add_company_relationship")
     # Emit relationship created event
     CompanyRelationshipProducer.send_relationship_created(
         tenant_id=tenant_id,
@@ -1357,6 +1421,7 @@ def add_company_relationship(
         to_company_id=rel_in.to_company_id,
         payload=_relationship_snapshot(rel),
     )
+    commit_or_raise(db, action="add_company_relationship")
     return rel
 
 
@@ -1402,7 +1467,7 @@ def update_company_relationship(
     rel.updated_at = datetime.utcnow()
     rel.updated_by = updated_by
     db.add(rel)
-    commit_or_raise(db, refresh=rel, action="update_company_relationship")
+    flush_or_raise(db, refresh=rel, action="update_company_relationship")
     CompanyRelationshipProducer.send_relationship_updated(
         tenant_id=tenant_id,
         from_company_id=from_company_id,
@@ -1410,6 +1475,7 @@ def update_company_relationship(
         changes=changes,
         payload=_relationship_snapshot(rel),
     )
+    commit_or_raise(db, action="update_company_relationship")
     return rel
 
 
@@ -1434,12 +1500,13 @@ def delete_company_relationship(
         raise HTTPException(status_code=404, detail="CompanyRelationship not found")
     to_company_id = rel.to_company_id
     db.delete(rel)
-    commit_or_raise(db, action="delete_company_relationship")
+    flush_or_raise(db, action="delete_company_relationship")
     CompanyRelationshipProducer.send_relationship_deleted(
         tenant_id=tenant_id,
         from_company_id=from_company_id,
         to_company_id=to_company_id,
     )
+    commit_or_raise(db, action="delete_company_relationship")
     return None
 
 
@@ -1493,7 +1560,7 @@ def add_company_contact(
         updated_by=updated_by,
     )
     db.add(rel)
-    commit_or_raise(db, refresh=rel, action="add_company_contact")
+    flush_or_raise(db, refresh=rel, action="add_company_contact")
     # Emit event via contact company relationship producer
     ContactCompanyRelationshipProducer.send_relationship_created(
         tenant_id=tenant_id,
@@ -1501,6 +1568,7 @@ def add_company_contact(
         company_id=company_id,
         payload=_contact_rel_snapshot(rel),
     )
+    commit_or_raise(db, action="add_company_contact")
     return rel
 
 
@@ -1561,7 +1629,7 @@ def update_company_contact(
     rel.updated_at = datetime.utcnow()
     rel.updated_by = updated_by
     db.add(rel)
-    commit_or_raise(db, refresh=rel, action="update_company_contact")
+    flush_or_raise(db, refresh=rel, action="update_company_contact")
     ContactCompanyRelationshipProducer.send_relationship_updated(
         tenant_id=tenant_id,
         contact_id=contact_id,
@@ -1569,6 +1637,7 @@ def update_company_contact(
         changes=changes,
         payload=_contact_rel_snapshot(rel),
     )
+    commit_or_raise(db, action="update_company_contact")
     return rel
 
 
@@ -1592,10 +1661,11 @@ def delete_company_contact(
     if rel is None:
         raise HTTPException(status_code=404, detail="Contact relationship not found")
     db.delete(rel)
-    commit_or_raise(db, action="delete_company_contact")
+    flush_or_raise(db, action="delete_company_contact")
     ContactCompanyRelationshipProducer.send_relationship_deleted(
         tenant_id=tenant_id,
         contact_id=contact_id,
         company_id=company_id,
     )
+    commit_or_raise(db, action="delete_company_contact")
     return None
\ No newline at end of file
@@ -23,10 +23,11 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, or_
+from sqlalchemy.orm import Session, selectinload
 
 # Import domain models and schemas from the CRM package.  These imports
 # replace the placeholder imports that were generated by the AI and
@@ -58,156 +59,121 @@ from app.domain.schemas.contact import (
     ContactCompanyRelationshipUpdateRequest,
 )
 
+from app.core.db import SessionLocal
+from app.util.serialization import column_extractor
+from app.domain.schemas.events.common import DELTA_COLLECTIONS, merge_deltas
 from app.domain.schemas.events.contact_event import ContactDelta
 from app.messaging.producers.contact_producer import ContactMessageProducer as ContactProducer
 from app.messaging.producers.contact_company_relationship_producer import (
     ContactCompanyRelationshipMessageProducer as RelationshipProducer,
 )
 from app.domain.schemas.json_patch import JsonPatchRequest, JsonPatchOperation
+from app.domain.schemas.bulk_patch import BulkPatchItem, BulkPatchResult
 
-from .common_service import commit_or_raise
+from .bulk_patch_service import run_bulk_patch
+from .common_service import commit_or_raise, flush_or_raise
+from .export_service import ExportSpec
+from .pagination_service import TotalMode, paginate
+from .resource_version_service import resource_version
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger("contact_service")
 
+# Columns streamed by GET /tenants/{tenant_id}/contacts/export
+EXPORT_SPEC = ExportSpec("contacts", Contact)
+
 
 # ---------------------------------------------------------------------------
 # Helper functions for snapshots and delta computation
 # ---------------------------------------------------------------------------
 
+# Snapshot extractors are built once at import.  Dates and UUIDs are
+# left as loaded and rendered by the JSON encoder when the event is sent.
 
-def _phone_snapshot(phone: ContactPhone) -> Dict[str, Any]:
-    return {
-        "id": phone.id,
-        "phone_raw": phone.phone_raw,
-        "phone_e164": phone.phone_e164,
-        "phone_type": phone.phone_type,
-        "is_primary": phone.is_primary,
-        "is_sms_capable": phone.is_sms_capable,
-        "is_verified": phone.is_verified,
-        "verified_at": phone.verified_at.isoformat() if phone.verified_at else None,
-        "created_at": phone.created_at.isoformat() if phone.created_at else None,
-        "updated_at": phone.updated_at.isoformat() if phone.updated_at else None,
-        "created_by": str(phone.created_by) if phone.created_by else None,
-        "updated_by": str(phone.updated_by) if phone.updated_by else None,
-    }
-
-
-def _email_snapshot(email: ContactEmail) -> Dict[str, Any]:
-    return {
-        "id": email.id,
-        "email": email.email,
-        "email_type": email.email_type,
-        "is_primary": email.is_primary,
-        "is_verified": email.is_verified,
-        "verified_at": email.verified_at.isoformat() if email.verified_at else None,
-        "created_at": email.created_at.isoformat() if email.created_at else None,
-        "updated_at": email.updated_at.isoformat() if email.updated_at else None,
-        "created_by": str(email.created_by) if email.created_by else None,
-        "updated_by": str(email.updated_by) if email.updated_by else None,
-    }
-
-
-def _address_snapshot(address: ContactAddress) -> Dict[str, Any]:
-    return {
-        "id": address.id,
-        "address_type": address.address_type,
-        "label": address.label,
-        "is_primary": address.is_primary,
-        "line1": address.line1,
-        "line2": address.line2,
-        "line3": address.line3,
-        "city": address.city,
-        "region": address.region,
-        "postal_code": address.postal_code,
-        "country_code": address.country_code,
-        "created_at": address.created_at.isoformat() if address.created_at else None,
-        "updated_at": address.updated_at.isoformat() if address.updated_at else None,
-        "created_by": str(address.created_by) if address.created_by else None,
-        "updated_by": str(address.updated_by) if address.updated_by else None,
-    }
-
-
-def _social_profile_snapshot(profile: ContactSocialProfile) -> Dict[str, Any]:
-    return {
-        "id": profile.id,
-        "profile_type": profile.profile_type,
-        "profile_url": profile.profile_url,
-        "created_at": profile.created_at.isoformat() if profile.created_at else None,
-        "updated_at": profile.updated_at.isoformat() if profile.updated_at else None,
-        "created_by": str(profile.created_by) if profile.created_by else None,
-        "updated_by": str(profile.updated_by) if profile.updated_by else None,
-    }
-
-
-def _note_snapshot(note: ContactNote) -> Dict[str, Any]:
-    return {
-        "id": note.id,
-        "note_type": note.note_type,
-        "title": note.title,
-        "body": note.body,
-        "noted_at": note.noted_at.isoformat() if note.noted_at else None,
-        "source_system": note.source_system,
-        "source_ref": note.source_ref,
-        "created_at": note.created_at.isoformat() if note.created_at else None,
-        "updated_at": note.updated_at.isoformat() if note.updated_at else None,
-        "created_by": str(note.created_by) if note.created_by else None,
-        "updated_by": str(note.updated_by) if note.updated_by else None,
-    }
-
-
-def _company_relationship_snapshot(rel: ContactCompanyRelationship) -> Dict[str, Any]:
-    return {
-        "id": rel.id,
-        "company_id": rel.company_id,
-        "relationship_type": rel.relationship_type,
-        "department": rel.department,
-        "job_title": rel.job_title,
-        "work_email": rel.work_email,
-        "work_phone_raw": rel.work_phone_raw,
-        "work_phone_e164": rel.work_phone_e164,
-        "work_phone_ext": rel.work_phone_ext,
-        "is_primary": rel.is_primary,
-        "start_date": rel.start_date.isoformat() if rel.start_date else None,
-        "end_date": rel.end_date.isoformat() if rel.end_date else None,
-        "is_active": rel.is_active,
-        "created_at": rel.created_at.isoformat() if rel.created_at else None,
-        "updated_at": rel.updated_at.isoformat() if rel.updated_at else None,
-        "created_by": rel.created_by,
-        "updated_by": rel.updated_by,
-    }
+_phone_snapshot = column_extractor(
+    ContactPhone,
+    (
+        "id", "phone_raw", "phone_e164", "phone_type", "is_primary", "is_sms_capable",
+        "is_verified", "verified_at", "created_at", "updated_at", "created_by",
+        "updated_by",
+    ),
+)
 
 
-def _contact_snapshot(contact: Any) -> Dict[str, Any]:
-    """Return a full snapshot of a contact including nested resources.
+_email_snapshot = column_extractor(
+    ContactEmail,
+    (
+        "id", "email", "email_type", "is_primary", "is_verified", "verified_at",
+        "created_at", "updated_at", "created_by", "updated_by",
+    ),
+)
 
-    The ``contact`` argument may be an ORM instance or any object
-    exposing attributes consistent with the Contact model.
-    """
-    return {
-        "id": contact.id,
-        "tenant_id": contact.tenant_id,
-        "first_name": contact.first_name,
-        "middle_name": contact.middle_name,
-        "last_name": contact.last_name,
-        "job_title": getattr(contact, "job_title", None),
-        "created_at": contact.created_at.isoformat() if contact.created_at else None,
-        "updated_at": contact.updated_at.isoformat() if contact.updated_at else None,
-        "created_by": getattr(contact, "created_by", None),
-        "updated_by": getattr(contact, "updated_by", None),
-        # Ownership fields included for consumers
-        "owned_by_user_id": getattr(contact, "owned_by_user_id", None),
-        "owned_by_group_id": getattr(contact, "owned_by_group_id", None),
-        "phones": [_phone_snapshot(p) for p in getattr(contact, "phones", [])],
-        "emails": [_email_snapshot(e) for e in getattr(contact, "emails", [])],
-        "addresses": [_address_snapshot(a) for a in getattr(contact, "addresses", [])],
-        "social_profiles": [
-            _social_profile_snapshot(s) for s in getattr(contact, "social_profiles", [])
-        ],
-        "notes": [_note_snapshot(n) for n in getattr(contact, "notes", [])],
-        "company_relationships": [
-            _company_relationship_snapshot(r) for r in getattr(contact, "company_relationships", [])
-        ],
-    }
+
+_address_snapshot = column_extractor(
+    ContactAddress,
+    (
+        "id", "address_type", "label", "is_primary", "line1", "line2", "line3", "city",
+        "region", "postal_code", "country_code", "created_at", "updated_at",
+        "created_by", "updated_by",
+    ),
+)
+
+
+_social_profile_snapshot = column_extractor(
+    ContactSocialProfile,
+    (
+        "id", "profile_type", "profile_url", "created_at", "updated_at", "created_by",
+        "updated_by",
+    ),
+)
+
+
+_note_snapshot = column_extractor(
+    ContactNote,
+    (
+        "id", "note_type", "title", "body", "noted_at", "source_system", "source_ref",
+        "created_at", "updated_at", "created_by", "updated_by",
+    ),
+)
+
+
+_company_relationship_snapshot = column_extractor(
+    ContactCompanyRelationship,
+    (
+        "id", "company_id", "relationship_type", "department", "job_title",
+        "work_email", "work_phone_raw", "work_phone_e164", "work_phone_ext",
+        "is_primary", "start_date", "end_date", "is_active", "created_at",
+        "updated_at", "created_by", "updated_by",
+    ),
+)
+
+
+_contact_columns = column_extractor(
+    Contact,
+    (
+        "id", "tenant_id", "first_name", "middle_name", "last_name", "created_at",
+        "updated_at", "created_by", "updated_by", "owned_by_user_id",
+        "owned_by_group_id",
+    ),
+)
+
+
+def _contact_snapshot(contact: Any) -> Dict[str, Any]:
+    """Return a full snapshot of a contact including nested resources."""
+    snapshot = _contact_columns(contact)
+    # Contact has no job_title column; the key is kept for consumers
+    snapshot["job_title"] = None
+    snapshot["phones"] = [_phone_snapshot(p) for p in contact.phones]
+    snapshot["emails"] = [_email_snapshot(e) for e in contact.emails]
+    snapshot["addresses"] = [_address_snapshot(a) for a in contact.addresses]
+    snapshot["social_profiles"] = [_social_profile_snapshot(s) for s in contact.social_profiles]
+    snapshot["notes"] = [_note_snapshot(n) for n in contact.notes]
+    snapshot["company_relationships"] = [
+        _company_relationship_snapshot(r) for r in contact.company_relationships
+    ]
+    return snapshot
 
 
 def _compute_base_changes(old: Any, new: Any) -> Dict[str, Any]:
@@ -237,13 +203,20 @@ def list_contacts(
     company_name: Optional[str] = None,  # Placeholder for future implementation
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[Any], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Any], Optional[int]]:
     """Return a filtered and paginated list of contacts.
 
     When ``tenant_id`` is provided, results are scoped to that tenant.
-    Filtering is case‑insensitive and performed on first/last names
-    directly in the database.  Phone and email filters are applied in
-    memory against the nested collections.
+    All filtering, counting and pagination happen in the database.
+    Name filters are case‑insensitive substring matches on the contact
+    columns; phone and email filters are expressed as ``EXISTS``
+    subqueries against ``contact_phone``/``contact_email`` so that the
+    nested collections are never loaded into memory.  The trigram
+    indexes added in ``007_contact_search_indexes.sql`` back the
+    substring matches.
 
     Parameters
     ----------
@@ -268,6 +241,12 @@ def list_contacts(
         Maximum number of items to return.
     offset: int | None
         Number of items to skip from the start of the result set.
+    cursor: str | None
+        Opaque keyset cursor from a previous page; enables keyset mode.
+    page_size: int | None
+        Keyset page size; enables keyset mode (``total`` is ``None``).
+    total_mode: str | None
+        ``exact``, ``estimated`` or ``none``; see :mod:`pagination_service`.
 
     Returns
     -------
@@ -288,34 +267,59 @@ def list_contacts(
         query = query.filter(Contact.first_name.ilike(f"%{first_name}%"))
     if last_name:
         query = query.filter(Contact.last_name.ilike(f"%{last_name}%"))
-    contacts: List[Any] = query.order_by(Contact.created_at.desc()).all()
-    # Filter by phone and email in memory
-    def match_phone(c: Any, pattern: str) -> bool:
-        pat = pattern.lower()
-        for ph in getattr(c, "phones", []):
-            if ph.phone_raw and pat in ph.phone_raw.lower():
-                return True
-            if ph.phone_e164 and pat in ph.phone_e164.lower():
-                return True
-        return False
-
-    def match_email(c: Any, pattern: str) -> bool:
-        pat = pattern.lower()
-        for em in getattr(c, "emails", []):
-            if em.email and pat in em.email.lower():
-                return True
-        return False
-
+    # Nested collection filters are correlated EXISTS subqueries joined on
+    # the tenant-safe composite key used by the ORM relationships.
     if phone:
-        contacts = [c for c in contacts if match_phone(c, phone)]
+        pattern = f"%{phone}%"
+        query = query.filter(
+            exists().where(
+                ContactPhone.contact_id == Contact.id,
+                ContactPhone.tenant_id == Contact.tenant_id,
+                or_(
+                    ContactPhone.phone_raw.ilike(pattern),
+                    ContactPhone.phone_e164.ilike(pattern),
+                ),
+            )
+        )
     if email:
-        contacts = [c for c in contacts if match_email(c, email)]
-    total = len(contacts)
-    if offset:
-        contacts = contacts[offset:]
-    if limit is not None:
-        contacts = contacts[:limit]
-    return contacts, total
+        query = query.filter(
+            exists().where(
+                ContactEmail.contact_id == Contact.id,
+                ContactEmail.tenant_id == Contact.tenant_id,
+                ContactEmail.email.ilike(f"%{email}%"),
+            )
+        )
+    # List responses serialize every collection; load them per page, not per row
+    query = query.options(*_contact_snapshot_options())
+    return paginate(
+        query,
+        Contact,
+        order_by=(Contact.created_at.desc(), Contact.id.desc()),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+
+
+def _contact_snapshot_options() -> Tuple[Any, ...]:
+    """Loader options for every collection read by ``_contact_snapshot``.
+
+    Each ``selectinload`` fetches one collection with a single ``IN``
+    query, so a full snapshot costs a fixed number of round trips
+    instead of one lazy load per collection.  Built on demand because
+    ``company_relationships`` is a backref that only exists once the
+    mappers are configured.
+    """
+    return (
+        selectinload(Contact.phones),
+        selectinload(Contact.emails),
+        selectinload(Contact.addresses),
+        selectinload(Contact.social_profiles),
+        selectinload(Contact.notes),
+        selectinload(Contact.company_relationships),
+    )
 
 
 def get_contact(
@@ -323,12 +327,15 @@ def get_contact(
     *,
     tenant_id: Optional[uuid.UUID],
     contact_id: uuid.UUID,
+    snapshot: bool = False,
 ) -> Any:
     """Retrieve a single contact by ID with optional tenant scoping.
 
     If ``tenant_id`` is provided, the contact must belong to that
     tenant.  Raises 404 if the contact does not exist or is outside
-    the tenant scope.
+    the tenant scope.  Pass ``snapshot=True`` when the nested
+    collections will be read (full responses, event snapshots) so they
+    are eager loaded together with the contact.
     """
     if Contact is None:
         raise HTTPException(
@@ -336,6 +343,8 @@ def get_contact(
             detail="Contact model is not available",
         )
     query = db.query(Contact).filter(Contact.id == contact_id)
+    if snapshot:
+        query = query.options(*_contact_snapshot_options())
     if tenant_id is not None:
         query = query.filter(Contact.tenant_id == tenant_id)
     contact: Optional[Any] = query.first()
@@ -344,6 +353,73 @@ def get_contact(
     return contact
 
 
+async def get_contact_async(
+    db: AsyncSession,
+    *,
+    tenant_id: Optional[uuid.UUID],
+    contact_id: uuid.UUID,
+    snapshot: bool = False,
+) -> Any:
+    """Async variant of :func:`get_contact` for an ``AsyncSession``.
+
+    Runs the sync lookup through ``run_sync``.  Attributes that are not
+    loaded cannot be lazy loaded afterwards, so callers serializing
+    the nested collections must pass ``snapshot=True``.
+    """
+    return await db.run_sync(
+        lambda session: get_contact(
+            session, tenant_id=tenant_id, contact_id=contact_id, snapshot=snapshot
+        )
+    )
+
+
+# Collections rendered in ``ContactOut``; part of the contact's version
+_CONTACT_COLLECTIONS = (
+    "phones",
+    "emails",
+    "addresses",
+    "social_profiles",
+    "notes",
+    "company_relationships",
+)
+
+
+def get_contact_version(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    contact_id: uuid.UUID,
+) -> Optional[str]:
+    """Return the version token of a contact and its nested collections.
+
+    Returns ``None`` if the contact does not exist in the tenant.
+    """
+    return resource_version(
+        db,
+        Contact,
+        tenant_id=tenant_id,
+        resource_id=contact_id,
+        collections=_CONTACT_COLLECTIONS,
+    )
+
+
+def _reload_contact_snapshot(db: Session, *, tenant_id: uuid.UUID, contact_id: uuid.UUID) -> Any:
+    """Reload a flushed contact with all snapshot collections.
+
+    Replaces ``db.refresh`` after a flush: the refresh only reloads
+    the contact row, leaving each collection to be lazy loaded by the
+    snapshot or response serialization.  ``populate_existing`` updates
+    the instance already held by the session.
+    """
+    return (
+        db.query(Contact)
+        .options(*_contact_snapshot_options())
+        .populate_existing()
+        .filter(Contact.id == contact_id, Contact.tenant_id == tenant_id)
+        .one()
+    )
+
+
 def create_contact(
     db: Session,
     *,
@@ -454,7 +530,8 @@ def create_contact(
             updated_by=created_by,
         )
         db.add(note)
-    commit_or_raise(db, refresh=contact, action="create_contact")
+    flush_or_raise(db, action="create_contact")
+    contact = _reload_contact_snapshot(db, tenant_id=tenant_id, contact_id=contact.id)
     logger.info("Created contact %s for tenant %s", contact.id, tenant_id)
     snapshot = _contact_snapshot(contact)
     try:
@@ -465,6 +542,7 @@ def create_contact(
             tenant_id,
             contact.id,
         )
+    commit_or_raise(db, action="create_contact")
     return contact
 
 
@@ -476,12 +554,12 @@ def delete_contact(
 ) -> None:
     """Delete a contact and all nested resources.
 
-    Emits a ``contact.deleted`` event after the commit.  If the
+    Emits a ``contact.deleted`` event with the commit.  If the
     contact does not exist, a 404 error is raised.
     """
     contact = get_contact(db, tenant_id=tenant_id, contact_id=contact_id)
     db.delete(contact)
-    commit_or_raise(db, action="delete_contact")
+    flush_or_raise(db, action="delete_contact")
     logger.info("Deleted contact %s for tenant %s", contact_id, tenant_id)
     try:
         ContactProducer.send_contact_deleted(
@@ -493,6 +571,7 @@ def delete_contact(
             tenant_id,
             contact_id,
         )
+    commit_or_raise(db, action="delete_contact")
 
 
 # ---------------------------------------------------------------------------
@@ -500,38 +579,20 @@ def delete_contact(
 # ---------------------------------------------------------------------------
 
 
-def patch_contact(
+def _apply_contact_patch(
     db: Session,
+    contact: Any,
+    patch_request: JsonPatchRequest,
     *,
     tenant_id: uuid.UUID,
-    contact_id: uuid.UUID,
-    patch_request: JsonPatchRequest,
-    updated_by: Optional[str] = None,
-) -> Any:
-    """Apply a JSON Patch document to a contact.
+    updated_by: Optional[str],
+) -> ContactDelta:
+    """Apply the operations of ``patch_request`` to a loaded contact.
 
-    Supports updating top‑level attributes as well as nested
-    collections.  Nested objects are identified by their UUID in the
-    path (e.g. ``/phones/<phone_id>/phone_raw``).  Adding new nested
-    objects is supported via a path of ``/phones`` with an object
-    value.
+    The contact must have been loaded with its snapshot collections.
+    Changes are made in the session but not committed; the returned
+    delta describes them.
     """
-    contact = get_contact(db, tenant_id=tenant_id, contact_id=contact_id)
-    # Clone original to compute base changes later
-    # Clone the original contact without a job_title attribute.  The
-    # Contact ORM does not define a job_title column.  Including it
-    # here would create a transient attribute that is not persisted.
-    original_contact = Contact(
-        id=contact.id,
-        tenant_id=contact.tenant_id,
-        first_name=contact.first_name,
-        middle_name=contact.middle_name,
-        last_name=contact.last_name,
-        created_at=contact.created_at,
-        updated_at=contact.updated_at,
-        created_by=contact.created_by,
-        updated_by=contact.updated_by,
-    )
     # Build delta accumulator
     delta = ContactDelta()
 
@@ -833,7 +894,46 @@ def patch_contact(
     # Update timestamps and user
     contact.updated_at = datetime.utcnow()
     contact.updated_by = updated_by
-    commit_or_raise(db, refresh=contact, action="patch_contact")
+    return delta
+
+
+def patch_contact(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    contact_id: uuid.UUID,
+    patch_request: JsonPatchRequest,
+    updated_by: Optional[str] = None,
+) -> Any:
+    """Apply a JSON Patch document to a contact.
+
+    Supports updating top‑level attributes as well as nested
+    collections.  Nested objects are identified by their UUID in the
+    path (e.g. ``/phones/<phone_id>/phone_raw``).  Adding new nested
+    objects is supported via a path of ``/phones`` with an object
+    value.
+    """
+    contact = get_contact(db, tenant_id=tenant_id, contact_id=contact_id, snapshot=True)
+    # Clone original to compute base changes later
+    # Clone the original contact without a job_title attribute.  The
+    # Contact ORM does not define a job_title column.  Including it
+    # here would create a transient attribute that is not persisted.
+    original_contact = Contact(
+        id=contact.id,
+        tenant_id=contact.tenant_id,
+        first_name=contact.first_name,
+        middle_name=contact.middle_name,
+        last_name=contact.last_name,
+        created_at=contact.created_at,
+        updated_at=contact.updated_at,
+        created_by=contact.created_by,
+        updated_by=contact.updated_by,
+    )
+    delta = _apply_contact_patch(
+        db, contact, patch_request, tenant_id=tenant_id, updated_by=updated_by
+    )
+    flush_or_raise(db, action="patch_contact")
+    contact = _reload_contact_snapshot(db, tenant_id=tenant_id, contact_id=contact_id)
     # Compute base changes if not already populated in delta
     base_changes = _compute_base_changes(original_contact, contact)
     if base_changes:
@@ -841,43 +941,62 @@ def patch_contact(
             delta.base_fields = base_changes
         else:
             delta.base_fields.update(base_changes)
-    # Emit event if any changes captured
-    if any(
-        [
-            delta.base_fields,
-            delta.phones_added,
-            delta.phones_updated,
-            delta.phones_deleted,
-            delta.emails_added,
-            delta.emails_updated,
-            delta.emails_deleted,
-            delta.addresses_added,
-            delta.addresses_updated,
-            delta.addresses_deleted,
-            delta.social_profiles_added,
-            delta.social_profiles_updated,
-            delta.social_profiles_deleted,
-            delta.notes_added,
-            delta.notes_updated,
-            delta.notes_deleted,
-        ]
-    ):
-        snapshot = _contact_snapshot(contact)
-        try:
-            ContactProducer.send_contact_updated(
-                tenant_id=tenant_id,
-                changes=delta,
-                payload=snapshot,
-            )
-        except Exception:
-            logger.exception(
-                "Failed to publish contact.updated event tenant_id=%s contact_id=%s",
-                tenant_id,
-                contact_id,
-            )
+    # Emit event if any changes captured (already reloaded above)
+    _emit_contact_update_event(db, contact, tenant_id, delta, refresh=False)
+    commit_or_raise(db, action="patch_contact")
     return contact
 
 
+def bulk_patch_contacts(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    items: List[BulkPatchItem],
+    updated_by: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+) -> BulkPatchResult:
+    """Apply a JSON Patch document to each of many contacts.
+
+    Contacts are loaded and committed in chunks (see
+    :func:`bulk_patch_service.run_bulk_patch`); an item that fails is
+    reported and skipped.  One ``contact.bulk_patched`` event carrying
+    the delta of every changed contact is published per chunk instead
+    of a ``contact.updated`` event per contact.
+    """
+
+    def _apply(contact: Any, patch_request: JsonPatchRequest) -> ContactDelta:
+        return _apply_contact_patch(
+            db, contact, patch_request, tenant_id=tenant_id, updated_by=updated_by
+        )
+
+    def _publish(patch_id: uuid.UUID, chunk: int, changes: Dict[uuid.UUID, ContactDelta]) -> None:
+        ContactProducer.send_contacts_bulk_patched(
+            tenant_id=tenant_id, patch_id=patch_id, chunk=chunk, changes=changes
+        )
+
+    result = run_bulk_patch(
+        db,
+        items,
+        model=Contact,
+        tenant_id=tenant_id,
+        apply=_apply,
+        publish=_publish,
+        merge=merge_deltas,
+        has_changes=_contact_delta_has_changes,
+        options=_contact_snapshot_options(),
+        not_found="Contact not found",
+        action="bulk_patch_contacts",
+        chunk_size=chunk_size,
+    )
+    logger.info(
+        "Bulk patched contacts for tenant %s: %d patched, %d failed",
+        tenant_id,
+        result.patched,
+        result.failed,
+    )
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Nested resource list functions
 # ---------------------------------------------------------------------------
@@ -948,34 +1067,72 @@ def list_contact_company_relationships(
 # ---------------------------------------------------------------------------
 
 
-def _emit_contact_update_event(db: Session, contact: Any, tenant_id: uuid.UUID, delta: ContactDelta) -> None:
+def _contact_delta_has_changes(delta: ContactDelta) -> bool:
+    if delta.base_fields:
+        return True
+    return any(
+        getattr(delta, f"{name}_{kind}")
+        for name in DELTA_COLLECTIONS
+        for kind in ("added", "updated", "deleted")
+    )
+
+
+def _publish_coalesced_contact_update(
+    tenant_id: uuid.UUID, contact_id: uuid.UUID, delta: ContactDelta
+) -> None:
+    """Publish one contact.updated event for a merged delta.
+
+    Runs when the request's publish buffer flushes, after the last
+    commit and once the request session has been closed, so the
+    snapshot is read with a short-lived session.  Nothing is sent if
+    the contact was deleted in the meantime; its contact.deleted event
+    supersedes the update.
+    """
+    with SessionLocal() as session:
+        try:
+            contact = get_contact(
+                session, tenant_id=tenant_id, contact_id=contact_id, snapshot=True
+            )
+        except HTTPException:
+            return
+        snapshot = _contact_snapshot(contact)
+    ContactProducer.send_contact_updated(
+        tenant_id=tenant_id,
+        changes=delta,
+        payload=snapshot,
+    )
+
+
+def _emit_contact_update_event(
+    db: Session,
+    contact: Any,
+    tenant_id: uuid.UUID,
+    delta: ContactDelta,
+    *,
+    refresh: bool = True,
+) -> None:
     """Internal helper to emit a contact.updated event after nested operations.
 
-    It refreshes the contact to obtain the latest state and publishes
-    the event if any changes were recorded.
+    Call it after flushing and before committing.  When a publish
+    buffer is active (i.e. inside an API request) the delta is merged
+    with any other updates of the same contact in the request and a
+    single event with one snapshot is published when the buffer
+    flushes, after the last commit.  Otherwise the contact and its
+    collections are reloaded to obtain the latest state and the event
+    is published immediately.
     """
-    if not any(
-        [
-            delta.base_fields,
-            delta.phones_added,
-            delta.phones_updated,
-            delta.phones_deleted,
-            delta.emails_added,
-            delta.emails_updated,
-            delta.emails_deleted,
-            delta.addresses_added,
-            delta.addresses_updated,
-            delta.addresses_deleted,
-            delta.social_profiles_added,
-            delta.social_profiles_updated,
-            delta.social_profiles_deleted,
-            delta.notes_added,
-            delta.notes_updated,
-            delta.notes_deleted,
-        ]
+    if not _contact_delta_has_changes(delta):
+        return
+    contact_id = contact.id
+    if ContactProducer.coalesce(
+        ("contact.updated", tenant_id, contact_id),
+        delta,
+        merge=merge_deltas,
+        emit=lambda merged: _publish_coalesced_contact_update(tenant_id, contact_id, merged),
     ):
         return
-    db.refresh(contact)
+    if refresh:
+        contact = _reload_contact_snapshot(db, tenant_id=tenant_id, contact_id=contact_id)
     snapshot = _contact_snapshot(contact)
     try:
         ContactProducer.send_contact_updated(
@@ -1013,9 +1170,10 @@ def add_contact_phone(
         updated_by=updated_by,
     )
     db.add(phone)
-    commit_or_raise(db, action="add_contact_phone")
+    flush_or_raise(db, action="add_contact_phone")
     delta = ContactDelta(phones_added=[_phone_snapshot(phone)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="add_contact_phone")
     return phone
 
 
@@ -1050,9 +1208,10 @@ def update_contact_phone(
         phone.is_verified = phone_update.is_verified
     phone.updated_at = datetime.utcnow()
     phone.updated_by = updated_by
-    commit_or_raise(db, action="update_contact_phone")
+    flush_or_raise(db, action="update_contact_phone")
     delta = ContactDelta(phones_updated=[_phone_snapshot(phone)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="update_contact_phone")
     return phone
 
 
@@ -1072,9 +1231,10 @@ def delete_contact_phone(
     if not phone:
         raise HTTPException(status_code=404, detail="Phone number not found")
     db.delete(phone)
-    commit_or_raise(db, action="delete_contact_phone")
+    flush_or_raise(db, action="delete_contact_phone")
     delta = ContactDelta(phones_deleted=[phone_id])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="delete_contact_phone")
     return None
 
 
@@ -1097,9 +1257,10 @@ def add_contact_email(
         updated_by=updated_by,
     )
     db.add(email)
-    commit_or_raise(db, action="add_contact_email")
+    flush_or_raise(db, action="add_contact_email")
     delta = ContactDelta(emails_added=[_email_snapshot(email)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="add_contact_email")
     return email
 
 
@@ -1129,9 +1290,10 @@ def update_contact_email(
         email.is_verified = email_update.is_verified
     email.updated_at = datetime.utcnow()
     email.updated_by = updated_by
-    commit_or_raise(db, action="update_contact_email")
+    flush_or_raise(db, action="update_contact_email")
     delta = ContactDelta(emails_updated=[_email_snapshot(email)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="update_contact_email")
     return email
 
 
@@ -1151,9 +1313,10 @@ def delete_contact_email(
     if not email:
         raise HTTPException(status_code=404, detail="Email not found")
     db.delete(email)
-    commit_or_raise(db, action="delete_contact_email")
+    flush_or_raise(db, action="delete_contact_email")
     delta = ContactDelta(emails_deleted=[email_id])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="delete_contact_email")
     return None
 
 
@@ -1182,9 +1345,10 @@ def add_contact_address(
         updated_by=updated_by,
     )
     db.add(addr)
-    commit_or_raise(db, action="add_contact_address")
+    flush_or_raise(db, action="add_contact_address")
     delta = ContactDelta(addresses_added=[_address_snapshot(addr)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="add_contact_address")
     return addr
 
 
@@ -1226,9 +1390,10 @@ def update_contact_address(
         addr.country_code = addr_update.country_code
     addr.updated_at = datetime.utcnow()
     addr.updated_by = updated_by
-    commit_or_raise(db, action="update_contact_address")
+    flush_or_raise(db, action="update_contact_address")
     delta = ContactDelta(addresses_updated=[_address_snapshot(addr)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="update_contact_address")
     return addr
 
 
@@ -1248,9 +1413,10 @@ def delete_contact_address(
     if not addr:
         raise HTTPException(status_code=404, detail="Address not found")
     db.delete(addr)
-    commit_or_raise(db, action="delete_contact_address")
+    flush_or_raise(db, action="delete_contact_address")
     delta = ContactDelta(addresses_deleted=[address_id])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="delete_contact_address")
     return None
 
 
@@ -1271,9 +1437,10 @@ def add_contact_social_profile(
         updated_by=updated_by,
     )
     db.add(sp)
-    commit_or_raise(db, action="add_contact_social_profile")
+    flush_or_raise(db, action="add_contact_social_profile")
     delta = ContactDelta(social_profiles_added=[_social_profile_snapshot(sp)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="add_contact_social_profile")
     return sp
 
 
@@ -1303,9 +1470,10 @@ def update_contact_social_profile(
         sp.profile_url = sp_update.profile_url
     sp.updated_at = datetime.utcnow()
     sp.updated_by = updated_by
-    commit_or_raise(db, action="update_contact_social_profile")
+    flush_or_raise(db, action="update_contact_social_profile")
     delta = ContactDelta(social_profiles_updated=[_social_profile_snapshot(sp)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="update_contact_social_profile")
     return sp
 
 
@@ -1329,9 +1497,10 @@ def delete_contact_social_profile(
     if not sp:
         raise HTTPException(status_code=404, detail="Social profile not found")
     db.delete(sp)
-    commit_or_raise(db, action="delete_contact_social_profile")
+    flush_or_raise(db, action="delete_contact_social_profile")
     delta = ContactDelta(social_profiles_deleted=[social_profile_id])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="delete_contact_social_profile")
     return None
 
 
@@ -1356,9 +1525,10 @@ def add_contact_note(
         updated_by=updated_by,
     )
     db.add(note)
-    commit_or_raise(db, action="add_contact_note")
+    flush_or_raise(db, action="add_contact_note")
     delta = ContactDelta(notes_added=[_note_snapshot(note)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="add_contact_note")
     return note
 
 
@@ -1392,9 +1562,10 @@ def update_contact_note(
         note.source_ref = note_update.source_ref
     note.updated_at = datetime.utcnow()
     note.updated_by = updated_by
-    commit_or_raise(db, action="update_contact_note")
+    flush_or_raise(db, action="update_contact_note")
     delta = ContactDelta(notes_updated=[_note_snapshot(note)])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="update_contact_note")
     return note
 
 
@@ -1414,9 +1585,10 @@ def delete_contact_note(
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     db.delete(note)
-    commit_or_raise(db, action="delete_contact_note")
+    flush_or_raise(db, action="delete_contact_note")
     delta = ContactDelta(notes_deleted=[note_id])
     _emit_contact_update_event(db, contact, tenant_id, delta)
+    commit_or_raise(db, action="delete_contact_note")
     return None
 
 
@@ -1469,7 +1641,7 @@ def add_contact_company_relationship(
         updated_by=updated_by,
     )
     db.add(rel)
-    commit_or_raise(db, action="add_contact_company_relationship")
+    flush_or_raise(db, action="add_contact_company_relationship")
     payload = _company_relationship_snapshot(rel)
     try:
         RelationshipProducer.send_relationship_created(
@@ -1485,6 +1657,7 @@ def add_contact_company_relationship(
             contact.id,
             rel.company_id,
         )
+    commit_or_raise(db, action="add_contact_company_relationship")
     return rel
 
 
@@ -1545,8 +1718,8 @@ def update_contact_company_relationship(
         changes["is_active"] = rel.is_active
     rel.updated_at = datetime.utcnow()
     rel.updated_by = updated_by
-    # Use centralized commit with rollback and translation
-    commit_or_raise(db, action="update_contact_company_relationship")
+    # Use centralized flush with rollback and translation
+    flush_or_raise(db, action="update_contact_company_relationship")
     payload = _company_relationship_snapshot(rel)
     if changes:
         try:
@@ -1564,6 +1737,7 @@ def update_contact_company_relationship(
                 contact.id,
                 company_id,
             )
+    commit_or_raise(db, action="update_contact_company_relationship")
     return rel
 
 
@@ -1587,8 +1761,8 @@ def delete_contact_company_relationship(
     if not rel:
         raise HTTPException(status_code=404, detail="Relationship not found")
     db.delete(rel)
-    # Use centralized commit with rollback and translation
-    commit_or_raise(db, action="delete_contact_company_relationship")
+    # Use centralized flush with rollback and translation
+    flush_or_raise(db, action="delete_contact_company_relationship")
     try:
         RelationshipProducer.send_relationship_deleted(
             tenant_id=tenant_id,
@@ -1603,4 +1777,5 @@ def delete_contact_company_relationship(
             contact.id,
             company_id,
         )
+    commit_or_raise(db, action="delete_contact_company_relationship")
     return None
\ No newline at end of file
@@ -27,7 +27,8 @@ from app.domain.schemas.events.csat_response_event import CsatResponseDelta
 from app.messaging.producers.csat_response_producer import (
     CsatResponseMessageProducer as CsatResponseProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("csat_response_service")
 
@@ -73,7 +74,10 @@ def list_csat_responses(
     csat_survey_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[CsatResponse], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[CsatResponse], Optional[int]]:
     """List CSAT responses for a ticket with optional filtering by survey."""
     logger.debug(
         "Listing CSAT responses: tenant_id=%s, ticket_id=%s, survey_id=%s, limit=%s, offset=%s",
@@ -89,13 +93,17 @@ def list_csat_responses(
     )
     if csat_survey_id:
         query = query.filter(CsatResponse.csat_survey_id == csat_survey_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(CsatResponse.submitted_at.asc())
-    return query.all(), total
+    return paginate(
+        query,
+        CsatResponse,
+        order_by=(CsatResponse.submitted_at.asc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        descending=False,
+        total_mode=total_mode,
+    )
 
 
 def create_csat_response(
@@ -137,9 +145,10 @@ def create_csat_response(
         created_by=created_by,
     )
     db.add(resp)
-    commit_or_raise(db, refresh=resp, action="create CSAT response")
+    flush_or_raise(db, refresh=resp, action="create CSAT response")
     snapshot = _snapshot(resp)
     CsatResponseProducer.send_csat_response_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create CSAT response")
     return resp
 
 
@@ -205,11 +214,12 @@ def update_csat_response(
     if delta.base_fields:
         for field, value in delta.base_fields.items():
             setattr(resp, field, value)
-        commit_or_raise(db, refresh=resp, action="update CSAT response")
+        flush_or_raise(db, refresh=resp, action="update CSAT response")
         snapshot = _snapshot(resp)
         CsatResponseProducer.send_csat_response_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update CSAT response")
     return resp
 
 
@@ -225,11 +235,12 @@ def delete_csat_response(
     """
     resp = get_csat_response(db, tenant_id=tenant_id, response_id=response_id)
     db.delete(resp)
-    commit_or_raise(db, action="delete CSAT response")
+    flush_or_raise(db, action="delete CSAT response")
     deleted_dt = datetime.utcnow().isoformat()
     CsatResponseProducer.send_csat_response_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete CSAT response")
     return None
 
 
@@ -26,7 +26,8 @@ from app.domain.schemas.events.csat_survey_event import CsatSurveyDelta
 from app.messaging.producers.csat_survey_producer import (
     CsatSurveyMessageProducer as CsatSurveyProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("csat_survey_service")
 
@@ -65,7 +66,10 @@ def list_csat_surveys(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[CsatSurvey], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[CsatSurvey], Optional[int]]:
     """List CSAT surveys with optional filtering by tenant and active status."""
     logger.debug(
         "Listing CSAT surveys: tenant_id=%s, is_active=%s, limit=%s, offset=%s",
@@ -79,13 +83,16 @@ def list_csat_surveys(
         query = query.filter(CsatSurvey.tenant_id == tenant_id)
     if is_active is not None:
         query = query.filter(CsatSurvey.is_active == is_active)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(CsatSurvey.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        CsatSurvey,
+        order_by=(CsatSurvey.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_csat_survey(
@@ -106,9 +113,10 @@ def create_csat_survey(
         updated_by=created_by,
     )
     db.add(survey)
-    commit_or_raise(db, refresh=survey, action="create CSAT survey")
+    flush_or_raise(db, refresh=survey, action="create CSAT survey")
     snapshot = _snapshot(survey)
     CsatSurveyProducer.send_csat_survey_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create CSAT survey")
     return survey
 
 
@@ -154,11 +162,12 @@ def update_csat_survey(
             setattr(survey, field, value)
         survey.updated_by = updated_by
         survey.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=survey, action="update CSAT survey")
+        flush_or_raise(db, refresh=survey, action="update CSAT survey")
         snapshot = _snapshot(survey)
         CsatSurveyProducer.send_csat_survey_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update CSAT survey")
     return survey
 
 
@@ -171,9 +180,10 @@ def delete_csat_survey(
     """Delete a CSAT survey and publish a deletion event."""
     survey = get_csat_survey(db, tenant_id=tenant_id, survey_id=survey_id)
     db.delete(survey)
-    commit_or_raise(db, action="delete CSAT survey")
+    flush_or_raise(db, action="delete CSAT survey")
     deleted_dt = datetime.utcnow().isoformat()
     CsatSurveyProducer.send_csat_survey_deleted(tenant_id=tenant_id, deleted_dt=deleted_dt)
+    commit_or_raise(db, action="delete CSAT survey")
     return None
 
 
@@ -6,7 +6,9 @@ domains.  It provides both tenant‑scoped and admin‑scoped operations for
 deals and is responsible for enforcing tenant isolation, validating
 parent resources (pipelines and stages) where necessary, committing
 transactions via :func:`commit_or_raise` and emitting events through
-``DealMessageProducer`` after successful commits.
+``DealMessageProducer`` after successful commits.  Every write also
+moves the deal's contribution in the pipeline rollups within the same
+transaction.
 
 Audit fields (``created_by`` and ``updated_by``) are strings derived
 from the ``X-User`` header.  When no user is supplied, ``"anonymous"``
@@ -24,10 +26,16 @@ from sqlalchemy.orm import Session
 
 from app.domain.models.deal import Deal
 from app.domain.schemas.deal import DealCreate, DealUpdate, DealRead
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services import pipeline_rollup_service
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.export_service import ExportSpec
+from app.domain.services.pagination_service import TotalMode, paginate
 from app.messaging.producers.deal_producer import DealMessageProducer
 
 
+# Columns streamed by GET /tenants/{tenant_id}/deals/export
+EXPORT_SPEC = ExportSpec("deals", Deal)
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
@@ -56,7 +64,10 @@ def service_list_deals(
     stage_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[Deal], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Deal], Optional[int]]:
     """
     List deals with optional filtering and pagination.
 
@@ -74,12 +85,15 @@ def service_list_deals(
         query = query.filter(Deal.pipeline_id == pipeline_id)
     if stage_id:
         query = query.filter(Deal.stage_id == stage_id)
-    total = query.count()
-    if limit is not None:
-        query = query.limit(limit)
-    if offset is not None:
-        query = query.offset(offset)
-    return query.all(), total
+    return paginate(
+        query,
+        Deal,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_get_deal(
@@ -140,11 +154,14 @@ def service_create_deal(
         updated_by=created_user,
     )
     db.add(deal)
-    # Commit the transaction.  If an integrity error occurs, it will be raised
-    # from commit_or_raise and the caller should handle it accordingly.
-    commit_or_raise(db)
+    pipeline_rollup_service.apply_deal_change(
+        db, None, pipeline_rollup_service.deal_contribution(deal)
+    )
+    # Flush the deal.  If an integrity error occurs, it will be raised
+    # from flush_or_raise and the caller should handle it accordingly.
+    flush_or_raise(db)
     db.refresh(deal)
-    # Emit event after commit
+    # Emit event; commit_or_raise stages it with the deal
     try:
         payload = _deal_snapshot(deal)
         DealMessageProducer.send_deal_created(
@@ -152,8 +169,9 @@ def service_create_deal(
             payload=payload,
         )
     except Exception:
-        # Log the error but do not raise; the database transaction already succeeded.
+        # Log the error but do not raise; the deal is still committed.
         pass
+    commit_or_raise(db)
     return deal
 
 
@@ -176,6 +194,7 @@ def service_update_deal(
     deal = service_get_deal(db, tenant_id=tenant_id, deal_id=deal_id)
     # Create snapshot of current state for change detection
     before = _deal_snapshot(deal)
+    contribution_before = pipeline_rollup_service.deal_contribution(deal)
     # Apply updates
     if deal_in.name is not None:
         deal.name = deal_in.name
@@ -207,8 +226,11 @@ def service_update_deal(
     if getattr(deal_in, "close_date", None) is not None:
         deal.close_date = deal_in.close_date
     deal.updated_by = modified_user
-    # Commit changes
-    commit_or_raise(db)
+    pipeline_rollup_service.apply_deal_change(
+        db, contribution_before, pipeline_rollup_service.deal_contribution(deal)
+    )
+    # Flush changes
+    flush_or_raise(db)
     db.refresh(deal)
     # Determine changes and emit event if any
     after = _deal_snapshot(deal)
@@ -227,6 +249,7 @@ def service_update_deal(
         except Exception:
             # Swallow messaging exceptions to avoid masking DB success
             pass
+    commit_or_raise(db)
     return deal
 
 
@@ -242,8 +265,11 @@ def service_delete_deal(
     Raises 404 if the deal is not found.
     """
     deal = service_get_deal(db, tenant_id=tenant_id, deal_id=deal_id)
+    pipeline_rollup_service.apply_deal_change(
+        db, pipeline_rollup_service.deal_contribution(deal), None
+    )
     db.delete(deal)
-    commit_or_raise(db)
+    flush_or_raise(db)
     # Emit deletion event
     try:
         deleted_dt = datetime.utcnow().isoformat()
@@ -252,4 +278,5 @@ def service_delete_deal(
             deleted_dt=deleted_dt,
         )
     except Exception:
-        pass
\ No newline at end of file
+        pass
+    commit_or_raise(db)
\ No newline at end of file
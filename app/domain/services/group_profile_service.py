@@ -25,12 +25,16 @@ from app.domain.schemas.group_profile import (
     TenantCreateGroupProfile,
     AdminCreateGroupProfile,
     GroupProfileUpdate,
+    GroupProfileOut,
 )
 from app.domain.schemas.events.group_profile_event import GroupProfileDelta
 from app.messaging.producers.group_profile_producer import (
     GroupProfileMessageProducer as GroupProfileProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services import sla_engine_service
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import tenant_config_cache
 
 logger = logging.getLogger("group_profile_service")
 
@@ -77,7 +81,10 @@ def list_group_profiles(
     is_support_queue: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[GroupProfile], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[GroupProfile], Optional[int]]:
     """List group profiles with optional filters.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.  The
@@ -100,13 +107,16 @@ def list_group_profiles(
     if is_support_queue is not None:
         query = query.filter(GroupProfile.is_support_queue == is_support_queue)
 
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(GroupProfile.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        GroupProfile,
+        order_by=(GroupProfile.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_group_profile(
@@ -134,11 +144,12 @@ def create_group_profile(
         updated_by=created_by,
     )
     db.add(profile)
-    commit_or_raise(db, refresh=profile, action="create group profile")
-
-    # Emit event after commit
+    flush_or_raise(db, refresh=profile, action="create group profile")
+    # Emit event; commit_or_raise stages it with the profile
     snapshot = _snapshot(profile)
     GroupProfileProducer.send_group_profile_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create group profile")
+    sla_engine_service.enqueue_recompute(tenant_id)
     return profile
 
 
@@ -168,6 +179,27 @@ def get_group_profile(
     return profile
 
 
+def get_group_profile_config(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    profile_id: uuid.UUID,
+) -> GroupProfileOut:
+    """Retrieve a group profile as a detached ``GroupProfileOut``.
+
+    Served from the tenant configuration cache; entries are dropped
+    when the group profile changes.
+    """
+    return tenant_config_cache.get_or_load(
+        tenant_id,
+        "group_profile",
+        profile_id,
+        lambda: GroupProfileOut.model_validate(
+            get_group_profile(db, tenant_id=tenant_id, profile_id=profile_id), from_attributes=True
+        ),
+    )
+
+
 def update_group_profile(
     db: Session,
     *,
@@ -200,11 +232,14 @@ def update_group_profile(
             setattr(profile, field, value)
         profile.updated_by = updated_by
         profile.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=profile, action="update group profile")
+        flush_or_raise(db, refresh=profile, action="update group profile")
         snapshot = _snapshot(profile)
         GroupProfileProducer.send_group_profile_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update group profile")
+        if {"default_sla_policy_id", "business_hours_id"} & set(delta.base_fields):
+            sla_engine_service.enqueue_recompute(tenant_id)
     return profile
 
 
@@ -217,12 +252,14 @@ def delete_group_profile(
     """Delete a group profile and publish a deletion event."""
     profile = get_group_profile(db, tenant_id=tenant_id, profile_id=profile_id)
     db.delete(profile)
-    commit_or_raise(db, action="delete group profile")
+    flush_or_raise(db, action="delete group profile")
     # Emitting deleted event with timestamp
     deleted_dt = datetime.utcnow().isoformat()
     GroupProfileProducer.send_group_profile_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete group profile")
+    sla_engine_service.enqueue_recompute(tenant_id)
     return None
 
 
@@ -230,6 +267,7 @@ __all__ = [
     "list_group_profiles",
     "create_group_profile",
     "get_group_profile",
+    "get_group_profile_config",
     "update_group_profile",
     "delete_group_profile",
 ]
@@ -29,7 +29,8 @@ from app.domain.schemas.events.inbound_channel_event import InboundChannelDelta
 from app.messaging.producers.inbound_channel_producer import (
     InboundChannelMessageProducer as InboundChannelProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("inbound_channel_service")
 
@@ -72,7 +73,10 @@ def list_inbound_channels(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[InboundChannel], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[InboundChannel], Optional[int]]:
     """List inbound channels with optional filtering by type and status.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.
@@ -96,13 +100,16 @@ def list_inbound_channels(
         query = query.filter(InboundChannel.channel_type == channel_type)
     if is_active is not None:
         query = query.filter(InboundChannel.is_active == is_active)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(InboundChannel.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        InboundChannel,
+        order_by=(InboundChannel.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_inbound_channel(
@@ -130,9 +137,10 @@ def create_inbound_channel(
         updated_by=created_by,
     )
     db.add(channel)
-    commit_or_raise(db, refresh=channel, action="create inbound channel")
+    flush_or_raise(db, refresh=channel, action="create inbound channel")
     snapshot = _snapshot(channel)
     InboundChannelProducer.send_inbound_channel_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create inbound channel")
     return channel
 
 
@@ -180,11 +188,12 @@ def update_inbound_channel(
             setattr(channel, field, value)
         channel.updated_by = updated_by
         channel.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=channel, action="update inbound channel")
+        flush_or_raise(db, refresh=channel, action="update inbound channel")
         snapshot = _snapshot(channel)
         InboundChannelProducer.send_inbound_channel_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update inbound channel")
     return channel
 
 
@@ -197,11 +206,12 @@ def delete_inbound_channel(
     """Delete an inbound channel and publish a deletion event."""
     channel = get_inbound_channel(db, tenant_id=tenant_id, channel_id=channel_id)
     db.delete(channel)
-    commit_or_raise(db, action="delete inbound channel")
+    flush_or_raise(db, action="delete inbound channel")
     deleted_dt = datetime.utcnow().isoformat()
     InboundChannelProducer.send_inbound_channel_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete inbound channel")
     return None
 
 
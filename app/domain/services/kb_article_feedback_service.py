@@ -25,7 +25,8 @@ from app.domain.schemas.kb_article_feedback import (
 from app.messaging.producers.kb_article_feedback_producer import (
     KbArticleFeedbackMessageProducer as KbArticleFeedbackProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("kb_article_feedback_service")
 
@@ -50,7 +51,10 @@ def list_kb_article_feedback(
     kb_article_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[KbArticleFeedback], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[KbArticleFeedback], Optional[int]]:
     """List article feedback with optional tenant and article filters."""
     logger.debug(
         "Listing KB article feedback: tenant_id=%s, article_id=%s, limit=%s, offset=%s",
@@ -64,13 +68,16 @@ def list_kb_article_feedback(
         query = query.filter(KbArticleFeedback.tenant_id == tenant_id)
     if kb_article_id:
         query = query.filter(KbArticleFeedback.kb_article_id == kb_article_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(KbArticleFeedback.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        KbArticleFeedback,
+        order_by=(KbArticleFeedback.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_kb_article_feedback(
@@ -95,11 +102,12 @@ def create_kb_article_feedback(
         created_by=created_by,
     )
     db.add(feedback)
-    commit_or_raise(db, refresh=feedback, action="create KB article feedback")
+    flush_or_raise(db, refresh=feedback, action="create KB article feedback")
     snapshot = _snapshot(feedback)
     KbArticleFeedbackProducer.send_kb_article_feedback_created(
         tenant_id=tenant_id, payload=snapshot
     )
+    commit_or_raise(db, action="create KB article feedback")
     return feedback
 
 
@@ -135,7 +143,8 @@ def delete_kb_article_feedback(
     """Delete a feedback entry (admin only) and publish a deleted event."""
     feedback = get_kb_article_feedback(db, tenant_id=tenant_id, feedback_id=feedback_id)
     db.delete(feedback)
-    commit_or_raise(db, action="delete KB article feedback")
+    flush_or_raise(db, action="delete KB article feedback")
     KbArticleFeedbackProducer.send_kb_article_feedback_deleted(
         tenant_id=tenant_id, deleted_dt=datetime.utcnow().isoformat()
-    )
\ No newline at end of file
+    )
+    commit_or_raise(db, action="delete KB article feedback")
\ No newline at end of file
@@ -26,7 +26,8 @@ from app.domain.schemas.kb_article_revision import (
 from app.messaging.producers.kb_article_revision_producer import (
     KbArticleRevisionMessageProducer as KbArticleRevisionProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("kb_article_revision_service")
 
@@ -50,7 +51,10 @@ def list_kb_article_revisions(
     kb_article_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[KbArticleRevision], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[KbArticleRevision], Optional[int]]:
     """List article revisions with optional tenant and article filters."""
     logger.debug(
         "Listing KB article revisions: tenant_id=%s, article_id=%s, limit=%s, offset=%s",
@@ -64,13 +68,16 @@ def list_kb_article_revisions(
         query = query.filter(KbArticleRevision.tenant_id == tenant_id)
     if kb_article_id:
         query = query.filter(KbArticleRevision.kb_article_id == kb_article_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(KbArticleRevision.version.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        KbArticleRevision,
+        order_by=(KbArticleRevision.version.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def _compute_next_version(db: Session, *, tenant_id: uuid.UUID, kb_article_id: uuid.UUID) -> int:
@@ -116,11 +123,12 @@ def create_kb_article_revision(
         created_by=created_by,
     )
     db.add(revision)
-    commit_or_raise(db, refresh=revision, action="create KB article revision")
+    flush_or_raise(db, refresh=revision, action="create KB article revision")
     snapshot = _snapshot(revision)
     KbArticleRevisionProducer.send_kb_article_revision_created(
         tenant_id=tenant_id, payload=snapshot
     )
+    commit_or_raise(db, action="create KB article revision")
     return revision
 
 
@@ -159,7 +167,8 @@ def delete_kb_article_revision(
     """Delete an article revision (admin only) and publish a deleted event."""
     revision = get_kb_article_revision(db, tenant_id=tenant_id, revision_id=revision_id)
     db.delete(revision)
-    commit_or_raise(db, action="delete KB article revision")
+    flush_or_raise(db, action="delete KB article revision")
     KbArticleRevisionProducer.send_kb_article_revision_deleted(
         tenant_id=tenant_id, deleted_dt=datetime.utcnow().isoformat()
-    )
\ No newline at end of file
+    )
+    commit_or_raise(db, action="delete KB article revision")
\ No newline at end of file
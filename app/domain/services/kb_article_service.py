@@ -28,7 +28,9 @@ from app.domain.schemas.events.kb_article_event import KbArticleDelta
 from app.messaging.producers.kb_article_producer import (
     KbArticleMessageProducer as KbArticleProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.resource_version_service import resource_version
 
 logger = logging.getLogger("kb_article_service")
 
@@ -66,7 +68,10 @@ def list_kb_articles(
     kb_section_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[KbArticle], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[KbArticle], Optional[int]]:
     """List articles with optional tenant and section filters."""
     logger.debug(
         "Listing KB articles: tenant_id=%s, section_id=%s, limit=%s, offset=%s",
@@ -80,13 +85,16 @@ def list_kb_articles(
         query = query.filter(KbArticle.tenant_id == tenant_id)
     if kb_section_id:
         query = query.filter(KbArticle.kb_section_id == kb_section_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(KbArticle.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        KbArticle,
+        order_by=(KbArticle.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def _normalize_slug(slug: Optional[str]) -> tuple[str | None, str | None]:
@@ -123,9 +131,10 @@ def create_kb_article(
         updated_by=created_by,
     )
     db.add(article)
-    commit_or_raise(db, refresh=article, action="create KB article")
+    flush_or_raise(db, refresh=article, action="create KB article")
     snapshot = _snapshot(article)
     KbArticleProducer.send_kb_article_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create KB article")
     return article
 
 
@@ -149,6 +158,16 @@ def get_kb_article(
     return article
 
 
+def get_kb_article_version(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    article_id: uuid.UUID,
+) -> Optional[str]:
+    """Return the version token of an article, or ``None`` if it does not exist."""
+    return resource_version(db, KbArticle, tenant_id=tenant_id, resource_id=article_id)
+
+
 def update_kb_article(
     db: Session,
     *,
@@ -175,11 +194,12 @@ def update_kb_article(
             setattr(article, field, value)
         article.updated_by = updated_by
         article.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=article, action="update KB article")
+        flush_or_raise(db, refresh=article, action="update KB article")
         snapshot = _snapshot(article)
         KbArticleProducer.send_kb_article_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update KB article")
     return article
 
 
@@ -193,7 +213,8 @@ def delete_kb_article(
     """Delete an article and publish a deleted event."""
     article = get_kb_article(db, tenant_id=tenant_id, article_id=article_id)
     db.delete(article)
-    commit_or_raise(db, action="delete KB article")
+    flush_or_raise(db, action="delete KB article")
     KbArticleProducer.send_kb_article_deleted(
         tenant_id=tenant_id, deleted_dt=datetime.utcnow().isoformat()
-    )
\ No newline at end of file
+    )
+    commit_or_raise(db, action="delete KB article")
\ No newline at end of file
@@ -28,7 +28,8 @@ from app.domain.schemas.events.kb_category_event import KbCategoryDelta
 from app.messaging.producers.kb_category_producer import (
     KbCategoryMessageProducer as KbCategoryProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("kb_category_service")
 
@@ -66,7 +67,10 @@ def list_kb_categories(
     tenant_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[KbCategory], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[KbCategory], Optional[int]]:
     """List knowledge base categories with optional tenant scoping and pagination."""
     logger.debug(
         "Listing KB categories: tenant_id=%s, limit=%s, offset=%s",
@@ -77,13 +81,16 @@ def list_kb_categories(
     query = db.query(KbCategory)
     if tenant_id:
         query = query.filter(KbCategory.tenant_id == tenant_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(KbCategory.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        KbCategory,
+        order_by=(KbCategory.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_kb_category(
@@ -108,9 +115,10 @@ def create_kb_category(
         updated_by=created_by,
     )
     db.add(category)
-    commit_or_raise(db, refresh=category, action="create KB category")
+    flush_or_raise(db, refresh=category, action="create KB category")
     snapshot = _snapshot(category)
     KbCategoryProducer.send_kb_category_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create KB category")
     return category
 
 
@@ -155,11 +163,12 @@ def update_kb_category(
             setattr(category, field, value)
         category.updated_by = updated_by
         category.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=category, action="update KB category")
+        flush_or_raise(db, refresh=category, action="update KB category")
         snapshot = _snapshot(category)
         KbCategoryProducer.send_kb_category_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update KB category")
     return category
 
 
@@ -173,5 +182,6 @@ def delete_kb_category(
     """Delete a category and publish a deleted event."""
     category = get_kb_category(db, tenant_id=tenant_id, category_id=category_id)
     db.delete(category)
-    commit_or_raise(db, action="delete KB category")
-    KbCategoryProducer.send_kb_category_deleted(tenant_id=tenant_id, deleted_dt=datetime.utcnow().isoformat())
\ No newline at end of file
+    flush_or_raise(db, action="delete KB category")
+    KbCategoryProducer.send_kb_category_deleted(tenant_id=tenant_id, deleted_dt=datetime.utcnow().isoformat())
+    commit_or_raise(db, action="delete KB category")
\ No newline at end of file
@@ -27,7 +27,8 @@ from app.domain.schemas.events.kb_section_event import KbSectionDelta
 from app.messaging.producers.kb_section_producer import (
     KbSectionMessageProducer as KbSectionProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("kb_section_service")
 
@@ -65,7 +66,10 @@ def list_kb_sections(
     kb_category_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[KbSection], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[KbSection], Optional[int]]:
     """List sections with optional tenant and category filters."""
     logger.debug(
         "Listing KB sections: tenant_id=%s, category_id=%s, limit=%s, offset=%s",
@@ -79,13 +83,16 @@ def list_kb_sections(
         query = query.filter(KbSection.tenant_id == tenant_id)
     if kb_category_id:
         query = query.filter(KbSection.kb_category_id == kb_category_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(KbSection.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        KbSection,
+        order_by=(KbSection.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_kb_section(
@@ -112,9 +119,10 @@ def create_kb_section(
         updated_by=created_by,
     )
     db.add(section)
-    commit_or_raise(db, refresh=section, action="create KB section")
+    flush_or_raise(db, refresh=section, action="create KB section")
     snapshot = _snapshot(section)
     KbSectionProducer.send_kb_section_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create KB section")
     return section
 
 
@@ -159,11 +167,12 @@ def update_kb_section(
             setattr(section, field, value)
         section.updated_by = updated_by
         section.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=section, action="update KB section")
+        flush_or_raise(db, refresh=section, action="update KB section")
         snapshot = _snapshot(section)
         KbSectionProducer.send_kb_section_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update KB section")
     return section
 
 
@@ -177,7 +186,8 @@ def delete_kb_section(
     """Delete a section and publish a deleted event."""
     section = get_kb_section(db, tenant_id=tenant_id, section_id=section_id)
     db.delete(section)
-    commit_or_raise(db, action="delete KB section")
+    flush_or_raise(db, action="delete KB section")
     KbSectionProducer.send_kb_section_deleted(
         tenant_id=tenant_id, deleted_dt=datetime.utcnow().isoformat()
-    )
\ No newline at end of file
+    )
+    commit_or_raise(db, action="delete KB section")
\ No newline at end of file
@@ -18,15 +18,20 @@ from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from fastapi import HTTPException, status
+from sqlalchemy import Text, and_, cast, exists, func, literal_column, select
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
 
 # Import commit_or_raise for robust transaction handling
-from .common_service import commit_or_raise
+from .bulk_patch_service import run_bulk_patch
+from .common_service import commit_or_raise, flush_or_raise
+from .pagination_service import TotalMode, paginate
 
 from app.domain.models import Lead
 from app.messaging.producers import LeadMessageProducer as LeadProducer
 from app.domain.schemas.lead import CreateLead, UpdateLead
 from app.domain.schemas.json_patch import JsonPatchOperation, JsonPatchRequest
+from app.domain.schemas.bulk_patch import BulkPatchItem, BulkPatchResult
 
 logger = logging.getLogger("lead_service")
 
@@ -41,14 +46,19 @@ def list_leads(
     email: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[Lead], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Lead], Optional[int]]:
     """Return a filtered and paginated list of leads.
 
     When ``tenant_id`` is provided, results are scoped to the tenant.  Filters
     on ``first_name`` and ``last_name`` perform case‑insensitive partial
     matches against the corresponding columns.  ``phone_number`` and ``email``
-    search within the ``lead_data`` JSON for array items whose ``value``
-    property contains the given substring (case insensitive).
+    search the values of the ``lead_data`` ``phone_numbers``/``emails``
+    objects for the given substring (case insensitive).  All filtering,
+    counting and pagination run in the database; see
+    :func:`_lead_data_value_match` for the JSONB predicate.
 
     Parameters
     ----------
@@ -68,6 +78,12 @@ def list_leads(
         Maximum number of items to return.
     offset: int | None
         Number of items to skip from the start of the result set.
+    cursor: str | None
+        Opaque keyset cursor from a previous page; enables keyset mode.
+    page_size: int | None
+        Keyset page size; enables keyset mode (``total`` is ``None``).
+    total_mode: str | None
+        ``exact``, ``estimated`` or ``none``; see :mod:`pagination_service`.
 
     Returns
     -------
@@ -84,41 +100,50 @@ def list_leads(
         query = query.filter(Lead.first_name.ilike(f"%{first_name}%"))
     if last_name:
         query = query.filter(Lead.last_name.ilike(f"%{last_name}%"))
-
-    # Eagerly load all candidate leads and perform JSONB filtering in Python.
-    # This approach simplifies JSON searching logic at the cost of in
-    # memory filtering.  For high volume workloads consider moving
-    # JSONB filters into the database using jsonb functions.
-    leads: List[Lead] = query.order_by(Lead.created_at.desc()).all()
-
-    def match_in_lead_data(lead: Lead, key: str, pattern: str) -> bool:
-        """Case insensitive substring match for phone/email within lead_data."""
-        data = lead.lead_data or {}
-        items = data.get(key, [])
-        pattern_lower = pattern.lower()
-        for item in items:
-            try:
-                value = item.get("value", "")
-                if value and pattern_lower in value.lower():
-                    return True
-            except AttributeError:
-                # Malformed item; ignore
-                continue
-        return False
-
-    # Apply phone/email filters in memory
+    # JSONB filters on lead_data
     if phone_number:
-        leads = [ld for ld in leads if match_in_lead_data(ld, "phone_numbers", phone_number)]
+        query = query.filter(_lead_data_value_match("phone_numbers", phone_number))
     if email:
-        leads = [ld for ld in leads if match_in_lead_data(ld, "emails", email)]
+        query = query.filter(_lead_data_value_match("emails", email))
+
+    return paginate(
+        query,
+        Lead,
+        order_by=(Lead.created_at.desc(), Lead.id.desc()),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+
+
+def _lead_data_value_match(key: str, pattern: str) -> Any:
+    """Return a SQL predicate matching leads whose ``lead_data[key]`` values contain ``pattern``.
+
+    ``lead_data`` stores phone numbers and emails as ``{"<type>": "<value>"}``
+    objects.  The predicate has two parts:
 
-    total = len(leads)
-    # Apply pagination
-    if offset:
-        leads = leads[offset:]
-    if limit is not None:
-        leads = leads[:limit]
-    return leads, total
+    * an ILIKE over ``jsonb_path_query_array(lead_data, '$.<key>.*')::text``,
+      which is the exact expression covered by the trigram GIN indexes in
+      ``008_lead_data_search_indexes.sql`` and narrows the candidate rows;
+    * an ``EXISTS`` over ``jsonb_each_text(lead_data -> key)`` that rechecks
+      each value individually so a pattern can never match across the JSON
+      punctuation separating two values.
+
+    ``key`` must be one of the fixed lead_data collection names; it is
+    rendered as a literal so that the expression matches the index.
+    """
+    like = f"%{pattern}%"
+    values_text = cast(
+        func.jsonb_path_query_array(Lead.lead_data, literal_column(f"'$.{key}.*'")),
+        Text,
+    )
+    entries = func.jsonb_each_text(Lead.lead_data[key]).table_valued("key", "value")
+    return and_(
+        values_text.ilike(like),
+        exists(select(1).select_from(entries).where(entries.c.value.ilike(like))),
+    )
 
 
 def _lead_snapshot(lead: Lead) -> Dict[str, Any]:
@@ -142,6 +167,32 @@ def _lead_snapshot(lead: Lead) -> Dict[str, Any]:
     }
 
 
+def _lead_state(lead: Lead) -> Dict[str, Any]:
+    """Capture the attributes compared by :func:`_lead_changes`."""
+    return {
+        "first_name": lead.first_name,
+        "middle_name": lead.middle_name,
+        "last_name": lead.last_name,
+        "source": lead.source,
+        "lead_data": copy.deepcopy(lead.lead_data),
+        "owned_by_user_id": lead.owned_by_user_id,
+        "owned_by_group_id": lead.owned_by_group_id,
+    }
+
+
+def _lead_changes(original: Dict[str, Any], lead: Lead) -> Dict[str, Any]:
+    """Return the attributes of ``lead`` that differ from ``original``."""
+    changes: Dict[str, Any] = {}
+    for field in ("first_name", "middle_name", "last_name", "source", "lead_data"):
+        if original[field] != getattr(lead, field):
+            changes[field] = getattr(lead, field)
+    for field in ("owned_by_user_id", "owned_by_group_id"):
+        value = getattr(lead, field)
+        if original[field] != value:
+            changes[field] = str(value) if value else None
+    return changes
+
+
 def create_lead(
     db: Session,
     *,
@@ -182,10 +233,10 @@ def create_lead(
         updated_by=created_user,
     )
     db.add(lead)
-    # Commit and refresh using centralized error handling
-    commit_or_raise(db, refresh=lead, action="create_lead")
+    # Flush and refresh using centralized error handling
+    flush_or_raise(db, refresh=lead, action="create_lead")
     logger.info("Created lead %s for tenant %s", lead.id, tenant_id)
-    # Emit event after commit
+    # Emit event; commit_or_raise stages it with the lead
     snapshot = _lead_snapshot(lead)
     try:
         LeadProducer.send_lead_created(tenant_id=tenant_id, payload=snapshot)
@@ -195,6 +246,7 @@ def create_lead(
             tenant_id,
             lead.id,
         )
+    commit_or_raise(db, action="create_lead")
     return lead
 
 
@@ -238,15 +290,7 @@ def update_lead(
     """
     lead = get_lead(db, tenant_id=tenant_id, lead_id=lead_id)
     # Keep copy of original values for change detection
-    original = {
-        "first_name": lead.first_name,
-        "middle_name": lead.middle_name,
-        "last_name": lead.last_name,
-        "source": lead.source,
-        "lead_data": copy.deepcopy(lead.lead_data),
-        "owned_by_user_id": lead.owned_by_user_id,
-        "owned_by_group_id": lead.owned_by_group_id,
-    }
+    original = _lead_state(lead)
     # Update fields
     lead.first_name = lead_in.first_name
     lead.middle_name = lead_in.middle_name
@@ -263,25 +307,11 @@ def update_lead(
     lead.updated_by = modified_user
     lead.updated_at = datetime.utcnow()
     db.add(lead)
-    # Commit and refresh using centralized error handling
-    commit_or_raise(db, refresh=lead, action="update_lead")
+    # Flush and refresh using centralized error handling
+    flush_or_raise(db, refresh=lead, action="update_lead")
     logger.info("Updated lead %s for tenant %s", lead.id, tenant_id)
     # Determine changes
-    changes: Dict[str, Any] = {}
-    if original["first_name"] != lead.first_name:
-        changes["first_name"] = lead.first_name
-    if original["middle_name"] != lead.middle_name:
-        changes["middle_name"] = lead.middle_name
-    if original["last_name"] != lead.last_name:
-        changes["last_name"] = lead.last_name
-    if original["source"] != lead.source:
-        changes["source"] = lead.source
-    if original["lead_data"] != lead.lead_data:
-        changes["lead_data"] = lead.lead_data
-    if original["owned_by_user_id"] != lead.owned_by_user_id:
-        changes["owned_by_user_id"] = str(lead.owned_by_user_id) if lead.owned_by_user_id else None
-    if original["owned_by_group_id"] != lead.owned_by_group_id:
-        changes["owned_by_group_id"] = str(lead.owned_by_group_id) if lead.owned_by_group_id else None
+    changes = _lead_changes(original, lead)
     # Emit update event if changes occurred
     if changes:
         snapshot = _lead_snapshot(lead)
@@ -297,6 +327,7 @@ def update_lead(
                 tenant_id,
                 lead.id,
             )
+    commit_or_raise(db, action="update_lead")
     return lead
 
 
@@ -436,6 +467,28 @@ def apply_patch_operation(lead: Lead, op: JsonPatchOperation) -> None:
             )
 
 
+def _apply_lead_patch(
+    lead: Lead,
+    patch_request: JsonPatchRequest,
+    modified_user: str,
+) -> Dict[str, Any]:
+    """Apply the operations of ``patch_request`` to a loaded lead.
+
+    Changes are made on the instance but not committed; the changed
+    attributes are returned.
+    """
+    original = _lead_state(lead)
+    for operation in patch_request.operations:
+        apply_patch_operation(lead, operation)
+    # lead_data is edited in place, which the plain JSONB column does
+    # not track
+    if original["lead_data"] != lead.lead_data:
+        flag_modified(lead, "lead_data")
+    lead.updated_by = modified_user
+    lead.updated_at = datetime.utcnow()
+    return _lead_changes(original, lead)
+
+
 def patch_lead(
     db: Session,
     *,
@@ -448,29 +501,15 @@ def patch_lead(
 
     Patching is atomic – if any operation fails validation, the entire
     transaction is rolled back and an error is raised.  After all
-    operations succeed the lead is committed and an update event is
-    emitted with the set of changes.
+    operations succeed an update event with the set of changes is
+    emitted and committed together with the lead.
     """
     lead = get_lead(db, tenant_id=tenant_id, lead_id=lead_id)
-    # Capture original values for change computation
-    original = {
-        "first_name": lead.first_name,
-        "middle_name": lead.middle_name,
-        "last_name": lead.last_name,
-        "source": lead.source,
-        "lead_data": copy.deepcopy(lead.lead_data),
-        "owned_by_user_id": lead.owned_by_user_id,
-        "owned_by_group_id": lead.owned_by_group_id,
-    }
     try:
-        for operation in patch_request.operations:
-            apply_patch_operation(lead, operation)
-        # Update audit fields
-        lead.updated_by = modified_user
-        lead.updated_at = datetime.utcnow()
+        changes = _apply_lead_patch(lead, patch_request, modified_user)
         db.add(lead)
-        # Commit and refresh using centralized error handling
-        commit_or_raise(db, refresh=lead, action="patch_lead")
+        # Flush and refresh using centralized error handling
+        flush_or_raise(db, refresh=lead, action="patch_lead")
     except HTTPException:
         # Rollback for validation errors
         db.rollback()
@@ -479,22 +518,6 @@ def patch_lead(
         db.rollback()
         logger.exception("Unexpected error applying patch: %s", exc)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to apply patch")
-    # Compute changes
-    changes: Dict[str, Any] = {}
-    if original["first_name"] != lead.first_name:
-        changes["first_name"] = lead.first_name
-    if original["middle_name"] != lead.middle_name:
-        changes["middle_name"] = lead.middle_name
-    if original["last_name"] != lead.last_name:
-        changes["last_name"] = lead.last_name
-    if original["source"] != lead.source:
-        changes["source"] = lead.source
-    if original["lead_data"] != lead.lead_data:
-        changes["lead_data"] = lead.lead_data
-    if original["owned_by_user_id"] != lead.owned_by_user_id:
-        changes["owned_by_user_id"] = str(lead.owned_by_user_id) if lead.owned_by_user_id else None
-    if original["owned_by_group_id"] != lead.owned_by_group_id:
-        changes["owned_by_group_id"] = str(lead.owned_by_group_id) if lead.owned_by_group_id else None
     # Emit update event if changes occurred
     if changes:
         snapshot = _lead_snapshot(lead)
@@ -510,9 +533,56 @@ def patch_lead(
                 tenant_id,
                 lead.id,
             )
+    commit_or_raise(db, action="patch_lead")
     return lead
 
 
+def bulk_patch_leads(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    items: List[BulkPatchItem],
+    modified_user: str,
+    chunk_size: Optional[int] = None,
+) -> BulkPatchResult:
+    """Apply a JSON Patch document to each of many leads.
+
+    Leads are loaded and committed in chunks (see
+    :func:`bulk_patch_service.run_bulk_patch`); an item that fails is
+    reported and skipped.  One ``lead.bulk_patched`` event carrying the
+    changes of every changed lead is published per chunk instead of a
+    ``lead.updated`` event per lead.
+    """
+
+    def _apply(lead: Lead, patch_request: JsonPatchRequest) -> Dict[str, Any]:
+        return _apply_lead_patch(lead, patch_request, modified_user)
+
+    def _publish(patch_id: uuid.UUID, chunk: int, changes: Dict[uuid.UUID, Dict[str, Any]]) -> None:
+        LeadProducer.send_leads_bulk_patched(
+            tenant_id=tenant_id, patch_id=patch_id, chunk=chunk, changes=changes
+        )
+
+    result = run_bulk_patch(
+        db,
+        items,
+        model=Lead,
+        tenant_id=tenant_id,
+        apply=_apply,
+        publish=_publish,
+        merge=lambda first, second: {**first, **second},
+        not_found="Lead not found",
+        action="bulk_patch_leads",
+        chunk_size=chunk_size,
+    )
+    logger.info(
+        "Bulk patched leads for tenant %s: %d patched, %d failed",
+        tenant_id,
+        result.patched,
+        result.failed,
+    )
+    return result
+
+
 def delete_lead(
     db: Session,
     *,
@@ -522,13 +592,13 @@ def delete_lead(
     """Delete a lead from the database.
 
     Returns ``None`` on success and raises HTTP 404 if the lead is not
-    found or does not belong to the tenant.  An event is emitted after
-    deletion is committed.
+    found or does not belong to the tenant.  An event is staged with
+    the deletion and only released once it commits.
     """
     lead = get_lead(db, tenant_id=tenant_id, lead_id=lead_id)
     db.delete(lead)
-    # Commit deletion using centralized error handling
-    commit_or_raise(db, action="delete_lead")
+    # Flush deletion using centralized error handling
+    flush_or_raise(db, action="delete_lead")
     logger.info("Deleted lead %s for tenant %s", lead.id, tenant_id)
     try:
         LeadProducer.send_lead_deleted(
@@ -541,6 +611,7 @@ def delete_lead(
             tenant_id,
             lead.id,
         )
+    commit_or_raise(db, action="delete_lead")
     return None
 
 # ---------------------------------------------------------------------------
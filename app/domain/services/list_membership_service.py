@@ -15,7 +15,8 @@ from sqlalchemy.orm import Session
 
 from app.domain.models.list_membership import ListMembership
 from app.domain.schemas.list_membership import ListMembershipCreate, ListMembershipRead
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 from app.messaging.producers.list_membership_producer import ListMembershipMessageProducer
 from fastapi import HTTPException, status
 from typing import Tuple, List as TypingList, Dict, Any, Optional
@@ -82,7 +83,10 @@ def service_list_memberships(
     list_id: uuid.UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[TypingList[ListMembership], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[TypingList[ListMembership], Optional[int]]:
     """
     List memberships for a given list with optional pagination.
 
@@ -92,12 +96,15 @@ def service_list_memberships(
     tenant validation.
     """
     query = db.query(ListMembership).filter(ListMembership.list_id == list_id)
-    total = query.count()
-    if limit is not None:
-        query = query.limit(limit)
-    if offset is not None:
-        query = query.offset(offset)
-    return query.all(), total
+    return paginate(
+        query,
+        ListMembership,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_get_membership(
@@ -139,7 +146,7 @@ def service_create_membership(
         created_by=created_user,
     )
     db.add(membership)
-    commit_or_raise(db, refresh=membership)
+    flush_or_raise(db, refresh=membership)
     # Emit event
     try:
         payload = _membership_snapshot(membership)
@@ -149,6 +156,7 @@ def service_create_membership(
         )
     except Exception:
         pass
+    commit_or_raise(db, refresh=membership)
     return membership
 
 
@@ -167,11 +175,12 @@ def service_delete_membership(
     """
     membership = service_get_membership(db, membership_id=membership_id)
     db.delete(membership)
-    commit_or_raise(db)
+    flush_or_raise(db)
     try:
         ListMembershipMessageProducer.send_membership_deleted(
             tenant_id=tenant_id,
             deleted_dt=None,
         )
     except Exception:
-        pass
\ No newline at end of file
+        pass
+    commit_or_raise(db)
\ No newline at end of file
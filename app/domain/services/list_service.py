@@ -16,7 +16,8 @@ from fastapi import HTTPException, status
 
 from app.domain.models.list import List
 from app.domain.schemas.list import ListCreate, ListUpdate, ListRead
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 from app.messaging.producers.list_producer import ListMessageProducer
 
 
@@ -126,7 +127,10 @@ def service_list_lists(
     is_archived: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> tuple[list[List], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> tuple[list[List], Optional[int]]:
     """
     List lists with optional filtering and pagination.
 
@@ -147,6 +151,12 @@ def service_list_lists(
     offset : int | None
         Number of records to skip from the beginning.  If ``None``, no
         offset is applied.
+    cursor : str | None
+        Opaque keyset cursor from a previous page.  Supplying ``cursor``
+        or ``page_size`` switches to keyset pagination (see
+        ``pagination_service``); ``total`` is then ``None``.
+    page_size : int | None
+        Number of records per keyset page.
 
     Returns
     -------
@@ -168,12 +178,15 @@ def service_list_lists(
         query = query.filter(List.processing_type == processing_type)
     if is_archived is not None:
         query = query.filter(List.is_archived == is_archived)
-    total = query.count()
-    if limit is not None:
-        query = query.limit(limit)
-    if offset is not None:
-        query = query.offset(offset)
-    return query.all(), total
+    return paginate(
+        query,
+        List,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_get_list(
@@ -245,7 +258,7 @@ def service_create_list(
         updated_by=created_user,
     )
     db.add(lst)
-    commit_or_raise(db, refresh=lst)
+    flush_or_raise(db, refresh=lst)
     # Emit event
     try:
         payload = _list_snapshot(lst)
@@ -256,6 +269,7 @@ def service_create_list(
     except Exception:
         # Suppress exceptions from event publishing; transaction already committed
         pass
+    commit_or_raise(db, refresh=lst)
     return lst
 
 
@@ -292,8 +306,8 @@ def service_update_list(
     if getattr(list_in, "is_archived", None) is not None:
         lst.is_archived = list_in.is_archived
     lst.updated_by = modified_user
-    # Commit and refresh
-    commit_or_raise(db, refresh=lst)
+    # Flush and refresh
+    flush_or_raise(db, refresh=lst)
     after = _list_snapshot(lst)
     changes = {k: after[k] for k in after.keys() if before.get(k) != after.get(k)}
     if changes:
@@ -305,6 +319,7 @@ def service_update_list(
             )
         except Exception:
             pass
+    commit_or_raise(db, refresh=lst)
     return lst
 
 
@@ -326,11 +341,12 @@ def service_delete_list(
     """
     lst = service_get_list(db, tenant_id=tenant_id, list_id=list_id)
     db.delete(lst)
-    commit_or_raise(db)
+    flush_or_raise(db)
     try:
         ListMessageProducer.send_list_deleted(
             tenant_id=tenant_id,
             deleted_dt=None,
         )
     except Exception:
-        pass
\ No newline at end of file
+        pass
+    commit_or_raise(db)
\ No newline at end of file
@@ -0,0 +1,298 @@
+"""
+Shared pagination helpers for list services.
+
+List services support two pagination modes:
+
+* **Offset mode** (default) – ``limit``/``offset`` paging with an exact
+  ``total`` computed by ``query.count()``.  This is the historical
+  behaviour of every list endpoint.
+* **Keyset mode** (opt‑in) – enabled when a ``cursor`` or ``page_size``
+  is supplied.  Rows are ordered by ``(<timestamp>, id)`` and each page
+  seeks past the last row of the previous page with a row‑value
+  comparison, so the cost of a page does not grow with its depth.  No
+  count query is executed and ``total`` is returned as ``None``.
+
+Cursors are opaque, URL‑safe strings produced by :func:`encode_cursor`.
+Clients must pass them back unchanged; their contents are not part of
+the API contract.
+
+How ``total`` is computed is controlled by ``total_mode``:
+
+* ``exact`` – run ``query.count()`` (offset‑mode default).
+* ``estimated`` – serve a recently cached count for the same query
+  when one exists; otherwise ask the planner (``EXPLAIN``) for a row
+  estimate and only fall back to an exact count when the estimate is
+  small enough to be cheap.  Results are cached for
+  ``Config.count_cache_ttl_seconds()`` per (compiled query, parameters),
+  which is effectively per tenant and filter set.
+* ``none`` – skip the count entirely (keyset‑mode default).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.core.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+TotalMode = Literal["exact", "estimated", "none"]
+
+
+# Page size used in keyset mode when only a ``cursor`` is supplied.
+DEFAULT_PAGE_SIZE: int = 50
+
+# Upper bound for ``page_size`` to keep a single page cheap.
+MAX_PAGE_SIZE: int = 500
+
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID) -> str:
+    """Encode the keyset position of a row as an opaque cursor string."""
+    raw = json.dumps({"k": sort_value.isoformat(), "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises a 400 HTTPException when the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(data["k"]), uuid.UUID(data["id"])
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def resolve_page_size(page_size: Optional[int]) -> int:
+    """Clamp a requested keyset page size to ``[1, MAX_PAGE_SIZE]``."""
+    if page_size is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def is_keyset(cursor: Optional[str], page_size: Optional[int]) -> bool:
+    """Return True when the caller opted into keyset pagination."""
+    return cursor is not None or page_size is not None
+
+
+# Cached totals keyed by (compiled SQL, bound parameters).  Values are
+# ``(expires_at, total)`` using ``time.monotonic()``.
+_COUNT_CACHE_MAX_ENTRIES = 10_000
+_count_cache: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[float, int]] = {}
+_count_cache_lock = threading.Lock()
+
+
+def _count_cache_key(query: Query) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    compiled = query.statement.compile(dialect=postgresql.dialect())
+    params = tuple(sorted((k, repr(v)) for k, v in compiled.params.items()))
+    return str(compiled), params
+
+
+def _count_cache_get(key: Tuple[str, Tuple[Tuple[str, str], ...]]) -> Optional[int]:
+    with _count_cache_lock:
+        entry = _count_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, total = entry
+        if expires_at <= time.monotonic():
+            del _count_cache[key]
+            return None
+        return total
+
+
+def _count_cache_put(key: Tuple[str, Tuple[Tuple[str, str], ...]], total: int) -> None:
+    now = time.monotonic()
+    with _count_cache_lock:
+        if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+            for stale in [k for k, (exp, _) in _count_cache.items() if exp <= now]:
+                del _count_cache[stale]
+            if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+                _count_cache.clear()
+        _count_cache[key] = (now + Config.count_cache_ttl_seconds(), total)
+
+
+def clear_count_cache() -> None:
+    """Drop all cached totals (used by tests and after bulk writes)."""
+    with _count_cache_lock:
+        _count_cache.clear()
+
+
+def estimate_count(query: Query) -> Optional[int]:
+    """Return the planner's row estimate for ``query`` or ``None``.
+
+    Runs ``EXPLAIN (FORMAT JSON)`` inside a savepoint so a failure does
+    not poison the caller's transaction.  Any error yields ``None``.
+    """
+    session = query.session
+    try:
+        compiled = query.statement.compile(
+            dialect=session.get_bind().dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        with session.begin_nested():
+            plan = (
+                session.connection()
+                .exec_driver_sql("EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params)
+                .scalar()
+            )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception:
+        logger.debug("Row estimate unavailable; falling back to exact count", exc_info=True)
+        return None
+
+
+def count_total(query: Query, total_mode: TotalMode) -> Optional[int]:
+    """Compute ``total`` for a filtered, unordered query per ``total_mode``."""
+    if total_mode == "none":
+        return None
+    if total_mode == "exact":
+        return query.count()
+    if total_mode != "estimated":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="total_mode must be one of: exact, estimated, none",
+        )
+    key = _count_cache_key(query)
+    cached = _count_cache_get(key)
+    if cached is not None:
+        return cached
+    estimate = estimate_count(query)
+    if estimate is not None and estimate >= Config.count_estimate_threshold():
+        total = estimate
+    else:
+        total = query.count()
+    _count_cache_put(key, total)
+    return total
+
+
+def paginate(
+    query: Query,
+    model: Any,
+    *,
+    order_by: Sequence[Any] = (),
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    sort_column: Any = None,
+    id_column: Any = None,
+    descending: bool = True,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Any], Optional[int]]:
+    """Execute ``query`` in offset or keyset mode and return ``(items, total)``.
+
+    Parameters
+    ----------
+    query: Query
+        Filtered query for ``model``; must not have ordering, limit or
+        offset applied yet.
+    model: Any
+        Mapped class being listed.  Its ``id`` column is the keyset
+        tie‑breaker.
+    order_by: sequence
+        Ordering applied in offset mode (the endpoint's historical order).
+    limit, offset: int | None
+        Offset‑mode paging parameters.
+    cursor: str | None
+        Opaque cursor returned by a previous keyset page.
+    page_size: int | None
+        Keyset page size; defaults to :data:`DEFAULT_PAGE_SIZE`.
+    sort_column: Column | None
+        Timestamp column used for the keyset; defaults to
+        ``model.created_at``.
+    id_column: Column | None
+        Unique tie‑breaker for the keyset; defaults to ``model.id``.  Set
+        this for models with natural or composite primary keys.
+    descending: bool
+        Keyset direction.  ``True`` returns newest rows first.
+    total_mode: "exact" | "estimated" | "none" | None
+        How to compute ``total``.  Defaults to ``exact`` in offset mode
+        and ``none`` in keyset mode.
+
+    Returns
+    -------
+    list, int | None
+        The page of rows and the total computed per ``total_mode``.
+    """
+    keyset = is_keyset(cursor, page_size)
+    if total_mode is None:
+        total_mode = "none" if keyset else "exact"
+    total = count_total(query, total_mode)
+
+    if keyset:
+        key_col = sort_column if sort_column is not None else model.created_at
+        id_col = id_column if id_column is not None else model.id
+        if descending:
+            query = query.order_by(key_col.desc(), id_col.desc())
+        else:
+            query = query.order_by(key_col.asc(), id_col.asc())
+        if cursor is not None:
+            key_value, id_value = decode_cursor(cursor)
+            position = tuple_(key_col, id_col)
+            bound = tuple_(key_value, id_value)
+            query = query.filter(position < bound if descending else position > bound)
+        return query.limit(resolve_page_size(page_size)).all(), total
+
+    if order_by:
+        query = query.order_by(*order_by)
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all(), total
+
+
+def next_cursor(
+    items: Sequence[Any],
+    *,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    sort_attr: str = "created_at",
+    id_attr: str = "id",
+) -> Optional[str]:
+    """Return the cursor for the page after ``items`` in keyset mode.
+
+    ``None`` is returned in offset mode and when the page is shorter
+    than the page size (i.e. there are no further rows).  ``items`` may
+    be ORM instances or response models exposing ``sort_attr`` and
+    ``id_attr``.
+    """
+    if not is_keyset(cursor, page_size):
+        return None
+    if not items or len(items) < resolve_page_size(page_size):
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "TotalMode",
+    "encode_cursor",
+    "decode_cursor",
+    "resolve_page_size",
+    "is_keyset",
+    "clear_count_cache",
+    "estimate_count",
+    "count_total",
+    "paginate",
+    "next_cursor",
+]
@@ -0,0 +1,495 @@
+"""
+Incrementally maintained pipeline analytics.
+
+The pipeline reports are served from three rollup tables instead of
+scanning ``stage_history`` and ``deal`` on every request:
+
+* ``pipeline_stage_daily_rollup`` – entries into and exits out of each
+  stage per UTC day, with the total time in stage of the exits;
+* ``pipeline_stage_transition_daily_rollup`` – stage-to-stage
+  transition counts per UTC day;
+* ``pipeline_stage_deal_rollup`` – the deals currently in each stage
+  with their amount and forecast parts.
+
+Writers call :func:`record_transition` and :func:`apply_deal_change`
+before committing the stage history row or deal they change, so the
+rollups commit or roll back together with the source row.  Every
+update is a single ``INSERT … ON CONFLICT DO UPDATE`` that adds its
+deltas to the existing counters.
+
+Stage names, order, probability and state are joined when reading, so
+editing a stage never invalidates the rollups.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.domain.models.pipeline_rollup import (
+    PipelineStageDailyRollup,
+    PipelineStageDealRollup,
+    PipelineStageTransitionDailyRollup,
+)
+from app.domain.models.pipeline_stage import PipelineStage
+from app.domain.models.stage_history import StageHistory
+from app.domain.schemas.pipeline_report import (
+    PipelineOverviewRow,
+    StageConversionRow,
+    StageFunnelRow,
+    StageVelocityRow,
+    WeightedPipelineRow,
+)
+
+ZERO = Decimal("0")
+SECONDS_PER_DAY = 86400
+
+
+# ---------------------------------------------------------------------------
+# Incremental updates
+# ---------------------------------------------------------------------------
+
+
+def _increment(db: Session, model: Any, key: Dict[str, Any], deltas: Dict[str, Any]) -> None:
+    """Add ``deltas`` to the rollup row identified by ``key``, creating it if needed."""
+    table = model.__table__
+    stmt = pg_insert(table).values(**key, **deltas)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={
+            **{column: table.c[column] + stmt.excluded[column] for column in deltas},
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _stage_entered_at(db: Session, entry: StageHistory) -> Optional[datetime]:
+    """When the entity entered the stage ``entry`` leaves, if recorded.
+
+    The entity's latest earlier transition must have entered
+    ``entry.from_stage_id``; otherwise the stay cannot be timed.
+    """
+    previous = (
+        db.query(StageHistory.changed_at, StageHistory.to_stage_id)
+        .filter(
+            StageHistory.tenant_id == entry.tenant_id,
+            StageHistory.entity_type == entry.entity_type,
+            StageHistory.entity_id == entry.entity_id,
+            StageHistory.changed_at <= entry.changed_at,
+        )
+        .order_by(StageHistory.changed_at.desc())
+        .first()
+    )
+    if previous is None or previous.to_stage_id != entry.from_stage_id:
+        return None
+    return previous.changed_at
+
+
+def record_transition(db: Session, entry: StageHistory) -> None:
+    """Fold a stage transition into the daily rollups.
+
+    Must be called before ``entry`` is flushed so that the lookup of
+    the entity's previous transition does not find ``entry`` itself.
+    Transitions without a pipeline are not rolled up.
+    """
+    if entry.pipeline_id is None:
+        return
+    changed_at = _as_utc(entry.changed_at)
+    day = changed_at.date()
+    base = {"tenant_id": entry.tenant_id, "pipeline_id": entry.pipeline_id}
+    if entry.to_stage_id is not None:
+        _increment(
+            db,
+            PipelineStageDailyRollup,
+            {**base, "stage_id": entry.to_stage_id, "day": day},
+            {"entered_count": 1},
+        )
+    if entry.from_stage_id is None:
+        return
+    deltas: Dict[str, Any] = {"exited_count": 1}
+    entered_at = _stage_entered_at(db, entry)
+    if entered_at is not None:
+        deltas["timed_exit_count"] = 1
+        deltas["exit_duration_seconds"] = max(
+            0, int((changed_at - _as_utc(entered_at)).total_seconds())
+        )
+    _increment(
+        db,
+        PipelineStageDailyRollup,
+        {**base, "stage_id": entry.from_stage_id, "day": day},
+        deltas,
+    )
+    if entry.to_stage_id is not None:
+        _increment(
+            db,
+            PipelineStageTransitionDailyRollup,
+            {
+                **base,
+                "from_stage_id": entry.from_stage_id,
+                "to_stage_id": entry.to_stage_id,
+                "day": day,
+            },
+            {"transition_count": 1},
+        )
+
+
+class DealContribution(NamedTuple):
+    """What one deal adds to its stage's deal rollup."""
+
+    tenant_id: uuid.UUID
+    pipeline_id: uuid.UUID
+    stage_id: uuid.UUID
+    amount: Decimal
+    forecast_weighted_amount: Decimal
+    unforecast_amount: Decimal
+
+
+def _decimal(value: Any) -> Decimal:
+    if value is None:
+        return ZERO
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def deal_contribution(deal: Any) -> Optional[DealContribution]:
+    """Return the rollup contribution of ``deal``; ``None`` outside any stage.
+
+    A deal's own probability is its ``forecast_probability``, else its
+    ``probability``, as in :mod:`pipeline_forecast_service`; deals with
+    neither are weighted by the stage probability when read.
+    """
+    if deal.pipeline_id is None or deal.stage_id is None:
+        return None
+    amount = _decimal(deal.amount)
+    probability = deal.forecast_probability
+    if probability is None:
+        probability = deal.probability
+    if probability is None:
+        forecast, unforecast = ZERO, amount
+    else:
+        forecast, unforecast = amount * _decimal(probability), ZERO
+    return DealContribution(
+        tenant_id=deal.tenant_id,
+        pipeline_id=deal.pipeline_id,
+        stage_id=deal.stage_id,
+        amount=amount,
+        forecast_weighted_amount=forecast,
+        unforecast_amount=unforecast,
+    )
+
+
+def _apply_contribution(db: Session, contribution: DealContribution, sign: int) -> None:
+    _increment(
+        db,
+        PipelineStageDealRollup,
+        {
+            "tenant_id": contribution.tenant_id,
+            "pipeline_id": contribution.pipeline_id,
+            "stage_id": contribution.stage_id,
+        },
+        {
+            "deal_count": sign,
+            "amount_sum": sign * contribution.amount,
+            "forecast_weighted_amount": sign * contribution.forecast_weighted_amount,
+            "unforecast_amount": sign * contribution.unforecast_amount,
+        },
+    )
+
+
+def apply_deal_change(
+    db: Session,
+    before: Optional[DealContribution],
+    after: Optional[DealContribution],
+) -> None:
+    """Move a deal's contribution from ``before`` to ``after``.
+
+    Pass ``before=None`` for a new deal and ``after=None`` for a
+    deleted one.  Nothing is written when the contribution is unchanged.
+    """
+    if before == after:
+        return
+    if before is not None:
+        _apply_contribution(db, before, -1)
+    if after is not None:
+        _apply_contribution(db, after, 1)
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+
+def _pipeline_stages(db: Session, *, tenant_id: uuid.UUID, pipeline_id: uuid.UUID) -> List[PipelineStage]:
+    stages = (
+        db.query(PipelineStage)
+        .filter(PipelineStage.tenant_id == tenant_id, PipelineStage.pipeline_id == pipeline_id)
+        .order_by(PipelineStage.display_order)
+        .all()
+    )
+    if not stages:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Pipeline not found or has no stages",
+        )
+    return stages
+
+
+def _current_deals(
+    db: Session, *, tenant_id: uuid.UUID, pipeline_id: uuid.UUID
+) -> Dict[uuid.UUID, Tuple[int, Decimal]]:
+    rows = db.query(
+        PipelineStageDealRollup.stage_id,
+        PipelineStageDealRollup.deal_count,
+        PipelineStageDealRollup.amount_sum,
+    ).filter(
+        PipelineStageDealRollup.tenant_id == tenant_id,
+        PipelineStageDealRollup.pipeline_id == pipeline_id,
+    )
+    return {stage_id: (count, amount) for stage_id, count, amount in rows}
+
+
+def _in_period(column: Any, start_date: Optional[date], end_date: Optional[date]) -> List[Any]:
+    criteria = []
+    if start_date is not None:
+        criteria.append(column >= start_date)
+    if end_date is not None:
+        criteria.append(column <= end_date)
+    return criteria
+
+
+def _stage_activity(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    pipeline_id: uuid.UUID,
+    start_date: Optional[date],
+    end_date: Optional[date],
+) -> Dict[uuid.UUID, Tuple[int, int, int, int]]:
+    """Per stage: (entered, exited, timed exits, exit seconds) over the period."""
+    R = PipelineStageDailyRollup
+    rows = (
+        db.query(
+            R.stage_id,
+            func.sum(R.entered_count),
+            func.sum(R.exited_count),
+            func.sum(R.timed_exit_count),
+            func.sum(R.exit_duration_seconds),
+        )
+        .filter(
+            R.tenant_id == tenant_id,
+            R.pipeline_id == pipeline_id,
+            *_in_period(R.day, start_date, end_date),
+        )
+        .group_by(R.stage_id)
+    )
+    return {
+        stage_id: (int(entered or 0), int(exited or 0), int(timed or 0), int(seconds or 0))
+        for stage_id, entered, exited, timed, seconds in rows
+    }
+
+
+def pipeline_overview(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    pipeline_id: Optional[uuid.UUID] = None,
+) -> List[PipelineOverviewRow]:
+    """Current deal count and amount per pipeline and stage state."""
+    R = PipelineStageDealRollup
+    query = (
+        db.query(
+            R.pipeline_id,
+            PipelineStage.stage_state,
+            func.sum(R.deal_count),
+            func.sum(R.amount_sum),
+        )
+        .join(PipelineStage, PipelineStage.id == R.stage_id)
+        .filter(R.tenant_id == tenant_id)
+    )
+    if pipeline_id is not None:
+        query = query.filter(R.pipeline_id == pipeline_id)
+    query = query.group_by(R.pipeline_id, PipelineStage.stage_state).order_by(
+        R.pipeline_id, PipelineStage.stage_state
+    )
+    return [
+        PipelineOverviewRow(
+            pipeline_id=pid,
+            status=str(state),
+            deal_count=int(count or 0),
+            total_amount=amount or ZERO,
+        )
+        for pid, state, count, amount in query
+    ]
+
+
+def weighted_pipeline(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    pipeline_id: Optional[uuid.UUID] = None,
+) -> List[WeightedPipelineRow]:
+    """Open deals per pipeline with their probability-weighted amount."""
+    R = PipelineStageDealRollup
+    weighted = R.forecast_weighted_amount + R.unforecast_amount * func.coalesce(
+        PipelineStage.probability, 0
+    )
+    query = (
+        db.query(
+            R.pipeline_id,
+            func.sum(R.deal_count),
+            func.sum(R.amount_sum),
+            func.sum(weighted),
+        )
+        .join(PipelineStage, PipelineStage.id == R.stage_id)
+        .filter(R.tenant_id == tenant_id, PipelineStage.stage_state == "OPEN")
+    )
+    if pipeline_id is not None:
+        query = query.filter(R.pipeline_id == pipeline_id)
+    query = query.group_by(R.pipeline_id).order_by(R.pipeline_id)
+    return [
+        WeightedPipelineRow(
+            pipeline_id=pid,
+            open_deal_count=int(count or 0),
+            total_amount=amount or ZERO,
+            weighted_amount=(weighted_amount or ZERO).quantize(Decimal("0.01")),
+        )
+        for pid, count, amount, weighted_amount in query
+    ]
+
+
+def stage_funnel(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    pipeline_id: uuid.UUID,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[StageFunnelRow]:
+    """Current deals per stage plus the entries into each stage in the period."""
+    stages = _pipeline_stages(db, tenant_id=tenant_id, pipeline_id=pipeline_id)
+    current = _current_deals(db, tenant_id=tenant_id, pipeline_id=pipeline_id)
+    activity = _stage_activity(
+        db, tenant_id=tenant_id, pipeline_id=pipeline_id, start_date=start_date, end_date=end_date
+    )
+    rows = []
+    for stage in stages:
+        count, amount = current.get(stage.id, (0, ZERO))
+        rows.append(
+            StageFunnelRow(
+                stage_id=stage.id,
+                stage_name=stage.name,
+                display_order=stage.display_order,
+                deal_count=count,
+                total_amount=amount,
+                entered_count=activity.get(stage.id, (0, 0, 0, 0))[0],
+            )
+        )
+    return rows
+
+
+def stage_velocity(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    pipeline_id: uuid.UUID,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[StageVelocityRow]:
+    """Entries, exits and average time in stage per stage over the period."""
+    stages = _pipeline_stages(db, tenant_id=tenant_id, pipeline_id=pipeline_id)
+    current = _current_deals(db, tenant_id=tenant_id, pipeline_id=pipeline_id)
+    activity = _stage_activity(
+        db, tenant_id=tenant_id, pipeline_id=pipeline_id, start_date=start_date, end_date=end_date
+    )
+    rows = []
+    for stage in stages:
+        entered, exited, timed, seconds = activity.get(stage.id, (0, 0, 0, 0))
+        rows.append(
+            StageVelocityRow(
+                stage_id=stage.id,
+                stage_name=stage.name,
+                display_order=stage.display_order,
+                entered_count=entered,
+                exited_count=exited,
+                avg_duration_days=(seconds / timed / SECONDS_PER_DAY) if timed else None,
+                current_count=current.get(stage.id, (0, ZERO))[0],
+            )
+        )
+    return rows
+
+
+def stage_conversion(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    pipeline_id: uuid.UUID,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[StageConversionRow]:
+    """Stage-to-stage movements in the period relative to entries into the source stage.
+
+    The rate compares period totals (transitions out of a stage against
+    entries into it), not cohorts of individual records.
+    """
+    stages = _pipeline_stages(db, tenant_id=tenant_id, pipeline_id=pipeline_id)
+    order = {stage.id: stage.display_order for stage in stages}
+    activity = _stage_activity(
+        db, tenant_id=tenant_id, pipeline_id=pipeline_id, start_date=start_date, end_date=end_date
+    )
+    T = PipelineStageTransitionDailyRollup
+    transitions: Dict[Tuple[uuid.UUID, uuid.UUID], int] = {
+        (from_stage_id, to_stage_id): int(count or 0)
+        for from_stage_id, to_stage_id, count in (
+            db.query(T.from_stage_id, T.to_stage_id, func.sum(T.transition_count))
+            .filter(
+                T.tenant_id == tenant_id,
+                T.pipeline_id == pipeline_id,
+                *_in_period(T.day, start_date, end_date),
+            )
+            .group_by(T.from_stage_id, T.to_stage_id)
+        )
+    }
+    rows = []
+    for (from_stage_id, to_stage_id), converted in sorted(
+        transitions.items(),
+        key=lambda item: (order.get(item[0][0], 0), order.get(item[0][1], 0)),
+    ):
+        entered = activity.get(from_stage_id, (0, 0, 0, 0))[0]
+        rows.append(
+            StageConversionRow(
+                from_stage_id=from_stage_id,
+                to_stage_id=to_stage_id,
+                entered_count=entered,
+                converted_count=converted,
+                conversion_rate=(converted / entered) if entered else None,
+            )
+        )
+    return rows
+
+
+__all__ = [
+    "DealContribution",
+    "deal_contribution",
+    "apply_deal_change",
+    "record_transition",
+    "pipeline_overview",
+    "weighted_pipeline",
+    "stage_funnel",
+    "stage_velocity",
+    "stage_conversion",
+]
@@ -14,7 +14,9 @@ from sqlalchemy.orm import Session
 
 from app.domain.models.pipeline import Pipeline
 from app.domain.schemas.pipeline import PipelineCreate, PipelineUpdate, PipelineRead
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import tenant_config_cache
 from app.messaging.producers.pipeline_producer import PipelineMessageProducer
 from fastapi import HTTPException, status
 from typing import List as TypingList, Dict, Any, Tuple
@@ -33,6 +35,15 @@ def get_pipeline(db: Session, pipeline_id: uuid.UUID, tenant_id: uuid.UUID) -> O
     )
 
 
+def pipeline_exists(db: Session, *, tenant_id: uuid.UUID, pipeline_id: uuid.UUID) -> bool:
+    """Return whether the pipeline belongs to the tenant, using the config cache."""
+
+    def load() -> Optional[bool]:
+        return True if get_pipeline(db, pipeline_id, tenant_id) else None
+
+    return bool(tenant_config_cache.get_or_load(tenant_id, "pipeline", pipeline_id, load))
+
+
 def create_pipeline(
     db: Session,
     tenant_id: uuid.UUID,
@@ -96,7 +107,10 @@ def service_list_pipelines(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[TypingList[Pipeline], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[TypingList[Pipeline], Optional[int]]:
     """
     List pipelines with optional filtering and pagination.
 
@@ -118,6 +132,12 @@ def service_list_pipelines(
     offset : int | None
         Number of records to skip from the beginning.  If ``None``, no
         offset is applied.
+    cursor : str | None
+        Opaque keyset cursor from a previous page.  Supplying ``cursor``
+        or ``page_size`` switches to keyset pagination (see
+        ``pagination_service``); ``total`` is then ``None``.
+    page_size : int | None
+        Number of records per keyset page.
 
     Returns
     -------
@@ -135,12 +155,15 @@ def service_list_pipelines(
         query = query.filter(Pipeline.object_type == object_type)
     if is_active is not None:
         query = query.filter(Pipeline.is_active == is_active)
-    total = query.count()
-    if limit is not None:
-        query = query.limit(limit)
-    if offset is not None:
-        query = query.offset(offset)
-    return query.all(), total
+    return paginate(
+        query,
+        Pipeline,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_get_pipeline(
@@ -217,7 +240,7 @@ def service_create_pipeline(
         updated_by=created_user,
     )
     db.add(pipeline)
-    commit_or_raise(db, refresh=pipeline)
+    flush_or_raise(db, refresh=pipeline)
     try:
         payload = _pipeline_snapshot(pipeline)
         PipelineMessageProducer.send_pipeline_created(
@@ -227,6 +250,7 @@ def service_create_pipeline(
     except Exception:
         # Do not propagate messaging failures
         pass
+    commit_or_raise(db, refresh=pipeline)
     return pipeline
 
 
@@ -276,7 +300,7 @@ def service_update_pipeline(
     # Audit
     pipeline.updated_by = updated_user
     # Persist updates
-    commit_or_raise(db, refresh=pipeline)
+    flush_or_raise(db, refresh=pipeline)
     # Publish event if changes exist
     if changes:
         try:
@@ -288,6 +312,7 @@ def service_update_pipeline(
             )
         except Exception:
             pass
+    commit_or_raise(db, refresh=pipeline)
     return pipeline
 
 
@@ -305,11 +330,12 @@ def service_delete_pipeline(
     """
     pipeline = service_get_pipeline(db, pipeline_id=pipeline_id, tenant_id=tenant_id)
     db.delete(pipeline)
-    commit_or_raise(db)
+    flush_or_raise(db)
     try:
         PipelineMessageProducer.send_pipeline_deleted(
             tenant_id=tenant_id,
             deleted_dt=None,
         )
     except Exception:
-        pass
\ No newline at end of file
+        pass
+    commit_or_raise(db)
\ No newline at end of file
@@ -21,7 +21,9 @@ from app.domain.schemas.pipeline_stage import (
     PipelineStageUpdate,
     PipelineStageRead,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import tenant_config_cache
 from app.messaging.producers.pipeline_stage_producer import PipelineStageMessageProducer
 from app.domain.models.pipeline import Pipeline
 from typing import List as TypingList, Dict, Any, Tuple
@@ -44,6 +46,18 @@ def get_stage(db: Session, stage_id: uuid.UUID) -> Optional[PipelineStage]:
     return db.query(PipelineStage).filter(PipelineStage.id == stage_id).first()
 
 
+def get_stage_pipeline_id(
+    db: Session, *, tenant_id: uuid.UUID, stage_id: uuid.UUID
+) -> Optional[uuid.UUID]:
+    """Return the pipeline a stage belongs to, using the config cache."""
+
+    def load() -> Optional[uuid.UUID]:
+        stage = get_stage(db, stage_id)
+        return stage.pipeline_id if stage else None
+
+    return tenant_config_cache.get_or_load(tenant_id, "pipeline_stage", stage_id, load)
+
+
 def create_stage(
     db: Session,
     tentant_id: uuid.UUID,
@@ -154,7 +168,10 @@ def service_list_stages(
     pipeline_id: uuid.UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[TypingList[PipelineStage], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[TypingList[PipelineStage], Optional[int]]:
     """
     List stages for a pipeline with optional pagination.
 
@@ -170,12 +187,15 @@ def service_list_stages(
         )
         .order_by(PipelineStage.display_order.asc())
     )
-    total = query.count()
-    if limit is not None:
-        query = query.limit(limit)
-    if offset is not None:
-        query = query.offset(offset)
-    return query.all(), total
+    return paginate(
+        query,
+        PipelineStage,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_get_stage(
@@ -207,7 +227,7 @@ def service_create_stage(
 
     Validates that the parent pipeline exists and belongs to the tenant,
     detects duplicate stage names or orders within the pipeline and
-    publishes a creation event after committing.
+    publishes a creation event with the commit.
     """
     # Validate pipeline existence and ownership
     pipeline = db.query(Pipeline).filter(
@@ -258,7 +278,7 @@ def service_create_stage(
         updated_by=created_user,
     )
     db.add(stage)
-    commit_or_raise(db, refresh=stage)
+    flush_or_raise(db, refresh=stage)
     # Emit creation event
     try:
         payload = _stage_snapshot(stage)
@@ -268,6 +288,7 @@ def service_create_stage(
         )
     except Exception:
         pass
+    commit_or_raise(db, refresh=stage)
     return stage
 
 
@@ -377,7 +398,7 @@ def service_update_stage(
         stage.inherit_pipeline_actions = stage_in.inherit_pipeline_actions
         changes["inherit_pipeline_actions"] = stage_in.inherit_pipeline_actions
     stage.updated_by = updated_user
-    commit_or_raise(db, refresh=stage)
+    flush_or_raise(db, refresh=stage)
     if changes:
         try:
             payload = _stage_snapshot(stage)
@@ -388,6 +409,7 @@ def service_update_stage(
             )
         except Exception:
             pass
+    commit_or_raise(db, refresh=stage)
     return stage
 
 
@@ -406,11 +428,12 @@ def service_delete_stage(
     if stage.tenant_id != tenant_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stage not found")
     db.delete(stage)
-    commit_or_raise(db)
+    flush_or_raise(db)
     try:
         PipelineStageMessageProducer.send_stage_deleted(
             tenant_id=tenant_id,
             deleted_dt=None,
         )
     except Exception:
-        pass
\ No newline at end of file
+        pass
+    commit_or_raise(db)
\ No newline at end of file
@@ -19,7 +19,8 @@ from sqlalchemy.orm import Session
 
 from app.domain.models.record_watcher import RecordWatcher
 from app.domain.schemas.record_watcher import RecordWatcherCreate, RecordWatcherRead
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 from app.messaging.producers.record_watcher_producer import RecordWatcherMessageProducer
 from fastapi import HTTPException, status
 
@@ -44,7 +45,10 @@ def service_list_watchers_by_record(
     record_id: uuid.UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[TypingList[RecordWatcher], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[TypingList[RecordWatcher], Optional[int]]:
     """
     List watchers for a given record.
 
@@ -57,12 +61,16 @@ def service_list_watchers_by_record(
         RecordWatcher.record_type == record_type,
         RecordWatcher.record_id == record_id,
     )
-    total = query.count()
-    if limit is not None:
-        query = query.limit(limit)
-    if offset is not None:
-        query = query.offset(offset)
-    return query.all(), total
+    return paginate(
+        query,
+        RecordWatcher,
+        id_column=RecordWatcher.principal_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_list_watchers_by_principal(
@@ -73,7 +81,10 @@ def service_list_watchers_by_principal(
     principal_id: uuid.UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[TypingList[RecordWatcher], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[TypingList[RecordWatcher], Optional[int]]:
     """
     List watchers for a given principal.
 
@@ -85,12 +96,16 @@ def service_list_watchers_by_principal(
         RecordWatcher.principal_type == principal_type,
         RecordWatcher.principal_id == principal_id,
     )
-    total = query.count()
-    if limit is not None:
-        query = query.limit(limit)
-    if offset is not None:
-        query = query.offset(offset)
-    return query.all(), total
+    return paginate(
+        query,
+        RecordWatcher,
+        id_column=RecordWatcher.record_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def service_create_watcher(
@@ -119,8 +134,8 @@ def service_create_watcher(
         created_by_user_id=created_user_id,
     )
     db.add(watcher)
-    commit_or_raise(db, refresh=watcher)
-    # Emit event after commit
+    flush_or_raise(db, refresh=watcher)
+    # Emit event; commit_or_raise stages it with the watcher
     try:
         payload = _watcher_snapshot(watcher)
         RecordWatcherMessageProducer.send_watcher_created(
@@ -130,6 +145,7 @@ def service_create_watcher(
     except Exception:
         # suppress messaging errors; classification done elsewhere
         pass
+    commit_or_raise(db, refresh=watcher)
     return watcher
 
 
@@ -159,7 +175,7 @@ def service_delete_watcher(
     if not watcher:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Watcher not found")
     db.delete(watcher)
-    commit_or_raise(db)
+    flush_or_raise(db)
     try:
         RecordWatcherMessageProducer.send_watcher_deleted(
             tenant_id=tenant_id,
@@ -167,4 +183,5 @@ def service_delete_watcher(
         )
     except Exception:
         pass
+    commit_or_raise(db)
     return None
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Version tokens for single-resource reads.
+
+A version token changes whenever a row or any of the child collections
+rendered with it changes.  It is computed with one indexed query on the
+primary key plus, per collection, a count and ``max(updated_at)``
+served by the ``(tenant_id, <parent>_id)`` index of the child table, so
+it is much cheaper than loading and serializing the resource.  The API
+layer turns tokens into ETags (see ``app.api.etag``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import and_, func, inspect as sa_inspect, select
+from sqlalchemy.orm import Session
+
+
+def resource_version(
+    db: Session,
+    model: Any,
+    *,
+    tenant_id: uuid.UUID,
+    resource_id: uuid.UUID,
+    collections: Iterable[str] = (),
+) -> Optional[str]:
+    """Return the version token of a tenant-scoped row, or ``None`` if absent.
+
+    ``collections`` names one-to-many relationships of ``model`` whose
+    rows are part of the resource's representation.  Counting them
+    catches deletions, which ``max(updated_at)`` alone would miss.
+    """
+    columns = [model.updated_at]
+    relationships = sa_inspect(model).relationships
+    for name in collections:
+        prop = relationships[name]
+        child = prop.mapper.class_
+        condition = and_(*(remote == local for local, remote in prop.local_remote_pairs))
+        columns.append(select(func.count()).select_from(child).where(condition).scalar_subquery())
+        columns.append(select(func.max(child.updated_at)).where(condition).scalar_subquery())
+    row = (
+        db.query(*columns)
+        .filter(model.id == resource_id, model.tenant_id == tenant_id)
+        .first()
+    )
+    if row is None:
+        return None
+    raw = "|".join([str(resource_id), *(str(value) for value in row)])
+    return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+__all__ = ["resource_version"]
@@ -0,0 +1,370 @@
+"""
+SLA due-date engine.
+
+Matches a ticket to an SLA policy and computes its first response,
+next response and resolution due dates from the policy's target for
+the ticket's priority.  Minutes are counted in the business hours of
+the ticket's assigned group (``group_profile.business_hours_id``); a
+ticket without a calendar is measured around the clock.  Results are
+upserted into ``ticket_sla_state``.
+
+Policy selection, first match wins:
+
+1. active policies with ``match_rules``, oldest first;
+2. the assigned group's ``default_sla_policy_id`` when it is active;
+3. active policies without ``match_rules`` (catch-all), oldest first.
+
+``match_rules`` maps ticket fields (:data:`MATCH_FIELDS`) to a value or
+a list of accepted values; every rule must match.
+
+Timers: the first response is due ``first_response_minutes`` after
+creation until the first response is given; the next response is due
+``next_response_minutes`` after the last message while a ticket that
+has had its first response awaits an agent (new/open); resolution is
+due ``resolution_minutes`` after creation.  Solved and closed tickets
+have no running timers.  Breach flags are set by
+:mod:`app.messaging.sla_breach_scanner`; a recomputation keeps a flag
+unless the new due date of that timer lies in the future.
+
+:mod:`ticket_service` recomputes a ticket in the transaction that
+creates it or changes one of :data:`RECOMPUTE_FIELDS`, against the
+tenant's :class:`SlaContext` from the tenant configuration cache.
+Changes to policies, targets, calendars and group profiles drop that
+entry and enqueue ``TASK_RECOMPUTE``, which recomputes all open tickets
+of the tenant in batches against one freshly loaded context.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.celery_app import EXCHANGE_NAME, celery_app
+from app.domain.models.business_hours import BusinessHours
+from app.domain.models.group_profile import GroupProfile
+from app.domain.models.sla_policy import SlaPolicy
+from app.domain.models.sla_target import SlaTarget
+from app.domain.models.ticket import Ticket
+from app.domain.models.ticket_sla_state import TicketSlaState
+from app.domain.services.business_calendar import ALWAYS_OPEN, BusinessCalendar, get_calendar
+from app.domain.services.tenant_config_cache import tenant_config_cache
+
+logger = logging.getLogger("sla_engine_service")
+
+TASK_RECOMPUTE: str = f"{EXCHANGE_NAME}.jobs.sla_recompute"
+
+# Ticket fields usable in sla_policy.match_rules
+MATCH_FIELDS = (
+    "priority",
+    "status",
+    "ticket_type",
+    "work_mode",
+    "inbound_channel_id",
+    "assigned_group_id",
+    "company_id",
+)
+# Ticket fields whose change can move a ticket's due dates
+RECOMPUTE_FIELDS = frozenset(
+    MATCH_FIELDS + ("first_response_at", "last_message_at")
+)
+STOPPED_STATUSES = ("solved", "closed")
+AWAITING_AGENT_STATUSES = ("new", "open")
+
+RECOMPUTE_BATCH_SIZE = 500
+ENGINE_USER = "sla_engine"
+
+# Columns read by the bulk recomputation
+_TICKET_COLUMNS = (
+    Ticket.id,
+    Ticket.created_at,
+    Ticket.first_response_at,
+    Ticket.last_message_at,
+) + tuple(getattr(Ticket, name) for name in MATCH_FIELDS)
+
+_DUE_FIELDS = ("first_response", "next_response", "resolution")
+
+
+@dataclass(frozen=True)
+class SlaDueDates:
+    """Policy and due dates computed for one ticket."""
+
+    sla_policy_id: Optional[uuid.UUID] = None
+    first_response_due_at: Optional[datetime] = None
+    next_response_due_at: Optional[datetime] = None
+    resolution_due_at: Optional[datetime] = None
+
+
+@dataclass
+class SlaContext:
+    """A tenant's SLA configuration, loaded once per recomputation.
+
+    ``policies`` holds the active policies in selection order as
+    ``(policy_id, match_rules)``; ``targets`` maps ``(policy_id,
+    priority)`` to first response, next response and resolution
+    minutes; ``groups`` maps a group to its default policy and
+    calendar id.
+    """
+
+    policies: List[Tuple[uuid.UUID, Optional[Dict[str, Any]]]] = field(default_factory=list)
+    targets: Dict[Tuple[uuid.UUID, str], Tuple[Optional[int], Optional[int], Optional[int]]] = field(
+        default_factory=dict
+    )
+    groups: Dict[uuid.UUID, Tuple[Optional[uuid.UUID], Optional[uuid.UUID]]] = field(
+        default_factory=dict
+    )
+    calendars: Dict[uuid.UUID, BusinessCalendar] = field(default_factory=dict)
+
+    def policy_for(self, ticket: Any) -> Optional[uuid.UUID]:
+        for policy_id, rules in self.policies:
+            if rules and matches(rules, ticket):
+                return policy_id
+        default_policy_id, _ = self.groups.get(ticket.assigned_group_id, (None, None))
+        active = {policy_id for policy_id, _ in self.policies}
+        if default_policy_id in active:
+            return default_policy_id
+        for policy_id, rules in self.policies:
+            if not rules:
+                return policy_id
+        return None
+
+    def calendar_for(self, ticket: Any) -> BusinessCalendar:
+        _, business_hours_id = self.groups.get(ticket.assigned_group_id, (None, None))
+        return self.calendars.get(business_hours_id, ALWAYS_OPEN)
+
+
+def matches(rules: Dict[str, Any], ticket: Any) -> bool:
+    """Return whether ``ticket`` satisfies every rule in ``rules``."""
+    for name, expected in rules.items():
+        if name not in MATCH_FIELDS:
+            return False
+        actual = getattr(ticket, name, None)
+        accepted = expected if isinstance(expected, list) else [expected]
+        if actual is None:
+            if None not in accepted:
+                return False
+        elif str(actual) not in {str(value) for value in accepted if value is not None}:
+            return False
+    return True
+
+
+def load_context(db: Session, *, tenant_id: uuid.UUID) -> SlaContext:
+    """Load the tenant's active policies, targets, group defaults and calendars."""
+    context = SlaContext()
+    policies = (
+        db.query(SlaPolicy.id, SlaPolicy.match_rules)
+        .filter(SlaPolicy.tenant_id == tenant_id, SlaPolicy.is_active.is_(True))
+        .order_by(SlaPolicy.created_at, SlaPolicy.id)
+        .all()
+    )
+    context.policies = [(p.id, p.match_rules) for p in policies if p.match_rules] + [
+        (p.id, None) for p in policies if not p.match_rules
+    ]
+    for target in db.query(
+        SlaTarget.sla_policy_id,
+        SlaTarget.priority,
+        SlaTarget.first_response_minutes,
+        SlaTarget.next_response_minutes,
+        SlaTarget.resolution_minutes,
+    ).filter(SlaTarget.tenant_id == tenant_id):
+        context.targets[(target.sla_policy_id, target.priority)] = (
+            target.first_response_minutes,
+            target.next_response_minutes,
+            target.resolution_minutes,
+        )
+    for group in db.query(
+        GroupProfile.group_id, GroupProfile.default_sla_policy_id, GroupProfile.business_hours_id
+    ).filter(GroupProfile.tenant_id == tenant_id):
+        context.groups[group.group_id] = (group.default_sla_policy_id, group.business_hours_id)
+    for hours in db.query(
+        BusinessHours.id, BusinessHours.time_zone, BusinessHours.weekly_hours, BusinessHours.holidays
+    ).filter(BusinessHours.tenant_id == tenant_id):
+        context.calendars[hours.id] = get_calendar(hours.time_zone, hours.weekly_hours, hours.holidays)
+    return context
+
+
+def cached_context(db: Session, *, tenant_id: uuid.UUID) -> SlaContext:
+    """Return the tenant's :class:`SlaContext` from the config cache.
+
+    The context is shared between requests and must not be modified.
+    """
+    return tenant_config_cache.get_or_load(
+        tenant_id, "sla_context", None, lambda: load_context(db, tenant_id=tenant_id)
+    )
+
+
+def compute_due_dates(ticket: Any, context: SlaContext) -> SlaDueDates:
+    """Select the policy of ``ticket`` and compute its running timers."""
+    policy_id = context.policy_for(ticket)
+    if policy_id is None:
+        return SlaDueDates()
+    target = context.targets.get((policy_id, ticket.priority))
+    if target is None or ticket.status in STOPPED_STATUSES:
+        return SlaDueDates(sla_policy_id=policy_id)
+    first_minutes, next_minutes, resolution_minutes = target
+    calendar = context.calendar_for(ticket)
+    created_at = ticket.created_at or datetime.now(timezone.utc)
+
+    def due(start: Optional[datetime], minutes: Optional[int]) -> Optional[datetime]:
+        if start is None or minutes is None:
+            return None
+        return calendar.add_minutes(start, minutes)
+
+    responded = ticket.first_response_at is not None
+    return SlaDueDates(
+        sla_policy_id=policy_id,
+        first_response_due_at=None if responded else due(created_at, first_minutes),
+        next_response_due_at=(
+            due(ticket.last_message_at, next_minutes)
+            if responded and ticket.status in AWAITING_AGENT_STATUSES
+            else None
+        ),
+        resolution_due_at=due(created_at, resolution_minutes),
+    )
+
+
+def _upsert_states(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    results: Sequence[Tuple[uuid.UUID, SlaDueDates]],
+    now: datetime,
+) -> None:
+    """Write the computed due dates with one INSERT .. ON CONFLICT statement."""
+    if not results:
+        return
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "tenant_id": tenant_id,
+            "ticket_id": ticket_id,
+            "sla_policy_id": dates.sla_policy_id,
+            "first_response_due_at": dates.first_response_due_at,
+            "next_response_due_at": dates.next_response_due_at,
+            "resolution_due_at": dates.resolution_due_at,
+            "first_response_breached": False,
+            "next_response_breached": False,
+            "resolution_breached": False,
+            "last_computed_at": now,
+            "created_at": now,
+            "updated_at": now,
+            "created_by": ENGINE_USER,
+            "updated_by": ENGINE_USER,
+        }
+        for ticket_id, dates in results
+    ]
+    stmt = pg_insert(TicketSlaState).values(rows)
+    excluded = stmt.excluded
+    updates: Dict[str, Any] = {
+        name: excluded[name]
+        for name in ("sla_policy_id", "last_computed_at", "updated_at", "updated_by")
+    }
+    for timer in _DUE_FIELDS:
+        due_at = f"{timer}_due_at"
+        breached = f"{timer}_breached"
+        updates[due_at] = excluded[due_at]
+        # Keep a breach unless the timer now runs into the future.
+        updates[breached] = getattr(TicketSlaState, breached) & func.coalesce(
+            excluded[due_at] <= now, true()
+        )
+    db.execute(
+        stmt.on_conflict_do_update(index_elements=["tenant_id", "ticket_id"], set_=updates)
+    )
+
+
+def apply_ticket_sla(
+    db: Session,
+    ticket: Ticket,
+    *,
+    context: Optional[SlaContext] = None,
+    now: Optional[datetime] = None,
+) -> SlaDueDates:
+    """Recompute the SLA state of ``ticket`` in the caller's transaction."""
+    db.flush()  # the state row references the ticket
+    if context is None:
+        context = cached_context(db, tenant_id=ticket.tenant_id)
+    dates = compute_due_dates(ticket, context)
+    _upsert_states(
+        db,
+        tenant_id=ticket.tenant_id,
+        results=[(ticket.id, dates)],
+        now=now or datetime.now(timezone.utc),
+    )
+    return dates
+
+
+def needs_recompute(changed_fields: Iterable[str]) -> bool:
+    """Return whether a ticket change touches a field the SLA depends on."""
+    return not RECOMPUTE_FIELDS.isdisjoint(changed_fields)
+
+
+def recompute_tenant(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    batch_size: int = RECOMPUTE_BATCH_SIZE,
+) -> int:
+    """Recompute the SLA state of every open ticket of a tenant.
+
+    Tickets are read in primary-key order, ``batch_size`` at a time,
+    with only the columns the engine needs; each batch is written with
+    one upsert and committed.  Returns the number of tickets processed.
+    """
+    context = load_context(db, tenant_id=tenant_id)
+    processed = 0
+    last_id: Optional[uuid.UUID] = None
+    while True:
+        query = db.query(*_TICKET_COLUMNS).filter(
+            Ticket.tenant_id == tenant_id, Ticket.status.notin_(STOPPED_STATUSES)
+        )
+        if last_id is not None:
+            query = query.filter(Ticket.id > last_id)
+        batch = query.order_by(Ticket.id).limit(batch_size).all()
+        if not batch:
+            break
+        _upsert_states(
+            db,
+            tenant_id=tenant_id,
+            results=[(ticket.id, compute_due_dates(ticket, context)) for ticket in batch],
+            now=datetime.now(timezone.utc),
+        )
+        db.commit()
+        processed += len(batch)
+        last_id = batch[-1].id
+    logger.info("Recomputed SLA state of %d tickets for tenant %s", processed, tenant_id)
+    return processed
+
+
+def enqueue_recompute(tenant_id: uuid.UUID) -> None:
+    """Queue a recomputation of the tenant's open tickets.
+
+    Called after SLA configuration changes have been committed; a
+    failure to queue is logged rather than failing the change.
+    """
+    try:
+        celery_app.send_task(TASK_RECOMPUTE, kwargs={"tenant_id": str(tenant_id)})
+    except Exception:
+        logger.exception("Failed to enqueue SLA recomputation for tenant %s", tenant_id)
+
+
+__all__ = [
+    "TASK_RECOMPUTE",
+    "MATCH_FIELDS",
+    "RECOMPUTE_FIELDS",
+    "SlaDueDates",
+    "SlaContext",
+    "matches",
+    "load_context",
+    "cached_context",
+    "compute_due_dates",
+    "apply_ticket_sla",
+    "needs_recompute",
+    "recompute_tenant",
+    "enqueue_recompute",
+]
@@ -23,12 +23,16 @@ from app.domain.schemas.sla_policy import (
     SlaPolicyUpdate,
     TenantCreateSlaPolicy,
     AdminCreateSlaPolicy,
+    SlaPolicyOut,
 )
 from app.domain.schemas.events.sla_policy_event import SlaPolicyDelta
 from app.messaging.producers.sla_policy_producer import (
     SlaPolicyMessageProducer as SlaPolicyProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services import sla_engine_service
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import tenant_config_cache
 
 logger = logging.getLogger("sla_policy_service")
 
@@ -69,7 +73,10 @@ def list_sla_policies(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[SlaPolicy], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[SlaPolicy], Optional[int]]:
     """List SLA policies with optional filtering by active status and tenant.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.
@@ -89,13 +96,16 @@ def list_sla_policies(
         query = query.filter(SlaPolicy.tenant_id == tenant_id)
     if is_active is not None:
         query = query.filter(SlaPolicy.is_active == is_active)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(SlaPolicy.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        SlaPolicy,
+        order_by=(SlaPolicy.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_sla_policy(
@@ -122,9 +132,11 @@ def create_sla_policy(
         updated_by=created_by,
     )
     db.add(policy)
-    commit_or_raise(db, refresh=policy, action="create SLA policy")
+    flush_or_raise(db, refresh=policy, action="create SLA policy")
     snapshot = _snapshot(policy)
     SlaPolicyProducer.send_sla_policy_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create SLA policy")
+    sla_engine_service.enqueue_recompute(tenant_id)
     return policy
 
 
@@ -151,6 +163,27 @@ def get_sla_policy(
     return policy
 
 
+def get_sla_policy_config(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    policy_id: uuid.UUID,
+) -> SlaPolicyOut:
+    """Retrieve an SLA policy as a detached ``SlaPolicyOut``.
+
+    Served from the tenant configuration cache; entries are dropped
+    when the SLA policy changes.
+    """
+    return tenant_config_cache.get_or_load(
+        tenant_id,
+        "sla_policy",
+        policy_id,
+        lambda: SlaPolicyOut.model_validate(
+            get_sla_policy(db, tenant_id=tenant_id, policy_id=policy_id), from_attributes=True
+        ),
+    )
+
+
 def update_sla_policy(
     db: Session,
     *,
@@ -172,13 +205,15 @@ def update_sla_policy(
             setattr(policy, field, value)
         policy.updated_by = updated_by
         policy.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=policy, action="update SLA policy")
+        flush_or_raise(db, refresh=policy, action="update SLA policy")
         snapshot = _snapshot(policy)
         SlaPolicyProducer.send_sla_policy_updated(
             tenant_id=tenant_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update SLA policy")
+        sla_engine_service.enqueue_recompute(tenant_id)
     return policy
 
 
@@ -191,9 +226,11 @@ def delete_sla_policy(
     """Delete an SLA policy and publish a deletion event."""
     policy = get_sla_policy(db, tenant_id=tenant_id, policy_id=policy_id)
     db.delete(policy)
-    commit_or_raise(db, action="delete SLA policy")
+    flush_or_raise(db, action="delete SLA policy")
     deleted_dt = datetime.utcnow().isoformat()
     SlaPolicyProducer.send_sla_policy_deleted(tenant_id=tenant_id, deleted_dt=deleted_dt)
+    commit_or_raise(db, action="delete SLA policy")
+    sla_engine_service.enqueue_recompute(tenant_id)
     return None
 
 
@@ -201,6 +238,7 @@ __all__ = [
     "list_sla_policies",
     "create_sla_policy",
     "get_sla_policy",
+    "get_sla_policy_config",
     "update_sla_policy",
     "delete_sla_policy",
 ]
@@ -23,12 +23,16 @@ from app.domain.schemas.sla_target import (
     SlaTargetUpdate,
     TenantCreateSlaTarget,
     AdminCreateSlaTarget,
+    SlaTargetOut,
 )
 from app.domain.schemas.events.sla_target_event import SlaTargetDelta
 from app.messaging.producers.sla_target_producer import (
     SlaTargetMessageProducer as SlaTargetProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services import sla_engine_service
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import tenant_config_cache
 
 logger = logging.getLogger("sla_target_service")
 
@@ -69,7 +73,10 @@ def list_sla_targets(
     priority: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[SlaTarget], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[SlaTarget], Optional[int]]:
     """List SLA targets with optional filtering by policy and priority.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.  If
@@ -94,13 +101,16 @@ def list_sla_targets(
         query = query.filter(SlaTarget.sla_policy_id == sla_policy_id)
     if priority:
         query = query.filter(SlaTarget.priority == priority)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(SlaTarget.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        SlaTarget,
+        order_by=(SlaTarget.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_sla_target(
@@ -127,9 +137,11 @@ def create_sla_target(
         created_by=created_by,
     )
     db.add(target)
-    commit_or_raise(db, refresh=target, action="create SLA target")
+    flush_or_raise(db, refresh=target, action="create SLA target")
     snapshot = _snapshot(target)
     SlaTargetProducer.send_sla_target_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create SLA target")
+    sla_engine_service.enqueue_recompute(tenant_id)
     return target
 
 
@@ -156,6 +168,27 @@ def get_sla_target(
     return target
 
 
+def get_sla_target_config(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    target_id: uuid.UUID,
+) -> SlaTargetOut:
+    """Retrieve an SLA target as a detached ``SlaTargetOut``.
+
+    Served from the tenant configuration cache; entries are dropped
+    when the SLA target changes.
+    """
+    return tenant_config_cache.get_or_load(
+        tenant_id,
+        "sla_target",
+        target_id,
+        lambda: SlaTargetOut.model_validate(
+            get_sla_target(db, tenant_id=tenant_id, target_id=target_id), from_attributes=True
+        ),
+    )
+
+
 def update_sla_target(
     db: Session,
     *,
@@ -182,13 +215,15 @@ def update_sla_target(
         for field, value in delta.base_fields.items():
             setattr(target, field, value)
         # No updated_at column on SlaTarget; we record updated_by in created_by?? Not needed.
-        commit_or_raise(db, refresh=target, action="update SLA target")
+        flush_or_raise(db, refresh=target, action="update SLA target")
         snapshot = _snapshot(target)
         SlaTargetProducer.send_sla_target_updated(
             tenant_id=tenant_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update SLA target")
+        sla_engine_service.enqueue_recompute(tenant_id)
     return target
 
 
@@ -201,9 +236,11 @@ def delete_sla_target(
     """Delete an SLA target and publish a deletion event."""
     target = get_sla_target(db, tenant_id=tenant_id, target_id=target_id)
     db.delete(target)
-    commit_or_raise(db, action="delete SLA target")
+    flush_or_raise(db, action="delete SLA target")
     deleted_dt = datetime.utcnow().isoformat()
     SlaTargetProducer.send_sla_target_deleted(tenant_id=tenant_id, deleted_dt=deleted_dt)
+    commit_or_raise(db, action="delete SLA target")
+    sla_engine_service.enqueue_recompute(tenant_id)
     return None
 
 
@@ -211,6 +248,7 @@ __all__ = [
     "list_sla_targets",
     "create_sla_target",
     "get_sla_target",
+    "get_sla_target_config",
     "update_sla_target",
     "delete_sla_target",
 ]
@@ -0,0 +1,288 @@
+"""
+Time-in-stage reports computed from ``stage_history``.
+
+A record's stay in a stage starts at the history row that moved it
+into the stage and ends at its next history row.  Both reports pair
+consecutive rows with ``LEAD(changed_at)`` over each record's history
+and aggregate the stays in the database, so only one row per stage is
+returned to Python.  The window is served in order by
+``ix_stage_history_entity_changed_at`` (tenant_id, entity_id,
+changed_at).
+
+Percentiles (p50/p90) cannot be combined from daily totals, which is
+why these reports read the history itself rather than the pipeline
+rollups.  Stays that have not ended are aged up to ``as_of`` (now by
+default).  Durations are reported in days.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.domain.schemas.pipeline_report import DealAgingRow, StageDurationRow
+
+DEFAULT_AGING_THRESHOLD_DAYS = 30
+
+# One row per stay: the stage entered by a history row and when the
+# record left it (NULL for the current stay).  Records are partitioned
+# by entity_id alone so the window follows the index order; ids are
+# UUIDs and do not collide across entity types.  ``{records}`` selects
+# the entity ids whose whole history is needed, including the moves
+# into and out of other pipelines.
+_STAYS_CTE = """
+stays AS (
+    SELECT
+        h.entity_id,
+        h.to_stage_id AS stage_id,
+        h.changed_at AS entered_at,
+        LEAD(h.changed_at) OVER (
+            PARTITION BY h.entity_id ORDER BY h.changed_at
+        ) AS exited_at
+    FROM dyno_crm.stage_history h
+    WHERE h.tenant_id = :tenant_id
+      AND h.entity_id IN ({records})
+)
+"""
+
+_STAGE_DURATIONS_SQL = """
+WITH {stays},
+timed AS (
+    SELECT
+        stage_id,
+        CASE WHEN exited_at IS NOT NULL {exit_filter}
+             THEN EXTRACT(EPOCH FROM exited_at - entered_at)::float8 / 86400
+        END AS completed_days,
+        CASE WHEN exited_at IS NULL
+             THEN GREATEST(EXTRACT(EPOCH FROM :as_of - entered_at)::float8, 0) / 86400
+        END AS current_days
+    FROM stays
+    WHERE stage_id IS NOT NULL
+),
+per_stage AS (
+    SELECT
+        stage_id,
+        COUNT(completed_days) AS exited_count,
+        AVG(completed_days) AS avg_days,
+        PERCENTILE_CONT(ARRAY[0.5, 0.9]) WITHIN GROUP (ORDER BY completed_days) AS completed_pct,
+        COUNT(current_days) AS current_count,
+        PERCENTILE_CONT(ARRAY[0.5, 0.9]) WITHIN GROUP (ORDER BY current_days) AS current_pct
+    FROM timed
+    GROUP BY stage_id
+)
+SELECT
+    ps.id AS stage_id,
+    ps.name AS stage_name,
+    ps.display_order,
+    COALESCE(a.exited_count, 0) AS exited_count,
+    a.avg_days,
+    a.completed_pct,
+    COALESCE(a.current_count, 0) AS current_count,
+    a.current_pct
+FROM dyno_crm.pipeline_stage ps
+LEFT JOIN per_stage a ON a.stage_id = ps.id
+WHERE ps.tenant_id = :tenant_id
+  AND ps.pipeline_id = :pipeline_id
+ORDER BY ps.display_order
+"""
+
+_PIPELINE_RECORDS = """
+SELECT p.entity_id
+FROM dyno_crm.stage_history p
+WHERE p.tenant_id = :tenant_id
+  AND p.pipeline_id = :pipeline_id
+"""
+
+# Deals without a history row for their current stage are aged from
+# their creation.
+_DEAL_AGING_SQL = """
+WITH {stays},
+open_deals AS (
+    SELECT
+        d.stage_id,
+        COALESCE(d.amount, 0) AS amount,
+        GREATEST(EXTRACT(EPOCH FROM :as_of - COALESCE(s.entered_at, d.created_at))::float8, 0)
+            / 86400 AS days_in_stage,
+        GREATEST(EXTRACT(EPOCH FROM :as_of - d.created_at)::float8, 0) / 86400 AS days_in_cycle
+    FROM dyno_crm.deal d
+    JOIN dyno_crm.pipeline_stage ps
+      ON ps.id = d.stage_id
+     AND ps.tenant_id = d.tenant_id
+    LEFT JOIN stays s
+      ON s.entity_id = d.id
+     AND s.stage_id = d.stage_id
+     AND s.exited_at IS NULL
+    WHERE d.tenant_id = :tenant_id
+      AND d.pipeline_id = :pipeline_id
+      AND ps.stage_state = 'OPEN'
+),
+flagged AS (
+    SELECT
+        *,
+        (days_in_stage > :threshold_days
+         OR days_in_cycle > CAST(:cycle_threshold_days AS float8)) IS TRUE AS at_risk
+    FROM open_deals
+),
+per_stage AS (
+    SELECT
+        stage_id,
+        COUNT(*) AS open_deal_count,
+        SUM(amount) AS open_amount,
+        AVG(days_in_stage) AS avg_days,
+        PERCENTILE_CONT(ARRAY[0.5, 0.9]) WITHIN GROUP (ORDER BY days_in_stage) AS pct,
+        COUNT(*) FILTER (WHERE at_risk) AS at_risk_count,
+        COALESCE(SUM(amount) FILTER (WHERE at_risk), 0) AS at_risk_amount
+    FROM flagged
+    GROUP BY stage_id
+)
+SELECT
+    ps.id AS stage_id,
+    ps.name AS stage_name,
+    ps.display_order,
+    COALESCE(a.open_deal_count, 0) AS open_deal_count,
+    COALESCE(a.open_amount, 0) AS open_amount,
+    a.avg_days,
+    a.pct,
+    COALESCE(a.at_risk_count, 0) AS at_risk_count,
+    COALESCE(a.at_risk_amount, 0) AS at_risk_amount
+FROM dyno_crm.pipeline_stage ps
+LEFT JOIN per_stage a ON a.stage_id = ps.id
+WHERE ps.tenant_id = :tenant_id
+  AND ps.pipeline_id = :pipeline_id
+  AND ps.stage_state = 'OPEN'
+ORDER BY ps.display_order
+"""
+
+_PIPELINE_DEALS = """
+SELECT d.id
+FROM dyno_crm.deal d
+WHERE d.tenant_id = :tenant_id
+  AND d.pipeline_id = :pipeline_id
+"""
+
+
+def _percentiles(values: Optional[List[Any]]) -> Tuple[Optional[float], Optional[float]]:
+    """Unpack a ``PERCENTILE_CONT(ARRAY[0.5, 0.9])`` result."""
+    if not values:
+        return None, None
+    return tuple(float(v) if v is not None else None for v in values)
+
+
+def _stage_rows(db: Session, sql: str, params: Dict[str, Any]) -> List[Any]:
+    rows = db.execute(text(sql), params).all()
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Pipeline not found or has no stages",
+        )
+    return rows
+
+
+def _start_of_day(value: date) -> datetime:
+    return datetime.combine(value, time.min, tzinfo=timezone.utc)
+
+
+def stage_durations(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    pipeline_id: uuid.UUID,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    as_of: Optional[datetime] = None,
+) -> List[StageDurationRow]:
+    """Average, p50 and p90 time in stage per stage of a pipeline.
+
+    Completed stays are those that ended during the period (inclusive
+    UTC dates); current stays are aged up to ``as_of``.
+    """
+    params: Dict[str, Any] = {
+        "tenant_id": str(tenant_id),
+        "pipeline_id": str(pipeline_id),
+        "as_of": as_of or datetime.now(timezone.utc),
+    }
+    exit_filter = ""
+    if start_date is not None:
+        exit_filter += " AND exited_at >= :period_start"
+        params["period_start"] = _start_of_day(start_date)
+    if end_date is not None:
+        exit_filter += " AND exited_at < :period_end"
+        params["period_end"] = _start_of_day(end_date + timedelta(days=1))
+    sql = _STAGE_DURATIONS_SQL.format(
+        stays=_STAYS_CTE.format(records=_PIPELINE_RECORDS), exit_filter=exit_filter
+    )
+    rows = []
+    for row in _stage_rows(db, sql, params):
+        p50, p90 = _percentiles(row.completed_pct)
+        current_p50, current_p90 = _percentiles(row.current_pct)
+        rows.append(
+            StageDurationRow(
+                stage_id=row.stage_id,
+                stage_name=row.stage_name,
+                display_order=row.display_order,
+                exited_count=row.exited_count,
+                avg_days=row.avg_days,
+                p50_days=p50,
+                p90_days=p90,
+                current_count=row.current_count,
+                current_p50_days=current_p50,
+                current_p90_days=current_p90,
+            )
+        )
+    return rows
+
+
+def deal_aging(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    pipeline_id: uuid.UUID,
+    threshold_days: float = DEFAULT_AGING_THRESHOLD_DAYS,
+    cycle_threshold_days: Optional[float] = None,
+    as_of: Optional[datetime] = None,
+) -> List[DealAgingRow]:
+    """Age of the open deals per open stage of a pipeline.
+
+    A deal is at risk when it has been in its stage for more than
+    ``threshold_days`` or, if ``cycle_threshold_days`` is given, open
+    for more than that many days since it was created.
+    """
+    params: Dict[str, Any] = {
+        "tenant_id": str(tenant_id),
+        "pipeline_id": str(pipeline_id),
+        "as_of": as_of or datetime.now(timezone.utc),
+        "threshold_days": float(threshold_days),
+        "cycle_threshold_days": cycle_threshold_days,
+    }
+    sql = _DEAL_AGING_SQL.format(stays=_STAYS_CTE.format(records=_PIPELINE_DEALS))
+    rows = []
+    for row in _stage_rows(db, sql, params):
+        p50, p90 = _percentiles(row.pct)
+        rows.append(
+            DealAgingRow(
+                stage_id=row.stage_id,
+                stage_name=row.stage_name,
+                display_order=row.display_order,
+                open_deal_count=row.open_deal_count,
+                open_amount=Decimal(row.open_amount),
+                avg_days_in_stage=row.avg_days,
+                p50_days_in_stage=p50,
+                p90_days_in_stage=p90,
+                at_risk_count=row.at_risk_count,
+                at_risk_amount=Decimal(row.at_risk_amount),
+            )
+        )
+    return rows
+
+
+__all__ = [
+    "DEFAULT_AGING_THRESHOLD_DAYS",
+    "stage_durations",
+    "deal_aging",
+]
@@ -3,8 +3,9 @@ Service layer for StageHistory entities.
 
 This module provides operations to record stage transitions and list
 historical stage changes for CRM entities.  Stage history entries are
-append-only and always associated with a tenant.  After a stage
-transition is recorded, an event is emitted via the message producer.
+append-only and always associated with a tenant.  Each recorded
+transition is folded into the pipeline rollups and its event is
+staged via the message producer, all in the same transaction.
 """
 
 from __future__ import annotations
@@ -18,7 +19,9 @@ from sqlalchemy.orm import Session
 
 from app.domain.models.stage_history import StageHistory
 from app.domain.schemas.stage_history import StageHistoryCreate, StageHistoryRead
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services import pipeline_rollup_service
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 from app.messaging.producers.stage_history_producer import StageHistoryMessageProducer
 
 logger = logging.getLogger("stage_history_service")
@@ -48,6 +51,8 @@ def record_stage_transition(
 ) -> StageHistory:
     """Record a stage transition for an entity and emit an event.
 
+    The pipeline rollups are updated in the same transaction.
+
     Parameters
     ----------
     db : Session
@@ -74,9 +79,12 @@ def record_stage_transition(
         changed_by_user_id=entry_in.changed_by_user_id,
         source=entry_in.source,
     )
+    # Roll up before the entry is flushed; see record_transition
+    pipeline_rollup_service.record_transition(db, entry)
     db.add(entry)
-    commit_or_raise(db, refresh=entry, action="create stage history")
-    # Emit stage history created event after successful commit
+    flush_or_raise(db, refresh=entry, action="create stage history")
+    # Publish the stage history created event; commit_or_raise stages it
+    # in the transaction of the entry
     try:
         payload = _snapshot(entry)
         StageHistoryMessageProducer.send_stage_history_created(
@@ -85,6 +93,7 @@ def record_stage_transition(
         )
     except Exception:
         logger.exception("Failed to publish stage history event")
+    commit_or_raise(db, action="create stage history")
     return entry
 
 
@@ -96,7 +105,10 @@ def list_stage_history_by_entity(
     entity_id: uuid.UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[StageHistory], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[StageHistory], Optional[int]]:
     """List stage history records for a given entity.
 
     Results are ordered by ``changed_at`` descending.  Pagination can be
@@ -107,13 +119,17 @@ def list_stage_history_by_entity(
         StageHistory.entity_type == entity_type,
         StageHistory.entity_id == entity_id,
     )
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(StageHistory.changed_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        StageHistory,
+        order_by=(StageHistory.changed_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        sort_column=StageHistory.changed_at,
+        total_mode=total_mode,
+    )
 
 
 __all__ = ["record_stage_transition", "list_stage_history_by_entity"]
\ No newline at end of file
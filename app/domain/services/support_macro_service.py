@@ -28,7 +28,8 @@ from app.domain.schemas.events.support_macro_event import SupportMacroDelta
 from app.messaging.producers.support_macro_producer import (
     SupportMacroMessageProducer as SupportMacroProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("support_macro_service")
 
@@ -68,7 +69,10 @@ def list_support_macros(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[SupportMacro], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[SupportMacro], Optional[int]]:
     """List support macros with optional filtering by active status and tenant.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.
@@ -89,13 +93,16 @@ def list_support_macros(
         query = query.filter(SupportMacro.tenant_id == tenant_id)
     if is_active is not None:
         query = query.filter(SupportMacro.is_active == is_active)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(SupportMacro.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        SupportMacro,
+        order_by=(SupportMacro.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_support_macro(
@@ -122,9 +129,10 @@ def create_support_macro(
         updated_by=created_by,
     )
     db.add(macro)
-    commit_or_raise(db, refresh=macro, action="create support macro")
+    flush_or_raise(db, refresh=macro, action="create support macro")
     snapshot = _snapshot(macro)
     SupportMacroProducer.send_support_macro_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create support macro")
     return macro
 
 
@@ -170,13 +178,14 @@ def update_support_macro(
             setattr(macro, field, value)
         macro.updated_by = updated_by
         macro.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=macro, action="update support macro")
+        flush_or_raise(db, refresh=macro, action="update support macro")
         snapshot = _snapshot(macro)
         SupportMacroProducer.send_support_macro_updated(
             tenant_id=tenant_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update support macro")
     return macro
 
 
@@ -189,9 +198,10 @@ def delete_support_macro(
     """Delete a support macro and publish a deletion event."""
     macro = get_support_macro(db, tenant_id=tenant_id, macro_id=macro_id)
     db.delete(macro)
-    commit_or_raise(db, action="delete support macro")
+    flush_or_raise(db, action="delete support macro")
     deleted_dt = datetime.utcnow().isoformat()
     SupportMacroProducer.send_support_macro_deleted(tenant_id=tenant_id, deleted_dt=deleted_dt)
+    commit_or_raise(db, action="delete support macro")
     return None
 
 
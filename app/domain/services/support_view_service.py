@@ -13,12 +13,13 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.domain.models.support_view import SupportView
+from app.domain.models.ticket import Ticket
 from app.domain.schemas.support_view import (
     SupportViewUpdate,
     TenantCreateSupportView,
@@ -28,10 +29,39 @@ from app.domain.schemas.events.support_view_event import SupportViewDelta
 from app.messaging.producers.support_view_producer import (
     SupportViewMessageProducer as SupportViewProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger("support_view_service")
 
+# Ticket columns a view's ``filter_definition`` may constrain.  Values
+# are a single value or a list of accepted values.
+VIEW_FILTER_FIELDS = (
+    "status",
+    "priority",
+    "ticket_type",
+    "work_mode",
+    "assigned_user_id",
+    "assigned_group_id",
+    "requester_contact_id",
+    "company_id",
+    "inbound_channel_id",
+)
+_VIEW_UUID_FIELDS = frozenset(f for f in VIEW_FILTER_FIELDS if f.endswith("_id"))
+
+# Ticket columns a view's ``sort_definition`` ({"field", "direction"}) may use
+VIEW_SORT_FIELDS = (
+    "created_at",
+    "updated_at",
+    "last_message_at",
+    "status",
+    "priority",
+    "subject",
+)
+
 
 def _snapshot(view: SupportView) -> Dict[str, Any]:
     """Return a dictionary representation of a SupportView suitable for event payloads."""
@@ -69,7 +99,10 @@ def list_support_views(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[SupportView], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[SupportView], Optional[int]]:
     """List support views with optional filtering by active status and tenant.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.
@@ -90,13 +123,16 @@ def list_support_views(
         query = query.filter(SupportView.tenant_id == tenant_id)
     if is_active is not None:
         query = query.filter(SupportView.is_active == is_active)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(SupportView.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        SupportView,
+        order_by=(SupportView.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_support_view(
@@ -124,9 +160,10 @@ def create_support_view(
         updated_by=created_by,
     )
     db.add(view)
-    commit_or_raise(db, refresh=view, action="create support view")
+    flush_or_raise(db, refresh=view, action="create support view")
     snapshot = _snapshot(view)
     SupportViewProducer.send_support_view_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create support view")
     return view
 
 
@@ -151,6 +188,79 @@ def get_support_view(
     return view
 
 
+def _view_filter_values(field: str, value: Any) -> List[Any]:
+    values = value if isinstance(value, list) else [value]
+    if field not in _VIEW_UUID_FIELDS:
+        return values
+    try:
+        return [uuid.UUID(str(v)) for v in values]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Support view filter {field} must contain UUIDs",
+        )
+
+
+def execute_support_view(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    view_id: uuid.UUID,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Ticket], Optional[int]]:
+    """Return the tenant's tickets matching a saved view.
+
+    Each key of ``filter_definition`` names a ticket column from
+    :data:`VIEW_FILTER_FIELDS`; list values match any of their items.
+    ``sort_definition`` (``{"field": ..., "direction": "asc"|"desc"}``)
+    orders offset-mode pages; keyset pages are always newest first.
+    Unsupported filter or sort fields raise 400.
+    """
+    view = get_support_view(db, tenant_id=tenant_id, view_id=view_id)
+    query = db.query(Ticket).filter(Ticket.tenant_id == tenant_id)
+    for field, value in (view.filter_definition or {}).items():
+        if field not in VIEW_FILTER_FIELDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported support view filter: {field}",
+            )
+        values = _view_filter_values(field, value)
+        column = getattr(Ticket, field)
+        query = query.filter(column.in_(values) if len(values) > 1 else column == values[0])
+    order_by: Tuple[Any, ...] = (Ticket.created_at.desc(),)
+    sort = view.sort_definition or {}
+    if sort.get("field"):
+        if sort["field"] not in VIEW_SORT_FIELDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported support view sort field: {sort['field']}",
+            )
+        column = getattr(Ticket, sort["field"])
+        descending = str(sort.get("direction", "asc")).lower() == "desc"
+        order_by = (column.desc() if descending else column.asc(), Ticket.id.asc())
+    return paginate(
+        query,
+        Ticket,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+
+
+async def execute_support_view_async(
+    db: AsyncSession, **kwargs: Any
+) -> Tuple[List[Ticket], Optional[int]]:
+    """Async variant of :func:`execute_support_view` (see ``run_sync``)."""
+    return await db.run_sync(lambda session: execute_support_view(session, **kwargs))
+
+
 def update_support_view(
     db: Session,
     *,
@@ -172,13 +282,14 @@ def update_support_view(
             setattr(view, field, value)
         view.updated_by = updated_by
         view.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=view, action="update support view")
+        flush_or_raise(db, refresh=view, action="update support view")
         snapshot = _snapshot(view)
         SupportViewProducer.send_support_view_updated(
             tenant_id=tenant_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update support view")
     return view
 
 
@@ -191,9 +302,10 @@ def delete_support_view(
     """Delete a support view and publish a deletion event."""
     view = get_support_view(db, tenant_id=tenant_id, view_id=view_id)
     db.delete(view)
-    commit_or_raise(db, action="delete support view")
+    flush_or_raise(db, action="delete support view")
     deleted_dt = datetime.utcnow().isoformat()
     SupportViewProducer.send_support_view_deleted(tenant_id=tenant_id, deleted_dt=deleted_dt)
+    commit_or_raise(db, action="delete support view")
     return None
 
 
@@ -201,6 +313,8 @@ __all__ = [
     "list_support_views",
     "create_support_view",
     "get_support_view",
+    "execute_support_view",
+    "execute_support_view_async",
     "update_support_view",
     "delete_support_view",
 ]
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+In-process cache of tenant configuration.
+
+Ticket forms, field definitions, form fields, SLA policies and targets,
+pipelines and group profiles change rarely but are read on many
+requests (deal validation, form and SLA lookups); the SLA engine's
+per-tenant context combines policies, targets, group profiles and
+business hours.  Services cache detached copies of them per tenant for
+``TENANT_CONFIG_CACHE_TTL_SECONDS``.
+
+Entries are dropped once a created/updated/deleted event of the
+producer for that configuration is released, i.e. after the transaction
+of the change has committed, so a concurrent load cannot cache the old
+row again (business hours publish no events; their service calls
+:func:`invalidate_domain` after committing instead):
+
+* in the process that made the change, through a producer event
+  listener registered when this module is imported;
+* in every other API process, through a ``config_cache.invalidated``
+  broadcast consumed by ``app.messaging.config_cache``.
+
+Cached values must not be bound to a session: store Pydantic models,
+tuples or plain values, never ORM instances.  Load them from the
+primary, never through ``get_read_db``: right after an invalidation a
+lagging replica could put the old row back for the full TTL.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from app.core.config import Config
+from app.messaging.producers.common import add_event_listener
+
+
+logger = logging.getLogger("tenant_config_cache")
+
+# Producer event domain -> cache kinds holding data derived from it
+EVENT_KINDS: Dict[str, Tuple[str, ...]] = {
+    "ticket_form": ("ticket_form",),
+    "ticket_field_def": ("ticket_field_def",),
+    "ticket_form_field": ("ticket_form_field",),
+    "sla_policy": ("sla_policy", "sla_context"),
+    "sla_target": ("sla_target", "sla_context"),
+    "pipeline": ("pipeline",),
+    "pipeline_stage": ("pipeline_stage",),
+    "group_profile": ("group_profile", "sla_context"),
+    "business_hours": ("sla_context",),
+}
+
+# Identifies this process in broadcasts so it can skip its own messages
+PROCESS_ORIGIN = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+class TenantConfigCache:
+    """TTL cache of configuration values grouped by tenant and kind.
+
+    Each tenant carries a generation counter that is bumped by
+    :meth:`invalidate`; a value loaded while an invalidation happened
+    is returned to its caller but not stored, so a concurrent change is
+    never cached as current.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # tenant -> {(kind, key): (expires_at, value)}
+        self._entries: Dict[str, Dict[Tuple[str, Hashable], Tuple[float, Any]]] = {}
+        self._generations: Dict[str, int] = {}
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return Config.tenant_config_cache_ttl_seconds()
+
+    def get_or_load(
+        self,
+        tenant_id: Any,
+        kind: str,
+        key: Hashable,
+        loader: Callable[[], Any],
+    ) -> Any:
+        """Return the cached value or call ``loader`` and cache its result.
+
+        ``None`` results are not cached, so a lookup of a missing row
+        keeps hitting the database until the row exists.
+        """
+        ttl = self.ttl_seconds
+        if ttl <= 0:
+            return loader()
+        tenant = str(tenant_id)
+        entry_key = (kind, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(tenant, {}).get(entry_key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = self._generations.get(tenant, 0)
+        value = loader()
+        if value is None:
+            return value
+        with self._lock:
+            if self._generations.get(tenant, 0) == generation:
+                self._entries.setdefault(tenant, {})[entry_key] = (now + ttl, value)
+        return value
+
+    def invalidate(self, tenant_id: Any, kinds: Optional[Iterable[str]] = None) -> None:
+        """Drop ``kinds`` (all kinds when omitted) cached for ``tenant_id``."""
+        tenant = str(tenant_id)
+        with self._lock:
+            self._generations[tenant] = self._generations.get(tenant, 0) + 1
+            entries = self._entries.get(tenant)
+            if not entries:
+                return
+            if kinds is None:
+                del self._entries[tenant]
+                return
+            dropped: Set[str] = set(kinds)
+            for entry_key in [k for k in entries if k[0] in dropped]:
+                del entries[entry_key]
+
+    def clear(self) -> None:
+        """Drop every cached entry (e.g. after losing the broadcast feed)."""
+        with self._lock:
+            for tenant in self._entries:
+                self._generations[tenant] = self._generations.get(tenant, 0) + 1
+            self._entries.clear()
+
+
+tenant_config_cache = TenantConfigCache()
+
+
+def kinds_for_event(task_name: str) -> Tuple[str, ...]:
+    """Return the cache kinds affected by producer event ``task_name``."""
+    parts = task_name.split(".")
+    if len(parts) != 3:
+        return ()
+    return EVENT_KINDS.get(parts[1], ())
+
+
+def _invalidate(tenant_id: Any, kinds: Tuple[str, ...]) -> None:
+    tenant_config_cache.invalidate(tenant_id, kinds)
+    if Config.tenant_config_cache_broadcast():
+        from app.messaging.producers.config_cache_producer import (
+            ConfigCacheMessageProducer,
+        )
+
+        ConfigCacheMessageProducer.send_config_cache_invalidated(
+            tenant_id=uuid.UUID(str(tenant_id)), kinds=kinds, origin=PROCESS_ORIGIN
+        )
+
+
+def _on_event(task_name: str, envelope: Dict[str, Any]) -> None:
+    kinds = kinds_for_event(task_name)
+    tenant_id = envelope.get("tenant_id")
+    if not kinds or not tenant_id:
+        return
+    _invalidate(tenant_id, kinds)
+
+
+def invalidate_domain(tenant_id: Any, domain: str) -> None:
+    """Drop the kinds derived from ``domain`` here and in other processes.
+
+    For configuration that publishes no events; call it after the
+    change has been committed.
+    """
+    _invalidate(tenant_id, EVENT_KINDS[domain])
+
+
+def apply_invalidation(data: Dict[str, Any]) -> None:
+    """Apply the ``data`` of a ``config_cache.invalidated`` event."""
+    if data.get("origin") == PROCESS_ORIGIN:
+        return
+    logger.debug(
+        "Invalidating config cache for tenant %s: %s", data.get("tenant_id"), data.get("kinds")
+    )
+    tenant_config_cache.invalidate(data["tenant_id"], data.get("kinds") or None)
+
+
+add_event_listener(_on_event)
+
+
+__all__ = [
+    "EVENT_KINDS",
+    "PROCESS_ORIGIN",
+    "TenantConfigCache",
+    "tenant_config_cache",
+    "kinds_for_event",
+    "invalidate_domain",
+    "apply_invalidation",
+]
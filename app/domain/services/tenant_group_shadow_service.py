@@ -21,6 +21,7 @@ from app.domain.models.tenant_group_shadow import TenantGroupShadow
 from app.domain.schemas.tenant_group_shadow import CreateTenantGroupShadow
 
 from app.domain.services.common_service import commit_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("tenant_group_shadow_service")
 
@@ -33,7 +34,10 @@ def list_tenant_groups(
     key: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TenantGroupShadow], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TenantGroupShadow], Optional[int]]:
     """List projected groups for a tenant with optional filtering.
 
     Parameters mirror those of other list functions.  Filters use
@@ -55,13 +59,16 @@ def list_tenant_groups(
     if key:
         query = query.filter(TenantGroupShadow.group_key == key)
 
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TenantGroupShadow.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        TenantGroupShadow,
+        order_by=(TenantGroupShadow.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def get_tenant_group(
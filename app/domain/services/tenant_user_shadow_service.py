@@ -27,6 +27,7 @@ from app.domain.models.tenant_user_shadow import TenantUserShadow
 from app.domain.schemas.tenant_user_shadow import CreateTenantUserShadow
 
 from app.domain.services.common_service import commit_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("tenant_user_shadow_service")
 
@@ -39,7 +40,10 @@ def list_tenant_users(
     email: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TenantUserShadow], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TenantUserShadow], Optional[int]]:
     """List projected users for a tenant with optional filtering.
 
     Parameters
@@ -56,6 +60,10 @@ def list_tenant_users(
         Maximum number of results to return.  If None, return all.
     offset : Optional[int], optional
         Number of records to skip before returning results.
+    cursor : Optional[str], optional
+        Opaque keyset cursor from a previous page; enables keyset mode.
+    page_size : Optional[int], optional
+        Keyset page size; enables keyset mode, in which ``total`` is None.
 
     Returns
     -------
@@ -83,16 +91,17 @@ def list_tenant_users(
         ilike_pattern = f"%{email.lower()}%"
         query = query.filter(TenantUserShadow.email.ilike(ilike_pattern))
 
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    # Order results by created_at descending to match other list endpoints
-    query = query.order_by(TenantUserShadow.created_at.desc())
-
-    results = query.all()
-    return results, total
+    return paginate(
+        query,
+        TenantUserShadow,
+        order_by=(TenantUserShadow.created_at.desc(),),
+        id_column=TenantUserShadow.user_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def get_tenant_user(
@@ -23,7 +23,8 @@ from app.domain.schemas.events.ticket_ai_work_ref_event import TicketAiWorkRefDe
 from app.messaging.producers.ticket_ai_work_ref_producer import (
     TicketAiWorkRefMessageProducer as Producer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("ticket_ai_work_ref_service")
 
@@ -77,7 +78,10 @@ def list_ticket_ai_work_refs(
     agent_key: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketAiWorkRef], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketAiWorkRef], Optional[int]]:
     """List ticket AI work references for a tenant with optional filtering by ticket and agent."""
     logger.debug(
         "Listing AI work refs: tenant_id=%s, ticket_id=%s, agent_key=%s, limit=%s, offset=%s",
@@ -92,13 +96,17 @@ def list_ticket_ai_work_refs(
         query = query.filter(TicketAiWorkRef.ticket_id == ticket_id)
     if agent_key:
         query = query.filter(TicketAiWorkRef.agent_key == agent_key)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TicketAiWorkRef.requested_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        TicketAiWorkRef,
+        order_by=(TicketAiWorkRef.requested_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        sort_column=TicketAiWorkRef.requested_at,
+        total_mode=total_mode,
+    )
 
 
 def get_ticket_ai_work_ref(
@@ -187,9 +195,10 @@ def upsert_ticket_ai_work_ref(
             created_by=request.created_by or updated_by,
         )
         db.add(ref)
-        commit_or_raise(db, refresh=ref, action="create ticket AI work ref")
+        flush_or_raise(db, refresh=ref, action="create ticket AI work ref")
         snapshot = _snapshot(ref)
         Producer.send_ticket_ai_work_ref_created(tenant_id=tenant_id, payload=snapshot)
+        commit_or_raise(db, action="create ticket AI work ref")
         return ref
     # Else update existing
     updates: Dict[str, Any] = {}
@@ -214,13 +223,14 @@ def upsert_ticket_ai_work_ref(
     if delta.base_fields:
         for field, value in delta.base_fields.items():
             setattr(ref, field, value)
-        commit_or_raise(db, refresh=ref, action="update ticket AI work ref")
+        flush_or_raise(db, refresh=ref, action="update ticket AI work ref")
         snapshot = _snapshot(ref)
         Producer.send_ticket_ai_work_ref_updated(
             tenant_id=tenant_id,
             delta=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update ticket AI work ref")
     return ref
 
 
@@ -234,8 +244,9 @@ def delete_ticket_ai_work_ref(
     ref = get_ticket_ai_work_ref(db, tenant_id=tenant_id, ref_id=ref_id)
     payload = _snapshot(ref)
     db.delete(ref)
-    commit_or_raise(db, action="delete ticket AI work ref")
+    flush_or_raise(db, action="delete ticket AI work ref")
     Producer.send_ticket_ai_work_ref_deleted(tenant_id=tenant_id, payload=payload)
+    commit_or_raise(db, action="delete ticket AI work ref")
     return None
 
 
@@ -28,7 +28,7 @@ from app.domain.schemas.ticket_assignment import (
 from app.messaging.producers.ticket_assignment_producer import (
     TicketAssignmentMessageProducer as AssignmentProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
 
 logger = logging.getLogger("ticket_assignment_service")
 
@@ -95,9 +95,10 @@ def create_ticket_assignment(
         created_by=created_by,
     )
     db.add(assignment)
-    commit_or_raise(db, refresh=assignment, action="create ticket assignment")
+    flush_or_raise(db, refresh=assignment, action="create ticket assignment")
     snapshot = _snapshot(assignment)
     AssignmentProducer.send_ticket_assignment_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create ticket assignment")
     return assignment
 
 
@@ -28,7 +28,7 @@ from app.domain.schemas.ticket_attachment import (
 from app.messaging.producers.ticket_attachment_producer import (
     TicketAttachmentMessageProducer as AttachmentProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
 
 logger = logging.getLogger("ticket_attachment_service")
 
@@ -118,10 +118,11 @@ def create_ticket_attachment(
         created_by=created_by,
     )
     db.add(attachment)
-    # Commit and refresh to get assigned id and timestamps
-    commit_or_raise(db, refresh=attachment, action="create ticket attachment")
+    # Flush and refresh to get assigned id and timestamps
+    flush_or_raise(db, refresh=attachment, action="create ticket attachment")
     snapshot = _snapshot(attachment)
     AttachmentProducer.send_ticket_attachment_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create ticket attachment")
     return attachment
 
 
@@ -165,10 +166,11 @@ def delete_ticket_attachment(
         db, tenant_id=tenant_id, ticket_id=ticket_id, attachment_id=attachment_id
     )
     db.delete(attachment)
-    commit_or_raise(db, action="delete ticket attachment")
+    flush_or_raise(db, action="delete ticket attachment")
     # Publish deletion event with timestamp
     AttachmentProducer.send_ticket_attachment_deleted(
         tenant_id=tenant_id,
         deleted_dt=datetime.utcnow().isoformat(),
     )
+    commit_or_raise(db, action="delete ticket attachment")
     return None
\ No newline at end of file
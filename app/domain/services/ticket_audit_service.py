@@ -23,7 +23,7 @@ from app.domain.models.ticket_audit import TicketAudit
 from app.messaging.producers.ticket_audit_producer import (
     TicketAuditMessageProducer as AuditProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
 
 logger = logging.getLogger("ticket_audit_service")
 
@@ -116,7 +116,8 @@ def create_ticket_audit(
     )
     # Note: TicketAudit has no created_by column; occurred_at is set explicitly.
     db.add(audit)
-    commit_or_raise(db, refresh=audit, action="create ticket audit")
+    flush_or_raise(db, refresh=audit, action="create ticket audit")
     snapshot = _snapshot(audit)
     AuditProducer.send_ticket_audit_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create ticket audit")
     return audit
\ No newline at end of file
@@ -24,12 +24,15 @@ from app.domain.schemas.ticket_field_def import (
     TicketFieldDefUpdate,
     TenantCreateTicketFieldDef,
     AdminCreateTicketFieldDef,
+    TicketFieldDefOut,
 )
 from app.domain.schemas.events.ticket_field_def_event import TicketFieldDefDelta
 from app.messaging.producers.ticket_field_def_producer import (
     TicketFieldDefMessageProducer as TicketFieldDefProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import tenant_config_cache
 
 logger = logging.getLogger("ticket_field_def_service")
 
@@ -73,7 +76,10 @@ def list_ticket_field_defs(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketFieldDef], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketFieldDef], Optional[int]]:
     """List ticket field definitions with optional filtering by type and active status.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.
@@ -97,13 +103,16 @@ def list_ticket_field_defs(
         query = query.filter(TicketFieldDef.field_type == field_type)
     if is_active is not None:
         query = query.filter(TicketFieldDef.is_active == is_active)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TicketFieldDef.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        TicketFieldDef,
+        order_by=(TicketFieldDef.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_ticket_field_def(
@@ -136,11 +145,12 @@ def create_ticket_field_def(
         updated_by=created_by,
     )
     db.add(defn)
-    commit_or_raise(db, refresh=defn, action="create ticket field definition")
+    flush_or_raise(db, refresh=defn, action="create ticket field definition")
     snapshot = _snapshot(defn)
     TicketFieldDefProducer.send_ticket_field_def_created(
         tenant_id=tenant_id, payload=snapshot
     )
+    commit_or_raise(db, action="create ticket field definition")
     return defn
 
 
@@ -169,6 +179,27 @@ def get_ticket_field_def(
     return defn
 
 
+def get_ticket_field_def_config(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    field_def_id: uuid.UUID,
+) -> TicketFieldDefOut:
+    """Retrieve a ticket field definition as a detached ``TicketFieldDefOut``.
+
+    Served from the tenant configuration cache; entries are dropped
+    when the ticket field definition changes.
+    """
+    return tenant_config_cache.get_or_load(
+        tenant_id,
+        "ticket_field_def",
+        field_def_id,
+        lambda: TicketFieldDefOut.model_validate(
+            get_ticket_field_def(db, tenant_id=tenant_id, field_def_id=field_def_id), from_attributes=True
+        ),
+    )
+
+
 def update_ticket_field_def(
     db: Session,
     *,
@@ -190,13 +221,14 @@ def update_ticket_field_def(
             setattr(defn, field, value)
         defn.updated_by = updated_by
         defn.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=defn, action="update ticket field definition")
+        flush_or_raise(db, refresh=defn, action="update ticket field definition")
         snapshot = _snapshot(defn)
         TicketFieldDefProducer.send_ticket_field_def_updated(
             tenant_id=tenant_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update ticket field definition")
     return defn
 
 
@@ -209,11 +241,12 @@ def delete_ticket_field_def(
     """Delete a ticket field definition and publish a deletion event."""
     defn = get_ticket_field_def(db, tenant_id=tenant_id, field_def_id=field_def_id)
     db.delete(defn)
-    commit_or_raise(db, action="delete ticket field definition")
+    flush_or_raise(db, action="delete ticket field definition")
     deleted_dt = datetime.utcnow().isoformat()
     TicketFieldDefProducer.send_ticket_field_def_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete ticket field definition")
     return None
 
 
@@ -221,6 +254,7 @@ __all__ = [
     "list_ticket_field_defs",
     "create_ticket_field_def",
     "get_ticket_field_def",
+    "get_ticket_field_def_config",
     "update_ticket_field_def",
     "delete_ticket_field_def",
 ]
\ No newline at end of file
@@ -31,7 +31,8 @@ from app.domain.schemas.events.ticket_field_value_event import (
 from app.messaging.producers.ticket_field_value_producer import (
     TicketFieldValueMessageProducer as TicketFieldValueProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("ticket_field_value_service")
 
@@ -78,7 +79,10 @@ def list_ticket_field_values(
     ticket_field_def_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketFieldValue], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketFieldValue], Optional[int]]:
     """List ticket field values for a specific ticket within a tenant.
 
     Optionally filter by a specific field definition.  Results are ordered
@@ -101,13 +105,17 @@ def list_ticket_field_values(
         query = query.filter(
             TicketFieldValue.ticket_field_def_id == ticket_field_def_id
         )
-    total = query.count()
-    query = query.order_by(TicketFieldValue.created_at.asc())
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    return query.all(), total
+    return paginate(
+        query,
+        TicketFieldValue,
+        order_by=(TicketFieldValue.created_at.asc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        descending=False,
+        total_mode=total_mode,
+    )
 
 
 def create_ticket_field_value(
@@ -139,11 +147,12 @@ def create_ticket_field_value(
         updated_by=created_by,
     )
     db.add(val)
-    commit_or_raise(db, refresh=val, action="create ticket field value")
+    flush_or_raise(db, refresh=val, action="create ticket field value")
     snapshot = _snapshot(val)
     TicketFieldValueProducer.send_ticket_field_value_created(
         tenant_id=tenant_id, payload=snapshot
     )
+    commit_or_raise(db, action="create ticket field value")
     return val
 
 
@@ -208,13 +217,14 @@ def update_ticket_field_value(
             setattr(val, field, value)
         val.updated_by = updated_by
         val.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=val, action="update ticket field value")
+        flush_or_raise(db, refresh=val, action="update ticket field value")
         snapshot = _snapshot(val)
         TicketFieldValueProducer.send_ticket_field_value_updated(
             tenant_id=tenant_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update ticket field value")
     return val
 
 
@@ -230,11 +240,12 @@ def delete_ticket_field_value(
         db, tenant_id=tenant_id, ticket_id=ticket_id, value_id=value_id
     )
     db.delete(val)
-    commit_or_raise(db, action="delete ticket field value")
+    flush_or_raise(db, action="delete ticket field value")
     deleted_dt = datetime.utcnow().isoformat()
     TicketFieldValueProducer.send_ticket_field_value_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete ticket field value")
     return None
 
 
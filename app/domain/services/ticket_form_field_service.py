@@ -24,6 +24,7 @@ from app.domain.schemas.ticket_form_field import (
     TicketFormFieldUpdate,
     TenantCreateTicketFormField,
     AdminCreateTicketFormField,
+    TicketFormFieldOut,
 )
 from app.domain.schemas.events.ticket_form_field_event import (
     TicketFormFieldDelta,
@@ -31,7 +32,9 @@ from app.domain.schemas.events.ticket_form_field_event import (
 from app.messaging.producers.ticket_form_field_producer import (
     TicketFormFieldMessageProducer as TicketFormFieldProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import tenant_config_cache
 
 logger = logging.getLogger("ticket_form_field_service")
 
@@ -69,7 +72,10 @@ def list_ticket_form_fields(
     ticket_field_def_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketFormField], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketFormField], Optional[int]]:
     """List ticket form fields with optional filtering by form and field definition.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.  Optional
@@ -93,13 +99,17 @@ def list_ticket_form_fields(
         query = query.filter(TicketFormField.ticket_form_id == ticket_form_id)
     if ticket_field_def_id:
         query = query.filter(TicketFormField.ticket_field_def_id == ticket_field_def_id)
-    total = query.count()
-    query = query.order_by(TicketFormField.display_order.asc())
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    return query.all(), total
+    return paginate(
+        query,
+        TicketFormField,
+        order_by=(TicketFormField.display_order.asc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        descending=False,
+        total_mode=total_mode,
+    )
 
 
 def create_ticket_form_field(
@@ -125,11 +135,12 @@ def create_ticket_form_field(
         created_by=created_by,
     )
     db.add(ff)
-    commit_or_raise(db, refresh=ff, action="create ticket form field")
+    flush_or_raise(db, refresh=ff, action="create ticket form field")
     snapshot = _snapshot(ff)
     TicketFormFieldProducer.send_ticket_form_field_created(
         tenant_id=tenant_id, payload=snapshot
     )
+    commit_or_raise(db, action="create ticket form field")
     return ff
 
 
@@ -160,6 +171,27 @@ def get_ticket_form_field(
     return ff
 
 
+def get_ticket_form_field_config(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    form_field_id: uuid.UUID,
+) -> TicketFormFieldOut:
+    """Retrieve a ticket form field as a detached ``TicketFormFieldOut``.
+
+    Served from the tenant configuration cache; entries are dropped
+    when the ticket form field changes.
+    """
+    return tenant_config_cache.get_or_load(
+        tenant_id,
+        "ticket_form_field",
+        form_field_id,
+        lambda: TicketFormFieldOut.model_validate(
+            get_ticket_form_field(db, tenant_id=tenant_id, form_field_id=form_field_id), from_attributes=True
+        ),
+    )
+
+
 def update_ticket_form_field(
     db: Session,
     *,
@@ -179,13 +211,14 @@ def update_ticket_form_field(
             setattr(ff, field, value)
         # update audit
         # There is no updated_at or updated_by on TicketFormField; created_at and created_by only
-        commit_or_raise(db, refresh=ff, action="update ticket form field")
+        flush_or_raise(db, refresh=ff, action="update ticket form field")
         snapshot = _snapshot(ff)
         TicketFormFieldProducer.send_ticket_form_field_updated(
             tenant_id=tenant_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update ticket form field")
     return ff
 
 
@@ -198,11 +231,12 @@ def delete_ticket_form_field(
     """Delete a ticket form field and publish a deletion event."""
     ff = get_ticket_form_field(db, tenant_id=tenant_id, form_field_id=form_field_id)
     db.delete(ff)
-    commit_or_raise(db, action="delete ticket form field")
+    flush_or_raise(db, action="delete ticket form field")
     deleted_dt = datetime.utcnow().isoformat()
     TicketFormFieldProducer.send_ticket_form_field_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete ticket form field")
     return None
 
 
@@ -210,6 +244,7 @@ __all__ = [
     "list_ticket_form_fields",
     "create_ticket_form_field",
     "get_ticket_form_field",
+    "get_ticket_form_field_config",
     "update_ticket_form_field",
     "delete_ticket_form_field",
 ]
\ No newline at end of file
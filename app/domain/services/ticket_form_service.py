@@ -23,12 +23,15 @@ from app.domain.schemas.ticket_form import (
     TicketFormUpdate,
     TenantCreateTicketForm,
     AdminCreateTicketForm,
+    TicketFormOut,
 )
 from app.domain.schemas.events.ticket_form_event import TicketFormDelta
 from app.messaging.producers.ticket_form_producer import (
     TicketFormMessageProducer as TicketFormProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.tenant_config_cache import tenant_config_cache
 
 logger = logging.getLogger("ticket_form_service")
 
@@ -69,7 +72,10 @@ def list_ticket_forms(
     is_active: Optional[bool] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketForm], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketForm], Optional[int]]:
     """List ticket forms with optional filtering by active status and tenant.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.
@@ -89,13 +95,16 @@ def list_ticket_forms(
         query = query.filter(TicketForm.tenant_id == tenant_id)
     if is_active is not None:
         query = query.filter(TicketForm.is_active == is_active)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TicketForm.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        TicketForm,
+        order_by=(TicketForm.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_ticket_form(
@@ -122,9 +131,10 @@ def create_ticket_form(
         updated_by=created_by,
     )
     db.add(form)
-    commit_or_raise(db, refresh=form, action="create ticket form")
+    flush_or_raise(db, refresh=form, action="create ticket form")
     snapshot = _snapshot(form)
     TicketFormProducer.send_ticket_form_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create ticket form")
     return form
 
 
@@ -151,6 +161,27 @@ def get_ticket_form(
     return form
 
 
+def get_ticket_form_config(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    form_id: uuid.UUID,
+) -> TicketFormOut:
+    """Retrieve a ticket form as a detached ``TicketFormOut``.
+
+    Served from the tenant configuration cache; entries are dropped
+    when the ticket form changes.
+    """
+    return tenant_config_cache.get_or_load(
+        tenant_id,
+        "ticket_form",
+        form_id,
+        lambda: TicketFormOut.model_validate(
+            get_ticket_form(db, tenant_id=tenant_id, form_id=form_id), from_attributes=True
+        ),
+    )
+
+
 def update_ticket_form(
     db: Session,
     *,
@@ -172,13 +203,14 @@ def update_ticket_form(
             setattr(form, field, value)
         form.updated_by = updated_by
         form.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=form, action="update ticket form")
+        flush_or_raise(db, refresh=form, action="update ticket form")
         snapshot = _snapshot(form)
         TicketFormProducer.send_ticket_form_updated(
             tenant_id=tenant_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update ticket form")
     return form
 
 
@@ -191,9 +223,10 @@ def delete_ticket_form(
     """Delete a ticket form and publish a deletion event."""
     form = get_ticket_form(db, tenant_id=tenant_id, form_id=form_id)
     db.delete(form)
-    commit_or_raise(db, action="delete ticket form")
+    flush_or_raise(db, action="delete ticket form")
     deleted_dt = datetime.utcnow().isoformat()
     TicketFormProducer.send_ticket_form_deleted(tenant_id=tenant_id, deleted_dt=deleted_dt)
+    commit_or_raise(db, action="delete ticket form")
     return None
 
 
@@ -201,6 +234,7 @@ __all__ = [
     "list_ticket_forms",
     "create_ticket_form",
     "get_ticket_form",
+    "get_ticket_form_config",
     "update_ticket_form",
     "delete_ticket_form",
 ]
\ No newline at end of file
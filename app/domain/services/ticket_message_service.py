@@ -27,7 +27,7 @@ from app.domain.schemas.ticket_message import (
 from app.messaging.producers.ticket_message_producer import (
     TicketMessageMessageProducer as MessageProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
 
 logger = logging.getLogger("ticket_message_service")
 
@@ -122,7 +122,8 @@ def create_ticket_message(
         created_by=created_by,
     )
     db.add(message)
-    commit_or_raise(db, refresh=message, action="create ticket message")
+    flush_or_raise(db, refresh=message, action="create ticket message")
     snapshot = _snapshot(message)
     MessageProducer.send_ticket_message_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create ticket message")
     return message
\ No newline at end of file
@@ -28,7 +28,8 @@ from app.domain.schemas.events.ticket_metrics_event import TicketMetricsDelta
 from app.messaging.producers.ticket_metrics_producer import (
     TicketMetricsMessageProducer as TicketMetricsProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("ticket_metrics_service")
 
@@ -66,7 +67,10 @@ def list_ticket_metrics(
     ticket_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketMetrics], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketMetrics], Optional[int]]:
     """List ticket metrics for a tenant with optional filtering by ticket.
 
     Returns a tuple of the list of metrics records and the total count.
@@ -82,13 +86,16 @@ def list_ticket_metrics(
     query = db.query(TicketMetrics).filter(TicketMetrics.tenant_id == tenant_id)
     if ticket_id:
         query = query.filter(TicketMetrics.ticket_id == ticket_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TicketMetrics.updated_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        TicketMetrics,
+        order_by=(TicketMetrics.updated_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def create_ticket_metrics(
@@ -113,11 +120,12 @@ def create_ticket_metrics(
         updated_by=created_by,
     )
     db.add(metrics)
-    commit_or_raise(db, refresh=metrics, action="create ticket metrics")
+    flush_or_raise(db, refresh=metrics, action="create ticket metrics")
     snapshot = _snapshot(metrics)
     TicketMetricsProducer.send_ticket_metrics_created(
         tenant_id=request.tenant_id, payload=snapshot
     )
+    commit_or_raise(db, action="create ticket metrics")
     return metrics
 
 
@@ -166,13 +174,14 @@ def update_ticket_metrics(
         setattr(metrics, field, value)
     metrics.updated_by = updated_by
     metrics.updated_at = datetime.utcnow()
-    commit_or_raise(db, refresh=metrics, action="update ticket metrics")
+    flush_or_raise(db, refresh=metrics, action="update ticket metrics")
     snapshot = _snapshot(metrics)
     TicketMetricsProducer.send_ticket_metrics_updated(
         tenant_id=tenant_id,
         changes=delta,
         payload=snapshot,
     )
+    commit_or_raise(db, action="update ticket metrics")
     return metrics
 
 
@@ -185,10 +194,11 @@ def delete_ticket_metrics(
     """Delete a metrics record and publish a deleted event."""
     metrics = get_ticket_metrics(db, tenant_id=tenant_id, metrics_id=metrics_id)
     db.delete(metrics)
-    commit_or_raise(db, action="delete ticket metrics")
+    flush_or_raise(db, action="delete ticket metrics")
     # Provide deletion timestamp in ISO format
     deleted_dt = datetime.utcnow().isoformat()
     TicketMetricsProducer.send_ticket_metrics_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete ticket metrics")
     return None
\ No newline at end of file
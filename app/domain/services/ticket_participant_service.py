@@ -28,7 +28,7 @@ from app.domain.schemas.ticket_participant import (
 from app.messaging.producers.ticket_participant_producer import (
     TicketParticipantMessageProducer as ParticipantProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
 
 logger = logging.getLogger("ticket_participant_service")
 
@@ -100,9 +100,10 @@ def create_ticket_participant(
         created_by=created_by,
     )
     db.add(participant)
-    commit_or_raise(db, refresh=participant, action="create ticket participant")
+    flush_or_raise(db, refresh=participant, action="create ticket participant")
     snapshot = _snapshot(participant)
     ParticipantProducer.send_ticket_participant_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create ticket participant")
     return participant
 
 
@@ -146,10 +147,11 @@ def delete_ticket_participant(
         db, tenant_id=tenant_id, ticket_id=ticket_id, participant_id=participant_id
     )
     db.delete(participant)
-    commit_or_raise(db, action="delete ticket participant")
+    flush_or_raise(db, action="delete ticket participant")
     # Publish deletion event with timestamp
     ParticipantProducer.send_ticket_participant_deleted(
         tenant_id=tenant_id,
         deleted_dt=datetime.utcnow().isoformat(),
     )
+    commit_or_raise(db, action="delete ticket participant")
     return None
\ No newline at end of file
@@ -6,7 +6,8 @@ created and updated in a tenant context; admin operations allow
 cross‑tenant management.  Listing operations support optional
 filters on status, priority and assignee.  After successful
 mutations, domain events are published via the ticket message
-producer.
+producer.  Creating a ticket, or changing a field its SLA depends on,
+recomputes its SLA due dates in the same transaction.
 """
 
 from __future__ import annotations
@@ -14,7 +15,7 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
@@ -27,47 +28,38 @@ from app.domain.schemas.ticket import (
 )
 from app.domain.schemas.events.ticket_event import TicketDelta
 from app.messaging.producers.ticket_producer import TicketMessageProducer as TicketProducer
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services import sla_engine_service
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.export_service import ExportSpec
+from app.domain.services.pagination_service import TotalMode, paginate
+from app.domain.services.resource_version_service import resource_version
+from app.util.serialization import column_extractor
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger("ticket_service")
 
+# Columns streamed by GET /tenants/{tenant_id}/tickets/export
+EXPORT_SPEC = ExportSpec("tickets", Ticket)
+
 
-def _snapshot(ticket: Ticket) -> Dict[str, Any]:
-    """Return a dictionary representation of a Ticket suitable for event payloads."""
-    return {
-        "id": ticket.id,
-        "tenant_id": ticket.tenant_id,
-        "requester_contact_id": ticket.requester_contact_id,
-        "company_id": ticket.company_id,
-        "inbound_channel_id": ticket.inbound_channel_id,
-        "ticket_form_id": ticket.ticket_form_id,
-        "subject": ticket.subject,
-        "description": ticket.description,
-        "status": ticket.status,
-        "priority": ticket.priority,
-        "ticket_type": ticket.ticket_type,
-        "assigned_group_id": ticket.assigned_group_id,
-        "assigned_user_id": ticket.assigned_user_id,
-        "first_response_at": ticket.first_response_at.isoformat() if ticket.first_response_at else None,
-        "last_message_at": ticket.last_message_at.isoformat() if ticket.last_message_at else None,
-        "solved_at": ticket.solved_at.isoformat() if ticket.solved_at else None,
-        "closed_at": ticket.closed_at.isoformat() if ticket.closed_at else None,
-        "custom_fields": ticket.custom_fields,
-        "orchestration_workflow_key": ticket.orchestration_workflow_key,
-        "orchestration_instance_id": ticket.orchestration_instance_id,
-        "orchestration_state": ticket.orchestration_state,
-        "work_mode": ticket.work_mode,
-        "ai_status": ticket.ai_status,
-        "ai_last_session_id": ticket.ai_last_session_id,
-        "ai_last_agent_key": ticket.ai_last_agent_key,
-        "ai_last_outcome": ticket.ai_last_outcome,
-        "ai_last_confidence": float(ticket.ai_last_confidence) if ticket.ai_last_confidence is not None else None,
-        "ai_last_completed_at": ticket.ai_last_completed_at.isoformat() if ticket.ai_last_completed_at else None,
-        "created_at": ticket.created_at.isoformat() if ticket.created_at else None,
-        "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else None,
-        "created_by": ticket.created_by,
-        "updated_by": ticket.updated_by,
-    }
+# Built once at import; the float converter keeps the Numeric
+# confidence as a JSON number, everything else is encoded as loaded.
+_snapshot = column_extractor(
+    Ticket,
+    (
+        "id", "tenant_id", "requester_contact_id", "company_id", "inbound_channel_id",
+        "ticket_form_id", "subject", "description", "status", "priority",
+        "ticket_type", "assigned_group_id", "assigned_user_id", "first_response_at",
+        "last_message_at", "solved_at", "closed_at", "custom_fields",
+        "orchestration_workflow_key", "orchestration_instance_id",
+        "orchestration_state", "work_mode", "ai_status", "ai_last_session_id",
+        "ai_last_agent_key", "ai_last_outcome", "ai_last_confidence",
+        "ai_last_completed_at", "created_at", "updated_at", "created_by", "updated_by",
+    ),
+    converters={"ai_last_confidence": float},
+)
 
 
 def _compute_delta(ticket: Ticket, updates: Dict[str, Any]) -> TicketDelta:
@@ -92,7 +84,10 @@ def list_tickets(
     assigned_group_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[Ticket], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[Ticket], Optional[int]]:
     """List tickets with optional filtering.
 
     If ``tenant_id`` is provided, results are scoped to that tenant.
@@ -121,13 +116,28 @@ def list_tickets(
         query = query.filter(Ticket.assigned_user_id == assigned_user_id)
     if assigned_group_id:
         query = query.filter(Ticket.assigned_group_id == assigned_group_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(Ticket.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        Ticket,
+        order_by=(Ticket.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
+
+
+async def list_tickets_async(
+    db: AsyncSession, **filters: Any
+) -> Tuple[List[Ticket], Optional[int]]:
+    """Async variant of :func:`list_tickets` for an ``AsyncSession``.
+
+    The query is built and paginated by the sync implementation inside
+    ``run_sync``; its statements go through the asyncpg driver, so the
+    event loop keeps serving other requests while the database works.
+    """
+    return await db.run_sync(lambda session: list_tickets(session, **filters))
 
 
 def create_ticket(
@@ -162,9 +172,11 @@ def create_ticket(
         updated_by=created_by,
     )
     db.add(ticket)
-    commit_or_raise(db, refresh=ticket, action="create ticket")
+    sla_engine_service.apply_ticket_sla(db, ticket)
+    flush_or_raise(db, refresh=ticket, action="create ticket")
     snapshot = _snapshot(ticket)
     TicketProducer.send_ticket_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create ticket")
     return ticket
 
 
@@ -188,6 +200,16 @@ def get_ticket(
     return ticket
 
 
+def get_ticket_version(
+    db: Session,
+    *,
+    tenant_id: uuid.UUID,
+    ticket_id: uuid.UUID,
+) -> Optional[str]:
+    """Return the version token of a ticket, or ``None`` if it does not exist."""
+    return resource_version(db, Ticket, tenant_id=tenant_id, resource_id=ticket_id)
+
+
 def update_ticket(
     db: Session,
     *,
@@ -221,11 +243,14 @@ def update_ticket(
             setattr(ticket, field, value)
         ticket.updated_by = updated_by
         ticket.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=ticket, action="update ticket")
+        if sla_engine_service.needs_recompute(delta.base_fields):
+            sla_engine_service.apply_ticket_sla(db, ticket)
+        flush_or_raise(db, refresh=ticket, action="update ticket")
         snapshot = _snapshot(ticket)
         TicketProducer.send_ticket_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update ticket")
     return ticket
 
 
@@ -238,9 +263,10 @@ def delete_ticket(
     """Delete a ticket and publish a deletion event."""
     ticket = get_ticket(db, tenant_id=tenant_id, ticket_id=ticket_id)
     db.delete(ticket)
-    commit_or_raise(db, action="delete ticket")
+    flush_or_raise(db, action="delete ticket")
     deleted_dt = datetime.utcnow().isoformat()
     TicketProducer.send_ticket_deleted(tenant_id=tenant_id, deleted_dt=deleted_dt)
+    commit_or_raise(db, action="delete ticket")
     return None
 
 
@@ -248,6 +274,7 @@ __all__ = [
     "list_tickets",
     "create_ticket",
     "get_ticket",
+    "get_ticket_version",
     "update_ticket",
     "delete_ticket",
 ]
\ No newline at end of file
@@ -25,12 +25,13 @@ from app.domain.schemas.events.ticket_sla_state_event import TicketSlaStateDelta
 from app.messaging.producers.ticket_sla_state_producer import (
     TicketSlaStateMessageProducer as TicketSlaStateProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("ticket_sla_state_service")
 
 
-def _snapshot(state: TicketSlaState) -> Dict[str, Any]:
+def ticket_sla_state_snapshot(state: TicketSlaState) -> Dict[str, Any]:
     """Return a dictionary representation of a TicketSlaState suitable for event payloads."""
     return {
         "id": state.id,
@@ -77,7 +78,10 @@ def list_ticket_sla_states(
     sla_policy_id: Optional[uuid.UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketSlaState], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketSlaState], Optional[int]]:
     """List ticket SLA states with optional filtering by ticket or policy."""
     logger.debug(
         "Listing ticket SLA states: tenant_id=%s, ticket_id=%s, sla_policy_id=%s, limit=%s, offset=%s",
@@ -92,13 +96,16 @@ def list_ticket_sla_states(
         query = query.filter(TicketSlaState.ticket_id == ticket_id)
     if sla_policy_id:
         query = query.filter(TicketSlaState.sla_policy_id == sla_policy_id)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TicketSlaState.last_computed_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        TicketSlaState,
+        order_by=(TicketSlaState.last_computed_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def get_ticket_sla_state(
@@ -182,14 +189,15 @@ def update_ticket_sla_state(
             setattr(state, field, value)
         state.updated_by = updated_by
         state.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=state, action="update ticket SLA state")
-        snapshot = _snapshot(state)
+        flush_or_raise(db, refresh=state, action="update ticket SLA state")
+        snapshot = ticket_sla_state_snapshot(state)
         TicketSlaStateProducer.send_ticket_sla_state_updated(
             tenant_id=tenant_id,
             ticket_id=ticket_id,
             changes=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update ticket SLA state")
     return state
 
 
@@ -197,4 +205,5 @@ __all__ = [
     "list_ticket_sla_states",
     "get_ticket_sla_state",
     "update_ticket_sla_state",
+    "ticket_sla_state_snapshot",
 ]
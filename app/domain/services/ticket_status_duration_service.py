@@ -30,7 +30,8 @@ from app.domain.schemas.events.ticket_status_duration_event import (
 from app.messaging.producers.ticket_status_duration_producer import (
     TicketStatusDurationMessageProducer as TicketStatusDurationProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("ticket_status_duration_service")
 
@@ -77,7 +78,10 @@ def list_ticket_status_durations(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketStatusDuration], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketStatusDuration], Optional[int]]:
     """List ticket status durations for a tenant with optional filtering.
 
     Returns a tuple of the list of records and the total count.  Records
@@ -98,13 +102,17 @@ def list_ticket_status_durations(
         query = query.filter(TicketStatusDuration.ticket_id == ticket_id)
     if status:
         query = query.filter(TicketStatusDuration.status == status)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TicketStatusDuration.started_at.asc())
-    return query.all(), total
+    return paginate(
+        query,
+        TicketStatusDuration,
+        order_by=(TicketStatusDuration.started_at.asc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        descending=False,
+        total_mode=total_mode,
+    )
 
 
 def create_ticket_status_duration(
@@ -130,11 +138,12 @@ def create_ticket_status_duration(
         created_by=created_by,
     )
     db.add(duration)
-    commit_or_raise(db, refresh=duration, action="create ticket status duration")
+    flush_or_raise(db, refresh=duration, action="create ticket status duration")
     snapshot = _snapshot(duration)
     TicketStatusDurationProducer.send_ticket_status_duration_created(
         tenant_id=request.tenant_id, payload=snapshot
     )
+    commit_or_raise(db, action="create ticket status duration")
     return duration
 
 
@@ -186,11 +195,12 @@ def update_ticket_status_duration(
     for field, value in updates.items():
         setattr(duration, field, value)
     # update created_by? do not change created_by; update created_at? not needed; set new created_by? but we store updated by maybe; we choose to not track updated_by for status durations; events rely on updated_by only in payload? We'll not include.
-    commit_or_raise(db, refresh=duration, action="update ticket status duration")
+    flush_or_raise(db, refresh=duration, action="update ticket status duration")
     snapshot = _snapshot(duration)
     TicketStatusDurationProducer.send_ticket_status_duration_updated(
         tenant_id=tenant_id, changes=delta, payload=snapshot
     )
+    commit_or_raise(db, action="update ticket status duration")
     return duration
 
 
@@ -203,9 +213,10 @@ def delete_ticket_status_duration(
     """Delete a status duration record and publish a deleted event."""
     duration = get_ticket_status_duration(db, tenant_id=tenant_id, duration_id=duration_id)
     db.delete(duration)
-    commit_or_raise(db, action="delete ticket status duration")
+    flush_or_raise(db, action="delete ticket status duration")
     deleted_dt = datetime.utcnow().isoformat()
     TicketStatusDurationProducer.send_ticket_status_duration_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete ticket status duration")
     return None
\ No newline at end of file
@@ -27,7 +27,7 @@ from app.domain.schemas.ticket_tag import (
 from app.messaging.producers.ticket_tag_producer import (
     TicketTagMessageProducer as TagProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
 
 logger = logging.getLogger("ticket_tag_service")
 
@@ -89,9 +89,10 @@ def create_ticket_tag(
         created_by=created_by,
     )
     db.add(tag)
-    commit_or_raise(db, refresh=tag, action="create ticket tag")
+    flush_or_raise(db, refresh=tag, action="create ticket tag")
     snapshot = _snapshot(tag)
     TagProducer.send_ticket_tag_created(tenant_id=tenant_id, payload=snapshot)
+    commit_or_raise(db, action="create ticket tag")
     return tag
 
 
@@ -133,9 +134,10 @@ def delete_ticket_tag(
     """Delete a ticket tag and publish a deletion event."""
     tag = get_ticket_tag(db, tenant_id=tenant_id, ticket_id=ticket_id, tag_id=tag_id)
     db.delete(tag)
-    commit_or_raise(db, action="delete ticket tag")
+    flush_or_raise(db, action="delete ticket tag")
     TagProducer.send_ticket_tag_deleted(
         tenant_id=tenant_id,
         deleted_dt=datetime.utcnow().isoformat(),
     )
+    commit_or_raise(db, action="delete ticket tag")
     return None
\ No newline at end of file
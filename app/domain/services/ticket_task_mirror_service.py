@@ -25,7 +25,8 @@ from app.domain.schemas.events.ticket_task_mirror_event import (
 from app.messaging.producers.ticket_task_mirror_producer import (
     TicketTaskMirrorMessageProducer as Producer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("ticket_task_mirror_service")
 
@@ -76,7 +77,10 @@ def list_ticket_task_mirrors(
     status: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketTaskMirror], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketTaskMirror], Optional[int]]:
     """List ticket task mirrors for a tenant with optional filtering by ticket and status."""
     logger.debug(
         "Listing task mirrors: tenant_id=%s, ticket_id=%s, status=%s, limit=%s, offset=%s",
@@ -91,13 +95,16 @@ def list_ticket_task_mirrors(
         query = query.filter(TicketTaskMirror.ticket_id == ticket_id)
     if status:
         query = query.filter(TicketTaskMirror.status == status)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TicketTaskMirror.created_at.desc())
-    return query.all(), total
+    return paginate(
+        query,
+        TicketTaskMirror,
+        order_by=(TicketTaskMirror.created_at.desc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=total_mode,
+    )
 
 
 def get_ticket_task_mirror(
@@ -180,9 +187,10 @@ def upsert_ticket_task_mirror(
         )
         db.add(mirror)
         # created_by and updated_by not stored on mirror (no created_by field)
-        commit_or_raise(db, refresh=mirror, action="create ticket task mirror")
+        flush_or_raise(db, refresh=mirror, action="create ticket task mirror")
         snapshot = _snapshot(mirror)
         Producer.send_ticket_task_mirror_created(tenant_id=tenant_id, payload=snapshot)
+        commit_or_raise(db, action="create ticket task mirror")
         return mirror
     # Else update existing
     updates: Dict[str, Any] = {}
@@ -207,13 +215,14 @@ def upsert_ticket_task_mirror(
         for field, value in delta.base_fields.items():
             setattr(mirror, field, value)
         mirror.updated_at = datetime.utcnow()
-        commit_or_raise(db, refresh=mirror, action="update ticket task mirror")
+        flush_or_raise(db, refresh=mirror, action="update ticket task mirror")
         snapshot = _snapshot(mirror)
         Producer.send_ticket_task_mirror_updated(
             tenant_id=tenant_id,
             delta=delta,
             payload=snapshot,
         )
+        commit_or_raise(db, action="update ticket task mirror")
     return mirror
 
 
@@ -227,8 +236,9 @@ def delete_ticket_task_mirror(
     mirror = get_ticket_task_mirror(db, tenant_id=tenant_id, mirror_id=mirror_id)
     payload = _snapshot(mirror)
     db.delete(mirror)
-    commit_or_raise(db, action="delete ticket task mirror")
+    flush_or_raise(db, action="delete ticket task mirror")
     Producer.send_ticket_task_mirror_deleted(tenant_id=tenant_id, payload=payload)
+    commit_or_raise(db, action="delete ticket task mirror")
     return None
 
 
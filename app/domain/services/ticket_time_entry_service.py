@@ -27,7 +27,8 @@ from app.domain.schemas.events.ticket_time_entry_event import TicketTimeEntryDel
 from app.messaging.producers.ticket_time_entry_producer import (
     TicketTimeEntryMessageProducer as TicketTimeEntryProducer,
 )
-from app.domain.services.common_service import commit_or_raise
+from app.domain.services.common_service import commit_or_raise, flush_or_raise
+from app.domain.services.pagination_service import TotalMode, paginate
 
 logger = logging.getLogger("ticket_time_entry_service")
 
@@ -76,7 +77,10 @@ def list_ticket_time_entries(
     work_type: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> Tuple[List[TicketTimeEntry], int]:
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Tuple[List[TicketTimeEntry], Optional[int]]:
     """List time entries for a ticket with optional filtering by user and work type.
 
     Returns a tuple of the list of entries and the total count. Entries are ordered
@@ -99,13 +103,17 @@ def list_ticket_time_entries(
         query = query.filter(TicketTimeEntry.user_id == user_id)
     if work_type:
         query = query.filter(TicketTimeEntry.work_type == work_type)
-    total = query.count()
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    query = query.order_by(TicketTimeEntry.created_at.asc())
-    return query.all(), total
+    return paginate(
+        query,
+        TicketTimeEntry,
+        order_by=(TicketTimeEntry.created_at.asc(),),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        page_size=page_size,
+        descending=False,
+        total_mode=total_mode,
+    )
 
 
 def create_ticket_time_entry(
@@ -149,11 +157,12 @@ def create_ticket_time_entry(
         created_by=created_by,
     )
     db.add(entry)
-    commit_or_raise(db, refresh=entry, action="create ticket time entry")
+    flush_or_raise(db, refresh=entry, action="create ticket time entry")
     snapshot = _snapshot(entry)
     TicketTimeEntryProducer.send_ticket_time_entry_created(
         tenant_id=tenant_id, payload=snapshot
     )
+    commit_or_raise(db, action="create ticket time entry")
     return entry
 
 
@@ -221,11 +230,12 @@ def update_ticket_time_entry(
             setattr(entry, field, value)
         # Note: only created_at/created_by fields exist on this model; no updated_at
         # We do not track updated_by/time as there is no separate updated fields on the model.
-        commit_or_raise(db, refresh=entry, action="update ticket time entry")
+        flush_or_raise(db, refresh=entry, action="update ticket time entry")
         snapshot = _snapshot(entry)
         TicketTimeEntryProducer.send_ticket_time_entry_updated(
             tenant_id=tenant_id, changes=delta, payload=snapshot
         )
+        commit_or_raise(db, action="update ticket time entry")
     return entry
 
 
@@ -238,11 +248,12 @@ def delete_ticket_time_entry(
     """Delete a time entry and publish a deletion event."""
     entry = get_ticket_time_entry(db, tenant_id=tenant_id, time_entry_id=time_entry_id)
     db.delete(entry)
-    commit_or_raise(db, action="delete ticket time entry")
+    flush_or_raise(db, action="delete ticket time entry")
     deleted_dt = datetime.utcnow().isoformat()
     TicketTimeEntryProducer.send_ticket_time_entry_deleted(
         tenant_id=tenant_id, deleted_dt=deleted_dt
     )
+    commit_or_raise(db, action="delete ticket time entry")
     return None
 
 
@@ -0,0 +1,129 @@
+"""
+Cross-process invalidation of the tenant configuration cache.
+
+Every API process runs a :class:`ConfigCacheListener` in a daemon
+thread.  It binds an exclusive, auto-delete queue to the CRM exchange
+for ``crm.config_cache.invalidated`` and drops the affected entries from
+``app.domain.services.tenant_config_cache`` as messages arrive.  The
+process that made a change has already invalidated its own cache and
+skips its own broadcasts.
+
+The queue only exists while the process is connected, so broadcasts
+published during a broker outage are lost; the listener therefore
+clears the whole cache every time it (re)connects.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from kombu import Queue
+from kombu.mixins import ConsumerMixin
+
+from app.core.celery_app import EXCHANGE_NAME, celery_app, crm_exchange
+from app.core.config import Config
+from app.domain.services.tenant_config_cache import (
+    apply_invalidation,
+    tenant_config_cache,
+)
+
+
+logger = logging.getLogger("config_cache_listener")
+
+ROUTING_KEY = f"{EXCHANGE_NAME}.config_cache.invalidated"
+
+
+def _event_data(body: Any) -> Optional[Dict[str, Any]]:
+    """Extract the event ``data`` from a Celery protocol 2 message body."""
+    if isinstance(body, (list, tuple)) and len(body) >= 2:
+        kwargs = body[1]
+    elif isinstance(body, dict):
+        kwargs = body.get("kwargs", body)
+    else:
+        return None
+    envelope = kwargs.get("envelope") if isinstance(kwargs, dict) else None
+    if not isinstance(envelope, dict):
+        return None
+    data = envelope.get("data")
+    return data if isinstance(data, dict) else None
+
+
+class ConfigCacheListener(ConsumerMixin):
+    """Consumes config cache invalidations on a per-process queue."""
+
+    def __init__(self, connection: Any) -> None:
+        self.connection = connection
+        self.queue = Queue(
+            name="",
+            exchange=crm_exchange,
+            routing_key=ROUTING_KEY,
+            exclusive=True,
+            auto_delete=True,
+            durable=False,
+        )
+
+    def get_consumers(self, Consumer: Any, channel: Any) -> List[Any]:
+        return [
+            Consumer(
+                queues=[self.queue],
+                callbacks=[self.on_message],
+                accept=["json"],
+            )
+        ]
+
+    def on_consume_ready(self, connection: Any, channel: Any, consumers: Any, **kwargs: Any) -> None:
+        # Anything broadcast while disconnected was missed
+        tenant_config_cache.clear()
+        logger.info("Listening for config cache invalidations")
+
+    def on_message(self, body: Any, message: Any) -> None:
+        try:
+            data = _event_data(body)
+            if data is not None and data.get("tenant_id"):
+                apply_invalidation(data)
+        except Exception:
+            logger.exception("Failed to apply config cache invalidation")
+        finally:
+            message.ack()
+
+
+_listener: Optional[ConfigCacheListener] = None
+_thread: Optional[threading.Thread] = None
+
+
+def start_listener() -> bool:
+    """Start the listener thread if the cache and broadcasts are enabled."""
+    global _listener, _thread
+    if _thread is not None:
+        return True
+    if (
+        Config.tenant_config_cache_ttl_seconds() <= 0
+        or not Config.tenant_config_cache_broadcast()
+    ):
+        return False
+    _listener = ConfigCacheListener(celery_app.connection_for_read())
+    _thread = threading.Thread(
+        target=_listener.run, name="config-cache-listener", daemon=True
+    )
+    _thread.start()
+    return True
+
+
+def stop_listener(timeout: float = 5.0) -> None:
+    """Stop the listener thread started by :func:`start_listener`."""
+    global _listener, _thread
+    if _listener is None or _thread is None:
+        return
+    _listener.should_stop = True
+    _thread.join(timeout)
+    try:
+        _listener.connection.release()
+    except Exception:
+        logger.debug("Error releasing config cache listener connection", exc_info=True)
+    _listener = None
+    _thread = None
+
+
+__all__ = ["ConfigCacheListener", "start_listener", "stop_listener"]
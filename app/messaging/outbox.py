@@ -0,0 +1,238 @@
+"""
+Transactional outbox for CRM domain events.
+
+Producers no longer need to talk to the broker on the request path.
+When ``OUTBOX_ENABLED`` is set, ``BaseProducer`` stores each event
+envelope as a row in ``dyno_crm.event_outbox`` and returns immediately.
+The relay implemented here (run with ``python -m app.messaging.outbox``)
+claims pending rows in batches, publishes them over a single broker
+connection with publisher confirms enabled, and stamps ``published_at``.
+
+Two write paths are provided:
+
+* :func:`enqueue_event` / :func:`enqueue_events` add rows to a caller
+  supplied session so they commit (or roll back) together with the
+  entity change.  Services publish into the request's publish buffer
+  before ``commit_or_raise``, which stages the buffered events this
+  way (see ``BaseProducer.staged``).
+* :func:`write_event` / :func:`write_events` write rows in their own
+  short transaction.  They serve producers called outside a publish
+  buffer and events no commit has staged, e.g. from scripts that
+  publish after committing themselves.
+
+Delivery is at least once.  The outbox row id equals the envelope
+``event_id`` and is reused as the Celery task id so consumers can
+de‑duplicate.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import Config
+from app.core.db import SessionLocal, WorkerSessionLocal
+from app.domain.models.event_outbox import EventOutbox
+
+
+logger = logging.getLogger("event_outbox")
+
+
+def _build_row(
+    *,
+    task_name: str,
+    envelope: Dict[str, Any],
+    headers: Dict[str, Any],
+) -> EventOutbox:
+    event_id = envelope.get("event_id")
+    tenant_id = envelope.get("tenant_id")
+    return EventOutbox(
+        id=uuid.UUID(str(event_id)) if event_id else uuid.uuid4(),
+        tenant_id=uuid.UUID(str(tenant_id)) if tenant_id else None,
+        task_name=task_name,
+        envelope=envelope,
+        headers=headers,
+        created_at=datetime.utcnow(),
+        attempts=0,
+    )
+
+
+def enqueue_event(
+    db: Session,
+    *,
+    task_name: str,
+    envelope: Dict[str, Any],
+    headers: Dict[str, Any],
+) -> EventOutbox:
+    """Stage an event envelope in ``db`` without committing.
+
+    The row becomes visible to the relay only when the caller commits,
+    i.e. atomically with whatever else the transaction changed.
+    """
+    row = _build_row(task_name=task_name, envelope=envelope, headers=headers)
+    db.add(row)
+    return row
+
+
+def enqueue_events(db: Session, events: Iterable[Any]) -> None:
+    """Stage several pending events in ``db`` without committing.
+
+    ``events`` are objects exposing ``task_name``, ``envelope`` and
+    ``headers`` (see ``app.messaging.producers.common.PendingEvent``).
+    """
+    db.add_all(
+        _build_row(task_name=e.task_name, envelope=e.envelope, headers=e.headers)
+        for e in events
+    )
+
+
+def write_event(
+    *,
+    task_name: str,
+    envelope: Dict[str, Any],
+    headers: Dict[str, Any],
+) -> None:
+    """Persist an event envelope to the outbox in its own transaction."""
+    with SessionLocal() as db:
+        enqueue_event(db, task_name=task_name, envelope=envelope, headers=headers)
+        db.commit()
+
+
+def write_events(events: Iterable[Any]) -> None:
+    """Persist several pending events in a single transaction.
+
+    ``events`` are objects exposing ``task_name``, ``envelope`` and
+    ``headers`` (see ``app.messaging.producers.common.PendingEvent``).
+    """
+    with SessionLocal() as db:
+        enqueue_events(db, events)
+        db.commit()
+
+
+def _publish_connection():
+    """Open a broker connection with publisher confirms enabled."""
+    from app.core.celery_app import celery_app
+
+    transport_options = dict(celery_app.conf.broker_transport_options or {})
+    transport_options["confirm_publish"] = True
+    return celery_app.connection_for_write(transport_options=transport_options)
+
+
+def relay_batch(db: Session, *, batch_size: Optional[int] = None) -> int:
+    """Publish one batch of pending outbox rows and return how many were sent.
+
+    Rows are claimed oldest first with ``FOR UPDATE SKIP LOCKED`` and
+    published in order over one connection and channel.  Publishing
+    stops at the first failure so later events are not delivered ahead
+    of an earlier one; the failing row records the error and is retried
+    on the next pass.
+    """
+    from app.core.celery_app import celery_app
+
+    limit = batch_size or Config.outbox_relay_batch_size()
+    rows = (
+        db.query(EventOutbox)
+        .filter(EventOutbox.published_at.is_(None))
+        .order_by(EventOutbox.created_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not rows:
+        db.rollback()
+        return 0
+
+    published = 0
+    try:
+        with _publish_connection() as connection, connection.Producer() as producer:
+            for row in rows:
+                row.attempts = (row.attempts or 0) + 1
+                celery_app.send_task(
+                    name=row.task_name,
+                    kwargs={"envelope": row.envelope},
+                    headers=row.headers,
+                    task_id=str(row.id),
+                    producer=producer,
+                )
+                row.published_at = datetime.utcnow()
+                row.last_error = None
+                published += 1
+    except Exception as exc:
+        failed = rows[published] if published < len(rows) else None
+        if failed is not None:
+            failed.last_error = repr(exc)[:2000]
+        logger.exception(
+            "Outbox relay stopped after %s of %s events", published, len(rows)
+        )
+    db.commit()
+    return published
+
+
+def purge_published(db: Session, *, older_than: timedelta) -> int:
+    """Delete rows published before ``now - older_than``; return the count."""
+    cutoff = datetime.utcnow() - older_than
+    deleted = (
+        db.query(EventOutbox)
+        .filter(
+            EventOutbox.published_at.is_not(None),
+            EventOutbox.published_at < cutoff,
+        )
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def run_relay(stop_event: Optional[threading.Event] = None) -> None:
+    """Drain the outbox until ``stop_event`` is set.
+
+    Full batches are followed immediately by the next batch; otherwise
+    the relay sleeps for ``OUTBOX_RELAY_POLL_SECONDS``.  Published rows
+    older than ``OUTBOX_RETENTION_HOURS`` are purged every ten minutes.
+    """
+    stop_event = stop_event or threading.Event()
+    batch_size = Config.outbox_relay_batch_size()
+    poll_seconds = Config.outbox_relay_poll_seconds()
+    retention = timedelta(hours=Config.outbox_retention_hours())
+    next_purge = 0.0
+    logger.info("Outbox relay started batch_size=%s", batch_size)
+    while not stop_event.is_set():
+        sent = 0
+        try:
+            with WorkerSessionLocal() as db:
+                sent = relay_batch(db, batch_size=batch_size)
+                if time.monotonic() >= next_purge:
+                    purged = purge_published(db, older_than=retention)
+                    if purged:
+                        logger.info("Purged %s published outbox events", purged)
+                    next_purge = time.monotonic() + 600
+        except Exception:
+            logger.exception("Outbox relay iteration failed")
+        if sent < batch_size:
+            stop_event.wait(poll_seconds)
+
+
+def main() -> None:  # pragma: no cover - process entry point
+    logging.basicConfig(level=logging.INFO)
+    run_relay()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
+
+
+__all__ = [
+    "enqueue_event",
+    "enqueue_events",
+    "write_event",
+    "write_events",
+    "relay_batch",
+    "purge_published",
+    "run_relay",
+]
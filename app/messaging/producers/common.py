@@ -3,13 +3,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
 from uuid import uuid4
 from datetime import datetime
 
 # import the shared Celery app and exchange name once
 from app.core.celery_app import celery_app, EXCHANGE_NAME
-from app.domain.schemas.events.common import EventEnvelope
+from app.core.config import Config
 from app.util.correlation import (
     get_correlation_id,
     get_message_id,
@@ -17,8 +21,308 @@ from app.util.correlation import (
 )
 
 
+logger = logging.getLogger("producer")
+
+
+@dataclass
+class PendingEvent:
+    """An envelope waiting in a :class:`PublishBuffer`."""
+
+    task_name: str
+    envelope: Dict[str, Any]
+    headers: Dict[str, str]
+
+
+# Events and coalesced updates staged in one transaction
+StagedEvents = Tuple[List[PendingEvent], Dict[Hashable, List[Any]]]
+
+
+class PublishBuffer:
+    """Collects events produced within a request or unit of work.
+
+    Services publish before they commit; :func:`commit_or_raise` then
+    calls :meth:`stage` so the events join the transaction of the
+    change they describe.  With the outbox enabled they are added to
+    that transaction as ``event_outbox`` rows.  Otherwise they are held
+    until the commit succeeds (:meth:`committed`) and sent by
+    :meth:`flush` over one pooled broker connection and a single AMQP
+    channel transaction.
+
+    Updates to the same aggregate can be registered with
+    :meth:`coalesce`.  Each commit carries the merged state forward,
+    and only the state merged across every commit is turned into an
+    event, when the buffer flushes.
+    """
+
+    def __init__(self) -> None:
+        self.events: List[PendingEvent] = []
+        # Broker mode only: events whose transaction has committed
+        self._committed: List[PendingEvent] = []
+        # key -> [state, emit, merge]; dicts keep first-registration order.
+        # Updates registered since the last stage ...
+        self._coalesced: Dict[Hashable, List[Any]] = {}
+        # ... and updates whose transaction has committed
+        self._committed_coalesced: Dict[Hashable, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return (
+            len(self.events)
+            + len(self._committed)
+            + len(self._coalesced.keys() | self._committed_coalesced.keys())
+        )
+
+    def add(self, event: PendingEvent) -> None:
+        self.events.append(event)
+
+    def coalesce(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        merge: Callable[[Any, Any], Any],
+        emit: Callable[[Any], None],
+    ) -> None:
+        """Merge ``value`` into the pending state for ``key``.
+
+        ``emit`` from the first registration is called once with the
+        merged state when the buffer flushes.
+        """
+        _merge_coalesced(self._coalesced, key, [value, emit, merge])
+
+    def _emit_coalesced(self) -> None:
+        pending, self._committed_coalesced = self._committed_coalesced, {}
+        for key, entry in self._coalesced.items():
+            _merge_coalesced(pending, key, entry)
+        self._coalesced = {}
+        if not pending:
+            return
+        # Re-enter the buffer so events produced by ``emit`` are batched
+        token = _publish_buffer.set(self)
+        try:
+            for key, (state, emit, _) in pending.items():
+                try:
+                    emit(state)
+                except Exception:
+                    logger.exception("Failed to emit coalesced event key=%s", key)
+        finally:
+            _publish_buffer.reset(token)
+
+    def stage(self, db: Any) -> StagedEvents:
+        """Move the events buffered so far into ``db``'s transaction.
+
+        Returns the staged events and coalesced updates, which the
+        caller hands to :meth:`committed` once the commit succeeds.
+        Coalesced updates are not turned into events here: later
+        commits in the same buffer may still merge into them.
+        """
+        events, self.events = self.events, []
+        coalesced, self._coalesced = self._coalesced, {}
+        if events and Config.outbox_enabled():
+            from app.messaging.outbox import enqueue_events
+
+            enqueue_events(db, events)
+        return events, coalesced
+
+    def committed(self, staged: StagedEvents) -> None:
+        """Record that the transaction holding ``staged`` has committed."""
+        events, coalesced = staged
+        if not Config.outbox_enabled():
+            self._committed.extend(events)
+        for key, entry in coalesced.items():
+            _merge_coalesced(self._committed_coalesced, key, entry)
+        _notify_released(events)
+
+    def flush(self) -> int:
+        """Deliver all releasable events and return how many were sent.
+
+        Coalesced updates are emitted first, after the last commit.
+        Committed events are published to the broker.  Events that were
+        never staged (published outside a :func:`commit_or_raise`,
+        including the coalesced ones) are written to the outbox in
+        their own transaction or sent along with the committed ones.
+        """
+        self._emit_coalesced()
+        committed, self._committed = self._committed, []
+        unstaged, self.events = self.events, []
+        _notify_released(unstaged)
+        sent = len(committed) + len(unstaged)
+        if unstaged and Config.outbox_enabled():
+            from app.messaging.outbox import write_events
+
+            write_events(unstaged)
+            unstaged = []
+        if committed or unstaged:
+            _publish_batch(committed + unstaged)
+        return sent
+
+    def discard_unstaged(self) -> None:
+        """Drop events and coalesced updates no transaction has staged.
+
+        Used when a unit of work fails: such events may describe
+        changes that were rolled back.  Coalesced updates whose
+        transaction committed are kept.
+        """
+        if self.events or self._coalesced:
+            logger.warning(
+                "Discarding %s unstaged events", len(self.events) + len(self._coalesced)
+            )
+        self.events = []
+        self._coalesced = {}
+
+
+def _merge_coalesced(
+    target: Dict[Hashable, List[Any]], key: Hashable, entry: List[Any]
+) -> None:
+    """Merge coalesced ``entry`` into ``target``; the first ``emit`` wins."""
+    current = target.get(key)
+    if current is None:
+        target[key] = list(entry)
+    else:
+        current[0] = current[2](current[0], entry[0])
+
+
+_publish_buffer: ContextVar[Optional[PublishBuffer]] = ContextVar(
+    "publish_buffer", default=None
+)
+
+# Called with ``(task_name, envelope)`` for every event produced in this
+# process once it is released: right after it has been sent without a
+# publish buffer, otherwise when the transaction holding it commits (or
+# when the buffer flushes events no commit has staged).  Events that are
+# discarded never reach the listeners.  Used for in-process side effects
+# such as cache invalidation, which must not run before the commit.
+EventListener = Callable[[str, Dict[str, Any]], None]
+_event_listeners: List[EventListener] = []
+
+
+def add_event_listener(listener: EventListener) -> None:
+    """Register ``listener`` for every event produced in this process."""
+    if listener not in _event_listeners:
+        _event_listeners.append(listener)
+
+
+def _notify_event_listeners(task_name: str, envelope: Dict[str, Any]) -> None:
+    for listener in list(_event_listeners):
+        try:
+            listener(task_name, envelope)
+        except Exception:
+            logger.exception("Event listener failed for %s", task_name)
+
+
+def _notify_released(events: List[PendingEvent]) -> None:
+    """Notify the listeners of buffered events whose changes are committed.
+
+    Events the listeners produce are sent right away rather than
+    buffered: their trigger has already committed.
+    """
+    if not _event_listeners or not events:
+        return
+    message_id = get_message_id()
+    token = _publish_buffer.set(None)
+    try:
+        for event in events:
+            _notify_event_listeners(event.task_name, event.envelope)
+    finally:
+        _publish_buffer.reset(token)
+        # Events sent by listeners must not become the causation of
+        # events produced later in this context.
+        set_message_id(message_id)
+
+
+def _publish_batch(events: List[PendingEvent]) -> None:
+    """Publish ``events`` over one pooled connection in one channel transaction."""
+    with celery_app.pool.acquire(block=True) as connection:
+        channel = connection.channel()
+        try:
+            producer = celery_app.amqp.Producer(channel)
+            transactional = hasattr(channel, "tx_select")
+            if transactional:
+                channel.tx_select()
+            for event in events:
+                celery_app.send_task(
+                    name=event.task_name,
+                    kwargs={"envelope": event.envelope},
+                    headers=event.headers,
+                    task_id=event.envelope.get("event_id"),
+                    producer=producer,
+                )
+            if transactional:
+                channel.tx_commit()
+        finally:
+            channel.close()
+
+
 class BaseProducer:
 
+    @staticmethod
+    def coalesce(
+        key: Hashable,
+        value: Any,
+        *,
+        merge: Callable[[Any, Any], Any],
+        emit: Callable[[Any], None],
+    ) -> bool:
+        """Defer an event so repeated updates within a buffer merge into one.
+
+        Returns ``False`` when no publish buffer is active; the caller
+        should then publish immediately as before.
+        """
+        buffer = _publish_buffer.get()
+        if buffer is None:
+            return False
+        buffer.coalesce(key, value, merge=merge, emit=emit)
+        return True
+
+    @classmethod
+    @contextmanager
+    def buffered(cls, *, autoflush: bool = True) -> Iterator[PublishBuffer]:
+        """Buffer every event published in this context and flush once.
+
+        Nested use joins the outermost buffer, which alone flushes.
+        Events staged by a successful ``commit_or_raise`` are always
+        delivered; when the block raises, events that no commit has
+        staged are discarded because their changes were never
+        committed.  Pass ``autoflush=False`` to flush manually (e.g.
+        off the event loop).
+        """
+        current = _publish_buffer.get()
+        if current is not None:
+            yield current
+            return
+        buffer = PublishBuffer()
+        token = _publish_buffer.set(buffer)
+        try:
+            yield buffer
+        except BaseException:
+            buffer.discard_unstaged()
+            raise
+        finally:
+            _publish_buffer.reset(token)
+            if autoflush:
+                try:
+                    buffer.flush()
+                except Exception:
+                    logger.exception("Failed to flush buffered events")
+
+    @classmethod
+    @contextmanager
+    def staged(cls, db: Any) -> Iterator[None]:
+        """Stage the buffered events in ``db``'s transaction around a commit.
+
+        Wrap the ``db.commit()`` of a unit of work: with the outbox
+        enabled the events are added to the transaction as outbox rows
+        and commit atomically with the change; otherwise they are
+        released to the broker only when the block exits without an
+        error.  Without an active buffer this is a no-op.
+        """
+        buffer = _publish_buffer.get()
+        if buffer is None:
+            yield
+            return
+        staged = buffer.stage(db)
+        yield
+        buffer.committed(staged)
+
     @classmethod
     def _send(
         cls,
@@ -31,35 +335,61 @@ class BaseProducer:
         Internal helper: wrap the domain message in an EventEnvelope and
         send it via Celery.  Adds correlation and causation identifiers
         to enable tracing across services.
+
+        The envelope is built as a plain dict with the ``EventEnvelope``
+        field layout and the message is dumped once in Python mode;
+        UUIDs and datetimes are encoded a single time by the orjson
+        task serializer (or the outbox's JSON column serializer).
+
+        Inside a publish buffer the event waits for the next
+        ``commit_or_raise`` to stage it in the caller's transaction.
+        Without a buffer it is sent immediately, or written to
+        ``event_outbox`` in its own transaction when the outbox is
+        enabled; the relay publishes outbox rows later.
         """
-        payload = message_model.model_dump(mode="json")
-        envelope = EventEnvelope(
-            event_id=uuid4(),
-            event_type=task_name,
-            schema_version=1,
-            occurred_at=datetime.utcnow(),
-            producer=EXCHANGE_NAME,
-            tenant_id=message_model.tenant_id,
-            correlation_id=get_correlation_id(),
-            causation_id=get_message_id(),
-            traceparent=None,
-            data=payload,
-        )
+        event_id = str(uuid4())
+        correlation_id = get_correlation_id()
+        causation_id = get_message_id()
+        envelope_json: Dict[str, Any] = {
+            "event_id": event_id,
+            "event_type": task_name,
+            "schema_version": 1,
+            "occurred_at": datetime.utcnow().isoformat(),
+            "producer": EXCHANGE_NAME,
+            "tenant_id": str(message_model.tenant_id),
+            "correlation_id": str(correlation_id) if correlation_id is not None else None,
+            "causation_id": str(causation_id) if causation_id is not None else None,
+            "traceparent": None,
+            "data": message_model.model_dump(),
+        }
         # update context so downstream producers use this event_id as causation
-        set_message_id(str(envelope.event_id))
+        set_message_id(event_id)
         correlation_headers = {
-            "message_id": str(envelope.event_id),
-            "correlation_id": str(envelope.correlation_id)
-            if envelope.correlation_id is not None
-            else None,
-            "causation_id": str(envelope.causation_id)
-            if envelope.causation_id is not None
-            else None,
+            "message_id": event_id,
+            "correlation_id": envelope_json["correlation_id"],
+            "causation_id": envelope_json["causation_id"],
         }
         correlation_headers = {k: v for k, v in correlation_headers.items() if v}
         combined_headers = {**headers, **correlation_headers}
-        celery_app.send_task(
-            name=task_name,
-            kwargs={"envelope": envelope.model_dump(mode="json")},
-            headers=combined_headers,
-        )
\ No newline at end of file
+        buffer = _publish_buffer.get()
+        if buffer is not None:
+            # Listeners are notified once the event is released
+            buffer.add(PendingEvent(task_name, envelope_json, combined_headers))
+            return
+        if Config.outbox_enabled():
+            # Imported lazily: the outbox pulls in the ORM layer, which
+            # producers otherwise do not depend on.
+            from app.messaging.outbox import write_event
+
+            write_event(task_name=task_name, envelope=envelope_json, headers=combined_headers)
+        else:
+            celery_app.send_task(
+                name=task_name,
+                kwargs={"envelope": envelope_json},
+                headers=combined_headers,
+            )
+        if _event_listeners:
+            _notify_event_listeners(task_name, envelope_json)
+            # Events sent by listeners must not become the causation of
+            # events produced later in this context.
+            set_message_id(event_id)
\ No newline at end of file
@@ -9,7 +9,7 @@ database transactions within the service layer.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
 from app.core.celery_app import EXCHANGE_NAME
@@ -17,6 +17,7 @@ from app.domain.schemas.events.company_event import (
     CompanyCreatedEvent,
     CompanyUpdatedEvent,
     CompanyDeletedEvent,
+    CompanyBulkImportedEvent,
     CompanyDelta,
 )
 from .common import BaseProducer
@@ -28,6 +29,7 @@ class CompanyMessageProducer(BaseProducer):
     TASK_CREATED: str = f"{EXCHANGE_NAME}.company.created"
     TASK_UPDATED: str = f"{EXCHANGE_NAME}.company.updated"
     TASK_DELETED: str = f"{EXCHANGE_NAME}.company.deleted"
+    TASK_BULK_IMPORTED: str = f"{EXCHANGE_NAME}.company.bulk_imported"
 
     @staticmethod
     def _build_headers(*, tenant_id: UUID) -> Dict[str, str]:
@@ -81,3 +83,22 @@ class CompanyMessageProducer(BaseProducer):
         )
         headers = cls._build_headers(tenant_id=tenant_id)
         cls._send(task_name=cls.TASK_DELETED, message_model=message, headers=headers)
+
+    @classmethod
+    def send_companies_bulk_imported(
+        cls,
+        *,
+        tenant_id: UUID,
+        import_id: UUID,
+        chunk: int,
+        company_ids: List[UUID],
+    ) -> None:
+        """Publish a company.bulk_imported event for one import chunk."""
+        message = CompanyBulkImportedEvent(
+            tenant_id=tenant_id,
+            import_id=import_id,
+            chunk=chunk,
+            company_ids=company_ids,
+        )
+        headers = cls._build_headers(tenant_id=tenant_id)
+        cls._send(task_name=cls.TASK_BULK_IMPORTED, message_model=message, headers=headers)
@@ -0,0 +1,46 @@
+"""
+Producer for tenant configuration cache invalidations.
+
+The event is not a domain event: it is routed to the CRM topic exchange
+under its own routing key and consumed only by the per-process
+listeners in ``app.messaging.config_cache``.  No durable queue is bound
+to it, so it is dropped when no API process is listening.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable
+from uuid import UUID
+
+from app.core.celery_app import EXCHANGE_NAME
+from app.domain.schemas.events.config_cache_event import ConfigCacheInvalidatedMessage
+from .common import BaseProducer
+
+
+class ConfigCacheMessageProducer(BaseProducer):
+    """Publishes tenant configuration cache invalidations."""
+
+    TASK_INVALIDATED: str = f"{EXCHANGE_NAME}.config_cache.invalidated"
+
+    @staticmethod
+    def _build_headers(*, tenant_id: UUID) -> Dict[str, str]:
+        return {
+            "tenant_id": str(tenant_id),
+        }
+
+    @classmethod
+    def send_config_cache_invalidated(
+        cls,
+        *,
+        tenant_id: UUID,
+        kinds: Iterable[str],
+        origin: str,
+    ) -> None:
+        """Publish a ``config_cache.invalidated`` event."""
+        message = ConfigCacheInvalidatedMessage(
+            tenant_id=tenant_id,
+            kinds=sorted(kinds),
+            origin=origin,
+        )
+        headers = cls._build_headers(tenant_id=tenant_id)
+        cls._send(task_name=cls.TASK_INVALIDATED, message_model=message, headers=headers)
@@ -9,7 +9,7 @@ successful database transactions within the service layer.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
 from app.core.celery_app import EXCHANGE_NAME
@@ -17,6 +17,8 @@ from app.domain.schemas.events.contact_event import (
     ContactCreatedEvent,
     ContactUpdatedEvent,
     ContactDeletedEvent,
+    ContactBulkImportedEvent,
+    ContactBulkPatchedEvent,
     ContactDelta,
 )
 from .common import BaseProducer
@@ -28,6 +30,8 @@ class ContactMessageProducer(BaseProducer):
     TASK_CREATED: str = f"{EXCHANGE_NAME}.contact.created"
     TASK_UPDATED: str = f"{EXCHANGE_NAME}.contact.updated"
     TASK_DELETED: str = f"{EXCHANGE_NAME}.contact.deleted"
+    TASK_BULK_IMPORTED: str = f"{EXCHANGE_NAME}.contact.bulk_imported"
+    TASK_BULK_PATCHED: str = f"{EXCHANGE_NAME}.contact.bulk_patched"
 
     @staticmethod
     def _build_headers(*, tenant_id: UUID) -> Dict[str, str]:
@@ -75,3 +79,41 @@ class ContactMessageProducer(BaseProducer):
         message = ContactDeletedEvent(tenant_id=tenant_id, deleted_dt=deleted_dt)
         headers = cls._build_headers(tenant_id=tenant_id)
         cls._send(task_name=cls.TASK_DELETED, message_model=message, headers=headers)
+
+    @classmethod
+    def send_contacts_bulk_imported(
+        cls,
+        *,
+        tenant_id: UUID,
+        import_id: UUID,
+        chunk: int,
+        contact_ids: List[UUID],
+    ) -> None:
+        """Publish a contact.bulk_imported event for one import chunk."""
+        message = ContactBulkImportedEvent(
+            tenant_id=tenant_id,
+            import_id=import_id,
+            chunk=chunk,
+            contact_ids=contact_ids,
+        )
+        headers = cls._build_headers(tenant_id=tenant_id)
+        cls._send(task_name=cls.TASK_BULK_IMPORTED, message_model=message, headers=headers)
+
+    @classmethod
+    def send_contacts_bulk_patched(
+        cls,
+        *,
+        tenant_id: UUID,
+        patch_id: UUID,
+        chunk: int,
+        changes: Dict[UUID, ContactDelta],
+    ) -> None:
+        """Publish a contact.bulk_patched event for one bulk patch chunk."""
+        message = ContactBulkPatchedEvent(
+            tenant_id=tenant_id,
+            patch_id=patch_id,
+            chunk=chunk,
+            changes=changes,
+        )
+        headers = cls._build_headers(tenant_id=tenant_id)
+        cls._send(task_name=cls.TASK_BULK_PATCHED, message_model=message, headers=headers)
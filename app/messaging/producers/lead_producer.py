@@ -18,6 +18,7 @@ from app.domain.schemas.events.lead_events import (
     LeadCreatedMessage,
     LeadUpdatedMessage,
     LeadDeletedMessage,
+    LeadBulkPatchedMessage,
 )
 from .common import BaseProducer
 
@@ -28,6 +29,7 @@ class LeadMessageProducer(BaseProducer):
     TASK_CREATED: str = f"{EXCHANGE_NAME}.lead.created"
     TASK_UPDATED: str = f"{EXCHANGE_NAME}.lead.updated"
     TASK_DELETED: str = f"{EXCHANGE_NAME}.lead.deleted"
+    TASK_BULK_PATCHED: str = f"{EXCHANGE_NAME}.lead.bulk_patched"
 
     @staticmethod
     def _build_headers(*, tenant_id: UUID) -> Dict[str, str]:
@@ -109,3 +111,34 @@ class LeadMessageProducer(BaseProducer):
         )
         headers = cls._build_headers(tenant_id=tenant_id)
         cls._send(task_name=cls.TASK_DELETED, message_model=message, headers=headers)
+
+    @classmethod
+    def send_leads_bulk_patched(
+        cls,
+        *,
+        tenant_id: UUID,
+        patch_id: UUID,
+        chunk: int,
+        changes: Dict[UUID, Dict[str, Any]],
+    ) -> None:
+        """Publish a lead.bulk_patched event for one bulk patch chunk.
+
+        Parameters
+        ----------
+        tenant_id: UUID
+            Identifier of the tenant that owns the leads.
+        patch_id: UUID
+            Identifier of the bulk patch request.
+        chunk: int
+            1-based chunk number within the request.
+        changes: dict
+            Changed attributes keyed by lead id.
+        """
+        message = LeadBulkPatchedMessage(
+            tenant_id=tenant_id,
+            patch_id=patch_id,
+            chunk=chunk,
+            changes=changes,
+        )
+        headers = cls._build_headers(tenant_id=tenant_id)
+        cls._send(task_name=cls.TASK_BULK_PATCHED, message_model=message, headers=headers)
@@ -0,0 +1,154 @@
+"""
+SLA breach scanner.
+
+The SLA engine computes due dates but never marks a timer as breached;
+this worker does.  Each ``ticket_sla_state`` row carries a generated
+``next_due_at`` column, the earliest due date among its unbreached
+timers, and a partial index holds only rows where it is set.  A scan
+(run with ``python -m app.messaging.sla_breach_scanner``) reads that
+index up to the current time, so it touches only states whose deadline
+passed since the previous scan rather than every open ticket.
+
+Each batch is one ``UPDATE .. RETURNING`` statement: the due rows are
+claimed oldest deadline first with ``FOR UPDATE SKIP LOCKED``, every
+timer whose due date has passed gets its breach flag set, and the
+updated rows are returned.  A flipped timer no longer counts towards
+``next_due_at``, so the row moves along (or out of) the index by itself.
+One ``ticket_sla_state.updated`` event per row is published through a
+single producer buffer and staged in the batch's transaction, so the
+events commit (or roll back) together with the flags.
+
+Several scanners may run side by side; locked rows are skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import false, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import Config
+from app.core.db import WorkerSessionLocal
+from app.domain.models.ticket_sla_state import TicketSlaState
+from app.domain.schemas.events.ticket_sla_state_event import TicketSlaStateDelta
+from app.domain.services.ticket_sla_state_service import ticket_sla_state_snapshot
+from app.messaging.producers.ticket_sla_state_producer import (
+    TicketSlaStateMessageProducer as TicketSlaStateProducer,
+)
+
+
+logger = logging.getLogger("sla_breach_scanner")
+
+SCANNER_USER = "sla_breach_scanner"
+
+_TIMERS = ("first_response", "next_response", "resolution")
+
+
+def breach_statement(*, now: datetime, batch_size: int):
+    """Build the statement that flips the breach flags of one batch.
+
+    Returns the updated columns plus ``was_<timer>_breached`` with each
+    flag's value before the update.
+    """
+    table = TicketSlaState.__table__
+    due = (
+        select(
+            table.c.id,
+            *(table.c[f"{timer}_breached"].label(f"was_{timer}_breached") for timer in _TIMERS),
+        )
+        .where(table.c.next_due_at.is_not(None), table.c.next_due_at <= now)
+        .order_by(table.c.next_due_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .cte("due")
+    )
+    values: Dict[str, Any] = {
+        f"{timer}_breached": table.c[f"{timer}_breached"]
+        | func.coalesce(table.c[f"{timer}_due_at"] <= now, false())
+        for timer in _TIMERS
+    }
+    values.update(updated_at=now, updated_by=SCANNER_USER)
+    return (
+        update(table)
+        .where(table.c.id == due.c.id)
+        .values(values)
+        .returning(*table.c, *(due.c[f"was_{timer}_breached"] for timer in _TIMERS))
+    )
+
+
+def scan_batch(
+    db: Session,
+    *,
+    now: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Flag one batch of passed deadlines as breached; return the row count.
+
+    The events are staged with the commit of the update, in line with
+    the services, so an event never describes an uncommitted flag.
+    """
+    now = now or datetime.now(timezone.utc)
+    limit = batch_size or Config.sla_breach_scan_batch_size()
+    with TicketSlaStateProducer.buffered():
+        rows = db.execute(breach_statement(now=now, batch_size=limit)).all()
+        for row in rows:
+            flipped = {
+                f"{timer}_breached": True
+                for timer in _TIMERS
+                if getattr(row, f"{timer}_breached") and not getattr(row, f"was_{timer}_breached")
+            }
+            if not flipped:
+                continue
+            TicketSlaStateProducer.send_ticket_sla_state_updated(
+                tenant_id=row.tenant_id,
+                ticket_id=row.ticket_id,
+                changes=TicketSlaStateDelta(base_fields=flipped),
+                payload=ticket_sla_state_snapshot(row),
+            )
+        with TicketSlaStateProducer.staged(db):
+            db.commit()
+    if not rows:
+        return 0
+    logger.info("Flagged SLA breaches on %s ticket SLA states", len(rows))
+    return len(rows)
+
+
+def run_scanner(stop_event: Optional[threading.Event] = None) -> None:
+    """Scan for passed deadlines until ``stop_event`` is set.
+
+    Full batches are followed immediately by the next batch; otherwise
+    the scanner sleeps for ``SLA_BREACH_SCAN_POLL_SECONDS``.
+    """
+    stop_event = stop_event or threading.Event()
+    batch_size = Config.sla_breach_scan_batch_size()
+    poll_seconds = Config.sla_breach_scan_poll_seconds()
+    logger.info("SLA breach scanner started batch_size=%s", batch_size)
+    while not stop_event.is_set():
+        flagged = 0
+        try:
+            with WorkerSessionLocal() as db:
+                flagged = scan_batch(db, batch_size=batch_size)
+        except Exception:
+            logger.exception("SLA breach scan failed")
+        if flagged < batch_size:
+            stop_event.wait(poll_seconds)
+
+
+def main() -> None:  # pragma: no cover - process entry point
+    logging.basicConfig(level=logging.INFO)
+    run_scanner()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
+
+
+__all__ = [
+    "breach_statement",
+    "scan_batch",
+    "run_scanner",
+]
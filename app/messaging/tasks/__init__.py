@@ -45,6 +45,8 @@ from .orchestration import (
     process_task_deleted,
 )
 from .orchestration import consume_orchestration_event, process_task_created, process_task_assigned, process_task_completed, process_task_updated, process_task_deleted
+from .company_import import run_company_import
+from .sla_recompute import run_sla_recompute
 
 __all__ = [
     "consume_event",
@@ -77,4 +79,6 @@ __all__ = [
     "process_task_completed",
     "process_task_updated",
     "process_task_deleted",
+    "run_company_import",
+    "run_sla_recompute",
 ]
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Celery task running bulk company import jobs.
+
+The API spools the upload and enqueues ``crm.jobs.company_import``
+with the job id (see :mod:`app.domain.services.company_import_service`).
+The task reports progress through Celery's ``PROGRESS`` state in
+addition to the counters stored on the job row.  Events are buffered
+for the run so each chunk's ``company.bulk_imported`` event is staged
+with the commit of that chunk.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict, Optional
+
+from app.core.celery_app import celery_app
+from app.core.db import WorkerSessionLocal
+from app.domain.services import company_import_service
+from app.messaging.producers.common import BaseProducer
+
+
+@celery_app.task(name=company_import_service.TASK_RUN_IMPORT, bind=True)
+def run_company_import(self: Any, job_id: str) -> Optional[Dict[str, Any]]:
+    """Process one queued company import job."""
+
+    def _progress(meta: Dict[str, Any]) -> None:
+        self.update_state(state="PROGRESS", meta=meta)
+
+    with WorkerSessionLocal() as db, BaseProducer.buffered():
+        job = company_import_service.run_import_job(
+            db, uuid.UUID(job_id), progress=_progress
+        )
+        if job is None:
+            return None
+        return {
+            "job_id": str(job.id),
+            "status": job.status,
+            "total_rows": job.total_rows,
+            "imported": job.imported,
+            "failed": job.failed,
+            "relationships": job.relationships,
+        }
+
+
+__all__ = ["run_company_import"]
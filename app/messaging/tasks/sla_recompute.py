@@ -0,0 +1,27 @@
+"""
+Celery task recomputing ticket SLA due dates in bulk.
+
+SLA policy, target, group profile and business hours changes enqueue
+``crm.jobs.sla_recompute`` with the tenant id (see
+:mod:`app.domain.services.sla_engine_service`).
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict
+
+from app.core.celery_app import celery_app
+from app.core.db import WorkerSessionLocal
+from app.domain.services import sla_engine_service
+
+
+@celery_app.task(name=sla_engine_service.TASK_RECOMPUTE)
+def run_sla_recompute(tenant_id: str) -> Dict[str, Any]:
+    """Recompute the SLA state of a tenant's open tickets."""
+    with WorkerSessionLocal() as db:
+        processed = sla_engine_service.recompute_tenant(db, tenant_id=uuid.UUID(tenant_id))
+    return {"tenant_id": tenant_id, "tickets": processed}
+
+
+__all__ = ["run_sla_recompute"]
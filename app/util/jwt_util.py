@@ -1,7 +1,10 @@
 # app/utils/jwt_util.py
 
+import hashlib
+import threading
 import time
-from typing import Iterable, Optional, Set, Dict, Any
+from collections import OrderedDict
+from typing import Iterable, Optional, Set, Dict, Any, Tuple
 
 from fastapi import HTTPException, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -16,6 +19,81 @@ TEST_PASSWORD = "changeme123"
 security = HTTPBearer()
 
 
+class _DecodedTokenCache:
+    """Bounded LRU of verified JWT payloads.
+
+    Keys are SHA-256 digests of the signing key, algorithm and token, so
+    raw tokens are not kept in memory and a key rotation misses the
+    cache.  Entries expire at the token's ``exp`` (capped by
+    ``JWT_CACHE_MAX_TTL_SECONDS``); after that the token is decoded
+    again, which rejects it once it has expired.
+    """
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str, secret: str, algorithm: str) -> bytes:
+        return hashlib.sha256(f"{algorithm}\0{secret}\0{token}".encode()).digest()
+
+    def get(self, key: bytes, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: bytes, payload: Dict[str, Any], now: float, max_size: int) -> None:
+        expires_at = now + Config.jwt_cache_max_ttl_seconds()
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_decoded_tokens = _DecodedTokenCache()
+
+
+def decode_jwt(token: str) -> Dict[str, Any]:
+    """Verify ``token`` and return its payload, reusing earlier results.
+
+    Raises the ``jose`` errors of ``jwt.decode`` for invalid tokens;
+    failures are never cached.
+    """
+    secret = Config.jwt_secret()
+    algorithm = Config.jwt_algorithm()
+    max_size = Config.jwt_cache_size()
+    if max_size <= 0:
+        return jwt.decode(token, key=secret, algorithms=[algorithm])
+    now = time.time()
+    key = _DecodedTokenCache.key(token, secret, algorithm)
+    payload = _decoded_tokens.get(key, now)
+    if payload is not None:
+        return payload
+    payload = jwt.decode(token, key=secret, algorithms=[algorithm])
+    _decoded_tokens.put(key, payload, now, max_size)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("JWT validated for subject: %s", payload.get("sub"))
+        for claim, value in payload.items():
+            logger.debug("JWT claim: %s = %s", claim, value)
+    return payload
+
+
 def generate_test_jwt(
     username: str,
     claims: Dict,
@@ -83,22 +161,9 @@ def auth_jwt(
         user_id: Optional[str] = None,    # injected from path if present
     ) -> Dict[str, Any]:
         try:
-            logger .info("Received JWT token for validation")
-
-            payload = jwt.decode(
-                token.credentials,
-                key=Config.jwt_secret(),
-                algorithms=[Config.jwt_algorithm()],
-            )
-
-            logger .info(
-                "JWT validation successful for subject: %s", payload.get("sub")
-            )
-            
-            # dubug info: log all claims
-            if logger .isEnabledFor(logging.DEBUG):
-                for claim, value in payload.items():
-                    logger .debug("JWT claim: %s = %s", claim, value)
+            # Verified payloads are cached; only cache misses are logged
+            # (at DEBUG) to keep logging off the per-request path.
+            payload = decode_jwt(token.credentials)
 
             # ---------- static required claims ----------
             if required:
@@ -0,0 +1,100 @@
+"""
+Fast JSON serialization helpers for the CRM service.
+
+Event payloads and API responses used to be converted value by value
+(``isoformat()``, ``str(uuid)``, ``model_dump(mode="json")``) and then
+encoded again by the stdlib ``json`` module.  orjson encodes UUID,
+datetime, date and Enum values natively, so rows can be copied into
+plain dicts and turned into JSON bytes in a single pass.
+
+``dumps`` is registered as the Celery task serializer, used as the
+SQLAlchemy JSON serializer (event outbox envelopes) and by the API
+response class.  ``column_extractor`` builds the per‑model snapshot
+functions used for event payloads.
+"""
+
+from __future__ import annotations
+
+import decimal
+import operator
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
+
+
+# Non-string dict keys (e.g. UUIDs) are stringified like the stdlib encoder does
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Encode the few types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, decimal.Decimal):
+        # Same representation Pydantic uses in JSON mode
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` to JSON bytes."""
+    return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS)
+
+
+def dumps_str(obj: Any) -> str:
+    """Encode ``obj`` to a JSON string (for APIs that require ``str``)."""
+    return dumps(obj).decode("utf-8")
+
+
+loads = orjson.loads
+
+
+def column_extractor(
+    model: Any,
+    fields: Optional[Iterable[str]] = None,
+    *,
+    converters: Optional[Mapping[str, Callable[[Any], Any]]] = None,
+) -> Callable[[Any], Dict[str, Any]]:
+    """Build a function that copies mapped columns of ``model`` into a dict.
+
+    ``fields`` fixes the keys (and their order) of the resulting dict
+    and defaults to every mapped column.  Unknown names raise
+    ``ValueError`` when the extractor is built, i.e. at import time of
+    the module declaring it.  Values are returned as loaded; ``dumps``
+    renders UUIDs and datetimes in the same format ``str()`` and
+    ``isoformat()`` produce.  ``converters`` maps a field to a callable
+    applied to non-null values.
+
+    The attribute lookups are compiled into a single
+    ``operator.attrgetter`` so extracting a row is one C call plus a
+    ``dict(zip(...))``.
+    """
+    mapper = sa_inspect(model)
+    columns = list(mapper.columns.keys())
+    keys = tuple(fields) if fields is not None else tuple(columns)
+    unknown = [key for key in keys if key not in columns]
+    if unknown:
+        raise ValueError(f"{mapper.class_.__name__} has no mapped columns {unknown}")
+    getter = operator.attrgetter(*keys)
+    convert = tuple((converters or {}).items())
+    single = len(keys) == 1
+
+    def extract(obj: Any) -> Dict[str, Any]:
+        values = getter(obj)
+        row = dict(zip(keys, (values,) if single else values))
+        for key, fn in convert:
+            value = row[key]
+            if value is not None:
+                row[key] = fn(value)
+        return row
+
+    extract.__name__ = f"extract_{mapper.class_.__name__}"
+    extract.__qualname__ = extract.__name__
+    return extract
+
+
+__all__ = ["column_extractor", "dumps", "dumps_str", "loads"]
@@ -8,7 +8,8 @@ developer guide and tenant service for consistency.
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import Config
 
@@ -87,6 +88,8 @@ from app.api.routes import (
     automation_actions_admin_router,
     automation_actions_tenant_router,
     stage_history_tenant_router,
+    pipeline_reports_tenant_router,
+    business_hours_tenant_router,
 )
 
 # Initialise logging and telemetry when the app is created.  Doing
@@ -97,7 +100,12 @@ from app.api.routes import (
 from app.core.logging import configure_logging, get_logger
 from app.core.telemetry import init_tracing, instrument_fastapi
 
+from app.api.responses import default_response_class
+from app.core import read_routing
+from app.core.db import dispose_async_engines
+from app.messaging import config_cache
 from app.util.liquibase import apply_changelog
+from app.messaging.producers.common import BaseProducer
 
 configure_logging()
 logger = get_logger(__name__)
@@ -116,8 +124,16 @@ async def lifespan(app: FastAPI):
             )
     else:
         logger.info("Skipping Liquibase schema validation and update")
+    try:
+        config_cache.start_listener()
+    except Exception as exc:
+        # Without broadcasts, entries changed by other processes expire
+        # after TENANT_CONFIG_CACHE_TTL_SECONDS.
+        logger.error("Failed to start the config cache listener", exc_info=exc)
     yield
     logger.info("shutdown_event: CRM Service is shutting down")
+    await run_in_threadpool(config_cache.stop_listener)
+    await dispose_async_engines()
 
 
 def create_app() -> FastAPI:
@@ -125,7 +141,50 @@ def create_app() -> FastAPI:
     # Configure logging and tracing before creating the app.  Logging
     # configuration happens only once; subsequent calls are idempotent.
     init_tracing(service_name="dyno-crm")
-    app = FastAPI(lifespan=lifespan, title="DYNO CRM API", version="0.1.0")
+    # orjson-rendered responses unless FastAPI already serializes
+    # response models to JSON bytes itself (see app.api.responses).
+    app = FastAPI(
+        lifespan=lifespan,
+        title="DYNO CRM API",
+        version="0.1.0",
+        default_response_class=default_response_class(),
+    )
+
+    @app.middleware("http")
+    async def publish_buffer_middleware(request: Request, call_next):
+        """Publish all events produced by a request in one batch.
+
+        Producers called while handling the request append to a shared
+        buffer instead of talking to the broker (or outbox) per event.
+        ``commit_or_raise`` stages the buffered events in the request's
+        transaction: as outbox rows when the outbox is enabled, or held
+        until the commit succeeds otherwise.  Events released that way
+        are sent once the endpoint returns; the flush runs in the
+        threadpool so broker I/O never blocks the event loop.
+        """
+        try:
+            with BaseProducer.buffered(autoflush=False) as buffer:
+                response = await call_next(request)
+        finally:
+            if len(buffer):
+                try:
+                    await run_in_threadpool(buffer.flush)
+                except Exception:
+                    logger.exception("Failed to publish buffered events")
+        return response
+
+    if Config.database_replica_url():
+
+        @app.middleware("http")
+        async def read_your_writes_middleware(request: Request, call_next):
+            """Pin clients and tenants to the primary after a write.
+
+            Read-only endpoints use the replica through ``get_read_db``;
+            see ``app.core.read_routing`` for how the pin is carried.
+            """
+            response = await call_next(request)
+            read_routing.record_write(request, response)
+            return response
 
     # Include routers
     app.include_router(contacts_admin_router)
@@ -165,6 +224,10 @@ def create_app() -> FastAPI:
     app.include_router(automation_actions_tenant_router)
     # Include stage history router (read-only)
     app.include_router(stage_history_tenant_router)
+    # Include pipeline reports router (read-only, served from rollups)
+    app.include_router(pipeline_reports_tenant_router)
+    # Include business hours router (SLA calendars)
+    app.include_router(business_hours_tenant_router)
     # Replace the legacy association router with separate admin and tenant routers
     app.include_router(associations_admin_router)
     app.include_router(associations_tenant_router)
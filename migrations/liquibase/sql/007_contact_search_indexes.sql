@@ -0,0 +1,46 @@
+-- ======================================================================
+-- Dyno CRM - Contact Search Indexes
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:007_contact_search_indexes
+--
+-- PURPOSE
+--   Contact search filters on phone and email are evaluated in the
+--   database as EXISTS subqueries using case-insensitive substring
+--   matches (ILIKE '%term%').  B-tree indexes cannot serve leading
+--   wildcard patterns, so this migration adds trigram GIN indexes on the
+--   searched columns of contact_phone and contact_email.
+--
+-- NOTES
+--   - gin_trgm_ops supports LIKE/ILIKE directly on the column, so no
+--     lower() expression index is required.
+--   - tenant_id is not part of the GIN index; the planner combines it
+--     with ix_contact_phone_tenant_contact / ix_contact_email_tenant_contact
+--     via a bitmap AND when the tenant filter is selective.
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ----------------------------------------------------------------------
+-- contact_phone
+-- ----------------------------------------------------------------------
+CREATE INDEX IF NOT EXISTS ix_contact_phone_phone_raw_trgm
+    ON dyno_crm.contact_phone USING GIN (phone_raw gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_contact_phone_phone_e164_trgm
+    ON dyno_crm.contact_phone USING GIN (phone_e164 gin_trgm_ops)
+    WHERE phone_e164 IS NOT NULL;
+
+-- ----------------------------------------------------------------------
+-- contact_email
+-- ----------------------------------------------------------------------
+CREATE INDEX IF NOT EXISTS ix_contact_email_email_trgm
+    ON dyno_crm.contact_email USING GIN (email gin_trgm_ops);
+
+-- ----------------------------------------------------------------------
+-- contact (stable ordering for paginated listing)
+-- ----------------------------------------------------------------------
+CREATE INDEX IF NOT EXISTS ix_contact_tenant_created_at
+    ON dyno_crm.contact(tenant_id, created_at DESC, id DESC);
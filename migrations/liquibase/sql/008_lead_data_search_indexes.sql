@@ -0,0 +1,40 @@
+-- ======================================================================
+-- Dyno CRM - Lead Data Search Indexes
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:008_lead_data_search_indexes
+--
+-- PURPOSE
+--   Lead search (used by inbound web-form dedupe) filters on the values
+--   of lead_data.phone_numbers and lead_data.emails, both stored as
+--   {"<type>": "<value>"} objects.  The service matches with
+--     jsonb_path_query_array(lead_data, '$.<key>.*')::text ILIKE '%term%'
+--   and rechecks individual values with jsonb_each_text.  This migration
+--   adds trigram GIN expression indexes on exactly those expressions so
+--   the first predicate is index-assisted.
+--
+-- NOTES
+--   - jsonb_path_query_array (non-_tz variant) and the jsonb -> text cast
+--     are IMMUTABLE, so they are legal in an index expression.
+--   - The expressions below must stay textually identical to the ones
+--     built in lead_service._lead_data_value_match.
+--   - Requires pg_trgm (created in 007_contact_search_indexes.sql).
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_lead_lead_data_phone_numbers_trgm
+    ON dyno_crm.lead USING GIN (
+        (jsonb_path_query_array(lead_data, '$.phone_numbers.*')::text) gin_trgm_ops
+    );
+
+CREATE INDEX IF NOT EXISTS ix_lead_lead_data_emails_trgm
+    ON dyno_crm.lead USING GIN (
+        (jsonb_path_query_array(lead_data, '$.emails.*')::text) gin_trgm_ops
+    );
+
+-- Stable ordering for paginated listing
+CREATE INDEX IF NOT EXISTS ix_lead_tenant_created_at
+    ON dyno_crm.lead(tenant_id, created_at DESC, id DESC);
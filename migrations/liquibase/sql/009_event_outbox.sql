@@ -0,0 +1,45 @@
+-- ======================================================================
+-- Dyno CRM - Transactional Event Outbox
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:009_event_outbox
+--
+-- PURPOSE
+--   Domain events used to be published with a synchronous Celery
+--   send_task inside the request, so a slow or unavailable broker added
+--   latency to every write and could drop events.  Producers now insert
+--   the event envelope into dyno_crm.event_outbox and a separate relay
+--   process (python -m app.messaging.outbox) publishes pending rows in
+--   batches and stamps published_at.
+--
+-- NOTES
+--   - id equals the envelope event_id and is reused as the broker task
+--     id, so consumers can de-duplicate the relay's at-least-once
+--     delivery.
+--   - The relay claims rows with FOR UPDATE SKIP LOCKED, so several
+--     relay processes can run side by side.
+--   - Both indexes are partial so they stay small: pending rows for the
+--     relay scan, published rows for the retention purge.
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+CREATE TABLE IF NOT EXISTS dyno_crm.event_outbox (
+    id            UUID         PRIMARY KEY,
+    tenant_id     UUID         NULL,
+    task_name     VARCHAR(255) NOT NULL,
+    envelope      JSONB        NOT NULL,
+    headers       JSONB        NOT NULL DEFAULT '{}'::jsonb,
+    created_at    TIMESTAMPTZ  NOT NULL DEFAULT now(),
+    published_at  TIMESTAMPTZ  NULL,
+    attempts      INTEGER      NOT NULL DEFAULT 0,
+    last_error    TEXT         NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_event_outbox_unpublished
+    ON dyno_crm.event_outbox (created_at)
+    WHERE published_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_event_outbox_published_at
+    ON dyno_crm.event_outbox (published_at)
+    WHERE published_at IS NOT NULL;
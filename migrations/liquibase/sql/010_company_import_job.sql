@@ -0,0 +1,66 @@
+-- ======================================================================
+-- Dyno CRM - Bulk Company Import Jobs
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:010_company_import_job
+--
+-- PURPOSE
+--   Bulk company imports (hundreds of thousands of companies with
+--   nested collections, company_relationship and
+--   contact_company_relationship rows) run as a Celery task instead of
+--   inside the HTTP request.  The upload is spooled into
+--   dyno_crm.company_import_row and the job's progress and outcome are
+--   tracked on dyno_crm.company_import_job.
+--
+-- NOTES
+--   - Each spooled row keeps the caller's external_key; company_id is
+--     filled once the company has been inserted.  Relationships given
+--     by external key are resolved by joining on
+--     (job_id, external_key) after all companies are loaded, so parents
+--     may appear before or after their children in the upload.
+--   - Spooled rows are deleted when the job finishes; the job row keeps
+--     the counters and the (capped) list of row errors.
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+CREATE TABLE IF NOT EXISTS dyno_crm.company_import_job (
+    id                UUID         PRIMARY KEY,
+    tenant_id         UUID         NOT NULL,
+    status            VARCHAR(20)  NOT NULL DEFAULT 'queued',
+    phase             VARCHAR(20)  NULL,
+    total_rows        INTEGER      NOT NULL DEFAULT 0,
+    processed_rows    INTEGER      NOT NULL DEFAULT 0,
+    imported          INTEGER      NOT NULL DEFAULT 0,
+    failed            INTEGER      NOT NULL DEFAULT 0,
+    relationships     INTEGER      NOT NULL DEFAULT 0,
+    errors            JSONB        NOT NULL DEFAULT '[]'::jsonb,
+    errors_truncated  BOOLEAN      NOT NULL DEFAULT FALSE,
+    error_message     TEXT         NULL,
+    started_at        TIMESTAMPTZ  NULL,
+    finished_at       TIMESTAMPTZ  NULL,
+    created_at        TIMESTAMPTZ  NOT NULL DEFAULT now(),
+    updated_at        TIMESTAMPTZ  NOT NULL DEFAULT now(),
+    created_by        VARCHAR(100) NULL,
+    updated_by        VARCHAR(100) NULL,
+    CONSTRAINT ck_company_import_job_status
+        CHECK (status IN ('queued', 'running', 'completed', 'failed'))
+);
+
+CREATE INDEX IF NOT EXISTS ix_company_import_job_tenant_created
+    ON dyno_crm.company_import_job (tenant_id, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS dyno_crm.company_import_row (
+    job_id        UUID          NOT NULL
+        REFERENCES dyno_crm.company_import_job (id) ON DELETE CASCADE,
+    row_no        INTEGER       NOT NULL,
+    external_key  VARCHAR(255)  NULL,
+    payload       JSONB         NULL,
+    parse_error   TEXT          NULL,
+    company_id    UUID          NULL,
+    PRIMARY KEY (job_id, row_no)
+);
+
+CREATE INDEX IF NOT EXISTS ix_company_import_row_job_external_key
+    ON dyno_crm.company_import_row (job_id, external_key)
+    WHERE external_key IS NOT NULL;
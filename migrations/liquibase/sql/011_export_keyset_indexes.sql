@@ -0,0 +1,29 @@
+-- ======================================================================
+-- Dyno CRM - Export Keyset Indexes
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:011_export_keyset_indexes
+--
+-- PURPOSE
+--   Streaming exports read all rows of a tenant ordered by
+--   (created_at, id) through a server-side cursor.  Contacts and leads
+--   already have a (tenant_id, created_at DESC, id DESC) index; this
+--   migration adds the same index for companies, tickets and deals so
+--   exports (and keyset-paginated lists) stream in index order instead
+--   of sorting the whole tenant first.
+--
+-- NOTES
+--   - A backward index scan serves the ascending export order, so one
+--     DESC index covers both exports and newest-first list pages.
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+CREATE INDEX IF NOT EXISTS ix_company_tenant_created_at
+    ON dyno_crm.company(tenant_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_ticket_tenant_created_at
+    ON dyno_crm.ticket(tenant_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_deals_tenant_created_at
+    ON dyno_crm.deal(tenant_id, created_at DESC, id DESC);
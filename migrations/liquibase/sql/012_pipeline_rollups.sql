@@ -0,0 +1,218 @@
+-- ======================================================================
+-- Dyno CRM - Pipeline Analytics Rollups
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:012_pipeline_rollups
+--
+-- PURPOSE
+--   The pipeline reports (Pipeline Overview, Stage Funnel, Stage
+--   Velocity, Stage Conversion, Weighted Pipeline) are served from
+--   small aggregate tables that are updated incrementally whenever a
+--   stage transition is recorded or a deal changes, instead of scanning
+--   stage_history and deal on every request:
+--
+--   - pipeline_stage_daily_rollup: per (tenant, pipeline, stage, day)
+--     transitions into and out of the stage and the total time spent
+--     in the stage by the exits that day.
+--   - pipeline_stage_transition_daily_rollup: per (tenant, pipeline,
+--     from stage, to stage, day) transition counts.
+--   - pipeline_stage_deal_rollup: the deals currently in each
+--     (tenant, pipeline, stage) with their amount and forecast parts.
+--
+-- NOTES
+--   - 005_pipeline_improvements dropped dyno_crm.stage_history while the
+--     service still records transitions into it; the table is recreated
+--     here (unchanged shape) when missing.
+--   - Stage probability and stage_state are joined at read time, so
+--     editing a stage does not invalidate the deal rollup.  The
+--     weighted amount is forecast_weighted_amount +
+--     unforecast_amount * COALESCE(stage.probability, 0), where a deal
+--     counts as forecast when COALESCE(forecast_probability, probability)
+--     is set (the order pipeline_forecast_service uses).
+--   - Days are UTC calendar days.
+--   - Existing history and deals are backfilled at the end.
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+-- ----------------------------------------------------------------------
+-- 1. Stage history (recreated)
+-- ----------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS dyno_crm.stage_history (
+    id                 UUID                     PRIMARY KEY,
+    tenant_id          UUID                     NOT NULL,
+    entity_type        dyno_crm.crm_record_type NOT NULL,
+    entity_id          UUID                     NOT NULL,
+    pipeline_id        UUID,
+    from_stage_id      UUID,
+    to_stage_id        UUID,
+    changed_at         TIMESTAMPTZ              NOT NULL DEFAULT NOW(),
+    changed_by_user_id UUID,
+    source             VARCHAR(50),
+    CONSTRAINT fk_stage_history_pipeline
+        FOREIGN KEY (tenant_id, pipeline_id)
+        REFERENCES dyno_crm.pipeline (tenant_id, id)
+        ON DELETE SET NULL
+        DEFERRABLE INITIALLY DEFERRED,
+    CONSTRAINT fk_stage_history_from_stage
+        FOREIGN KEY (tenant_id, from_stage_id)
+        REFERENCES dyno_crm.pipeline_stage (tenant_id, id)
+        ON DELETE SET NULL
+        DEFERRABLE INITIALLY DEFERRED,
+    CONSTRAINT fk_stage_history_to_stage
+        FOREIGN KEY (tenant_id, to_stage_id)
+        REFERENCES dyno_crm.pipeline_stage (tenant_id, id)
+        ON DELETE SET NULL
+        DEFERRABLE INITIALLY DEFERRED
+);
+
+CREATE INDEX IF NOT EXISTS ix_stage_history_entity
+    ON dyno_crm.stage_history (tenant_id, entity_type, entity_id);
+
+CREATE INDEX IF NOT EXISTS ix_stage_history_pipeline
+    ON dyno_crm.stage_history (tenant_id, pipeline_id);
+
+-- ----------------------------------------------------------------------
+-- 2. Rollup tables
+-- ----------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS dyno_crm.pipeline_stage_daily_rollup (
+    tenant_id              UUID         NOT NULL,
+    pipeline_id            UUID         NOT NULL,
+    stage_id               UUID         NOT NULL,
+    day                    DATE         NOT NULL,
+    entered_count          INTEGER      NOT NULL DEFAULT 0,
+    exited_count           INTEGER      NOT NULL DEFAULT 0,
+    -- Exits whose entry into the stage is known; exit_duration_seconds
+    -- sums the time in stage of exactly these exits.
+    timed_exit_count       INTEGER      NOT NULL DEFAULT 0,
+    exit_duration_seconds  BIGINT       NOT NULL DEFAULT 0,
+    updated_at             TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_pipeline_stage_daily_rollup
+        PRIMARY KEY (tenant_id, pipeline_id, stage_id, day),
+    CONSTRAINT fk_pipeline_stage_daily_rollup_pipeline
+        FOREIGN KEY (pipeline_id, tenant_id)
+        REFERENCES dyno_crm.pipeline (id, tenant_id)
+        ON DELETE CASCADE,
+    CONSTRAINT fk_pipeline_stage_daily_rollup_stage
+        FOREIGN KEY (stage_id, tenant_id)
+        REFERENCES dyno_crm.pipeline_stage (id, tenant_id)
+        ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS dyno_crm.pipeline_stage_transition_daily_rollup (
+    tenant_id         UUID         NOT NULL,
+    pipeline_id       UUID         NOT NULL,
+    from_stage_id     UUID         NOT NULL,
+    to_stage_id       UUID         NOT NULL,
+    day               DATE         NOT NULL,
+    transition_count  INTEGER      NOT NULL DEFAULT 0,
+    updated_at        TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_pipeline_stage_transition_daily_rollup
+        PRIMARY KEY (tenant_id, pipeline_id, from_stage_id, to_stage_id, day),
+    CONSTRAINT fk_pipeline_stage_transition_daily_rollup_pipeline
+        FOREIGN KEY (pipeline_id, tenant_id)
+        REFERENCES dyno_crm.pipeline (id, tenant_id)
+        ON DELETE CASCADE,
+    CONSTRAINT fk_pipeline_stage_transition_daily_rollup_from_stage
+        FOREIGN KEY (from_stage_id, tenant_id)
+        REFERENCES dyno_crm.pipeline_stage (id, tenant_id)
+        ON DELETE CASCADE,
+    CONSTRAINT fk_pipeline_stage_transition_daily_rollup_to_stage
+        FOREIGN KEY (to_stage_id, tenant_id)
+        REFERENCES dyno_crm.pipeline_stage (id, tenant_id)
+        ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS dyno_crm.pipeline_stage_deal_rollup (
+    tenant_id                 UUID           NOT NULL,
+    pipeline_id               UUID           NOT NULL,
+    stage_id                  UUID           NOT NULL,
+    deal_count                INTEGER        NOT NULL DEFAULT 0,
+    amount_sum                NUMERIC(18,2)  NOT NULL DEFAULT 0,
+    -- SUM(amount * COALESCE(forecast_probability, probability)) of deals
+    -- with a probability of their own
+    forecast_weighted_amount  NUMERIC(20,4)  NOT NULL DEFAULT 0,
+    -- SUM(amount) of deals without one (weighted by the stage probability)
+    unforecast_amount         NUMERIC(18,2)  NOT NULL DEFAULT 0,
+    updated_at                TIMESTAMPTZ    NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_pipeline_stage_deal_rollup
+        PRIMARY KEY (tenant_id, pipeline_id, stage_id),
+    CONSTRAINT fk_pipeline_stage_deal_rollup_pipeline
+        FOREIGN KEY (pipeline_id, tenant_id)
+        REFERENCES dyno_crm.pipeline (id, tenant_id)
+        ON DELETE CASCADE,
+    CONSTRAINT fk_pipeline_stage_deal_rollup_stage
+        FOREIGN KEY (stage_id, tenant_id)
+        REFERENCES dyno_crm.pipeline_stage (id, tenant_id)
+        ON DELETE CASCADE
+);
+
+-- ----------------------------------------------------------------------
+-- 3. Backfill
+-- ----------------------------------------------------------------------
+-- An exit is timed when the entity's previous transition entered the
+-- stage it is leaving (the same rule the service applies).
+WITH ordered AS (
+    SELECT
+        h.tenant_id,
+        h.pipeline_id,
+        h.from_stage_id,
+        h.to_stage_id,
+        (h.changed_at AT TIME ZONE 'UTC')::date AS day,
+        h.changed_at,
+        LAG(h.changed_at) OVER w AS prev_changed_at,
+        LAG(h.to_stage_id) OVER w AS prev_to_stage_id
+    FROM dyno_crm.stage_history h
+    WINDOW w AS (PARTITION BY h.tenant_id, h.entity_type, h.entity_id ORDER BY h.changed_at)
+),
+movements AS (
+    SELECT tenant_id, pipeline_id, to_stage_id AS stage_id, day,
+           1 AS entered, 0 AS exited, 0 AS timed, 0::bigint AS seconds
+    FROM ordered
+    WHERE pipeline_id IS NOT NULL AND to_stage_id IS NOT NULL
+    UNION ALL
+    SELECT tenant_id, pipeline_id, from_stage_id, day,
+           0, 1,
+           CASE WHEN prev_to_stage_id = from_stage_id THEN 1 ELSE 0 END,
+           CASE WHEN prev_to_stage_id = from_stage_id
+                THEN GREATEST(0, EXTRACT(EPOCH FROM changed_at - prev_changed_at))::bigint
+                ELSE 0 END
+    FROM ordered
+    WHERE pipeline_id IS NOT NULL AND from_stage_id IS NOT NULL
+)
+INSERT INTO dyno_crm.pipeline_stage_daily_rollup (
+    tenant_id, pipeline_id, stage_id, day,
+    entered_count, exited_count, timed_exit_count, exit_duration_seconds
+)
+SELECT tenant_id, pipeline_id, stage_id, day,
+       SUM(entered), SUM(exited), SUM(timed), SUM(seconds)
+FROM movements
+GROUP BY tenant_id, pipeline_id, stage_id, day
+ON CONFLICT DO NOTHING;
+
+INSERT INTO dyno_crm.pipeline_stage_transition_daily_rollup (
+    tenant_id, pipeline_id, from_stage_id, to_stage_id, day, transition_count
+)
+SELECT tenant_id, pipeline_id, from_stage_id, to_stage_id,
+       (changed_at AT TIME ZONE 'UTC')::date, COUNT(*)
+FROM dyno_crm.stage_history
+WHERE pipeline_id IS NOT NULL
+  AND from_stage_id IS NOT NULL
+  AND to_stage_id IS NOT NULL
+GROUP BY tenant_id, pipeline_id, from_stage_id, to_stage_id, (changed_at AT TIME ZONE 'UTC')::date
+ON CONFLICT DO NOTHING;
+
+INSERT INTO dyno_crm.pipeline_stage_deal_rollup (
+    tenant_id, pipeline_id, stage_id,
+    deal_count, amount_sum, forecast_weighted_amount, unforecast_amount
+)
+SELECT tenant_id, pipeline_id, stage_id,
+       COUNT(*),
+       COALESCE(SUM(amount), 0),
+       COALESCE(SUM(amount * COALESCE(forecast_probability, probability))
+                FILTER (WHERE COALESCE(forecast_probability, probability) IS NOT NULL), 0),
+       COALESCE(SUM(amount) FILTER (WHERE COALESCE(forecast_probability, probability) IS NULL), 0)
+FROM dyno_crm.deal
+WHERE pipeline_id IS NOT NULL AND stage_id IS NOT NULL
+GROUP BY tenant_id, pipeline_id, stage_id
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,24 @@
+-- ======================================================================
+-- Dyno CRM - Stage History Dwell Index
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:013_stage_history_dwell_index
+--
+-- PURPOSE
+--   The Stage Durations and Deal Aging reports derive the time each
+--   record spent in a stage from consecutive stage_history rows with
+--   LEAD(changed_at) OVER (PARTITION BY entity_id ORDER BY changed_at).
+--   This covering index returns a tenant's history already in that
+--   order, so the window runs over an index-only scan without a sort
+--   or heap access.
+--
+-- NOTES
+--   - entity_type, pipeline_id and to_stage_id are INCLUDE columns:
+--     they are read by the reports but are not part of the ordering.
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+CREATE INDEX IF NOT EXISTS ix_stage_history_entity_changed_at
+    ON dyno_crm.stage_history (tenant_id, entity_id, changed_at)
+    INCLUDE (entity_type, pipeline_id, to_stage_id);
@@ -0,0 +1,50 @@
+-- ======================================================================
+-- Dyno CRM - SLA Business Hours
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:014_sla_business_hours
+--
+-- PURPOSE
+--   SLA due dates are computed by the CRM from sla_target minutes and a
+--   business-hours calendar instead of being written by orchestration.
+--   business_hours stores the calendars that group_profile.business_hours_id
+--   has referenced since 002 (it was a placeholder until now).
+--
+-- NOTES
+--   - weekly_hours is a JSON array of {"day": "mon".."sun",
+--     "start": "HH:MM", "end": "HH:MM"} open intervals in time_zone
+--     (an IANA zone name); "24:00" ends an interval at midnight.
+--     An empty array means the calendar is always open.
+--   - holidays is a JSON array of ISO dates on which the calendar is
+--     closed.
+--   - The group_profile foreign key is added NOT VALID so profiles
+--     holding placeholder ids do not block the migration.
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+CREATE TABLE IF NOT EXISTS dyno_crm.business_hours (
+    id           UUID         PRIMARY KEY,
+    tenant_id    UUID         NOT NULL,
+    name         VARCHAR(255) NOT NULL,
+    time_zone    VARCHAR(64)  NOT NULL DEFAULT 'UTC',
+    weekly_hours JSONB        NOT NULL DEFAULT '[]'::jsonb,
+    holidays     JSONB        NOT NULL DEFAULT '[]'::jsonb,
+    created_at   TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    updated_at   TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    created_by   VARCHAR(100),
+    updated_by   VARCHAR(100),
+
+    CONSTRAINT ux_business_hours_id_tenant UNIQUE (id, tenant_id),
+    CONSTRAINT ux_business_hours_tenant_name UNIQUE (tenant_id, name)
+);
+
+DO $$ BEGIN
+    ALTER TABLE dyno_crm.group_profile
+        ADD CONSTRAINT fk_group_profile_business_hours
+        FOREIGN KEY (business_hours_id) REFERENCES dyno_crm.business_hours(id)
+        ON DELETE SET NULL
+        NOT VALID;
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END $$;
@@ -0,0 +1,38 @@
+-- ======================================================================
+-- Dyno CRM - Ticket SLA State Next Due Index
+-- ======================================================================
+-- liquibase formatted sql
+-- changeset crm_service:015_ticket_sla_state_next_due
+--
+-- PURPOSE
+--   The SLA breach scanner (app.messaging.sla_breach_scanner) flips the
+--   breach flags of timers whose due date has passed.  next_due_at is
+--   the earliest due date among a state's unbreached timers; the
+--   partial index below holds only states that still have such a timer,
+--   ordered by that deadline.  Each scan reads the index range
+--   next_due_at <= now, so its cost is proportional to the deadlines
+--   that passed since the previous scan, not to the number of open
+--   tickets.
+--
+-- NOTES
+--   - next_due_at is a stored generated column; LEAST ignores NULLs, so
+--     it is NULL once every timer is stopped or breached and the row
+--     leaves the index.
+--   - Adding a stored generated column rewrites ticket_sla_state.
+-- ======================================================================
+
+SET search_path TO public, dyno_crm;
+
+ALTER TABLE dyno_crm.ticket_sla_state
+    ADD COLUMN IF NOT EXISTS next_due_at TIMESTAMPTZ
+    GENERATED ALWAYS AS (
+        LEAST(
+            CASE WHEN NOT first_response_breached THEN first_response_due_at END,
+            CASE WHEN NOT next_response_breached THEN next_response_due_at END,
+            CASE WHEN NOT resolution_breached THEN resolution_due_at END
+        )
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_ticket_sla_state_next_due
+    ON dyno_crm.ticket_sla_state (next_due_at)
+    WHERE next_due_at IS NOT NULL;
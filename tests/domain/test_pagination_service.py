@@ -0,0 +1,149 @@
+"""
+Tests for the shared pagination helpers.
+
+These tests cover cursor encoding and the SQL emitted by ``paginate`` in
+both offset and keyset mode.  A ``RecordingQuery`` compiles the final
+statement instead of executing it, so no database is required.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+from app.domain.models.deal import Deal
+import app.domain.services.pagination_service as pagination_service
+from app.domain.services.pagination_service import (
+    clear_count_cache,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+    paginate,
+)
+
+
+class RecordingQuery(Query):
+    """Query that records compiled SQL instead of hitting a database."""
+
+    statements: list[str] = []
+    count_calls: int = 0
+
+    def _record(self) -> None:
+        RecordingQuery.statements.append(
+            str(self.statement.compile(dialect=postgresql.dialect()))
+        )
+
+    def count(self):  # type: ignore[override]
+        RecordingQuery.count_calls += 1
+        self._record()
+        return 7
+
+    def all(self):  # type: ignore[override]
+        self._record()
+        return []
+
+
+@pytest.fixture
+def db() -> Session:
+    RecordingQuery.statements = []
+    RecordingQuery.count_calls = 0
+    return Session(query_cls=RecordingQuery)
+
+
+def test_cursor_round_trip() -> None:
+    """A cursor decodes back to the sort value and id it was built from."""
+    created = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(created, row_id)) == (created, row_id)
+
+
+def test_decode_cursor_rejects_garbage() -> None:
+    """Malformed cursors are reported as a 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+def test_paginate_offset_mode_counts_and_pages(db: Session) -> None:
+    """Offset mode keeps the exact total and applies LIMIT/OFFSET."""
+    items, total = paginate(
+        db.query(Deal),
+        Deal,
+        order_by=(Deal.created_at.desc(),),
+        limit=10,
+        offset=20,
+    )
+    assert items == []
+    assert total == 7
+    assert len(RecordingQuery.statements) == 2
+    page_sql = RecordingQuery.statements[1]
+    assert "ORDER BY dyno_crm.deals.created_at DESC" in page_sql
+    assert "LIMIT" in page_sql and "OFFSET" in page_sql
+
+
+def test_paginate_keyset_mode_seeks_without_count(db: Session) -> None:
+    """Keyset mode skips the count and seeks past the cursor row."""
+    cursor = encode_cursor(datetime(2024, 5, 1, tzinfo=timezone.utc), uuid.uuid4())
+    items, total = paginate(db.query(Deal), Deal, cursor=cursor, page_size=25)
+    assert items == []
+    assert total is None
+    assert len(RecordingQuery.statements) == 1
+    sql = RecordingQuery.statements[0]
+    assert "(dyno_crm.deals.created_at, dyno_crm.deals.id) < (" in sql
+    assert "ORDER BY dyno_crm.deals.created_at DESC, dyno_crm.deals.id DESC" in sql
+    assert "OFFSET" not in sql
+
+
+def test_next_cursor_only_for_full_keyset_pages() -> None:
+    """A next cursor is returned only when another page may exist."""
+    rows = [
+        SimpleNamespace(id=uuid.uuid4(), created_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        for _ in range(2)
+    ]
+    assert next_cursor(rows) is None
+    assert next_cursor(rows, page_size=3) is None
+    token = next_cursor(rows, page_size=2)
+    assert decode_cursor(token) == (rows[-1].created_at, rows[-1].id)
+
+
+def test_total_mode_none_skips_count(db: Session) -> None:
+    """``total_mode='none'`` runs only the page query."""
+    items, total = paginate(db.query(Deal), Deal, limit=10, total_mode="none")
+    assert total is None
+    assert RecordingQuery.count_calls == 0
+
+
+def test_total_mode_estimated_caches_per_filter(db: Session) -> None:
+    """Estimated totals are cached per compiled query and parameters."""
+    clear_count_cache()
+    tenant_a, tenant_b = uuid.uuid4(), uuid.uuid4()
+
+    def page(tenant_id: uuid.UUID):
+        query = db.query(Deal).filter(Deal.tenant_id == tenant_id)
+        return paginate(query, Deal, limit=10, total_mode="estimated")
+
+    # No database is bound, so the planner estimate is unavailable and the
+    # helper falls back to an exact count which is then cached.
+    assert page(tenant_a)[1] == 7
+    assert page(tenant_a)[1] == 7
+    assert page(tenant_b)[1] == 7
+    assert RecordingQuery.count_calls == 2
+    clear_count_cache()
+
+
+def test_total_mode_estimated_uses_large_planner_estimate(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Large planner estimates are returned without an exact count."""
+    clear_count_cache()
+    monkeypatch.setattr(pagination_service, "estimate_count", lambda query: 250_000)
+    _, total = paginate(db.query(Deal), Deal, limit=10, total_mode="estimated")
+    assert total == 250_000
+    assert RecordingQuery.count_calls == 0
+    clear_count_cache()
@@ -0,0 +1,118 @@
+"""Tests for bulk JSON Patch of leads and the shared bulk patch runner."""
+
+from __future__ import annotations
+
+import contextlib
+import uuid
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from app.domain.models.lead import Lead
+from app.domain.schemas.bulk_patch import BulkPatchItem
+from app.domain.services import bulk_patch_service, lead_service
+
+
+class FakeQuery:
+    def __init__(self, rows: List[Any]) -> None:
+        self.rows = rows
+
+    def filter(self, *criteria: Any) -> "FakeQuery":
+        return self
+
+    def options(self, *options: Any) -> "FakeQuery":
+        return self
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.rows)
+
+
+class FakeSession:
+    """Serves a fixed set of leads; counts savepoints and commits."""
+
+    def __init__(self, leads: List[Lead]) -> None:
+        self.leads = leads
+        self.loads = 0
+        self.savepoints = 0
+        self.commits = 0
+
+    def query(self, model: Any) -> FakeQuery:
+        self.loads += 1
+        return FakeQuery(self.leads)
+
+    @contextlib.contextmanager
+    def begin_nested(self) -> Iterator[None]:
+        self.savepoints += 1
+        yield
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+def _lead(tenant_id: uuid.UUID, first_name: str) -> Lead:
+    return Lead(id=uuid.uuid4(), tenant_id=tenant_id, first_name=first_name, lead_data={"tags": []})
+
+
+def _item(lead_id: uuid.UUID, *operations: Dict[str, Any]) -> BulkPatchItem:
+    return BulkPatchItem.model_validate({"id": lead_id, "patch": {"operations": list(operations)}})
+
+
+def test_bulk_patch_leads_reports_item_errors_and_groups_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant_id = uuid.uuid4()
+    ann, bo = _lead(tenant_id, "Ann"), _lead(tenant_id, "Bo")
+    missing = uuid.uuid4()
+    db = FakeSession([ann, bo])
+    events: List[Dict[str, Any]] = []
+    monkeypatch.setattr(
+        lead_service.LeadProducer,
+        "send_leads_bulk_patched",
+        classmethod(lambda cls, **kwargs: events.append(kwargs)),
+    )
+
+    result = lead_service.bulk_patch_leads(
+        db,
+        tenant_id=tenant_id,
+        items=[
+            _item(ann.id, {"op": "replace", "path": "/first_name", "value": "Anne"}),
+            _item(missing, {"op": "replace", "path": "/first_name", "value": "X"}),
+            _item(bo.id, {"op": "remove", "path": "/first_name"}),
+            _item(ann.id, {"op": "add", "path": "/lead_data/tags/0", "value": "vip"}),
+        ],
+        modified_user="cleanup-job",
+        chunk_size=2,
+    )
+
+    assert (result.total, result.patched, result.failed) == (4, 2, 2)
+    assert [(e.index, e.id, e.status_code) for e in result.errors] == [
+        (1, missing, 404),
+        (2, bo.id, 400),
+    ]
+    assert ann.first_name == "Anne" and ann.lead_data == {"tags": ["vip"]}
+    assert ann.updated_by == "cleanup-job" and bo.updated_by is None
+    assert (db.loads, db.commits) == (2, 2)
+    assert [e["chunk"] for e in events] == [1, 2]
+    assert all(e["patch_id"] == result.patch_id for e in events)
+    assert events[0]["changes"] == {ann.id: {"first_name": "Anne"}}
+    assert events[1]["changes"] == {ann.id: {"lead_data": {"tags": ["vip"]}}}
+
+
+def test_run_bulk_patch_merges_repeated_ids_and_skips_empty_changes() -> None:
+    tenant_id = uuid.uuid4()
+    ann = _lead(tenant_id, "Ann")
+    db = FakeSession([ann])
+    published: List[Any] = []
+    changes = iter([{"a": 1}, {}, {"b": 2}])
+
+    result = bulk_patch_service.run_bulk_patch(
+        db,
+        [_item(ann.id), _item(ann.id), _item(ann.id)],
+        model=Lead,
+        tenant_id=tenant_id,
+        apply=lambda lead, patch: next(changes),
+        publish=lambda patch_id, chunk, chunk_changes: published.append(chunk_changes),
+        merge=lambda first, second: {**first, **second},
+        chunk_size=10,
+    )
+
+    assert (result.patched, result.failed, db.savepoints) == (3, 0, 3)
+    assert published == [{ann.id: {"a": 1, "b": 2}}]
@@ -0,0 +1,52 @@
+"""Tests for business-hours calendar arithmetic."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from app.domain.services.business_calendar import ALWAYS_OPEN, get_calendar
+
+UTC = timezone.utc
+WEEKDAYS_9_TO_5 = [
+    {"day": day, "start": "09:00", "end": "17:00"} for day in ("mon", "tue", "wed", "thu", "fri")
+]
+
+
+def test_add_minutes_skips_nights_weekends_and_holidays() -> None:
+    # New York; Monday 2026-03-09 is a holiday and DST starts on Sunday 03-08.
+    calendar = get_calendar("America/New_York", WEEKDAYS_9_TO_5, ["2026-03-09"])
+    friday_4pm = datetime(2026, 3, 6, 21, 0, tzinfo=UTC)  # 16:00 EST
+
+    assert calendar.add_minutes(friday_4pm, 60) == datetime(2026, 3, 6, 22, 0, tzinfo=UTC)
+    # 60 minutes Friday, then Tuesday 09:00-10:00 EDT (UTC-4)
+    assert calendar.add_minutes(friday_4pm, 120) == datetime(2026, 3, 10, 14, 0, tzinfo=UTC)
+    # Saturday counts from Tuesday's opening
+    saturday = datetime(2026, 3, 7, 15, 0, tzinfo=UTC)
+    assert calendar.add_minutes(saturday, 30) == datetime(2026, 3, 10, 13, 30, tzinfo=UTC)
+
+
+def test_add_minutes_and_minutes_between_are_inverse() -> None:
+    calendar = get_calendar("Europe/Berlin", WEEKDAYS_9_TO_5 + [
+        {"day": "sat", "start": "10:00", "end": "12:00"},
+        {"day": "mon", "start": "16:00", "end": "24:00"},
+    ])
+    start = datetime(2026, 10, 20, 7, 13, tzinfo=UTC)
+    for minutes in (1, 59, 480, 5000, 250_000):
+        due = calendar.add_minutes(start, minutes)
+        assert round(calendar.minutes_between(start, due), 6) == minutes
+        assert round(calendar.minutes_between(due, start), 6) == -minutes
+
+
+def test_deadline_at_closing_time_and_naive_utc_input() -> None:
+    calendar = get_calendar("UTC", WEEKDAYS_9_TO_5)
+    monday_9am = datetime(2026, 3, 2, 9, 0)
+    assert calendar.add_minutes(monday_9am, 480) == datetime(2026, 3, 2, 17, 0, tzinfo=UTC)
+    assert calendar.add_minutes(monday_9am, 481) == datetime(2026, 3, 3, 9, 1, tzinfo=UTC)
+    assert calendar.add_minutes(monday_9am, 0) == datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+
+
+def test_empty_schedule_is_always_open_and_calendars_are_shared() -> None:
+    start = datetime(2026, 3, 7, 3, 0, tzinfo=UTC)
+    assert get_calendar(None, []).add_minutes(start, 90) == start + timedelta(minutes=90)
+    assert ALWAYS_OPEN.minutes_between(start, start + timedelta(hours=2)) == 120
+    assert get_calendar("UTC", WEEKDAYS_9_TO_5) is get_calendar("UTC", list(reversed(WEEKDAYS_9_TO_5)))
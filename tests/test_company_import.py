@@ -0,0 +1,204 @@
+"""Tests for the asynchronous bulk company import job."""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from app.domain.models.company_import import CompanyImportJob
+from app.domain.schemas.company_import import CompanyImportRecord
+from app.domain.services import company_import_service
+from app.domain.services.bulk_import_service import MultiRowLoader
+
+
+class FakeQuery:
+    def __init__(self, result: List[Any]) -> None:
+        self.result = result
+
+    def filter(self, *criteria: Any) -> "FakeQuery":
+        return self
+
+    def all(self) -> List[Any]:
+        return self.result
+
+    def delete(self, synchronize_session: Any = None) -> int:
+        return 0
+
+
+class FakeSession:
+    """Holds one job and its spooled rows; records executed statements."""
+
+    def __init__(self, job: CompanyImportJob, rows: List[SimpleNamespace]) -> None:
+        self.job = job
+        self.rows = rows
+        self.commits = 0
+        self.executed: List[Any] = []
+
+    def get(self, model: Any, key: Any) -> Optional[CompanyImportJob]:
+        return self.job if key == self.job.id else None
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        pass
+
+    def execute(self, statement: Any, params: Any = None) -> None:
+        self.executed.append((statement, params))
+        if isinstance(params, list) and params and "b_company_id" in params[0]:
+            by_row = {p["b_row_no"]: p["b_company_id"] for p in params}
+            for row in self.rows:
+                if row.row_no in by_row:
+                    row.company_id = by_row[row.row_no]
+
+    def query(self, *entities: Any) -> FakeQuery:
+        # Only the external key lookup of the relationship phase selects columns
+        pairs = [(r.external_key, r.company_id) for r in self.rows if r.company_id]
+        return FakeQuery(pairs)
+
+
+def _job(tenant_id: uuid.UUID, total_rows: int) -> CompanyImportJob:
+    return CompanyImportJob(
+        id=uuid.uuid4(),
+        tenant_id=tenant_id,
+        status="queued",
+        total_rows=total_rows,
+        processed_rows=0,
+        imported=0,
+        failed=0,
+        relationships=0,
+        errors=[],
+        errors_truncated=False,
+        created_by="importer",
+    )
+
+
+def _row(row_no: int, payload: Optional[Dict[str, Any]], parse_error: Optional[str] = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        row_no=row_no,
+        payload=payload,
+        parse_error=parse_error,
+        external_key=(payload or {}).get("external_key"),
+        company_id=None,
+    )
+
+
+def test_build_company_item_applies_create_defaults() -> None:
+    record = CompanyImportRecord.model_validate(
+        {
+            "name": "Acme",
+            "website": "acme.test",
+            "phones": [{"phone_raw": "555", "phone_type": None}],
+            "addresses": [{"line1": "1 Main", "city": "Town", "address_type": None}],
+        }
+    )
+    item = company_import_service.build_company_item(
+        3, record, tenant_id=uuid.uuid4(), created_by="importer"
+    )
+    tables = {t.table.name: t.columns for t in company_import_service.COMPANY_TABLES}
+    for name, rows in item.rows.items():
+        for row in rows:
+            assert len(row) == len(tables[name])
+    company = dict(zip(tables["company"], item.rows["company"][0]))
+    assert company["company_name"] == "Acme" and company["domain"] == "acme.test"
+    phone = dict(zip(tables["company_phone"], item.rows["company_phone"][0]))
+    assert phone["company_id"] == item.key and phone["phone_type"] == "main"
+    address = dict(zip(tables["company_address"], item.rows["company_address"][0]))
+    assert address["address_type"] == "office"
+
+
+def test_relationship_target_must_be_exactly_one() -> None:
+    with pytest.raises(ValueError):
+        CompanyImportRecord.model_validate(
+            {"name": "A", "relationships": [{"from_role": "partner", "to_role": "partner"}]}
+        )
+
+
+def test_build_relationship_item_resolves_external_keys() -> None:
+    tenant_id = uuid.uuid4()
+    company_id, parent_id, contact_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    record = CompanyImportRecord.model_validate(
+        {
+            "name": "Child",
+            "external_key": "c-1",
+            "parent_external_key": "p-1",
+            "relationships": [
+                {"to_external_key": "missing", "from_role": "client", "to_role": "vendor"}
+            ],
+            "contact_relationships": [{"contact_id": str(contact_id), "relationship_type": "employee"}],
+        }
+    )
+    assert company_import_service.referenced_keys(record) == {"p-1", "missing"}
+    item, unresolved = company_import_service.build_relationship_item(
+        5, company_id, record, {"p-1": parent_id}, tenant_id=tenant_id, created_by="importer"
+    )
+    tables = {t.table.name: t.columns for t in company_import_service.RELATIONSHIP_TABLES}
+    (parent_rel,) = item.rows["company_relationship"]
+    parent_rel = dict(zip(tables["company_relationship"], parent_rel))
+    assert (parent_rel["from_company_id"], parent_rel["to_company_id"]) == (parent_id, company_id)
+    assert (parent_rel["from_role"], parent_rel["to_role"]) == ("parent", "subsidiary")
+    (contact_rel,) = item.rows["contact_company_relationship"]
+    assert len(contact_rel) == len(tables["contact_company_relationship"])
+    assert unresolved == [
+        "relationships.0.to_external_key: no imported company with key 'missing'"
+    ]
+
+
+def test_run_import_job_loads_companies_then_relationships(monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant_id = uuid.uuid4()
+    rows = [
+        _row(1, {"name": "Child", "external_key": "c", "parent_external_key": "p"}),
+        _row(2, None, parse_error="invalid JSON: oops"),
+        _row(3, {"name": "Parent", "external_key": "p"}),
+        _row(4, {"external_key": "no-name"}),
+    ]
+    job = _job(tenant_id, total_rows=len(rows))
+    db = FakeSession(job, rows)
+    loads: List[List[str]] = []
+    events: List[Dict[str, Any]] = []
+    progress: List[Dict[str, Any]] = []
+
+    def fake_iter(db: Any, job_id: uuid.UUID, chunk_size: int, *, imported_only: bool = False):
+        selected = [r for r in rows if r.company_id] if imported_only else rows
+        for start in range(0, len(selected), chunk_size):
+            yield selected[start : start + chunk_size]
+
+    def fake_load(self: MultiRowLoader, items: List[Any]) -> Any:
+        loads.append([self.tables[0].table.name] + [str(i.row) for i in items])
+        return list(items), []
+
+    monkeypatch.setattr(company_import_service, "_iter_spooled", fake_iter)
+    monkeypatch.setattr(company_import_service, "_flag_duplicate_keys", lambda db, job_id: None)
+    monkeypatch.setattr(MultiRowLoader, "load", fake_load)
+    monkeypatch.setattr(
+        company_import_service.CompanyProducer,
+        "send_companies_bulk_imported",
+        classmethod(lambda cls, **kwargs: events.append(kwargs)),
+    )
+
+    result = company_import_service.run_import_job(
+        db, job.id, chunk_size=2, progress=progress.append
+    )
+
+    assert result is job
+    assert job.status == "completed" and job.phase is None
+    assert (job.processed_rows, job.imported, job.failed, job.relationships) == (4, 2, 2, 1)
+    assert [e["row"] for e in job.errors] == [2, 4]
+    assert loads == [
+        ["company", "1"],
+        ["company", "3"],
+        ["company_relationship", "1"],
+    ]
+    assert [e["chunk"] for e in events] == [1, 2]
+    assert [p["phase"] for p in progress] == ["companies", "companies", "relationships", None]
+
+
+def test_run_import_job_skips_jobs_that_are_not_queued() -> None:
+    job = _job(uuid.uuid4(), total_rows=0)
+    job.status = "completed"
+    db = FakeSession(job, [])
+    assert company_import_service.run_import_job(db, job.id) is job
+    assert db.commits == 0
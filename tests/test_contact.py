@@ -4,7 +4,9 @@ import uuid
 from datetime import datetime, timezone
 
 import pytest
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
 
 from app.domain.schemas.contact import TenantCreateContact, ContactOut
 from app.domain.schemas.json_patch import JsonPatchRequest, JsonPatchOperation
@@ -223,3 +225,159 @@ def test_delete_contact_calls_service_and_returns_none(monkeypatch: pytest.Monke
     assert captured["tenant_id"] == tenant_id
     assert captured["contact_id"] == contact_id
     assert result is None
+
+
+# ---------------------------------------------------------------------------
+# contact_service.list_contacts
+# ---------------------------------------------------------------------------
+
+class RecordingQuery(Query):
+    """Query stand-in that captures the final SQL instead of executing it."""
+
+    captured: dict = {}
+
+    def count(self):  # type: ignore[override]
+        RecordingQuery.captured["count_sql"] = str(
+            self.statement.compile(dialect=postgresql.dialect())
+        )
+        return 42
+
+    def all(self):  # type: ignore[override]
+        RecordingQuery.captured["select_sql"] = str(
+            self.statement.compile(dialect=postgresql.dialect())
+        )
+        return []
+
+    def first(self):  # type: ignore[override]
+        RecordingQuery.captured["eager"] = sorted(
+            ctx.path[1].key for opt in self._with_options for ctx in opt.context
+        )
+        return None
+
+
+def test_list_contacts_pushes_phone_email_filters_and_paging_into_sql():
+    RecordingQuery.captured = {}
+    db = Session(query_cls=RecordingQuery)
+
+    contacts, total = contact_service.list_contacts(
+        db,
+        tenant_id=uuid.uuid4(),
+        phone="555",
+        email="example.com",
+        limit=10,
+        offset=20,
+    )
+
+    assert contacts == []
+    assert total == 42
+    count_sql = RecordingQuery.captured["count_sql"]
+    select_sql = RecordingQuery.captured["select_sql"]
+    assert "EXISTS (SELECT" in count_sql
+    assert "dyno_crm.contact_phone" in select_sql
+    assert "dyno_crm.contact_email" in select_sql
+    assert "LIMIT" in select_sql and "OFFSET" in select_sql
+    assert "ORDER BY dyno_crm.contact.created_at DESC" in select_sql
+
+
+def test_get_contact_snapshot_eager_loads_every_snapshot_collection():
+    """``snapshot=True`` attaches one selectinload per collection read by the snapshot."""
+    db = Session(query_cls=RecordingQuery)
+
+    RecordingQuery.captured = {}
+    with pytest.raises(HTTPException):
+        contact_service.get_contact(db, tenant_id=uuid.uuid4(), contact_id=uuid.uuid4())
+    assert RecordingQuery.captured["eager"] == []
+
+    RecordingQuery.captured = {}
+    with pytest.raises(HTTPException):
+        contact_service.get_contact(
+            db, tenant_id=uuid.uuid4(), contact_id=uuid.uuid4(), snapshot=True
+        )
+    assert RecordingQuery.captured["eager"] == [
+        "addresses",
+        "company_relationships",
+        "emails",
+        "notes",
+        "phones",
+        "social_profiles",
+    ]
+
+
+def test_merge_contact_deltas_folds_nested_changes():
+    """Add+update collapses into one add, add+delete cancels, updates keep the latest."""
+    from app.domain.schemas.events.common import merge_deltas
+    from app.domain.schemas.events.contact_event import ContactDelta
+
+    p1, p2, e1 = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    merged = ContactDelta(base_fields={"first_name": "A"}, phones_added=[{"id": p1, "phone_raw": "1"}])
+    for step in (
+        ContactDelta(phones_updated=[{"id": p1, "phone_raw": "2"}]),
+        ContactDelta(phones_added=[{"id": p2, "phone_raw": "9"}]),
+        ContactDelta(phones_deleted=[p2]),
+        ContactDelta(emails_updated=[{"id": e1, "email": "a@x"}]),
+        ContactDelta(emails_updated=[{"id": e1, "email": "b@x"}], base_fields={"last_name": "B"}),
+    ):
+        merged = merge_deltas(merged, step)
+
+    assert merged.base_fields == {"first_name": "A", "last_name": "B"}
+    assert merged.phones_added == [{"id": p1, "phone_raw": "2"}]
+    assert merged.phones_updated is None and merged.phones_deleted is None
+    assert merged.emails_updated == [{"id": e1, "email": "b@x"}]
+
+
+def test_nested_contact_updates_coalesce_within_publish_buffer(monkeypatch: pytest.MonkeyPatch):
+    """Nested mutations that each commit publish one merged update per buffer."""
+    from contextlib import nullcontext
+    from types import SimpleNamespace
+
+    from app.domain.schemas.contact import ContactPhoneNumberCreateRequest
+    from app.messaging.producers.common import BaseProducer
+
+    monkeypatch.delenv("OUTBOX_ENABLED", raising=False)
+    batches: list = []
+    monkeypatch.setattr(
+        "app.messaging.producers.common._publish_batch",
+        lambda events: batches.append(list(events)),
+    )
+    tenant_id = uuid.uuid4()
+    contact = SimpleNamespace(id=uuid.uuid4())
+
+    class CommittingSession:
+        def __init__(self) -> None:
+            self.commits = 0
+
+        def add(self, instance) -> None:
+            instance.id = instance.id or uuid.uuid4()
+
+        def flush(self) -> None:
+            pass
+
+        def commit(self) -> None:
+            self.commits += 1
+
+        def rollback(self) -> None:  # pragma: no cover - commits succeed
+            raise AssertionError("unexpected rollback")
+
+    db = CommittingSession()
+    monkeypatch.setattr(contact_service, "get_contact", lambda session, **kwargs: contact)
+    monkeypatch.setattr(contact_service, "SessionLocal", lambda: nullcontext(db))
+    monkeypatch.setattr(contact_service, "_contact_snapshot", lambda c: {"id": str(c.id)})
+
+    with BaseProducer.buffered():
+        for i in range(10):
+            contact_service.add_contact_phone(
+                db,  # type: ignore[arg-type]
+                tenant_id,
+                contact.id,
+                ContactPhoneNumberCreateRequest(phone_raw=f"555-000{i}"),
+                "tester",
+            )
+        assert batches == []
+
+    assert db.commits == 10
+    assert len(batches) == 1 and len(batches[0]) == 1
+    event = batches[0][0]
+    assert event.task_name.endswith("contact.updated")
+    changes = event.envelope["data"]["changes"]
+    assert [p["phone_raw"] for p in changes["phones_added"]] == [f"555-000{i}" for i in range(10)]
+    assert event.envelope["data"]["payload"] == {"id": str(contact.id)}
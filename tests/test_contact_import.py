@@ -0,0 +1,170 @@
+"""Tests for the streaming bulk contact import."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict, List
+
+import pytest
+
+from app.domain.services import bulk_import_service, contact_import_service
+from app.domain.services.bulk_import_service import (
+    BatchLoader,
+    StagedLoader,
+    encode_copy_rows,
+    iter_lines,
+    iter_records,
+)
+
+
+class DummySession:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    def flush(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        pass
+
+
+class UniqueViolation(Exception):
+    pgcode = "23505"
+
+    class diag:
+        constraint_name = "ux_contact_email_contact_email"
+        message_detail = "Key already exists."
+
+
+def test_iter_lines_handles_split_multibyte_and_crlf() -> None:
+    data = "a,b\r\nJosé,x\r\nlast".encode()
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+    assert list(iter_lines(chunks)) == ["a,b\r\n", "José,x\r\n", "last"]
+
+
+def test_iter_records_csv_parses_nested_json_columns() -> None:
+    lines = [
+        "first_name,last_name,middle_name,emails\n",
+        'Ada,Lovelace,,"[{""email"": ""ada@example.com""}]"\n',
+        "Bad,Row,,not-json\n",
+    ]
+    records = list(iter_records(lines, "csv", json_fields=("emails",)))
+    assert records[0] == (
+        1,
+        {"first_name": "Ada", "last_name": "Lovelace", "emails": [{"email": "ada@example.com"}]},
+        None,
+    )
+    assert records[1][0] == 2 and records[1][1] is None
+    assert "emails" in records[1][2]
+
+
+def test_iter_records_ndjson_reports_bad_lines() -> None:
+    lines = ['{"first_name": "A"}\n', "\n", "[1]\n", "{oops\n"]
+    records = list(iter_records(lines, "ndjson"))
+    assert [r[0] for r in records] == [1, 2, 3]
+    assert records[0][1] == {"first_name": "A"}
+    assert records[1][2] == "each line must be a JSON object"
+    assert records[2][2].startswith("invalid JSON")
+
+
+def test_encode_copy_rows_escapes_text_format() -> None:
+    row_id = uuid.UUID(int=1)
+    encoded = encode_copy_rows([(row_id, None, True, "a\tb\\c\nd")])
+    assert encoded == f"{row_id}\t\\N\tt\ta\\tb\\\\c\\nd\n"
+
+
+def test_import_contacts_reports_rows_and_publishes_per_chunk(monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant_id = uuid.uuid4()
+    loaded_chunks: List[List[int]] = []
+    events: List[Dict[str, Any]] = []
+
+    def fake_load(self: StagedLoader, items: List[Any]) -> Any:
+        loaded_chunks.append([item.row for item in items])
+        ok = [item for item in items if item.row != 4]
+        bad = [(item, UniqueViolation()) for item in items if item.row == 4]
+        return ok, bad
+
+    monkeypatch.setattr(StagedLoader, "load", fake_load)
+    monkeypatch.setattr(
+        contact_import_service.ContactProducer,
+        "send_contacts_bulk_imported",
+        classmethod(lambda cls, **kwargs: events.append(kwargs)),
+    )
+
+    lines = [
+        '{"first_name": "Ada", "last_name": "Lovelace", "emails": [{"email": "a@x.io"}]}\n',
+        '{"first_name": "NoLast"}\n',
+        '{"first_name": "Alan", "last_name": "Turing", "phones": [{"phone_raw": "555"}]}\n',
+        '{"first_name": "Dup", "last_name": "Email"}\n',
+        '{"first_name": "Grace", "last_name": "Hopper", "phones": "nope"}\n',
+    ]
+    db = DummySession()
+    result = contact_import_service.import_contacts(
+        db, tenant_id=tenant_id, lines=lines, fmt="ndjson", created_by="importer", chunk_size=2
+    )
+
+    assert loaded_chunks == [[1, 3], [4]]
+    assert (result.total_rows, result.imported, result.failed) == (5, 2, 3)
+    assert [e.row for e in result.errors] == [2, 4, 5]
+    assert result.errors[0].errors == ["last_name: Field required"]
+    assert result.errors[1].constraint == "ux_contact_email_contact_email"
+    assert result.errors[2].errors[0].startswith("phones")
+    assert db.commits == 1
+    assert len(events) == 1
+    assert events[0]["import_id"] == result.import_id
+    assert events[0]["chunk"] == 1
+    assert len(events[0]["contact_ids"]) == 2
+
+
+def test_build_contact_item_applies_create_defaults() -> None:
+    tenant_id = uuid.uuid4()
+    contact_in = contact_import_service.TenantCreateContact.model_validate(
+        {
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+            "phones": [{"phone_raw": "555", "phone_type": None}],
+            "addresses": [{"line1": "1 Main", "city": "Town", "country_code": None}],
+        }
+    )
+    item = contact_import_service.build_contact_item(
+        7, contact_in, tenant_id=tenant_id, created_by="importer"
+    )
+    tables = {t.table.name: t.columns for t in contact_import_service.CONTACT_TABLES}
+    for name, rows in item.rows.items():
+        for row in rows:
+            assert len(row) == len(tables[name])
+    phone = dict(zip(tables["contact_phone"], item.rows["contact_phone"][0]))
+    assert phone["contact_id"] == item.key and phone["phone_type"] == "mobile"
+    address = dict(zip(tables["contact_address"], item.rows["contact_address"][0]))
+    assert address["country_code"] == "US"
+    assert item.rows["contact_email"] == []
+
+
+def test_loader_bisects_to_isolate_failing_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts: List[List[int]] = []
+
+    def fake_load_once(self: StagedLoader, items: List[Any]) -> None:
+        attempts.append([item.row for item in items])
+        if any(item.row == 3 for item in items):
+            raise UniqueViolation()
+
+    monkeypatch.setattr(StagedLoader, "_prepare", lambda self: None)
+    monkeypatch.setattr(StagedLoader, "_load_once", fake_load_once)
+    monkeypatch.setattr(StagedLoader, "_db_errors", lambda self: (UniqueViolation,))
+
+    items = [bulk_import_service.ImportItem(row=i, key=uuid.uuid4(), rows={}) for i in range(1, 5)]
+    loaded, rejected = StagedLoader(None, ()).load(items)  # type: ignore[arg-type]
+    assert [i.row for i in loaded] == [1, 2, 4]
+    assert [i.row for i, _ in rejected] == [3]
+    assert attempts == [[1, 2, 3, 4], [1, 2], [3, 4], [3], [4]]
+
+
+def test_loader_without_load_once_cannot_be_instantiated() -> None:
+    class IncompleteLoader(BatchLoader):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteLoader(None, ())  # type: ignore[arg-type]
@@ -0,0 +1,107 @@
+"""Tests for ETag / If-None-Match handling on single-resource GETs."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.etag import etag_guard, if_none_match, make_etag
+from app.core.db import get_read_db
+from app.domain.models.contact import Contact
+from app.domain.services.resource_version_service import resource_version
+
+
+def _app(versions: Dict[uuid.UUID, str], served: List[uuid.UUID]) -> FastAPI:
+    def lookup(db: Any, *, tenant_id: uuid.UUID, item_id: uuid.UUID) -> Optional[str]:
+        return versions.get(item_id)
+
+    app = FastAPI()
+
+    @app.get("/tenants/{tenant_id}/items/{item_id}", dependencies=[etag_guard(lookup, "item_id")])
+    def get_item(tenant_id: uuid.UUID, item_id: uuid.UUID) -> Dict[str, str]:
+        served.append(item_id)
+        return {"id": str(item_id)}
+
+    app.dependency_overrides[get_read_db] = lambda: None
+    return app
+
+
+def test_if_none_match_uses_weak_comparison() -> None:
+    etag = make_etag("abc")
+    assert if_none_match('W/"abc"', etag)
+    assert if_none_match('"xyz", "abc"', etag)
+    assert if_none_match("*", etag)
+    assert not if_none_match('W/"xyz"', etag)
+    assert not if_none_match(None, etag)
+
+
+def test_matching_etag_returns_304_without_running_handler() -> None:
+    item_id = uuid.uuid4()
+    versions = {item_id: "v1"}
+    served: List[uuid.UUID] = []
+    client = TestClient(_app(versions, served))
+    url = f"/tenants/{uuid.uuid4()}/items/{item_id}"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.headers["etag"] == 'W/"v1"'
+
+    cached = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == 'W/"v1"'
+    assert served == [item_id]
+
+    versions[item_id] = "v2"
+    changed = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] == 'W/"v2"'
+
+
+def test_unknown_resource_is_left_to_the_handler() -> None:
+    served: List[uuid.UUID] = []
+    client = TestClient(_app({}, served))
+    response = client.get(f"/tenants/{uuid.uuid4()}/items/{uuid.uuid4()}")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert len(served) == 1
+
+
+def test_contact_version_query_covers_nested_collections() -> None:
+    statements: List[str] = []
+
+    class RecordingQuery:
+        def __init__(self, *columns: Any) -> None:
+            self.columns = columns
+
+        def filter(self, *criteria: Any) -> "RecordingQuery":
+            from sqlalchemy import select
+
+            stmt = select(*self.columns).where(*criteria)
+            statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+            return self
+
+        def first(self) -> None:
+            return None
+
+    class FakeSession:
+        def query(self, *columns: Any) -> RecordingQuery:
+            return RecordingQuery(*columns)
+
+    assert (
+        resource_version(
+            FakeSession(),  # type: ignore[arg-type]
+            Contact,
+            tenant_id=uuid.uuid4(),
+            resource_id=uuid.uuid4(),
+            collections=("phones", "notes"),
+        )
+        is None
+    )
+    sql = statements[0]
+    assert "count(*)" in sql and "max(dyno_crm.contact_phone.updated_at)" in sql
+    assert "dyno_crm.contact_note.contact_id = dyno_crm.contact.id" in sql
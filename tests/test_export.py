@@ -0,0 +1,121 @@
+"""Tests for the streaming NDJSON/CSV exports."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Iterator, List, Tuple
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.api.export import export_response
+from app.domain.models.contact import Contact
+from app.domain.services import export_service
+from app.domain.services.export_service import (
+    ExportSpec,
+    encode_csv,
+    encode_ndjson,
+    gzip_chunks,
+    resolve_export_format,
+)
+from app.util.serialization import loads
+
+
+SPEC = ExportSpec("contacts", Contact, ("id", "first_name", "created_at"))
+
+CREATED_AT = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _batches() -> List[List[Tuple[Any, ...]]]:
+    return [
+        [(uuid.UUID(int=1), "Ann", CREATED_AT), (uuid.UUID(int=2), None, CREATED_AT)],
+        [(uuid.UUID(int=3), "Bo, Jr.", CREATED_AT)],
+    ]
+
+
+def test_resolve_export_format() -> None:
+    assert resolve_export_format(None) == "ndjson"
+    assert resolve_export_format(None, "text/csv") == "csv"
+    assert resolve_export_format("CSV", "application/x-ndjson") == "csv"
+    with pytest.raises(HTTPException) as exc:
+        resolve_export_format("xml")
+    assert exc.value.status_code == 400
+
+
+def test_spec_defaults_to_all_table_columns() -> None:
+    names = ExportSpec("contacts", Contact).column_names()
+    assert names == tuple(c.key for c in Contact.__table__.columns)
+    assert "tenant_id" in names and "created_at" in names
+
+
+def test_encode_ndjson_emits_one_chunk_per_batch() -> None:
+    chunks = list(encode_ndjson(SPEC.column_names(), _batches()))
+    assert len(chunks) == 2
+    rows = [loads(line) for line in b"".join(chunks).splitlines()]
+    assert [r["id"] for r in rows] == [str(uuid.UUID(int=i)) for i in (1, 2, 3)]
+    assert rows[1]["first_name"] is None
+
+
+def test_encode_csv_writes_header_then_rows() -> None:
+    chunks = list(encode_csv(SPEC.column_names(), _batches()))
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert rows[0] == ["id", "first_name", "created_at"]
+    assert rows[2] == [str(uuid.UUID(int=2)), "", CREATED_AT.isoformat()]
+    assert rows[3][1] == "Bo, Jr."
+
+
+def test_gzip_chunks_round_trip() -> None:
+    data = [b"a" * 1000, b"b" * 1000]
+    assert gzip.decompress(b"".join(gzip_chunks(data))) == b"".join(data)
+
+
+def test_export_endpoint_streams_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant_id = uuid.uuid4()
+    calls: List[Any] = []
+
+    sessions: List[Any] = []
+
+    class FakeSession:
+        closed = False
+
+        def __enter__(self) -> "FakeSession":
+            sessions.append(self)
+            return self
+
+        def __exit__(self, *exc: Any) -> None:
+            self.closed = True
+
+    def fake_iter(db: Any, spec: ExportSpec, *, tenant_id: uuid.UUID, batch_size: Any = None) -> Iterator[Any]:
+        # The stream reads from a session it opened itself, still open here
+        assert isinstance(db, FakeSession) and not db.closed
+        calls.append(tenant_id)
+        yield from _batches()
+
+    monkeypatch.setattr(export_service, "iter_batches", fake_iter)
+    app = FastAPI()
+
+    @app.get("/tenants/{tenant_id}/contacts/export")
+    def export(tenant_id: uuid.UUID, request: Request, format: Any = None, gzip: bool = False):
+        return export_response(request, FakeSession, SPEC, tenant_id=tenant_id, format=format, gzip=gzip)
+
+    client = TestClient(app)
+    url = f"/tenants/{tenant_id}/contacts/export"
+
+    plain = client.get(url, params={"format": "csv"})
+    assert plain.status_code == 200
+    assert plain.headers["content-type"].startswith("text/csv")
+    assert f"contacts-{tenant_id}.csv" in plain.headers["content-disposition"]
+    assert plain.text.splitlines()[0] == "id,first_name,created_at"
+
+    compressed = client.get(url, params={"gzip": "true"}, headers={"Accept-Encoding": "identity"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-type"] == "application/x-ndjson"
+    assert len(compressed.text.splitlines()) == 3
+    assert calls == [tenant_id, tenant_id]
+    assert len(sessions) == 2 and all(session.closed for session in sessions)
@@ -0,0 +1,100 @@
+"""Tests for the decoded JWT cache in ``app.util.jwt_util``."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, List
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt as jose_jwt
+
+from app.util import jwt_util
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    jwt_util._decoded_tokens.clear()
+
+
+@pytest.fixture
+def decode_calls(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    calls: List[str] = []
+    real_decode = jose_jwt.decode
+
+    def counting_decode(token: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(token)
+        return real_decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(jwt_util.jwt, "decode", counting_decode)
+    return calls
+
+
+def _token(sub: str = "user-1", expires_in: int = 3600, **claims: Any) -> str:
+    return jwt_util.generate_test_jwt(
+        sub, dict(claims), jwt_util.TEST_PASSWORD, expires_in=expires_in
+    )
+
+
+def _auth(token: str, **kwargs: Any) -> Any:
+    dependency = jwt_util.auth_jwt(kwargs.pop("required", None))
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    return asyncio.run(dependency(token=credentials, **kwargs))
+
+
+def test_repeated_token_is_verified_once(decode_calls: List[str]) -> None:
+    token = _token(tenant_id="t-1")
+    first = _auth(token, required={"tenant_id": None}, tenant_id="t-1")
+    second = _auth(token, required={"tenant_id": None}, tenant_id="t-1")
+    assert first == second
+    assert first["sub"] == "user-1"
+    assert first["claims"] == {"tenant_id": "t-1"}
+    assert decode_calls == [token]
+
+
+def test_cached_token_still_checks_required_claims(decode_calls: List[str]) -> None:
+    token = _token(tenant_id="t-1")
+    _auth(token, required={"tenant_id": None}, tenant_id="t-1")
+    with pytest.raises(HTTPException) as exc:
+        _auth(token, required={"tenant_id": None}, tenant_id="t-2")
+    assert exc.value.status_code == 403
+    assert len(decode_calls) == 1
+
+
+def test_entry_expires_with_token(monkeypatch: pytest.MonkeyPatch, decode_calls: List[str]) -> None:
+    token = _token(expires_in=60)
+    jwt_util.decode_jwt(token)
+    jwt_util.decode_jwt(token)
+    later = time.time() + 120
+    monkeypatch.setattr(jwt_util.time, "time", lambda: later)
+    # Past ``exp`` the cache misses and the token is verified again
+    jwt_util.decode_jwt(token)
+    assert decode_calls == [token, token]
+
+
+def test_invalid_tokens_are_not_cached(decode_calls: List[str]) -> None:
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            _auth("not-a-token")
+        assert exc.value.status_code == 401
+    assert len(decode_calls) == 2
+
+
+def test_cache_is_bounded(monkeypatch: pytest.MonkeyPatch, decode_calls: List[str]) -> None:
+    monkeypatch.setenv("JWT_CACHE_SIZE", "2")
+    tokens = [_token(sub=f"user-{i}") for i in range(3)]
+    for token in tokens:
+        jwt_util.decode_jwt(token)
+    jwt_util.decode_jwt(tokens[2])
+    jwt_util.decode_jwt(tokens[0])
+    assert decode_calls == tokens + [tokens[0]]
+
+
+def test_zero_size_disables_cache(monkeypatch: pytest.MonkeyPatch, decode_calls: List[str]) -> None:
+    monkeypatch.setenv("JWT_CACHE_SIZE", "0")
+    token = _token()
+    jwt_util.decode_jwt(token)
+    jwt_util.decode_jwt(token)
+    assert decode_calls == [token, token]
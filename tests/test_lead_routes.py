@@ -4,7 +4,8 @@ import uuid
 from datetime import datetime, timezone
 
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
 
 from app.domain.schemas.lead import CreateLead, LeadOut
 from app.api.routes.leads_tenant_route import create_lead_endpoint
@@ -145,4 +146,43 @@ def test_create_lead_admin_route_propagates_owner(monkeypatch: pytest.MonkeyPatc
     assert captured["tenant_id"] == tenant_id
     assert captured["lead_in"] == payload
     assert captured["created_user"] == user_id
-    assert result == fake_lead
\ No newline at end of file
+    assert result == fake_lead
+
+
+class RecordingQuery(Query):
+    """Query stand-in that captures the final SQL instead of executing it."""
+
+    captured: dict = {}
+
+    def count(self):  # type: ignore[override]
+        return 3
+
+    def all(self):  # type: ignore[override]
+        RecordingQuery.captured["select_sql"] = str(
+            self.statement.compile(dialect=postgresql.dialect())
+        )
+        return []
+
+
+def test_list_leads_matches_lead_data_in_sql() -> None:
+    """Phone/email filters on lead_data should be evaluated by Postgres, not in Python."""
+    RecordingQuery.captured = {}
+    db = Session(query_cls=RecordingQuery)
+
+    leads, total = lead_service.list_leads(
+        db,
+        tenant_id=uuid.uuid4(),
+        phone_number="555",
+        email="example.com",
+        limit=25,
+        offset=50,
+    )
+
+    assert leads == []
+    assert total == 3
+    sql = RecordingQuery.captured["select_sql"]
+    # Index-backed prefilter expressions must match 008_lead_data_search_indexes.sql
+    assert "jsonb_path_query_array(dyno_crm.lead.lead_data, '$.phone_numbers.*')" in sql
+    assert "jsonb_path_query_array(dyno_crm.lead.lead_data, '$.emails.*')" in sql
+    assert "jsonb_each_text" in sql
+    assert "LIMIT" in sql and "OFFSET" in sql
@@ -0,0 +1,145 @@
+"""Tests for the transactional event outbox.
+
+The producer tests verify that ``BaseProducer._send`` writes envelopes to
+the outbox instead of calling Celery when ``OUTBOX_ENABLED`` is set.  The
+relay tests drive ``relay_batch`` with an in-memory stand-in for the
+session and a fake broker connection, so no database or RabbitMQ is
+needed.
+"""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from app.core.celery_app import celery_app
+from app.domain.models.event_outbox import EventOutbox
+from app.messaging import outbox
+from app.messaging.producers.contact_producer import ContactMessageProducer
+
+
+class FakeQuery:
+    """Minimal query chain returning a fixed list of rows."""
+
+    def __init__(self, rows: List[EventOutbox]) -> None:
+        self.rows = rows
+
+    def filter(self, *args: Any, **kwargs: Any) -> "FakeQuery":
+        return self
+
+    def order_by(self, *args: Any) -> "FakeQuery":
+        return self
+
+    def limit(self, n: int) -> "FakeQuery":
+        self.rows = self.rows[:n]
+        return self
+
+    def with_for_update(self, **kwargs: Any) -> "FakeQuery":
+        return self
+
+    def all(self) -> List[EventOutbox]:
+        return list(self.rows)
+
+
+class FakeSession:
+    def __init__(self, rows: List[EventOutbox]) -> None:
+        self.rows = rows
+        self.commits = 0
+        self.rollbacks = 0
+
+    def query(self, model: Any) -> FakeQuery:
+        return FakeQuery(self.rows)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+class FakeConnection:
+    @contextmanager
+    def Producer(self):  # noqa: N802 - mirrors kombu.Connection.Producer
+        yield object()
+
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+def _row(task_name: str = "crm.contact.created") -> EventOutbox:
+    event_id = uuid.uuid4()
+    return EventOutbox(
+        id=event_id,
+        tenant_id=uuid.uuid4(),
+        task_name=task_name,
+        envelope={"event_id": str(event_id), "data": {}},
+        headers={"tenant_id": "t"},
+        attempts=0,
+    )
+
+
+def test_producer_writes_to_outbox_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With the outbox enabled, producers never call the broker inline."""
+    monkeypatch.setenv("OUTBOX_ENABLED", "true")
+    written: List[Dict[str, Any]] = []
+    monkeypatch.setattr(outbox, "write_event", lambda **kwargs: written.append(kwargs))
+    tenant_id = uuid.uuid4()
+    with patch.object(celery_app, "send_task") as send_task:
+        ContactMessageProducer.send_contact_created(tenant_id=tenant_id, payload={"id": "c1"})
+    assert send_task.call_count == 0
+    assert len(written) == 1
+    event = written[0]
+    assert event["task_name"] == ContactMessageProducer.TASK_CREATED
+    assert event["envelope"]["tenant_id"] == str(tenant_id)
+    assert event["headers"]["message_id"] == event["envelope"]["event_id"]
+
+
+def test_relay_batch_publishes_and_marks_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each pending row is published with its id as task id and stamped."""
+    rows = [_row(), _row("crm.contact.updated")]
+    db = FakeSession(rows)
+    sent: List[Dict[str, Any]] = []
+    monkeypatch.setattr(outbox, "_publish_connection", FakeConnection)
+    monkeypatch.setattr(celery_app, "send_task", lambda **kwargs: sent.append(kwargs))
+
+    assert outbox.relay_batch(db, batch_size=10) == 2  # type: ignore[arg-type]
+
+    assert [s["task_id"] for s in sent] == [str(r.id) for r in rows]
+    assert [s["name"] for s in sent] == ["crm.contact.created", "crm.contact.updated"]
+    assert all(r.published_at is not None and r.attempts == 1 for r in rows)
+    assert db.commits == 1
+
+
+def test_relay_batch_stops_at_first_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A publish error leaves the failing and later rows pending, in order."""
+    rows = [_row(), _row(), _row()]
+    db = FakeSession(rows)
+    calls: List[str] = []
+
+    def flaky_send(**kwargs: Any) -> None:
+        calls.append(kwargs["task_id"])
+        if len(calls) == 2:
+            raise ConnectionError("broker gone")
+
+    monkeypatch.setattr(outbox, "_publish_connection", FakeConnection)
+    monkeypatch.setattr(celery_app, "send_task", flaky_send)
+
+    assert outbox.relay_batch(db, batch_size=10) == 1  # type: ignore[arg-type]
+
+    assert rows[0].published_at is not None
+    assert rows[1].published_at is None and "broker gone" in rows[1].last_error
+    assert rows[2].published_at is None and rows[2].attempts == 0
+    assert db.commits == 1
+
+
+def test_relay_batch_without_pending_rows_is_a_noop() -> None:
+    db = FakeSession([])
+    assert outbox.relay_batch(db, batch_size=10) == 0  # type: ignore[arg-type]
+    assert db.commits == 0 and db.rollbacks == 1
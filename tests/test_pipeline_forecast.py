@@ -0,0 +1,84 @@
+"""Tests for the vectorized weighted-pipeline and forecast engine."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.domain.services.pipeline_forecast_service import (
+    NO_MONTH,
+    columns_from_row,
+    compute_forecast,
+)
+
+NAN = float("nan")
+NO_OWNER = "00000000-0000-0000-0000-000000000000"
+ANN, BO = uuid.UUID(int=1), uuid.UUID(int=2)
+QUALIFY, CLOSED = uuid.UUID(int=10), uuid.UUID(int=11)
+MARCH, APRIL = 2026 * 12 + 2, 2026 * 12 + 3
+
+
+def _deal_row() -> SimpleNamespace:
+    """The columns query result for five deals (owner codes: Ann, Bo, none)."""
+    return SimpleNamespace(
+        stage_ids=[str(QUALIFY), str(CLOSED)],
+        owner_ids=[str(ANN), str(BO), NO_OWNER],
+        amount=[1000.0, 500.0, 200.0, 300.0, 700.0],
+        forecast_probability=[0.95, NAN, NAN, NAN, NAN],
+        deal_probability=[0.1, 0.6, NAN, NAN, NAN],
+        stage_probability=[0.2, 0.2, 0.2, NAN, 1.0],
+        won=[False, False, False, False, True],
+        month=[MARCH, MARCH, APRIL, NO_MONTH, MARCH],
+        stage_code=[0, 0, 0, 0, 1],
+        owner_code=[0, 0, 1, 2, 1],
+    )
+
+
+def test_columns_from_row_maps_ids_and_probabilities() -> None:
+    columns = columns_from_row(_deal_row())
+    assert len(columns) == 5
+    assert columns.owner_ids == [ANN, BO, None]
+    assert columns.stage_ids == [QUALIFY, CLOSED]
+    assert columns.won.dtype == np.bool_ and columns.month.dtype == np.int64
+    np.testing.assert_allclose(columns.probability(), [0.95, 0.6, 0.2, 0.0, 1.0])
+
+
+def test_compute_forecast_totals_and_scenarios() -> None:
+    (total,) = compute_forecast(columns_from_row(_deal_row()))
+    assert total.owner_id is None and total.close_month is None
+    assert (total.open_deal_count, total.won_deal_count) == (4, 1)
+    assert total.pipeline_amount == 2000.0
+    assert total.weighted_amount == 1000 * 0.95 + 500 * 0.6 + 200 * 0.2
+    assert (total.commit_amount, total.best_case_amount) == (1000.0, 1500.0)
+    assert total.won_amount == 700.0
+
+
+def test_compute_forecast_groups_by_owner_and_month_within_period() -> None:
+    rows = compute_forecast(
+        columns_from_row(_deal_row()),
+        group_by=["owner", "close_month", "owner"],
+        start_month=date(2026, 3, 15),
+        end_month=date(2026, 4, 1),
+        best_case_probability=0.2,
+    )
+    summary = [
+        (r.owner_id, r.close_month, r.open_deal_count, r.best_case_amount, r.won_amount)
+        for r in rows
+    ]
+    assert summary == [
+        (ANN, date(2026, 3, 1), 2, 1500.0, 0.0),
+        (BO, date(2026, 3, 1), 0, 0.0, 700.0),
+        (BO, date(2026, 4, 1), 1, 200.0, 0.0),
+    ]
+    assert all(r.stage_id is None for r in rows)
+
+
+def test_compute_forecast_without_deals() -> None:
+    empty = {name: [] for name in vars(_deal_row())}
+    columns = columns_from_row(SimpleNamespace(**empty))
+    assert compute_forecast(columns, group_by=["stage"]) == []
+    (total,) = compute_forecast(columns)
+    assert (total.open_deal_count, total.weighted_amount) == (0, 0.0)
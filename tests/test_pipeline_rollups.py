@@ -0,0 +1,192 @@
+"""Tests for the incrementally maintained pipeline rollups and reports."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.models.deal import Deal
+from app.domain.models.stage_history import StageHistory
+from app.domain.services import pipeline_rollup_service as rollups
+
+
+class FakeQuery:
+    def __init__(self, row: Any) -> None:
+        self.row = row
+
+    def filter(self, *criteria: Any) -> "FakeQuery":
+        return self
+
+    def order_by(self, *columns: Any) -> "FakeQuery":
+        return self
+
+    def first(self) -> Any:
+        return self.row
+
+
+class FakeSession:
+    """Records executed upserts; serves one row to ``query().first()``."""
+
+    def __init__(self, previous: Any = None) -> None:
+        self.previous = previous
+        self.upserts: List[Dict[str, Any]] = []
+
+    def query(self, *entities: Any) -> FakeQuery:
+        return FakeQuery(self.previous)
+
+    def execute(self, stmt: Any) -> None:
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        params = {k: v for k, v in compiled.params.items() if not k.startswith("param_")}
+        self.upserts.append({"table": stmt.table.name, **params})
+
+
+def _entry(**kwargs: Any) -> StageHistory:
+    values = dict(
+        tenant_id=uuid.uuid4(),
+        entity_type="deal",
+        entity_id=uuid.uuid4(),
+        pipeline_id=uuid.uuid4(),
+        changed_at=datetime(2026, 3, 1, 23, 30, tzinfo=timezone(timedelta(hours=-2))),
+    )
+    values.update(kwargs)
+    return StageHistory(**values)
+
+
+def test_record_transition_increments_daily_and_transition_rollups() -> None:
+    qualify, proposal = uuid.uuid4(), uuid.uuid4()
+    entry = _entry(from_stage_id=qualify, to_stage_id=proposal)
+    entered = datetime(2026, 2, 27, 1, 30)  # naive UTC, 3 days earlier
+    db = FakeSession(SimpleNamespace(changed_at=entered, to_stage_id=qualify))
+
+    rollups.record_transition(db, entry)
+
+    day = date(2026, 3, 2)  # 23:30 at UTC-2 is the next UTC day
+    entry_row, exit_row, transition_row = db.upserts
+    assert entry_row["table"] == "pipeline_stage_daily_rollup"
+    assert (entry_row["stage_id"], entry_row["day"], entry_row["entered_count"]) == (proposal, day, 1)
+    assert (exit_row["stage_id"], exit_row["exited_count"], exit_row["timed_exit_count"]) == (qualify, 1, 1)
+    assert exit_row["exit_duration_seconds"] == 3 * 86400
+    assert transition_row["table"] == "pipeline_stage_transition_daily_rollup"
+    assert (transition_row["from_stage_id"], transition_row["to_stage_id"]) == (qualify, proposal)
+    assert transition_row["transition_count"] == 1
+
+
+def test_record_transition_leaves_exit_untimed_without_matching_entry() -> None:
+    entry = _entry(from_stage_id=uuid.uuid4(), to_stage_id=None)
+    db = FakeSession(SimpleNamespace(changed_at=datetime(2026, 1, 1), to_stage_id=uuid.uuid4()))
+
+    rollups.record_transition(db, entry)
+    rollups.record_transition(db, _entry(pipeline_id=None, to_stage_id=uuid.uuid4()))
+
+    assert len(db.upserts) == 1
+    assert db.upserts[0]["exited_count"] == 1
+    assert not db.upserts[0].get("timed_exit_count") and not db.upserts[0].get("exit_duration_seconds")
+
+
+def _deal(**kwargs: Any) -> Deal:
+    values = dict(
+        tenant_id=uuid.uuid4(),
+        pipeline_id=uuid.uuid4(),
+        stage_id=uuid.uuid4(),
+        amount=1000.0,
+        forecast_probability=None,
+    )
+    values.update(kwargs)
+    return Deal(**values)
+
+
+def test_deal_contribution_splits_forecast_and_stage_weighted_amounts() -> None:
+    plain = rollups.deal_contribution(_deal())
+    forecast = rollups.deal_contribution(_deal(forecast_probability=Decimal("0.25")))
+    assert (plain.amount, plain.forecast_weighted_amount, plain.unforecast_amount) == (
+        Decimal("1000.0"), Decimal("0"), Decimal("1000.0")
+    )
+    assert forecast.forecast_weighted_amount == Decimal("250.000")
+    assert forecast.unforecast_amount == Decimal("0")
+    assert rollups.deal_contribution(_deal(stage_id=None)) is None
+
+
+def test_deal_contribution_falls_back_to_the_deal_probability() -> None:
+    """Weighted like pipeline_forecast_service: forecast, then deal, then stage."""
+    import numpy as np
+
+    from app.domain.services.pipeline_forecast_service import DealColumns
+
+    only_deal = rollups.deal_contribution(_deal(probability=Decimal("0.40")))
+    both = rollups.deal_contribution(
+        _deal(probability=Decimal("0.40"), forecast_probability=Decimal("0.10"))
+    )
+    assert only_deal.forecast_weighted_amount == Decimal("400.000")
+    assert only_deal.unforecast_amount == Decimal("0")
+    assert both.forecast_weighted_amount == Decimal("100.000")
+
+    columns = DealColumns(
+        amount=np.array([1000.0, 1000.0]),
+        forecast_probability=np.array([np.nan, 0.10]),
+        deal_probability=np.array([0.40, 0.40]),
+        stage_probability=np.array([0.90, 0.90]),
+        won=np.array([False, False]),
+        month=np.array([0, 0]),
+        stage_code=np.array([0, 0]),
+        owner_code=np.array([0, 0]),
+        stage_ids=[None],
+        owner_ids=[None],
+    )
+    assert (columns.amount * columns.probability()).tolist() == [
+        float(only_deal.forecast_weighted_amount),
+        float(both.forecast_weighted_amount),
+    ]
+
+
+def test_apply_deal_change_moves_contribution_between_stages() -> None:
+    deal = _deal()
+    before = rollups.deal_contribution(deal)
+    db = FakeSession()
+
+    rollups.apply_deal_change(db, before, rollups.deal_contribution(deal))
+    assert db.upserts == []
+
+    deal.stage_id = uuid.uuid4()
+    rollups.apply_deal_change(db, before, rollups.deal_contribution(deal))
+    removed, added = db.upserts
+    assert (removed["stage_id"], removed["deal_count"], removed["amount_sum"]) == (
+        before.stage_id, -1, Decimal("-1000.0")
+    )
+    assert (added["stage_id"], added["deal_count"], added["amount_sum"]) == (
+        deal.stage_id, 1, Decimal("1000.0")
+    )
+
+
+def test_stage_velocity_and_conversion_reports(monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant_id, pipeline_id = uuid.uuid4(), uuid.uuid4()
+    lead_in = SimpleNamespace(id=uuid.uuid4(), name="Lead in", display_order=1)
+    won = SimpleNamespace(id=uuid.uuid4(), name="Won", display_order=2)
+    monkeypatch.setattr(rollups, "_pipeline_stages", lambda db, **kw: [lead_in, won])
+    monkeypatch.setattr(rollups, "_current_deals", lambda db, **kw: {won.id: (3, Decimal("30"))})
+    monkeypatch.setattr(
+        rollups,
+        "_stage_activity",
+        lambda db, **kw: {lead_in.id: (4, 2, 2, 3 * 86400), won.id: (2, 0, 0, 0)},
+    )
+
+    velocity = rollups.stage_velocity(None, tenant_id=tenant_id, pipeline_id=pipeline_id)
+    assert [(r.stage_name, r.exited_count, r.avg_duration_days, r.current_count) for r in velocity] == [
+        ("Lead in", 2, 1.5, 0),
+        ("Won", 0, None, 3),
+    ]
+
+    class TransitionQuery(FakeQuery):
+        def group_by(self, *columns: Any) -> List[Any]:
+            return [(lead_in.id, won.id, 2)]
+
+    db = SimpleNamespace(query=lambda *entities: TransitionQuery(None))
+    (conversion,) = rollups.stage_conversion(
+        db, tenant_id=tenant_id, pipeline_id=pipeline_id, start_date=date(2026, 3, 1)
+    )
+    assert (conversion.entered_count, conversion.converted_count, conversion.conversion_rate) == (4, 2, 0.5)
@@ -438,3 +438,155 @@ def test_kb_category_producer_created() -> None:
         assert message.payload == payload
         headers = kwargs["headers"]
         assert headers["tenant_id"] == str(tenant_id)
+
+
+def test_buffered_producers_flush_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Events published inside ``BaseProducer.buffered`` are sent in one batch."""
+    from app.messaging.producers import common
+
+    monkeypatch.delenv("OUTBOX_ENABLED", raising=False)
+    batches: list = []
+    monkeypatch.setattr(common, "_publish_batch", lambda events: batches.append(list(events)))
+    tenant_id = uuid4()
+    with patch.object(common.celery_app, "send_task") as send_task:
+        with ContactMessageProducer.buffered():
+            ContactMessageProducer.send_contact_created(tenant_id=tenant_id, payload={"id": "a"})
+            # Nested scopes join the outer buffer and do not flush on their own
+            with CompanyMessageProducer.buffered():
+                CompanyMessageProducer.send_company_created(tenant_id=tenant_id, payload={"id": "b"})
+            assert batches == []
+    assert send_task.call_count == 0
+    assert len(batches) == 1
+    assert [e.task_name for e in batches[0]] == [
+        f"{EXCHANGE_NAME}.contact.created",
+        f"{EXCHANGE_NAME}.company.created",
+    ]
+    assert batches[0][0].headers["message_id"] == batches[0][0].envelope["event_id"]
+
+
+def test_buffered_producers_write_outbox_in_one_transaction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With the outbox enabled a buffer flush performs a single outbox write."""
+    from app.messaging import outbox
+
+    monkeypatch.setenv("OUTBOX_ENABLED", "true")
+    writes: list = []
+    monkeypatch.setattr(outbox, "write_events", lambda events: writes.append(list(events)))
+    monkeypatch.setattr(outbox, "write_event", lambda **kwargs: pytest.fail("unbatched write"))
+    tenant_id = uuid4()
+    with ContactMessageProducer.buffered():
+        for _ in range(3):
+            ContactMessageProducer.send_contact_created(tenant_id=tenant_id, payload={})
+    assert len(writes) == 1 and len(writes[0]) == 3
+
+
+
+class _StagingSession:
+    """Records outbox rows added to the session and fails commits on demand."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.added: list = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def add_all(self, rows) -> None:
+        self.added.extend(rows)
+
+    def flush(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        if self.fail:
+            raise RuntimeError("commit failed")
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def test_commit_or_raise_stages_events_as_outbox_rows_in_the_same_transaction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With the outbox enabled the rows join the caller's commit, not a new session."""
+    from app.domain.services.common_service import commit_or_raise
+    from app.messaging import outbox
+
+    monkeypatch.setenv("OUTBOX_ENABLED", "true")
+    monkeypatch.setattr(outbox, "write_events", lambda events: pytest.fail("separate transaction"))
+    db = _StagingSession()
+    with ContactMessageProducer.buffered() as buffer:
+        ContactMessageProducer.send_contact_created(tenant_id=uuid4(), payload={"id": "a"})
+        assert db.added == []
+        commit_or_raise(db)
+        assert len(buffer) == 0
+    assert db.commits == 1
+    assert [row.task_name for row in db.added] == [f"{EXCHANGE_NAME}.contact.created"]
+
+
+def test_commit_or_raise_releases_broker_events_only_after_commit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without the outbox, events of a failed commit are never published."""
+    from fastapi import HTTPException
+
+    from app.domain.services.common_service import commit_or_raise
+    from app.messaging.producers import common
+
+    monkeypatch.delenv("OUTBOX_ENABLED", raising=False)
+    batches: list = []
+    monkeypatch.setattr(common, "_publish_batch", lambda events: batches.append(list(events)))
+    tenant_id = uuid4()
+    with ContactMessageProducer.buffered():
+        ContactMessageProducer.send_contact_created(tenant_id=tenant_id, payload={"id": "a"})
+        commit_or_raise(_StagingSession())
+        failing = _StagingSession(fail=True)
+        ContactMessageProducer.send_contact_created(tenant_id=tenant_id, payload={"id": "b"})
+        with pytest.raises(HTTPException):
+            commit_or_raise(failing)
+        assert failing.rollbacks == 1 and batches == []
+    assert [len(batch) for batch in batches] == [1]
+    assert batches[0][0].envelope["data"]["payload"] == {"id": "a"}
+
+
+def test_buffered_discards_unstaged_events_when_the_block_raises(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.messaging.producers import common
+
+    monkeypatch.delenv("OUTBOX_ENABLED", raising=False)
+    batches: list = []
+    monkeypatch.setattr(common, "_publish_batch", lambda events: batches.append(list(events)))
+    with pytest.raises(ValueError):
+        with ContactMessageProducer.buffered():
+            ContactMessageProducer.send_contact_created(tenant_id=uuid4(), payload={})
+            raise ValueError("rolled back")
+    assert batches == []
+
+def test_send_envelope_matches_event_envelope_and_encodes_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The dict envelope validates as ``EventEnvelope`` and encodes like Pydantic JSON mode."""
+    from datetime import datetime, timezone
+
+    from app.domain.schemas.events.common import EventEnvelope
+    from app.messaging.producers import common
+    from app.util.serialization import dumps, loads
+
+    monkeypatch.delenv("OUTBOX_ENABLED", raising=False)
+    tenant_id = uuid4()
+    contact_id = uuid4()
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+    with patch.object(common.celery_app, "send_task") as send_task:
+        ContactMessageProducer.send_contact_created(
+            tenant_id=tenant_id, payload={"id": contact_id, "created_at": created_at}
+        )
+    envelope = send_task.call_args.kwargs["kwargs"]["envelope"]
+
+    validated = EventEnvelope.model_validate(envelope)
+    assert validated.tenant_id == tenant_id
+    assert loads(dumps(envelope))["data"]["payload"] == {
+        "id": str(contact_id),
+        "created_at": created_at.isoformat(),
+    }
@@ -0,0 +1,95 @@
+"""Tests for read-replica routing and the read-your-writes guard."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core import db, read_routing
+
+
+def _request(
+    method: str = "GET",
+    path: str = "/admin/tickets",
+    headers: Optional[Dict[str, str]] = None,
+) -> Request:
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request(
+        {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "query_string": b"",
+            "headers": raw_headers,
+        }
+    )
+
+
+def test_fresh_client_reads_from_replica() -> None:
+    assert read_routing.must_read_primary(_request()) is False
+
+
+def test_header_and_cookie_pin_until_deadline() -> None:
+    future = f"{time.time() + 30:.3f}"
+    past = f"{time.time() - 30:.3f}"
+    header = read_routing.PRIMARY_UNTIL_HEADER
+    cookie = read_routing.PRIMARY_UNTIL_COOKIE
+    assert read_routing.must_read_primary(_request(headers={header: future}))
+    assert read_routing.must_read_primary(_request(headers={"cookie": f"{cookie}={future}"}))
+    assert not read_routing.must_read_primary(_request(headers={header: past}))
+    assert not read_routing.must_read_primary(_request(headers={header: "garbage"}))
+
+
+def test_tenant_write_pins_tenant_and_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("READ_YOUR_WRITES_SECONDS", "10")
+    tenant_id = str(uuid.uuid4())
+    response = Response(status_code=201)
+    read_routing.record_write(_request("POST", f"/tenants/{tenant_id}/tickets/"), response)
+
+    assert float(response.headers[read_routing.PRIMARY_UNTIL_HEADER]) > time.time()
+    assert read_routing.PRIMARY_UNTIL_COOKIE in response.headers["set-cookie"]
+    # Another client of the same tenant is pinned in this process
+    assert read_routing.must_read_primary(_request(path=f"/tenants/{tenant_id}/tickets/"))
+    assert not read_routing.must_read_primary(
+        _request(path=f"/tenants/{uuid.uuid4()}/tickets/")
+    )
+
+
+def test_reads_and_failed_writes_do_not_pin() -> None:
+    tenant_id = str(uuid.uuid4())
+    for method, status_code in (("GET", 200), ("PATCH", 422)):
+        response = Response(status_code=status_code)
+        read_routing.record_write(_request(method, f"/tenants/{tenant_id}/contacts"), response)
+        assert read_routing.PRIMARY_UNTIL_HEADER not in response.headers
+    assert not read_routing.must_read_primary(_request(path=f"/tenants/{tenant_id}/contacts"))
+
+
+def test_get_read_db_routes_pinned_requests_to_primary(monkeypatch: pytest.MonkeyPatch) -> None:
+    opened: List[str] = []
+
+    class FakeSession:
+        def __init__(self, name: str) -> None:
+            opened.append(name)
+
+        def close(self) -> None:
+            return None
+
+    monkeypatch.setattr(db, "REPLICA_URL", "postgresql+psycopg2://replica/crm")
+    monkeypatch.setattr(db, "SessionLocal", lambda: FakeSession("primary"))
+    monkeypatch.setattr(db, "ReadSessionLocal", lambda: FakeSession("replica"))
+
+    def use(request: Request) -> Any:
+        gen = db.get_read_db(request)
+        session = next(gen)
+        gen.close()
+        return session
+
+    use(_request())
+    pinned = {read_routing.PRIMARY_UNTIL_HEADER: f"{time.time() + 30:.3f}"}
+    use(_request(headers=pinned))
+    assert opened == ["replica", "primary"]
@@ -0,0 +1,86 @@
+"""Tests for the orjson based default response class."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.api.responses as responses
+from app.api.responses import FastJSONResponse
+
+
+def test_fast_json_response_renders_native_types() -> None:
+    value_id = uuid.uuid4()
+    ts = datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)
+    response = FastJSONResponse({"id": value_id, "at": ts, "n": None})
+    assert response.body == (
+        b'{"id":"' + str(value_id).encode() + b'","at":"2024-01-01T08:00:00+00:00","n":null}'
+    )
+    assert response.media_type == "application/json"
+
+
+def test_default_response_class_prefers_pydantic_serialization(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """orjson is installed only when FastAPI does not dump response models itself."""
+    from fastapi.datastructures import DefaultPlaceholder
+
+    monkeypatch.setattr(responses, "_fastapi_dumps_response_models", lambda: True)
+    assert isinstance(responses.default_response_class(), DefaultPlaceholder)
+
+    monkeypatch.setattr(responses, "_fastapi_dumps_response_models", lambda: False)
+    assert responses.default_response_class() is FastJSONResponse
+
+
+def test_application_keeps_fastapi_response_model_serialization() -> None:
+    """The real application leaves response models to FastAPI where it dumps them to JSON."""
+    from fastapi.datastructures import DefaultPlaceholder
+
+    from main_api import create_app
+
+    app = create_app()
+    if responses._fastapi_dumps_response_models():
+        assert isinstance(app.router.default_response_class, DefaultPlaceholder)
+    else:
+        assert app.router.default_response_class is FastJSONResponse
+
+
+def test_app_uses_orjson_when_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    from fastapi import FastAPI
+
+    app = FastAPI(default_response_class=FastJSONResponse)
+    item_id = uuid.uuid4()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: uuid.UUID) -> dict:
+        return {"id": item_id}
+
+    calls: list = []
+    real_dumps = responses.dumps
+    monkeypatch.setattr(
+        responses, "dumps", lambda content: calls.append(content) or real_dumps(content)
+    )
+    assert TestClient(app).get(f"/items/{item_id}").json() == {"id": str(item_id)}
+    assert len(calls) == 1
+
+
+def test_validate_items_validates_rows_once_and_passes_models_through() -> None:
+    from types import SimpleNamespace
+
+    from pydantic import BaseModel
+
+    from app.domain.schemas.common import validate_items
+
+    class Item(BaseModel):
+        id: uuid.UUID
+        name: str
+
+    existing = Item(id=uuid.uuid4(), name="a")
+    row = SimpleNamespace(id=uuid.uuid4(), name="b")
+    items = validate_items(Item, [existing, row, {"id": str(row.id), "name": "c"}])
+    assert items[0] is existing
+    assert [i.name for i in items] == ["a", "b", "c"]
+    assert isinstance(items[1], Item)
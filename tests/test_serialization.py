@@ -0,0 +1,62 @@
+"""Tests for the orjson helpers and the column snapshot extractors."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.domain.models.contact_phone import ContactPhone
+from app.domain.models.ticket import Ticket
+from app.domain.services import contact_service, ticket_service
+from app.util.serialization import column_extractor, dumps, loads
+
+
+def test_dumps_renders_values_like_str_and_isoformat() -> None:
+    value_id = uuid.uuid4()
+    aware = datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=timezone.utc)
+    naive = datetime(2024, 1, 2, 3, 4, 5)
+    encoded = loads(
+        dumps({"id": value_id, "aware": aware, "naive": naive, "day": date(2024, 1, 2),
+               "amount": Decimal("1.50"), value_id: 1})
+    )
+    assert encoded == {
+        "id": str(value_id),
+        "aware": aware.isoformat(),
+        "naive": naive.isoformat(),
+        "day": "2024-01-02",
+        "amount": "1.50",
+        str(value_id): 1,
+    }
+
+
+def test_column_extractor_copies_listed_columns_in_order() -> None:
+    phone = ContactPhone(
+        id=uuid.uuid4(),
+        phone_raw="555",
+        phone_type="mobile",
+        is_primary=True,
+        created_by="tester",
+    )
+    snapshot = contact_service._phone_snapshot(phone)
+    assert list(snapshot)[:3] == ["id", "phone_raw", "phone_e164"]
+    assert snapshot["phone_raw"] == "555" and snapshot["id"] == phone.id
+    assert "tenant_id" not in snapshot
+
+    extract_all = column_extractor(ContactPhone)
+    assert {"tenant_id", "contact_id", "phone_raw"} <= set(extract_all(phone))
+
+
+def test_column_extractor_rejects_unknown_columns_at_build_time() -> None:
+    with pytest.raises(ValueError, match="job_title"):
+        column_extractor(ContactPhone, ("id", "job_title"))
+
+
+def test_ticket_snapshot_converts_confidence_to_float() -> None:
+    ticket = Ticket(id=uuid.uuid4(), subject="Help", ai_last_confidence=Decimal("0.875"))
+    snapshot = ticket_service._snapshot(ticket)
+    assert snapshot["ai_last_confidence"] == 0.875
+    assert snapshot["closed_at"] is None
+    assert loads(dumps(snapshot))["id"] == str(ticket.id)
@@ -0,0 +1,111 @@
+"""Tests for the SLA breach scanner."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.messaging import sla_breach_scanner as scanner
+from app.messaging.producers.ticket_sla_state_producer import TicketSlaStateMessageProducer
+
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    def __init__(self, rows: List[Any]) -> None:
+        self.rows = rows
+
+    def all(self) -> List[Any]:
+        return self.rows
+
+
+class FakeSession:
+    """Compiles executed statements for PostgreSQL and returns the given rows."""
+
+    def __init__(self, rows: List[Any]) -> None:
+        self.rows = rows
+        self.sql = ""
+        self.commits = 0
+
+    def execute(self, stmt: Any) -> FakeResult:
+        self.sql = str(stmt.compile(dialect=postgresql.dialect()))
+        return FakeResult(self.rows)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+def _state(**kwargs: Any) -> SimpleNamespace:
+    values: Dict[str, Any] = dict(
+        id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        ticket_id=uuid.uuid4(),
+        sla_policy_id=None,
+        first_response_due_at=NOW - timedelta(minutes=5),
+        next_response_due_at=None,
+        resolution_due_at=NOW + timedelta(hours=4),
+        next_due_at=NOW + timedelta(hours=4),
+        first_response_breached=True,
+        next_response_breached=False,
+        resolution_breached=False,
+        was_first_response_breached=False,
+        was_next_response_breached=False,
+        was_resolution_breached=False,
+        last_computed_at=NOW - timedelta(hours=1),
+        created_at=NOW - timedelta(hours=1),
+        updated_at=NOW,
+        created_by="sla_engine",
+        updated_by=scanner.SCANNER_USER,
+    )
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+def test_breach_statement_claims_due_rows_from_the_next_due_index() -> None:
+    sql = str(scanner.breach_statement(now=NOW, batch_size=100).compile(dialect=postgresql.dialect()))
+
+    assert "WITH due AS" in sql
+    assert "next_due_at IS NOT NULL AND dyno_crm.ticket_sla_state.next_due_at <=" in sql
+    assert "ORDER BY dyno_crm.ticket_sla_state.next_due_at" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "first_response_breached=(dyno_crm.ticket_sla_state.first_response_breached OR coalesce(" in sql
+    assert "RETURNING" in sql and "due.was_resolution_breached" in sql
+
+
+def test_scan_batch_publishes_newly_breached_timers_in_one_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    first = _state()
+    both = _state(resolution_breached=True, first_response_breached=True, was_first_response_breached=True)
+    db = FakeSession([first, both])
+    sent: List[Dict[str, Any]] = []
+    monkeypatch.setattr(
+        TicketSlaStateMessageProducer,
+        "send_ticket_sla_state_updated",
+        classmethod(lambda cls, **kwargs: sent.append(kwargs)),
+    )
+
+    assert scanner.scan_batch(db, now=NOW, batch_size=100) == 2  # type: ignore[arg-type]
+
+    assert db.commits == 1
+    assert [event["changes"].base_fields for event in sent] == [
+        {"first_response_breached": True},
+        {"resolution_breached": True},
+    ]
+    assert sent[0]["ticket_id"] == first.ticket_id
+    assert sent[1]["payload"]["resolution_breached"] is True
+
+
+def test_scan_batch_without_due_rows_publishes_nothing(monkeypatch: pytest.MonkeyPatch) -> None:
+    db = FakeSession([])
+    monkeypatch.setattr(
+        TicketSlaStateMessageProducer,
+        "send_ticket_sla_state_updated",
+        classmethod(lambda cls, **kwargs: pytest.fail("unexpected event")),
+    )
+
+    assert scanner.scan_batch(db, now=NOW, batch_size=100) == 0  # type: ignore[arg-type]
+    assert "LIMIT" in db.sql and db.commits == 1
@@ -0,0 +1,148 @@
+"""Tests for the SLA due-date engine."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.services import sla_engine_service as engine
+from app.domain.services.business_calendar import get_calendar
+
+UTC = timezone.utc
+VIP, SUPPORT, FALLBACK = uuid.UUID(int=1), uuid.UUID(int=2), uuid.UUID(int=3)
+QUEUE, HOURS = uuid.UUID(int=10), uuid.UUID(int=20)
+
+
+def _context() -> engine.SlaContext:
+    return engine.SlaContext(
+        policies=[
+            (VIP, {"priority": ["high", "urgent"], "ticket_type": "incident"}),
+            (SUPPORT, {"ticket_type": "task"}),
+            (FALLBACK, None),
+        ],
+        targets={
+            (VIP, "urgent"): (60, 120, 480),
+            (SUPPORT, "normal"): (240, None, 960),
+            (FALLBACK, "normal"): (30, 30, 60),
+        },
+        groups={QUEUE: (SUPPORT, HOURS)},
+        calendars={
+            HOURS: get_calendar(
+                "UTC", [{"day": d, "start": "09:00", "end": "17:00"} for d in ("mon", "tue", "wed", "thu", "fri")]
+            )
+        },
+    )
+
+
+def _ticket(**kwargs: Any) -> SimpleNamespace:
+    values: Dict[str, Any] = dict(
+        id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        priority="normal",
+        status="open",
+        ticket_type="question",
+        work_mode="human_only",
+        inbound_channel_id=None,
+        assigned_group_id=None,
+        company_id=None,
+        created_at=datetime(2026, 3, 6, 16, 0, tzinfo=UTC),  # Friday
+        first_response_at=None,
+        last_message_at=None,
+    )
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+def test_policy_selection_order() -> None:
+    context = _context()
+    assert context.policy_for(_ticket(priority="urgent", ticket_type="incident")) == VIP
+    assert context.policy_for(_ticket(assigned_group_id=QUEUE)) == SUPPORT
+    assert context.policy_for(_ticket()) == FALLBACK
+    assert not engine.matches({"unknown_field": "x"}, _ticket())
+    assert engine.matches({"company_id": [None]}, _ticket())
+
+
+def test_compute_due_dates_uses_group_calendar_and_timer_rules() -> None:
+    context = _context()
+    dates = engine.compute_due_dates(_ticket(assigned_group_id=QUEUE), context)
+    assert dates.sla_policy_id == SUPPORT
+    # 60 business minutes on Friday, the rest on Monday from 09:00
+    assert dates.first_response_due_at == datetime(2026, 3, 9, 12, 0, tzinfo=UTC)
+    assert dates.resolution_due_at == datetime(2026, 3, 10, 16, 0, tzinfo=UTC)
+    assert dates.next_response_due_at is None
+
+    responded = engine.compute_due_dates(
+        _ticket(
+            first_response_at=datetime(2026, 3, 6, 16, 5, tzinfo=UTC),
+            last_message_at=datetime(2026, 3, 6, 17, 0, tzinfo=UTC),
+        ),
+        context,
+    )
+    assert responded.first_response_due_at is None
+    assert responded.next_response_due_at == datetime(2026, 3, 6, 17, 30, tzinfo=UTC)
+
+    assert engine.compute_due_dates(_ticket(status="solved"), context) == engine.SlaDueDates(FALLBACK)
+    assert engine.compute_due_dates(_ticket(priority="low"), context) == engine.SlaDueDates(FALLBACK)
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.flushed = 0
+        self.statements: List[Any] = []
+
+    def flush(self) -> None:
+        self.flushed += 1
+
+    def execute(self, stmt: Any) -> None:
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_apply_ticket_sla_upserts_state_keeping_past_breaches() -> None:
+    db = FakeSession()
+    ticket = _ticket()
+    now = datetime(2026, 3, 6, 16, 10, tzinfo=UTC)
+
+    dates = engine.apply_ticket_sla(db, ticket, context=_context(), now=now)
+
+    (compiled,) = db.statements
+    sql = str(compiled)
+    assert db.flushed == 1
+    assert "ON CONFLICT (tenant_id, ticket_id) DO UPDATE" in sql
+    assert "ticket_sla_state.first_response_breached AND coalesce(excluded.first_response_due_at <=" in sql
+    params = compiled.params
+    assert params["ticket_id_m0"] == ticket.id and params["sla_policy_id_m0"] == FALLBACK
+    assert params["resolution_due_at_m0"] == dates.resolution_due_at == datetime(2026, 3, 6, 17, 0, tzinfo=UTC)
+
+
+
+def test_apply_ticket_sla_loads_the_context_through_the_config_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.domain.services import tenant_config_cache as cache_module
+
+    monkeypatch.setenv("TENANT_CONFIG_CACHE_BROADCAST", "false")
+    loads: List[uuid.UUID] = []
+    monkeypatch.setattr(
+        engine, "load_context", lambda db, *, tenant_id: loads.append(tenant_id) or _context()
+    )
+    ticket = _ticket()
+
+    for _ in range(2):
+        engine.apply_ticket_sla(FakeSession(), ticket)
+    assert loads == [ticket.tenant_id]
+
+    for task_name in ("crm.sla_policy.updated", "crm.sla_target.created", "crm.group_profile.deleted"):
+        assert "sla_context" in cache_module.kinds_for_event(task_name)
+    cache_module.invalidate_domain(ticket.tenant_id, "business_hours")
+    engine.apply_ticket_sla(FakeSession(), ticket)
+    assert loads == [ticket.tenant_id, ticket.tenant_id]
+
+def test_needs_recompute() -> None:
+    assert engine.needs_recompute({"priority": "high", "subject": "x"})
+    assert engine.needs_recompute(["status"])
+    assert not engine.needs_recompute({"subject": "x", "description": "y"})
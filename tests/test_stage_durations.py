@@ -0,0 +1,91 @@
+"""Tests for the stage duration and deal aging window queries."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import HTTPException
+
+from app.domain.services import stage_duration_service as durations
+
+
+class FakeResult:
+    def __init__(self, rows: List[Any]) -> None:
+        self.rows = rows
+
+    def all(self) -> List[Any]:
+        return self.rows
+
+
+class FakeSession:
+    """Records the executed SQL and parameters; returns the given rows."""
+
+    def __init__(self, rows: List[Any]) -> None:
+        self.rows = rows
+        self.sql = ""
+        self.params: Dict[str, Any] = {}
+
+    def execute(self, stmt: Any, params: Dict[str, Any]) -> FakeResult:
+        self.sql, self.params = str(stmt), params
+        return FakeResult(self.rows)
+
+
+AS_OF = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+
+def test_stage_durations_runs_window_query_and_unpacks_percentiles() -> None:
+    qualify = SimpleNamespace(
+        stage_id=uuid.uuid4(), stage_name="Qualify", display_order=1,
+        exited_count=4, avg_days=2.5, completed_pct=[2.0, 4.5],
+        current_count=1, current_pct=[7.0, 7.0],
+    )
+    won = SimpleNamespace(
+        stage_id=uuid.uuid4(), stage_name="Won", display_order=2,
+        exited_count=0, avg_days=None, completed_pct=None,
+        current_count=0, current_pct=None,
+    )
+    db = FakeSession([qualify, won])
+
+    rows = durations.stage_durations(
+        db, tenant_id=uuid.uuid4(), pipeline_id=uuid.uuid4(),
+        start_date=date(2026, 3, 1), end_date=date(2026, 3, 7), as_of=AS_OF,
+    )
+
+    assert "LEAD(h.changed_at) OVER" in db.sql
+    assert "AND exited_at >= :period_start AND exited_at < :period_end" in db.sql
+    assert db.params["period_start"] == datetime(2026, 3, 1, tzinfo=timezone.utc)
+    assert db.params["period_end"] == datetime(2026, 3, 8, tzinfo=timezone.utc)
+    assert db.params["as_of"] == AS_OF
+    assert [(r.stage_name, r.exited_count, r.p50_days, r.p90_days, r.current_p50_days) for r in rows] == [
+        ("Qualify", 4, 2.0, 4.5, 7.0),
+        ("Won", 0, None, None, None),
+    ]
+
+
+def test_deal_aging_passes_thresholds_and_reads_at_risk_totals() -> None:
+    row = SimpleNamespace(
+        stage_id=uuid.uuid4(), stage_name="Proposal", display_order=2,
+        open_deal_count=3, open_amount=Decimal("900.00"), avg_days=20.0,
+        pct=[12.0, 40.0], at_risk_count=1, at_risk_amount=Decimal("500.00"),
+    )
+    db = FakeSession([row])
+
+    (aging,) = durations.deal_aging(
+        db, tenant_id=uuid.uuid4(), pipeline_id=uuid.uuid4(), threshold_days=30, as_of=AS_OF
+    )
+
+    assert "FROM dyno_crm.deal d" in db.sql and "s.exited_at IS NULL" in db.sql
+    assert (db.params["threshold_days"], db.params["cycle_threshold_days"]) == (30.0, None)
+    assert (aging.open_deal_count, aging.p50_days_in_stage, aging.p90_days_in_stage) == (3, 12.0, 40.0)
+    assert (aging.at_risk_count, aging.at_risk_amount) == (1, Decimal("500.00"))
+
+
+def test_stage_durations_unknown_pipeline_is_not_found() -> None:
+    with pytest.raises(HTTPException) as exc:
+        durations.stage_durations(FakeSession([]), tenant_id=uuid.uuid4(), pipeline_id=uuid.uuid4())
+    assert exc.value.status_code == 404
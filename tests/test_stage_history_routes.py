@@ -64,7 +64,18 @@ def test_list_stage_history_calls_service(monkeypatch: pytest.MonkeyPatch) -> No
     total = 1
     captured: dict = {}
 
-    def fake_list(db, *, tenant_id, entity_type, entity_id, limit, offset):
+    def fake_list(
+        db,
+        *,
+        tenant_id,
+        entity_type,
+        entity_id,
+        limit,
+        offset,
+        cursor=None,
+        page_size=None,
+        total_mode=None,
+    ):
         captured["db"] = db
         captured["tenant_id"] = tenant_id
         captured["entity_type"] = entity_type
@@ -239,4 +239,103 @@ def test_delete_support_view_calls_service(monkeypatch: pytest.MonkeyPatch) -> N
     assert captured_kwargs["db"] is fake_db
     assert captured_kwargs["tenant_id"] == tenant_id
     assert captured_kwargs["view_id"] == view_id
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+# ---------------------------------------------------------------------------
+# execute_support_view
+# ---------------------------------------------------------------------------
+
+
+def _saved_view(tenant_id: uuid.UUID, filters: Dict[str, Any], sort=None):
+    from app.domain.models.support_view import SupportView
+
+    return SupportView(
+        id=uuid.uuid4(),
+        tenant_id=tenant_id,
+        name="Queue",
+        is_active=True,
+        filter_definition=filters,
+        sort_definition=sort,
+    )
+
+
+def test_execute_support_view_applies_filter_definition(monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant_id = uuid.uuid4()
+    group_id = uuid.uuid4()
+    view = _saved_view(
+        tenant_id,
+        {"status": ["new", "open"], "assigned_group_id": str(group_id)},
+        {"field": "updated_at", "direction": "desc"},
+    )
+    captured: dict = {}
+
+    def fake_paginate(query, model, **kwargs):
+        captured["sql"] = str(query.statement)
+        captured["params"] = query.statement.compile().params
+        captured.update(kwargs)
+        return [], 0
+
+    monkeypatch.setattr(support_view_service, "get_support_view", lambda db, **kw: view)
+    monkeypatch.setattr(support_view_service, "paginate", fake_paginate)
+
+    support_view_service.execute_support_view(
+        Session(), tenant_id=tenant_id, view_id=view.id, limit=10
+    )
+
+    assert "ticket.status IN" in captured["sql"]
+    assert group_id in captured["params"].values()
+    assert str(captured["order_by"][0]).endswith("updated_at DESC")
+    assert captured["limit"] == 10
+
+
+def test_execute_support_view_rejects_unknown_filters(monkeypatch: pytest.MonkeyPatch) -> None:
+    from fastapi import HTTPException
+
+    tenant_id = uuid.uuid4()
+    view = _saved_view(tenant_id, {"sla_breached": True})
+    monkeypatch.setattr(support_view_service, "get_support_view", lambda db, **kw: view)
+
+    with pytest.raises(HTTPException) as exc:
+        support_view_service.execute_support_view(Session(), tenant_id=tenant_id, view_id=view.id)
+    assert exc.value.status_code == 400
+
+
+def test_execute_support_view_async_endpoint_runs_sync_service(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The async handler runs the sync service through ``run_sync``."""
+    import asyncio
+
+    from app.api.routes.support_views_tenant_route import execute_support_view_endpoint_async
+
+    tenant_id = uuid.uuid4()
+    sync_session = DummySession()
+    captured: dict = {}
+
+    class FakeAsyncSession:
+        async def run_sync(self, fn):
+            return fn(sync_session)
+
+    def fake_execute(db, **kwargs):
+        captured["db"] = db
+        captured.update(kwargs)
+        return [], 0
+
+    monkeypatch.setattr(support_view_service, "execute_support_view", fake_execute)
+
+    result = asyncio.run(
+        execute_support_view_endpoint_async(
+            tenant_id=tenant_id,
+            view_id=uuid.uuid4(),
+            limit=5,
+            offset=None,
+            cursor=None,
+            page_size=None,
+            total_mode=None,
+            db=FakeAsyncSession(),
+        )
+    )
+
+    assert captured["db"] is sync_session
+    assert captured["limit"] == 5
+    assert result.total == 0 and result.items == []
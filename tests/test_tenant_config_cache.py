@@ -0,0 +1,132 @@
+"""Tests for the tenant configuration cache and its invalidation."""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from app.domain.services import pipeline_service, tenant_config_cache as cache_module
+from app.domain.services.tenant_config_cache import TenantConfigCache, tenant_config_cache
+from app.messaging import config_cache
+from app.messaging.producers.common import BaseProducer
+from app.messaging.producers.pipeline_producer import PipelineMessageProducer
+
+
+def test_get_or_load_caches_per_tenant_and_skips_none() -> None:
+    cache = TenantConfigCache(ttl_seconds=60)
+    tenant_a, tenant_b = uuid.uuid4(), uuid.uuid4()
+    calls: List[str] = []
+
+    def loader(value: Any) -> Any:
+        def load() -> Any:
+            calls.append(value)
+            return value
+
+        return load
+
+    assert cache.get_or_load(tenant_a, "sla_policy", 1, loader("a")) == "a"
+    assert cache.get_or_load(tenant_a, "sla_policy", 1, loader("stale")) == "a"
+    assert cache.get_or_load(tenant_b, "sla_policy", 1, loader("b")) == "b"
+    assert cache.get_or_load(tenant_a, "sla_policy", 2, loader(None)) is None
+    assert cache.get_or_load(tenant_a, "sla_policy", 2, loader(None)) is None
+    assert calls == ["a", "b", None, None]
+
+
+def test_zero_ttl_disables_cache() -> None:
+    cache = TenantConfigCache(ttl_seconds=0)
+    calls: List[int] = []
+    for _ in range(2):
+        cache.get_or_load(uuid.uuid4(), "pipeline", 1, lambda: calls.append(1) or True)
+    assert len(calls) == 2
+
+
+def test_invalidate_drops_only_requested_kinds() -> None:
+    cache = TenantConfigCache(ttl_seconds=60)
+    tenant_id = uuid.uuid4()
+    cache.get_or_load(tenant_id, "ticket_form", 1, lambda: "form")
+    cache.get_or_load(tenant_id, "sla_policy", 1, lambda: "policy")
+
+    cache.invalidate(tenant_id, ["ticket_form"])
+
+    assert cache.get_or_load(tenant_id, "ticket_form", 1, lambda: "form v2") == "form v2"
+    assert cache.get_or_load(tenant_id, "sla_policy", 1, lambda: "policy v2") == "policy"
+
+
+def test_load_racing_an_invalidation_is_not_stored() -> None:
+    cache = TenantConfigCache(ttl_seconds=60)
+    tenant_id = uuid.uuid4()
+
+    def load_while_changed() -> str:
+        cache.invalidate(tenant_id, ["pipeline"])
+        return "old"
+
+    assert cache.get_or_load(tenant_id, "pipeline", 1, load_while_changed) == "old"
+    assert cache.get_or_load(tenant_id, "pipeline", 1, lambda: "new") == "new"
+
+
+def test_producer_event_invalidates_and_broadcasts_after_commit(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: List[Dict[str, Any]] = []
+    monkeypatch.setenv("TENANT_CONFIG_CACHE_BROADCAST", "true")
+    tenant_id = uuid.uuid4()
+    pipeline_id = uuid.uuid4()
+    lookups: List[uuid.UUID] = []
+
+    def fake_get_pipeline(db: Any, pid: uuid.UUID, tid: uuid.UUID) -> Any:
+        lookups.append(pid)
+        return SimpleNamespace(id=pid, tenant_id=tid)
+
+    monkeypatch.setattr(pipeline_service, "get_pipeline", fake_get_pipeline)
+    for _ in range(2):
+        assert pipeline_service.pipeline_exists(None, tenant_id=tenant_id, pipeline_id=pipeline_id)
+    assert lookups == [pipeline_id]
+
+    class CommittingSession:
+        def commit(self) -> None:
+            pass
+
+    monkeypatch.delenv("OUTBOX_ENABLED", raising=False)
+    monkeypatch.setattr(
+        "app.messaging.producers.common.celery_app.send_task",
+        lambda **kwargs: sent.append(kwargs),
+    )
+    with BaseProducer.buffered(autoflush=False) as buffer:
+        PipelineMessageProducer.send_pipeline_deleted(
+            tenant_id=tenant_id, deleted_dt="2026-01-01T00:00:00"
+        )
+        # Not committed yet: a concurrent load must not see the entry dropped
+        assert pipeline_service.pipeline_exists(None, tenant_id=tenant_id, pipeline_id=pipeline_id)
+        assert lookups == [pipeline_id] and sent == []
+        with BaseProducer.staged(CommittingSession()):
+            pass
+
+    assert [event.task_name for event in buffer._committed] == ["crm.pipeline.deleted"]
+    assert [s["name"] for s in sent] == ["crm.config_cache.invalidated"]
+    assert sent[0]["kwargs"]["envelope"]["data"]["kinds"] == ["pipeline"]
+    assert pipeline_service.pipeline_exists(None, tenant_id=tenant_id, pipeline_id=pipeline_id)
+    assert lookups == [pipeline_id, pipeline_id]
+
+
+def test_broadcast_from_another_process_invalidates() -> None:
+    tenant_id = uuid.uuid4()
+    tenant_config_cache.get_or_load(tenant_id, "sla_target", 1, lambda: "target")
+    data = {"tenant_id": str(tenant_id), "kinds": ["sla_target"], "origin": "other"}
+
+    listener = config_cache.ConfigCacheListener(connection=None)
+    message = SimpleNamespace(acked=False)
+    message.ack = lambda: setattr(message, "acked", True)
+    listener.on_message([[], {"envelope": {"data": data}}, {}], message)
+
+    assert message.acked
+    assert tenant_config_cache.get_or_load(tenant_id, "sla_target", 1, lambda: "new") == "new"
+
+
+def test_own_broadcast_is_ignored() -> None:
+    tenant_id = uuid.uuid4()
+    tenant_config_cache.get_or_load(tenant_id, "sla_target", 1, lambda: "target")
+    cache_module.apply_invalidation(
+        {"tenant_id": str(tenant_id), "kinds": ["sla_target"], "origin": cache_module.PROCESS_ORIGIN}
+    )
+    assert tenant_config_cache.get_or_load(tenant_id, "sla_target", 1, lambda: "new") == "target"